@@ -0,0 +1,181 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) Gazebo-ROS2 Conveyor Belt Plugin. URL: https://github.com/IFRA-Cranfield/IFRA_ConveyorBelt.
+
+
+# PartFeeder.py:
+# CONVEYOR PART FEEDER -> Continuous part feeding onto the ConveyorBelt, for throughput (parts/min) stress tests of the whole cell:
+#   - The parts are taken from a PART POOL (partpool.py), created once at start -> No entity is spawned while feeding.
+#   - MODE "rate": --rate parts/min, while the belt is running (CONVEYORSTATE: enabled).
+#   - MODE "spacing": One part every --spacing meters of belt travel -> Interval = spacing / belt velocity (power [%] * --max_velocity).
+#   - Every part is placed at the feed point (--x, --y, --z) + a random lateral offset in [-lateral, +lateral] (across the belt).
+#   - RECYCLE: A part is returned to the pool once the belt has moved it --travel meters (0 = never).
+# The belt travel is integrated from the power reported on CONVEYORSTATE, in simulation time.
+#
+# EXAMPLE:
+#   ros2 run ros2_conveyorbelt PartFeeder.py --mode spacing --spacing 0.15 --lateral 0.1 --size 30
+#   ros2 service call /CONVEYORPOWER conveyorbelt_msgs/srv/ConveyorBeltControl "{power: 50}"
+
+# IMPORT LIBRARIES:
+import argparse
+import math
+import random
+import rclpy
+from rclpy.parameter import Parameter
+from conveyorbelt_msgs.msg import ConveyorBeltState
+from conveyorbelt_msgs.msg import PartPoolState
+from partpool import PartPool
+
+class PartFeeder():
+
+    def __init__(self, node, POOL, args):
+        self.node = node
+        self.POOL = POOL
+        self.args = args
+        self.POWER = 0.0
+        self.ENABLED = False
+        self.CREDIT = 0.0           # Parts due (feeding is triggered at 1.0).
+        self.TRAVEL = {}            # Part -> Belt travel since it was fed [m].
+        self.FED = 0
+        self.RECYCLED = 0
+        self.T_START = None
+        self.T_LAST = None
+        self.T_REPORT = None
+        self.FED_REPORT = 0
+
+        node.create_subscription(ConveyorBeltState, 'CONVEYORSTATE', self.State, 10)
+        self.publisher = node.create_publisher(PartPoolState, 'PARTPOOLSTATE', 10)
+        node.create_timer(args.tick, self.Tick)
+        node.create_timer(args.period, lambda: self.Report())
+
+    def State(self, MSG):
+        self.POWER = MSG.power
+        self.ENABLED = MSG.enabled
+
+    def Tick(self):
+        T = self.node.get_clock().now().nanoseconds * 1e-9
+        if self.T_LAST is None:
+            self.T_LAST = T
+            self.T_START = T
+            self.T_REPORT = T
+            return
+        DT = max(T - self.T_LAST, 0.0)
+        self.T_LAST = T
+        V = self.args.max_velocity * self.POWER / 100.0 if self.ENABLED else 0.0
+
+        # 1. RECYCLE -> Belt travel of every part on the belt:
+        for NAME in list(self.TRAVEL):
+            self.TRAVEL[NAME] = self.TRAVEL[NAME] + V * DT
+            if self.args.travel > 0.0 and self.TRAVEL[NAME] >= self.args.travel:
+                del self.TRAVEL[NAME]
+                self.POOL.RELEASE(NAME)
+                self.RECYCLED = self.RECYCLED + 1
+
+        # 2. FEED -> Parts due since the last tick (no burst after a stop/empty pool: max. 1 part pending):
+        if not self.ENABLED:
+            return
+        if self.args.mode == 'rate':
+            self.CREDIT = self.CREDIT + DT * self.args.rate / 60.0
+        else:
+            self.CREDIT = self.CREDIT + V * DT / self.args.spacing
+        if self.CREDIT >= 1.0:
+            OFFSET = random.uniform(-self.args.lateral, self.args.lateral)
+            x = self.args.x + OFFSET * math.cos(self.args.belt_yaw)
+            y = self.args.y + OFFSET * math.sin(self.args.belt_yaw)
+            NAME = self.POOL.ACQUIRE(x, y, self.args.z, self.args.yaw)
+            if NAME is not None:
+                self.TRAVEL[NAME] = 0.0
+                self.FED = self.FED + 1
+            self.CREDIT = min(self.CREDIT - 1.0, 1.0)
+
+    # THROUGHPUT -> Parts/min (last period + total) and pool usage:
+    def Report(self, FINAL=False):
+        if self.T_REPORT is None:
+            return
+        T = self.T_LAST
+        STATS = self.POOL.STATS()
+        if not FINAL:
+            self.publisher.publish(PartPoolState(**STATS))
+        RATE = 60.0 * (self.FED - self.FED_REPORT) / (T - self.T_REPORT) if T > self.T_REPORT else 0.0
+        TOTAL = 60.0 * self.FED / (T - self.T_START) if T > self.T_START else 0.0
+        self.node.get_logger().info(
+            'FEEDER -> power: {:.0f}%, fed: {} ({:.1f} parts/min, total {:.1f} parts/min), on belt: {}, recycled: {}, pool empty: {}, set_entity_state: {:.1f}ms mean, {:.1f}ms max'.format(
+            self.POWER, self.FED, RATE, TOTAL, len(self.TRAVEL), self.RECYCLED, STATS['misses'],
+            1e3 * STATS['latency_mean'], 1e3 * STATS['latency_max']))
+        self.T_REPORT = T
+        self.FED_REPORT = self.FED
+
+def main():
+    # Get input arguments from user
+    parser = argparse.ArgumentParser(description='Conveyor part feeder: parts at a fixed rate or spacing, from a part pool.')
+    parser.add_argument('--package', type=str, default='conveyorbelt_gazebo', help='Package where URDF/XACRO file is located.')
+    parser.add_argument('--urdf', type=str, default='box.urdf', help='URDF of the part.')
+    parser.add_argument('--prefix', type=str, default='part', help='Name prefix of the parts -> <prefix>_<i>.')
+    parser.add_argument('--size', type=int, default=30, help='Number of parts in the pool.')
+    parser.add_argument('--mode', type=str, default='spacing', choices=['rate', 'spacing'], help='Feeding mode.')
+    parser.add_argument('--rate', type=float, default=30.0, help='MODE rate: parts/min.')
+    parser.add_argument('--spacing', type=float, default=0.2, help='MODE spacing: distance between parts along the belt [meters].')
+    parser.add_argument('--max_velocity', type=float, default=1.0, help='Belt velocity at 100%% power (<max_velocity> of the plugin) [m/s].')
+    parser.add_argument('--x', type=float, default=0.0, help='Feed point: x [meters].')
+    parser.add_argument('--y', type=float, default=-0.5, help='Feed point: y [meters].')
+    parser.add_argument('--z', type=float, default=0.76, help='Feed point: z [meters].')
+    parser.add_argument('--yaw', type=float, default=0.0, help='Part rotation around Z [rad].')
+    parser.add_argument('--belt_yaw', type=float, default=0.0, help='Rotation of the belt in the world (lateral axis = belt X axis) [rad].')
+    parser.add_argument('--lateral', type=float, default=0.1, help='Max. random lateral offset [meters].')
+    parser.add_argument('--travel', type=float, default=2.4, help='Belt travel after which a part is returned to the pool [meters] (0 = never).')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed (lateral offsets).')
+    parser.add_argument('--tick', type=float, default=0.01, help='Feeder update period (simulation time) [s].')
+    parser.add_argument('--period', type=float, default=5.0, help='Throughput report period (simulation time) [s].')
+    parser.add_argument('--park_x', type=float, default=0.0, help='Parking area (off-stage): x of the first slot [meters].')
+    parser.add_argument('--park_y', type=float, default=-5.0, help='Parking area (off-stage): y of the first slot [meters].')
+    parser.add_argument('--park_z', type=float, default=0.1, help='Parking area (off-stage): z of the slots [meters].')
+    parser.add_argument('--state_ns', type=str, default='/ros2_grasp', help='Namespace of the gazebo_ros_state plugin.')
+
+    args, unknown = parser.parse_known_args()
+    random.seed(args.seed)
+
+    # Start node (simulation time) + fill the pool:
+    rclpy.init()
+    node = rclpy.create_node('part_feeder', parameter_overrides=[Parameter('use_sim_time', Parameter.Type.BOOL, True)])
+    POOL = PartPool(node, args.package, args.urdf, args.prefix, args.size, (args.park_x, args.park_y, args.park_z), 0.2, args.state_ns)
+    node.get_logger().info('FEEDER -> Spawning a pool of {} parts ({}/{})...'.format(args.size, args.package, args.urdf))
+    node.get_logger().info('FEEDER -> {}/{} parts ready. Waiting for the belt (CONVEYORSTATE)...'.format(POOL.FILL(), args.size))
+
+    FEEDER = PartFeeder(node, POOL, args)
+    try:
+        rclpy.spin(node)
+    except KeyboardInterrupt:
+        pass
+
+    FEEDER.Report(FINAL=True)
+    node.destroy_node()
+    rclpy.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) Gazebo-ROS2 Conveyor Belt Plugin. URL: https://github.com/IFRA-Cranfield/IFRA_ConveyorBelt.
+
+
+# PartPoolManager.py:
+# PART POOL MANAGER -> ROS2 interface of the PART POOL (partpool.py):
+#   - /PARTSPAWN (conveyorbelt_msgs/srv/PartSpawn): A parked part is teleported to (x, y, z, yaw) -> Returns its name.
+#   - /PARTREMOVE (conveyorbelt_msgs/srv/PartRemove): The part is teleported back off-stage, and returned to the pool.
+#   - /PARTPOOLSTATE (conveyorbelt_msgs/msg/PartPoolState): Pool usage metrics, published every --period seconds.
+#
+# EXAMPLE:
+#   ros2 run ros2_conveyorbelt PartPoolManager.py --package "conveyorbelt_gazebo" --urdf "box.urdf" --size 20
+#   ros2 service call /PARTSPAWN conveyorbelt_msgs/srv/PartSpawn "{x: 0.0, y: -0.5, z: 0.76, yaw: 0.0}"
+#   ros2 service call /PARTREMOVE conveyorbelt_msgs/srv/PartRemove "{name: 'part_0'}"
+
+# IMPORT LIBRARIES:
+import argparse
+import rclpy
+from conveyorbelt_msgs.msg import PartPoolState
+from conveyorbelt_msgs.srv import PartRemove
+from conveyorbelt_msgs.srv import PartSpawn
+from partpool import PartPool
+
+def main():
+    # Get input arguments from user
+    parser = argparse.ArgumentParser(description='Part pool: pre-spawned parts, teleported in/out of the scene.')
+    parser.add_argument('--package', type=str, default='conveyorbelt_gazebo', help='Package where URDF/XACRO file is located.')
+    parser.add_argument('--urdf', type=str, default='box.urdf', help='URDF of the part.')
+    parser.add_argument('--prefix', type=str, default='part', help='Name prefix of the parts -> <prefix>_<i>.')
+    parser.add_argument('--size', type=int, default=20, help='Number of parts in the pool.')
+    parser.add_argument('--park_x', type=float, default=0.0, help='Parking area (off-stage): x of the first slot [meters].')
+    parser.add_argument('--park_y', type=float, default=-5.0, help='Parking area (off-stage): y of the first slot [meters].')
+    parser.add_argument('--park_z', type=float, default=0.1, help='Parking area (off-stage): z of the slots [meters].')
+    parser.add_argument('--spacing', type=float, default=0.2, help='Distance between parking slots [meters].')
+    parser.add_argument('--state_ns', type=str, default='/ros2_grasp', help='Namespace of the gazebo_ros_state plugin.')
+    parser.add_argument('--period', type=float, default=1.0, help='PARTPOOLSTATE publishing period [s].')
+
+    args, unknown = parser.parse_known_args()
+
+    # Start node + fill the pool:
+    rclpy.init()
+    node = rclpy.create_node('part_pool')
+    POOL = PartPool(node, args.package, args.urdf, args.prefix, args.size, (args.park_x, args.park_y, args.park_z), args.spacing, args.state_ns)
+    node.get_logger().info('PART POOL -> Spawning {} parts ({}/{})...'.format(args.size, args.package, args.urdf))
+    N = POOL.FILL()
+    node.get_logger().info('PART POOL -> {}/{} parts ready.'.format(N, args.size))
+
+    # Services + metrics:
+    def Spawn(request, response):
+        NAME = POOL.ACQUIRE(request.x, request.y, request.z, request.yaw)
+        response.success = NAME is not None
+        response.name = NAME if NAME is not None else ''
+        return response
+
+    def Remove(request, response):
+        response.success = POOL.RELEASE(request.name)
+        return response
+
+    publisher = node.create_publisher(PartPoolState, 'PARTPOOLSTATE', 10)
+    def Publish():
+        publisher.publish(PartPoolState(**POOL.STATS()))
+
+    node.create_service(PartSpawn, 'PARTSPAWN', Spawn)
+    node.create_service(PartRemove, 'PARTREMOVE', Remove)
+    node.create_timer(args.period, Publish)
+
+    try:
+        rclpy.spin(node)
+    except KeyboardInterrupt:
+        pass
+
+    node.get_logger().info('PART POOL -> {}'.format(POOL.STATS()))
+    node.destroy_node()
+    rclpy.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -34,17 +34,91 @@
 
 # IMPORT LIBRARIES:
 import argparse
+import json
 import os
-import xacro
+import time
+import yaml
 from ament_index_python.packages import get_package_share_directory
 from gazebo_msgs.srv import SpawnEntity
 import rclpy
+from xacrocache import ProcessXacro
 
 # Reference to SPAWN OBJECT (.urdf or .xacro file) from the terminal shell:
 # REFERENCE: ros2 run ros2_conveyorbelt SpawnObject.py --package "{}" --urdf "{}.urdf" --name "{}" --x {} --y {} --z {}
 # EXAMPLE: BOX -> ros2 run ros2_conveyorbelt SpawnObject.py --package "conveyorbelt_gazebo" --urdf "box.urdf" --name "box" --x 0.0 --y -0.5 --z 0.76
 
 
+# BATCH MODE -> All the objects of a MANIFEST (.yaml or .json) are spawned from a single node, with concurrent /spawn_entity calls:
+# EXAMPLE: ros2 run ros2_conveyorbelt SpawnObject.py --manifest "objects.yaml"
+#   objects.yaml -> objects:
+#                     - {package: "conveyorbelt_gazebo", urdf: "box.urdf", name: "box1", x: 0.0, y: -0.5, z: 0.76}
+#                     - {name: "box2", x: 0.0, y: -0.3, z: 0.76}   # package/urdf -> --package/--urdf arguments.
+# Every .urdf/.xacro file is processed only once per batch (and reused from the XACRO CACHE, xacrocache.py, if unchanged).
+
+def LoadManifest(path, args):
+    with open(path) as f:
+        data = json.load(f) if path.endswith('.json') else yaml.safe_load(f)
+    if isinstance(data, dict):
+        data = data['objects']
+    objects = []
+    for i, obj in enumerate(data):
+        objects.append({
+            'package': obj.get('package', args.package),
+            'urdf': obj.get('urdf', args.urdf),
+            'name': obj.get('name', args.name + '_' + str(i)),
+            'namespace': obj.get('namespace', ''),
+            'x': float(obj.get('x', 0.0)),
+            'y': float(obj.get('y', 0.0)),
+            'z': float(obj.get('z', 0.0)),
+        })
+    return objects
+
+def SpawnBatch(node, client, objects, timeout):
+    # 1. Process every (package, urdf) source once:
+    t0 = time.monotonic()
+    XML = {}
+    for obj in objects:
+        key = (obj['package'], obj['urdf'])
+        if key not in XML:
+            XML[key] = ProcessXacro(os.path.join(get_package_share_directory(obj['package']), 'urdf', obj['urdf']), log=node.get_logger().info)
+    t_xacro = time.monotonic() - t0
+
+    # 2. Send all the requests at once -> The response time of every object is stored by a done-callback:
+    t0 = time.monotonic()
+    T_DONE = {}
+    futures = []
+    for obj in objects:
+        request = SpawnEntity.Request()
+        request.name = obj['name']
+        request.xml = XML[(obj['package'], obj['urdf'])]
+        request.namespace = obj['namespace']
+        request.initial_pose.position.x = obj['x']
+        request.initial_pose.position.y = obj['y']
+        request.initial_pose.position.z = obj['z']
+        future = client.call_async(request)
+        future.add_done_callback(lambda f, name=obj['name']: T_DONE.setdefault(name, time.monotonic()))
+        futures.append(future)
+
+    # 3. Spin until every response has arrived (or TIMEOUT):
+    while rclpy.ok() and not all(f.done() for f in futures) and (time.monotonic() - t0) < timeout:
+        rclpy.spin_once(node, timeout_sec=0.1)
+    t_total = time.monotonic() - t0
+
+    # 4. Report -> Per-object + total spawn time:
+    ok = 0
+    for obj, future in zip(objects, futures):
+        if not future.done():
+            node.get_logger().info('`{}` -> TIMEOUT'.format(obj['name']))
+            continue
+        result = future.result()
+        ok = ok + (1 if (result is not None and result.success) else 0)
+        node.get_logger().info('`{}` -> {} ({:.3f}s): {}'.format(
+            obj['name'], 'OK' if (result is not None and result.success) else 'ERROR', T_DONE[obj['name']] - t0,
+            result.status_message if result is not None else future.exception()))
+    node.get_logger().info('BATCH SPAWN -> {}/{} objects in {:.3f}s ({:.1f} objects/s), xacro: {} file(s) in {:.3f}s.'.format(
+        ok, len(objects), t_total, len(objects) / t_total if t_total > 0 else 0.0, len(XML), t_xacro))
+    return [f.result() if f.done() else None for f in futures]
+
 def main():
     # Get input arguments from user
     parser = argparse.ArgumentParser(description='Spawn object into our Gazebo world.')
@@ -56,6 +130,8 @@ def main():
     parser.add_argument('--x', type=float, default=0.0, help='the x component of the initial position [meters].')
     parser.add_argument('--y', type=float, default=0.0, help='the y component of the initial position [meters].')
     parser.add_argument('--z', type=float, default=0.0, help='the z component of the initial position [meters].')
+    parser.add_argument('--manifest', type=str, default='', help='BATCH MODE: .yaml/.json file with the objects (package, urdf, name, x, y, z) to spawn.')
+    parser.add_argument('--timeout', type=float, default=60.0, help='BATCH MODE: Max. waiting time for all the responses [s].')
     
     args, unknown = parser.parse_known_args()
 
@@ -72,13 +148,19 @@ def main():
         client.wait_for_service()
         node.get_logger().info('...connected!')
 
+    # BATCH MODE:
+    if args.manifest != '':
+        SpawnBatch(node, client, LoadManifest(args.manifest, args), args.timeout)
+        node.destroy_node()
+        rclpy.shutdown()
+        return
+
     # Set data for request:
     request = SpawnEntity.Request()
     request.name = args.name
 
     urdf_file_path = os.path.join(get_package_share_directory(args.package), 'urdf', args.urdf) # It is assumed that the .urdf/.xacro file is located in /urdf folder!
-    xacro_file = xacro.process_file(urdf_file_path)
-    request.xml = xacro_file.toxml() 
+    request.xml = ProcessXacro(urdf_file_path, log=node.get_logger().info)
 
     request.initial_pose.position.x = float(args.x)
     request.initial_pose.position.y = float(args.y)
@@ -0,0 +1,167 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) Gazebo-ROS2 Conveyor Belt Plugin. URL: https://github.com/IFRA-Cranfield/IFRA_ConveyorBelt.
+
+
+# partpool.py:
+# PART POOL -> Repeated part feeding without spawning a new Gazebo entity per part:
+#   - FILL: SIZE instances of the part (.urdf/.xacro) are spawned ONCE, off-stage, in a grid of parking slots (SpawnObject.py batch).
+#   - ACQUIRE: A free instance is teleported to the requested pose (set_entity_state, zero velocity) -> O(1), no model insertion.
+#   - RELEASE: The instance is teleported back to its parking slot, and returned to the pool.
+# The set_entity_state calls are asynchronous: ACQUIRE/RELEASE return immediately, and the responses (latency, errors) are
+# processed by the executor of the node.
+# REQUIREMENT: gazebo_ros_state plugin in the Gazebo world (/ros2_grasp namespace -> /ros2_grasp/set_entity_state).
+#
+# USAGE (inside a node):
+#   POOL = PartPool(node, "conveyorbelt_gazebo", "box.urdf", SIZE=20)
+#   POOL.FILL()
+#   NAME = POOL.ACQUIRE(0.0, -0.5, 0.76)     # None if the pool is empty.
+#   POOL.RELEASE(NAME)
+#   POOL.STATS()
+
+# IMPORT LIBRARIES:
+import math
+import time
+from collections import deque
+from gazebo_msgs.msg import EntityState
+from gazebo_msgs.srv import SetEntityState
+from gazebo_msgs.srv import SpawnEntity
+import rclpy
+from SpawnObject import SpawnBatch
+
+class PartPool():
+
+    def __init__(self, node, PACKAGE, URDF, PREFIX='part', SIZE=20, PARK=(0.0, -5.0, 0.1), SPACING=0.2, STATE_NS='/ros2_grasp'):
+        self.node = node
+        self.PACKAGE = PACKAGE
+        self.URDF = URDF
+        self.PARK = PARK
+        self.SPACING = SPACING
+        self.NAMES = [PREFIX + '_' + str(i) for i in range(SIZE)]
+        self.SLOT = {NAME: i for i, NAME in enumerate(self.NAMES)}
+        self.FREE = deque()
+        self.USED = set()
+
+        self.SPAWN_CLIENT = node.create_client(SpawnEntity, '/spawn_entity')
+        self.STATE_CLIENT = node.create_client(SetEntityState, STATE_NS + '/set_entity_state')
+
+        # METRICS:
+        self.PEAK = 0
+        self.ACQUIRED = 0
+        self.RELEASED = 0
+        self.MISSES = 0
+        self.ERRORS = 0
+        self.N_LATENCY = 0
+        self.LATENCY_SUM = 0.0
+        self.LATENCY_MAX = 0.0
+
+    # Parking slot i -> Grid of 10 columns, off-stage:
+    def ParkPose(self, i):
+        return (self.PARK[0] + (i % 10) * self.SPACING, self.PARK[1] - (i // 10) * self.SPACING, self.PARK[2])
+
+    # Spawn every instance at its parking slot. Instances that already exist (e.g. previous run of the manager) are reused:
+    def FILL(self, TIMEOUT=60.0):
+        self.SPAWN_CLIENT.wait_for_service()
+        self.STATE_CLIENT.wait_for_service()
+        objects = []
+        for i, NAME in enumerate(self.NAMES):
+            x, y, z = self.ParkPose(i)
+            objects.append({'package': self.PACKAGE, 'urdf': self.URDF, 'name': NAME, 'namespace': '', 'x': x, 'y': y, 'z': z})
+        results = SpawnBatch(self.node, self.SPAWN_CLIENT, objects, TIMEOUT)
+
+        self.FREE.clear()
+        self.USED.clear()
+        for NAME, result in zip(self.NAMES, results):
+            if result is None:
+                continue
+            if result.success:
+                self.FREE.append(NAME)
+            elif 'already exists' in result.status_message:
+                self.FREE.append(NAME)
+                self.Teleport(NAME, *self.ParkPose(self.SLOT[NAME]))
+        return len(self.FREE)
+
+    def Teleport(self, NAME, x, y, z, yaw=0.0):
+        request = SetEntityState.Request()
+        request.state = EntityState()
+        request.state.name = NAME
+        request.state.reference_frame = 'world'
+        request.state.pose.position.x = float(x)
+        request.state.pose.position.y = float(y)
+        request.state.pose.position.z = float(z)
+        request.state.pose.orientation.z = math.sin(yaw / 2.0)
+        request.state.pose.orientation.w = math.cos(yaw / 2.0)
+        t0 = time.monotonic()
+        future = self.STATE_CLIENT.call_async(request)
+        future.add_done_callback(lambda f: self.Response(f, t0))
+
+    def Response(self, future, t0):
+        DT = time.monotonic() - t0
+        self.N_LATENCY = self.N_LATENCY + 1
+        self.LATENCY_SUM = self.LATENCY_SUM + DT
+        self.LATENCY_MAX = max(self.LATENCY_MAX, DT)
+        result = future.result()
+        if result is None or not result.success:
+            self.ERRORS = self.ERRORS + 1
+
+    # Free instance -> Pose (x, y, z, yaw). Returns the name of the part, or None if the pool is empty:
+    def ACQUIRE(self, x, y, z, yaw=0.0):
+        if len(self.FREE) == 0:
+            self.MISSES = self.MISSES + 1
+            return None
+        NAME = self.FREE.popleft()
+        self.USED.add(NAME)
+        self.Teleport(NAME, x, y, z, yaw)
+        self.ACQUIRED = self.ACQUIRED + 1
+        self.PEAK = max(self.PEAK, len(self.USED))
+        return NAME
+
+    # Part -> Parking slot + pool:
+    def RELEASE(self, NAME):
+        if NAME not in self.USED:
+            return False
+        self.USED.remove(NAME)
+        self.Teleport(NAME, *self.ParkPose(self.SLOT[NAME]))
+        self.FREE.append(NAME)
+        self.RELEASED = self.RELEASED + 1
+        return True
+
+    def STATS(self):
+        return {
+            'size': len(self.FREE) + len(self.USED),
+            'in_use': len(self.USED),
+            'free': len(self.FREE),
+            'peak': self.PEAK,
+            'acquired': self.ACQUIRED,
+            'released': self.RELEASED,
+            'misses': self.MISSES,
+            'errors': self.ERRORS,
+            'latency_mean': self.LATENCY_SUM / self.N_LATENCY if self.N_LATENCY > 0 else 0.0,
+            'latency_max': self.LATENCY_MAX,
+        }
@@ -32,7 +32,10 @@
 #define GAZEBO_LINK_ATTACHER_HPP_
 
 #include <gazebo/common/Plugin.hh>
+#include <functional>
 #include <memory>
+#include <string>
+#include <unordered_map>
 
 struct JointSTRUCT
 {
@@ -47,6 +50,35 @@ struct JointSTRUCT
   gazebo::physics::JointPtr joint;
 };
 
+// JointKEY: Identifies an attachment -> {MODEL , LINK} -- {MODEL , LINK}.
+// The order of the two {MODEL , LINK} endpoints does not matter: {A , a} -- {B , b} and {B , b} -- {A , a} are the same attachment
+// (only one joint can be created between two links).
+struct JointKEY
+{
+  std::string model1;
+  std::string link1;
+  std::string model2;
+  std::string link2;
+
+  bool operator==(const JointKEY & other) const
+  {
+    return ((model1 == other.model1) && (link1 == other.link1) && (model2 == other.model2) && (link2 == other.link2)) ||
+           ((model1 == other.model2) && (link1 == other.link2) && (model2 == other.model1) && (link2 == other.link1));
+  }
+};
+
+struct JointKEYHash
+{
+  std::size_t operator()(const JointKEY & key) const
+  {
+    // Symmetric -> Hash of each endpoint, combined with a commutative operation:
+    std::hash<std::string> h;
+    std::size_t h1 = h(key.model1) ^ (h(key.link1) + 0x9e3779b9 + (h(key.model1) << 6) + (h(key.model1) >> 2));
+    std::size_t h2 = h(key.model2) ^ (h(key.link2) + 0x9e3779b9 + (h(key.model2) << 6) + (h(key.model2) >> 2));
+    return h1 + h2;
+  }
+};
+
 namespace gazebo_ros
 {
 
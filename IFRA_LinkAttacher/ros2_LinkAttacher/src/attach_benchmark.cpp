@@ -0,0 +1,188 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) Gazebo-ROS2 Link Attacher. URL: https://github.com/IFRA-Cranfield/IFRA_LinkAttacher.
+*/
+
+// attach_benchmark.cpp:
+// LINKATTACHER BENCHMARK -> Latency of INDIVIDUAL (ATTACHLINK/DETACHLINK, one call per pair) vs. BATCHED (ATTACHLINKS/DETACHLINKS,
+// one call for all pairs) requests. Every cycle attaches all OBJECTS to {MODEL1 , LINK1} and detaches them again.
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <memory>
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include the ROS2 SERVICES:
+#include <linkattacher_msgs/msg/link_pair.hpp>
+#include <linkattacher_msgs/srv/attach_link.hpp>
+#include <linkattacher_msgs/srv/detach_link.hpp>
+#include <linkattacher_msgs/srv/attach_links.hpp>
+#include <linkattacher_msgs/srv/detach_links.hpp>
+
+template<typename ServiceT>
+bool Call(const rclcpp::Node::SharedPtr & node, const typename rclcpp::Client<ServiceT>::SharedPtr & client,
+          const typename ServiceT::Request::SharedPtr & request)
+{
+    auto result = client->async_send_request(request);
+    if (rclcpp::spin_until_future_complete(node, result) != rclcpp::FutureReturnCode::SUCCESS){
+        return false;
+    }
+    return result.get()->success;
+}
+
+void PrintResult(const rclcpp::Logger & logger, const std::string & NAME, std::vector<double> T, size_t PAIRS)
+{
+    std::sort(T.begin(), T.end());
+    double MEAN = 0.0;
+    for (double t : T){
+        MEAN = MEAN + t;
+    }
+    MEAN = MEAN / T.size();
+    double MEDIAN = T[T.size() / 2];
+    double P99 = T[(T.size() * 99) / 100];
+
+    RCLCPP_INFO(logger, "%s -> %zu cycles x %zu pairs | ATTACH+DETACH [ms] mean: %.2f, median: %.2f, p99: %.2f, max: %.2f (%.3f per pair)",
+                NAME.c_str(), T.size(), PAIRS, 1000.0 * MEAN, 1000.0 * MEDIAN, 1000.0 * P99, 1000.0 * T.back(), 1000.0 * MEAN / PAIRS);
+}
+
+// ===================================================================================== //
+// ======================================= MAIN ======================================== //
+// ===================================================================================== //
+
+int main(int argc, char ** argv)
+{
+    // Initialise MAIN NODE:
+    rclcpp::init(argc, argv);
+    auto const node = std::make_shared<rclcpp::Node>(
+        "linkattacher_benchmark", rclcpp::NodeOptions().automatically_declare_parameters_from_overrides(true));
+    auto const logger = node->get_logger();
+
+    // Obtain parameters:
+    std::string MODEL1 = "ur3";
+    std::string LINK1 = "EE_robotiq_2f85";
+    std::vector<std::string> OBJECTS;
+    std::string LINK2 = "box";
+    int N = 50;
+    node->get_parameter("MODEL1", MODEL1);
+    node->get_parameter("LINK1", LINK1);
+    node->get_parameter("OBJECTS", OBJECTS);
+    node->get_parameter("LINK2", LINK2);
+    node->get_parameter("N", N);
+
+    if (OBJECTS.empty() || N < 1){
+        RCLCPP_ERROR(logger, "At least one OBJECT (model name) and N >= 1 must be given.");
+        rclcpp::shutdown();
+        return 1;
+    }
+
+    // SERVICE CLIENTS:
+    auto ATTACH = node->create_client<linkattacher_msgs::srv::AttachLink>("ATTACHLINK");
+    auto DETACH = node->create_client<linkattacher_msgs::srv::DetachLink>("DETACHLINK");
+    auto ATTACH_BATCH = node->create_client<linkattacher_msgs::srv::AttachLinks>("ATTACHLINKS");
+    auto DETACH_BATCH = node->create_client<linkattacher_msgs::srv::DetachLinks>("DETACHLINKS");
+
+    if (!ATTACH->wait_for_service(std::chrono::seconds(10)) || !DETACH->wait_for_service(std::chrono::seconds(10)) ||
+        !ATTACH_BATCH->wait_for_service(std::chrono::seconds(10)) || !DETACH_BATCH->wait_for_service(std::chrono::seconds(10))){
+        RCLCPP_ERROR(logger, "The LinkAttacher services are not available (is the plugin loaded in the Gazebo world?).");
+        rclcpp::shutdown();
+        return 1;
+    }
+
+    // REQUESTS -> Built once, outside the measured loop:
+    std::vector<linkattacher_msgs::srv::AttachLink::Request::SharedPtr> A;
+    std::vector<linkattacher_msgs::srv::DetachLink::Request::SharedPtr> D;
+    auto AB = std::make_shared<linkattacher_msgs::srv::AttachLinks::Request>();
+    auto DB = std::make_shared<linkattacher_msgs::srv::DetachLinks::Request>();
+
+    for (const std::string & OBJECT : OBJECTS){
+        linkattacher_msgs::msg::LinkPair PAIR;
+        PAIR.model1_name = MODEL1;
+        PAIR.link1_name = LINK1;
+        PAIR.model2_name = OBJECT;
+        PAIR.link2_name = LINK2;
+        AB->pairs.push_back(PAIR);
+        DB->pairs.push_back(PAIR);
+
+        auto a = std::make_shared<linkattacher_msgs::srv::AttachLink::Request>();
+        a->model1_name = MODEL1;
+        a->link1_name = LINK1;
+        a->model2_name = OBJECT;
+        a->link2_name = LINK2;
+        A.push_back(a);
+
+        auto d = std::make_shared<linkattacher_msgs::srv::DetachLink::Request>();
+        d->model1_name = MODEL1;
+        d->link1_name = LINK1;
+        d->model2_name = OBJECT;
+        d->link2_name = LINK2;
+        D.push_back(d);
+    }
+
+    // BENCHMARK -> N cycles per mode:
+    RCLCPP_INFO(logger, "LINKATTACHER BENCHMARK -> {%s , %s} + %zu objects, %d cycles per mode.", MODEL1.c_str(), LINK1.c_str(), OBJECTS.size(), N);
+    std::vector<double> T_INDIVIDUAL, T_BATCHED;
+
+    for (int k = 0; k < N; k++){
+
+        // 1. INDIVIDUAL:
+        auto t0 = std::chrono::steady_clock::now();
+        bool OK = true;
+        for (const auto & a : A){
+            OK = Call<linkattacher_msgs::srv::AttachLink>(node, ATTACH, a) && OK;
+        }
+        for (const auto & d : D){
+            OK = Call<linkattacher_msgs::srv::DetachLink>(node, DETACH, d) && OK;
+        }
+        auto t1 = std::chrono::steady_clock::now();
+        T_INDIVIDUAL.push_back(std::chrono::duration<double>(t1 - t0).count());
+
+        // 2. BATCHED:
+        t0 = std::chrono::steady_clock::now();
+        OK = Call<linkattacher_msgs::srv::AttachLinks>(node, ATTACH_BATCH, AB) && OK;
+        OK = Call<linkattacher_msgs::srv::DetachLinks>(node, DETACH_BATCH, DB) && OK;
+        t1 = std::chrono::steady_clock::now();
+        T_BATCHED.push_back(std::chrono::duration<double>(t1 - t0).count());
+
+        if (!OK){
+            RCLCPP_ERROR(logger, "An attach/detach request failed (cycle %d), check the model and link names.", k);
+            rclcpp::shutdown();
+            return 1;
+        }
+    }
+
+    PrintResult(logger, "INDIVIDUAL (ATTACHLINK/DETACHLINK)  ", T_INDIVIDUAL, OBJECTS.size());
+    PrintResult(logger, "BATCHED    (ATTACHLINKS/DETACHLINKS)", T_BATCHED, OBJECTS.size());
+
+    rclcpp::shutdown();
+    return 0;
+}
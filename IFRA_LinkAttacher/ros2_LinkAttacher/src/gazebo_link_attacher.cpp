@@ -28,6 +28,7 @@
 # IFRA-Cranfield (2023) IFRA Gazebo-ROS2 Link Attacher. URL: https://github.com/IFRA-Cranfield/IFRA_LinkAttacher.
 */
 
+#include <gazebo/common/Events.hh>
 #include <gazebo/common/Plugin.hh>
 #include <gazebo/physics/Entity.hh>
 #include <gazebo/physics/Light.hh>
@@ -36,8 +37,18 @@
 #include <gazebo/physics/World.hh>
 #include <gazebo/physics/PhysicsEngine.hh>
 
+#include <boost/thread/recursive_mutex.hpp>
+
 #include <gazebo_ros/node.hpp>
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <deque>
 #include <memory>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <vector>
 
 #include "gazebo_ros/conversions/builtin_interfaces.hpp"
 #include "gazebo_ros/conversions/geometry_msgs.hpp"
@@ -45,18 +56,18 @@
 #include "ros2_linkattacher/gazebo_link_attacher.hpp"   // INCLUDE HADER FILE.
 #include <linkattacher_msgs/srv/attach_link.hpp>        // INCLUDE ROS2 SERVICE.
 #include <linkattacher_msgs/srv/detach_link.hpp>        // INCLUDE ROS2 SERVICE.
+#include <linkattacher_msgs/srv/attach_links.hpp>       // INCLUDE ROS2 SERVICE.
+#include <linkattacher_msgs/srv/detach_links.hpp>       // INCLUDE ROS2 SERVICE.
 
-// GLOBAL VARIABLE:
-std::vector<JointSTRUCT> GV_joints;
-JointSTRUCT GV_jointSTR;
-
-// IsAttached variable:
-// Gazebo breaks if -> An attachment request is done between 2 links, and the joint attachment has already been created and not removed!
-// Therefore, we have added this variable to make sure the attachment is only requested when the previous attachment has already been removed.
-bool IsAttached = false;
-
-// JointName:
-std::string JointName = "None";
+// OperationSTRUCT: Queued ATTACH/DETACH request (one or more pairs), applied from the world update thread.
+struct OperationSTRUCT
+{
+  bool attach;
+  std::vector<JointKEY> keys;
+  std::vector<bool> results;
+  std::vector<std::string> messages;
+  bool done = false;
+};
 
 namespace gazebo_ros
 {
@@ -75,6 +86,16 @@ public:
     linkattacher_msgs::srv::DetachLink::Request::SharedPtr _req,
     linkattacher_msgs::srv::DetachLink::Response::SharedPtr _res);
 
+  // ATTACH -> BATCH of link pairs (ROS2 service):
+  void AttachBatch(
+    linkattacher_msgs::srv::AttachLinks::Request::SharedPtr _req,
+    linkattacher_msgs::srv::AttachLinks::Response::SharedPtr _res);
+
+  // DETACH -> BATCH of link pairs (ROS2 service):
+  void DetachBatch(
+    linkattacher_msgs::srv::DetachLinks::Request::SharedPtr _req,
+    linkattacher_msgs::srv::DetachLinks::Response::SharedPtr _res);
+
   // World pointer from Gazebo.
   gazebo::physics::WorldPtr world_;
 
@@ -84,9 +105,56 @@ public:
   // ROS services to handle requests for attach/detach.
   rclcpp::Service<linkattacher_msgs::srv::AttachLink>::SharedPtr attach_link_service_;
   rclcpp::Service<linkattacher_msgs::srv::DetachLink>::SharedPtr detach_link_service_;
-
-  // getJoint function:
-  bool getJoint(std::string M1, std::string L1, std::string M2, std::string L2, JointSTRUCT &joint);
+  rclcpp::Service<linkattacher_msgs::srv::AttachLinks>::SharedPtr attach_links_service_;
+  rclcpp::Service<linkattacher_msgs::srv::DetachLinks>::SharedPtr detach_links_service_;
+
+  // ATTACHED JOINTS -> One entry per active attachment, removed when detaching.
+  // Gazebo breaks if -> An attachment request is done between 2 links, and the joint attachment has already been created and not removed!
+  // Therefore, a new attachment between 2 links is only created if the pair is not in this map.
+  std::unordered_map<JointKEY, JointSTRUCT, JointKEYHash> joints_;
+
+  // ATTACH/DETACH a single pair of links -> Must be called with the physics update mutex locked.
+  bool AttachPair(const JointKEY & key, std::string & message);
+  bool DetachPair(const JointKEY & key, std::string & message);
+
+  // OPERATION QUEUE -> The service callbacks do not touch the physics engine. Every request is queued, applied at the beginning of
+  // the next world update (OnWorldUpdateBegin, in the Gazebo world thread), and the service responds once it has been applied.
+  // If the simulation is PAUSED (no world updates), the request is applied directly by the service callback. If it has not been
+  // applied after timeout_ seconds (<timeout> element of the plugin, world not updating), it is removed from the queue and fails.
+  void Submit(const std::shared_ptr<OperationSTRUCT> & op);
+  void Apply(const std::shared_ptr<OperationSTRUCT> & op);
+  void Fail(const std::shared_ptr<OperationSTRUCT> & op, const std::string & message);
+  void OnWorldUpdateBegin();
+  void OnWorldUpdateEnd();
+
+  // SHUTDOWN (plugin destruction) -> Pending requests fail, and the waiting service callbacks are released:
+  void Shutdown();
+
+  std::deque<std::shared_ptr<OperationSTRUCT>> queue_;
+  std::mutex queue_mutex_;
+  std::condition_variable queue_cv_;
+  double timeout_ = 5.0;
+  int waiters_ = 0;
+  bool shutdown_ = false;
+
+  // Gazebo WORLD UPDATE events.
+  gazebo::event::ConnectionPtr update_begin_connection_;
+  gazebo::event::ConnectionPtr update_end_connection_;
+
+  // PHYSICS STEP TIME statistics (wall time from WorldUpdateBegin to WorldUpdateEnd), logged every stats_period_ seconds
+  // (<stats_period> element of the plugin, disabled if <= 0). Steps in which attach/detach operations were applied are
+  // reported separately, to measure the impact of the joint creation/removal on the physics step.
+  double stats_period_ = 0.0;
+  std::chrono::steady_clock::time_point step_begin_;
+  std::chrono::steady_clock::time_point stats_begin_;
+  bool step_ops_ = false;
+  int idle_n_ = 0;
+  double idle_sum_ = 0.0;
+  double idle_max_ = 0.0;
+  int ops_n_ = 0;
+  double ops_sum_ = 0.0;
+  double ops_max_ = 0.0;
+  int ops_pairs_ = 0;
 
 };
 
@@ -97,6 +165,7 @@ GazeboLinkAttacher::GazeboLinkAttacher()
 
 GazeboLinkAttacher::~GazeboLinkAttacher()
 {
+  impl_->Shutdown();
 }
 
 void GazeboLinkAttacher::Load(gazebo::physics::WorldPtr _world, sdf::ElementPtr _sdf)
@@ -108,6 +177,23 @@ void GazeboLinkAttacher::Load(gazebo::physics::WorldPtr _world, sdf::ElementPtr
   // ROS2 NODE:
   impl_->ros_node_ = gazebo_ros::Node::Get(_sdf);
 
+  // STEP TIME STATISTICS:
+  if (_sdf->HasElement("stats_period")) {
+    impl_->stats_period_ = _sdf->Get<double>("stats_period");
+  }
+  impl_->stats_begin_ = std::chrono::steady_clock::now();
+
+  // ATTACH/DETACH TIMEOUT [s]:
+  if (_sdf->HasElement("timeout")) {
+    impl_->timeout_ = _sdf->Get<double>("timeout");
+  }
+
+  // WORLD UPDATE EVENTS -> The queued ATTACH/DETACH operations are applied here:
+  impl_->update_begin_connection_ = gazebo::event::Events::ConnectWorldUpdateBegin(
+    std::bind(&GazeboLinkAttacherPrivate::OnWorldUpdateBegin, impl_.get()));
+  impl_->update_end_connection_ = gazebo::event::Events::ConnectWorldUpdateEnd(
+    std::bind(&GazeboLinkAttacherPrivate::OnWorldUpdateEnd, impl_.get()));
+
   // ROS2 SERVICE SERVERS:
   impl_->attach_link_service_ =
     impl_->ros_node_->create_service<linkattacher_msgs::srv::AttachLink>(
@@ -119,6 +205,16 @@ void GazeboLinkAttacher::Load(gazebo::physics::WorldPtr _world, sdf::ElementPtr
     "DETACHLINK", std::bind(
       &GazeboLinkAttacherPrivate::Detach, impl_.get(),
       std::placeholders::_1, std::placeholders::_2));
+  impl_->attach_links_service_ =
+    impl_->ros_node_->create_service<linkattacher_msgs::srv::AttachLinks>(
+    "ATTACHLINKS", std::bind(
+      &GazeboLinkAttacherPrivate::AttachBatch, impl_.get(),
+      std::placeholders::_1, std::placeholders::_2));
+  impl_->detach_links_service_ =
+    impl_->ros_node_->create_service<linkattacher_msgs::srv::DetachLinks>(
+    "DETACHLINKS", std::bind(
+      &GazeboLinkAttacherPrivate::DetachBatch, impl_.get(),
+      std::placeholders::_1, std::placeholders::_2));
 
 }
 
@@ -126,131 +222,303 @@ void GazeboLinkAttacherPrivate::Attach(
   linkattacher_msgs::srv::AttachLink::Request::SharedPtr _req,
   linkattacher_msgs::srv::AttachLink::Response::SharedPtr _res)
 {
+  auto op = std::make_shared<OperationSTRUCT>();
+  op->attach = true;
+  op->keys.push_back(JointKEY{_req->model1_name, _req->link1_name, _req->model2_name, _req->link2_name});
+  Submit(op);
+  _res->success = op->results[0];
+  _res->message = op->messages[0];
+}
 
-  // CHECK if -> Joint already exists in GV_joints:
-  /* THIS IS NO LONGER NEEDED, SINCE THE JOINT IS REMOVED AFTER DETACHING!
-  JointSTRUCT j;
-  if (this->getJoint(_req->model1_name, _req->link1_name, _req->model2_name, _req->link2_name, j)){
-    j.joint->Attach(j.l1, j.l2);
-    _res->success = true;
-    _res->message = "ATTACHED: {MODEL , LINK} -> {" + _req->model1_name + " , " + _req->link1_name + "} -- {" + _req->model2_name + " , " + _req->link2_name + "}.";
-    return;
-  }
-  */
+void GazeboLinkAttacherPrivate::Detach(
+  linkattacher_msgs::srv::DetachLink::Request::SharedPtr _req,
+  linkattacher_msgs::srv::DetachLink::Response::SharedPtr _res)
+{
+  auto op = std::make_shared<OperationSTRUCT>();
+  op->attach = false;
+  op->keys.push_back(JointKEY{_req->model1_name, _req->link1_name, _req->model2_name, _req->link2_name});
+  Submit(op);
+  _res->success = op->results[0];
+  _res->message = op->messages[0];
+}
 
-  // Get the first link:
-  gazebo::physics::ModelPtr model1 = world_->ModelByName(_req->model1_name);
-  if (!model1) {
-    _res->success = false;
-    _res->message = "Failed to find model with name: " + _req->model1_name;
-    return;
+void GazeboLinkAttacherPrivate::AttachBatch(
+  linkattacher_msgs::srv::AttachLinks::Request::SharedPtr _req,
+  linkattacher_msgs::srv::AttachLinks::Response::SharedPtr _res)
+{
+  // The whole batch is a single operation -> All joints are created in the same world update.
+  auto op = std::make_shared<OperationSTRUCT>();
+  op->attach = true;
+  for (const auto & pair : _req->pairs){
+    op->keys.push_back(JointKEY{pair.model1_name, pair.link1_name, pair.model2_name, pair.link2_name});
   }
-  gazebo::physics::LinkPtr link1 = model1->GetLink(_req->link1_name);
-  if (!link1) {
-    _res->success = false;
-    _res->message = "Failed to find link with name: " + _req->link1_name;
-    return;
+  Submit(op);
+
+  _res->success = std::all_of(op->results.begin(), op->results.end(), [](bool r) {return r;});
+  _res->results = op->results;
+  _res->messages = op->messages;
+}
+
+void GazeboLinkAttacherPrivate::DetachBatch(
+  linkattacher_msgs::srv::DetachLinks::Request::SharedPtr _req,
+  linkattacher_msgs::srv::DetachLinks::Response::SharedPtr _res)
+{
+  auto op = std::make_shared<OperationSTRUCT>();
+  op->attach = false;
+  for (const auto & pair : _req->pairs){
+    op->keys.push_back(JointKEY{pair.model1_name, pair.link1_name, pair.model2_name, pair.link2_name});
   }
+  Submit(op);
 
-  // Get the second link:
-  gazebo::physics::ModelPtr model2 = world_->ModelByName(_req->model2_name);
-  if (!model2) {
-    _res->success = false;
-    _res->message = "Failed to find model with name: " + _req->model2_name;
+  _res->success = std::all_of(op->results.begin(), op->results.end(), [](bool r) {return r;});
+  _res->results = op->results;
+  _res->messages = op->messages;
+}
+
+void GazeboLinkAttacherPrivate::Submit(const std::shared_ptr<OperationSTRUCT> & op)
+{
+  std::unique_lock<std::mutex> lock(queue_mutex_);
+  if (shutdown_) {
+    Fail(op, "LinkAttacher plugin is shutting down, request not applied.");
     return;
   }
-  gazebo::physics::LinkPtr link2 = model2->GetLink(_req->link2_name);
-  if (!link2) {
-    _res->success = false;
-    _res->message = "Failed to find link with name: " + _req->link2_name;
+
+  // PAUSED -> No world update will apply the operation, apply it here:
+  if (world_->IsPaused()) {
+    lock.unlock();
+    Apply(op);
     return;
   }
 
-  if (IsAttached == true){
+  waiters_++;
+  queue_.push_back(op);
+  const auto DEADLINE = std::chrono::steady_clock::now() + std::chrono::duration<double>(timeout_);
 
-    _res->success = false;
-    _res->message = "Both links have already been attached, aborting new attachment.";
+  while (!op->done) {
+    queue_cv_.wait_for(lock, std::chrono::milliseconds(10));
+    if (op->done) {
+      break;
+    }
 
-  } else {
+    // Not in the queue anymore -> Being applied by the world update thread:
+    auto it = std::find(queue_.begin(), queue_.end(), op);
+    if (it == queue_.end()) {
+      continue;
+    }
 
-    // Create a fixed joint between the two links:
-    JointName = _req->model1_name + "_" + _req->link1_name + "_" + _req->model2_name + "_" + _req->link2_name + "_joint";
-    gazebo::physics::JointPtr joint = model1->CreateJoint(JointName, "revolute", link1, link2);
-    joint->Attach(link1, link2);
-    joint->Load(link1, link2, ignition::math::Pose3d());
-    joint->SetProvideFeedback(true);
-    
-    joint->SetAxis(0, ignition::math::Vector3d(1, 0, 0));
-    joint->SetUpperLimit(0, 0);
-    joint->SetLowerLimit(0, 0);
-    joint->SetEffortLimit(0, 0);
-    joint->SetDamping(1, 1.0);
-
-    joint->Init();
-    model1->Update();
-
-    GV_jointSTR.model1 = _req->model1_name;
-    GV_jointSTR.model2 = _req->model2_name;
-    GV_jointSTR.link1 = _req->link1_name;
-    GV_jointSTR.link2 = _req->link2_name;
-    GV_jointSTR.m1 = model1;
-    GV_jointSTR.m2 = model2;
-    GV_jointSTR.l1 = link1;
-    GV_jointSTR.l2 = link2;
-    GV_jointSTR.joint = joint;
-    
-    GV_joints.push_back(GV_jointSTR);
-
-    // Set the success and message in the response:
-    _res->success = true;
-    _res->message = "ATTACHED: {MODEL , LINK} -> {" + _req->model1_name + " , " + _req->link1_name + "} -- {" + _req->model2_name + " , " + _req->link2_name + "}.";
-
-    IsAttached = true;
+    if (world_->IsPaused()) {
+      queue_.erase(it);
+      lock.unlock();
+      Apply(op);
+      lock.lock();
+      op->done = true;
+    } else if (std::chrono::steady_clock::now() >= DEADLINE) {
+      queue_.erase(it);
+      Fail(op, "TIMEOUT: The Gazebo world has not been updated in " + std::to_string(timeout_) + "s, request not applied.");
+      op->done = true;
+    }
+  }
+
+  waiters_--;
+  queue_cv_.notify_all();
+}
 
+void GazeboLinkAttacherPrivate::Fail(const std::shared_ptr<OperationSTRUCT> & op, const std::string & message)
+{
+  op->results.assign(op->keys.size(), false);
+  op->messages.assign(op->keys.size(), message);
+}
+
+void GazeboLinkAttacherPrivate::Shutdown()
+{
+  // 1. No more world updates -> Nothing is applied from now on:
+  update_begin_connection_.reset();
+  update_end_connection_.reset();
+
+  // 2. Pending operations fail, and the waiting service callbacks return before the queue is destroyed:
+  std::unique_lock<std::mutex> lock(queue_mutex_);
+  shutdown_ = true;
+  for (const auto & op : queue_){
+    Fail(op, "LinkAttacher plugin is shutting down, request not applied.");
+    op->done = true;
   }
+  queue_.clear();
+  queue_cv_.notify_all();
+  queue_cv_.wait_for(lock, std::chrono::duration<double>(timeout_), [this]() {return waiters_ == 0;});
+}
 
+void GazeboLinkAttacherPrivate::Apply(const std::shared_ptr<OperationSTRUCT> & op)
+{
+  boost::recursive_mutex::scoped_lock lock(*world_->Physics()->GetPhysicsUpdateMutex());
+  for (const JointKEY & key : op->keys){
+    std::string message;
+    bool result = op->attach ? AttachPair(key, message) : DetachPair(key, message);
+    op->results.push_back(result);
+    op->messages.push_back(message);
+  }
 }
 
-void GazeboLinkAttacherPrivate::Detach(
-  linkattacher_msgs::srv::DetachLink::Request::SharedPtr _req,
-  linkattacher_msgs::srv::DetachLink::Response::SharedPtr _res)
+void GazeboLinkAttacherPrivate::OnWorldUpdateBegin()
 {
+  step_begin_ = std::chrono::steady_clock::now();
+  step_ops_ = false;
 
-  // CHECK if -> Joint already exists in GV_joints:
-  JointSTRUCT j;
-  if (this->getJoint(_req->model1_name, _req->link1_name, _req->model2_name, _req->link2_name, j)){
-    j.joint->Detach();
-    _res->success = true;
-    _res->message = "DETACHED: {MODEL , LINK} -> {" + _req->model1_name + " , " + _req->link1_name + "} -- {" + _req->model2_name + " , " + _req->link2_name + "}.";
-    
-    // (+) Remove joint --> This fixes the following problem: If the object to be attached is removed and spawned again, 
-    // gazebo breaks when attaching it again, since the joint already existed. Joint must be REMOVED when detaching.
-    gazebo::physics::ModelPtr model1 = world_->ModelByName(_req->model1_name);
-    model1->RemoveJoint(JointName);
-
-    IsAttached = false;
-    
+  std::deque<std::shared_ptr<OperationSTRUCT>> ops;
+  {
+    std::lock_guard<std::mutex> lock(queue_mutex_);
+    if (queue_.empty()) {
+      return;
+    }
+    ops.swap(queue_);
+  }
+
+  for (const auto & op : ops){
+    Apply(op);
+    ops_pairs_ += static_cast<int>(op->keys.size());
+  }
+  step_ops_ = true;
+
+  {
+    std::lock_guard<std::mutex> lock(queue_mutex_);
+    for (const auto & op : ops){
+      op->done = true;
+    }
+  }
+  queue_cv_.notify_all();
+}
+
+void GazeboLinkAttacherPrivate::OnWorldUpdateEnd()
+{
+  if (stats_period_ <= 0.0) {
     return;
+  }
+
+  auto now = std::chrono::steady_clock::now();
+  double dt = std::chrono::duration<double>(now - step_begin_).count();
+  if (step_ops_) {
+    ops_n_++;
+    ops_sum_ += dt;
+    ops_max_ = std::max(ops_max_, dt);
   } else {
-    _res->success = false;
-    _res->message = "DETACHED -- ERROR (Joint does not exist!): {MODEL , LINK} -> {" + _req->model1_name + " , " + _req->link1_name + "} -- {" + _req->model2_name + " , " + _req->link2_name + "}.";
+    idle_n_++;
+    idle_sum_ += dt;
+    idle_max_ = std::max(idle_max_, dt);
   }
 
+  if (std::chrono::duration<double>(now - stats_begin_).count() < stats_period_) {
+    return;
+  }
+
+  RCLCPP_INFO(
+    ros_node_->get_logger(),
+    "PHYSICS STEP [ms] -> %d steps without attach/detach: mean %.3f, max %.3f | %d steps with attach/detach (%d pairs): mean %.3f, max %.3f | %zu active joints.",
+    idle_n_, (idle_n_ > 0) ? 1000.0 * idle_sum_ / idle_n_ : 0.0, 1000.0 * idle_max_,
+    ops_n_, ops_pairs_, (ops_n_ > 0) ? 1000.0 * ops_sum_ / ops_n_ : 0.0, 1000.0 * ops_max_, joints_.size());
+
+  idle_n_ = 0;
+  idle_sum_ = 0.0;
+  idle_max_ = 0.0;
+  ops_n_ = 0;
+  ops_sum_ = 0.0;
+  ops_max_ = 0.0;
+  ops_pairs_ = 0;
+  stats_begin_ = now;
 }
 
-bool GazeboLinkAttacherPrivate::getJoint(std::string M1, std::string L1, std::string M2, std::string L2, JointSTRUCT &joint)
-  {
-    JointSTRUCT j;
-    for(std::vector<JointSTRUCT>::iterator it = GV_joints.begin(); it != GV_joints.end(); ++it){
-      j = *it;
-      if ((j.model1.compare(M1) == 0) && (j.model2.compare(M2) == 0) && (j.link1.compare(L1) == 0) && (j.link2.compare(L2) == 0)){
-        joint = j;
-        return true;
-      }
-    }
+bool GazeboLinkAttacherPrivate::AttachPair(const JointKEY & key, std::string & message)
+{
+
+  // Get the first link:
+  gazebo::physics::ModelPtr model1 = world_->ModelByName(key.model1);
+  if (!model1) {
+    message = "Failed to find model with name: " + key.model1;
+    return false;
+  }
+  gazebo::physics::LinkPtr link1 = model1->GetLink(key.link1);
+  if (!link1) {
+    message = "Failed to find link with name: " + key.link1;
+    return false;
+  }
+
+  // Get the second link:
+  gazebo::physics::ModelPtr model2 = world_->ModelByName(key.model2);
+  if (!model2) {
+    message = "Failed to find model with name: " + key.model2;
+    return false;
+  }
+  gazebo::physics::LinkPtr link2 = model2->GetLink(key.link2);
+  if (!link2) {
+    message = "Failed to find link with name: " + key.link2;
+    return false;
+  }
+
+  if (joints_.count(key) > 0){
+    message = "Both links have already been attached, aborting new attachment.";
     return false;
   }
 
+  // Create a fixed joint between the two links:
+  std::string JointName = key.model1 + "_" + key.link1 + "_" + key.model2 + "_" + key.link2 + "_joint";
+  gazebo::physics::JointPtr joint = model1->CreateJoint(JointName, "revolute", link1, link2);
+  joint->Attach(link1, link2);
+  joint->Load(link1, link2, ignition::math::Pose3d());
+  joint->SetProvideFeedback(true);
+  
+  joint->SetAxis(0, ignition::math::Vector3d(1, 0, 0));
+  joint->SetUpperLimit(0, 0);
+  joint->SetLowerLimit(0, 0);
+  joint->SetEffortLimit(0, 0);
+  joint->SetDamping(1, 1.0);
+
+  joint->Init();
+  model1->Update();
+
+  JointSTRUCT j;
+  j.model1 = key.model1;
+  j.model2 = key.model2;
+  j.link1 = key.link1;
+  j.link2 = key.link2;
+  j.m1 = model1;
+  j.m2 = model2;
+  j.l1 = link1;
+  j.l2 = link2;
+  j.joint = joint;
+  
+  joints_.emplace(key, j);
+
+  message = "ATTACHED: {MODEL , LINK} -> {" + key.model1 + " , " + key.link1 + "} -- {" + key.model2 + " , " + key.link2 + "}.";
+  return true;
+
+}
+
+bool GazeboLinkAttacherPrivate::DetachPair(const JointKEY & key, std::string & message)
+{
+
+  // CHECK if -> Joint exists in joints_:
+  auto it = joints_.find(key);
+  if (it == joints_.end()){
+    message = "DETACHED -- ERROR (Joint does not exist!): {MODEL , LINK} -> {" + key.model1 + " , " + key.link1 + "} -- {" + key.model2 + " , " + key.link2 + "}.";
+    return false;
+  }
+
+  JointSTRUCT & j = it->second;
+  j.joint->Detach();
+  
+  // (+) Remove joint --> This fixes the following problem: If the object to be attached is removed and spawned again, 
+  // gazebo breaks when attaching it again, since the joint already existed. Joint must be REMOVED when detaching.
+  // The joint belongs to the first model of the ATTACH request (the DETACH request may give the links in the opposite order):
+  gazebo::physics::ModelPtr model1 = world_->ModelByName(j.model1);
+  if (model1) {
+    model1->RemoveJoint(j.joint->GetName());
+  }
+
+  joints_.erase(it);
+
+  message = "DETACHED: {MODEL , LINK} -> {" + key.model1 + " , " + key.link1 + "} -- {" + key.model2 + " , " + key.link2 + "}.";
+  return true;
+
+}
+
 GZ_REGISTER_WORLD_PLUGIN(GazeboLinkAttacher)
 
 }  // namespace gazebo_ros
\ No newline at end of file
@@ -0,0 +1,105 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef DIRECTEXEC_H
+#define DIRECTEXEC_H
+
+// Include standard libraries:
+#include <atomic>
+#include <mutex>
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+#include "rclcpp_action/rclcpp_action.hpp"
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+
+// Include the ROS2 ACTIONS:
+#include <control_msgs/action/follow_joint_trajectory.hpp>
+#include <control_msgs/action/gripper_command.hpp>
+
+struct DirectSTRUCT {
+  std::string RES;        // "EXECUTION: OK", "EXECUTION: ERROR", "VALIDATION: ERROR (...)".
+  double T_CALL;          // [s] Wall time of the execute call.
+  double DURATION;        // [s] Trajectory duration.
+};
+
+// DIRECT EXECUTION BACKEND -> Bypasses the move_group trajectory execution manager:
+// The controllers are read ONCE from move_group (moveit_simple_controller_manager parameters: controller names, action_ns, type and
+// joints) together with the trajectory_execution tolerances. Every trajectory is validated (known joints, increasing time stamps,
+// start within allowed_start_tolerance of the measured state), split per controller and sent directly:
+//   - FollowJointTrajectory controllers (ur_controller) -> The sub-trajectory of their joints.
+//   - GripperCommand controllers (Robotiq joints) -> The last position of their (first) joint.
+// The execution is monitored with the same time limit as move_group (duration * allowed_execution_duration_scaling +
+// allowed_goal_duration_margin), and all the goals are canceled if it is exceeded. Every EXECUTE() call has its own goals and cancel
+// state, so that concurrent calls (early hand-off) do not interfere: a new goal preempts the previous one in the controller, and STOP()
+// cancels every call that was started before it.
+class DirectExecutor
+{
+public:
+    DirectExecutor();
+
+    bool CONFIGURE(const rclcpp::Node::SharedPtr & node, const std::string & SERVER = "/move_group");
+    bool ACTIVE() const;
+
+    DirectSTRUCT EXECUTE(moveit::planning_interface::MoveGroupInterface & MGI, const moveit::planning_interface::MoveGroupInterface::Plan & PLAN);
+    void STOP();
+
+    // EXECUTE-CALL OVERHEAD (wall time - trajectory duration) statistics:
+    std::string STATS();
+
+private:
+    using FJT = control_msgs::action::FollowJointTrajectory;
+    using GC = control_msgs::action::GripperCommand;
+
+    struct Controller {
+        std::string NAME;
+        std::string TYPE;
+        std::vector<std::string> JOINTS;
+        rclcpp_action::Client<FJT>::SharedPtr FJT_CLIENT;
+        rclcpp_action::Client<GC>::SharedPtr GC_CLIENT;
+    };
+
+    std::vector<Controller> CONTROLLERS_;
+    double SCALING_;
+    double MARGIN_;
+    double START_TOL_;
+    std::atomic<unsigned long> STOP_ID_;   // Incremented by STOP(), compared against the value at the start of each EXECUTE().
+
+    int N_;
+    double OVERHEAD_SUM_;
+    double OVERHEAD_MAX_;
+    std::mutex MUTEX_;
+};
+
+#endif /* DIRECTEXEC_H */
@@ -0,0 +1,112 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef GRIPCMD_H
+#define GRIPCMD_H
+
+// Include standard libraries:
+#include <atomic>
+#include <mutex>
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+#include "rclcpp_action/rclcpp_action.hpp"
+
+// Include the ROBOT/END-EFFECTOR REGISTRY:
+#include "ros2srrc_execution/robotregistry.h"
+
+// Include the ROS2 ACTIONS/MESSAGES:
+#include <control_msgs/action/gripper_command.hpp>
+#include <sensor_msgs/msg/joint_state.hpp>
+
+struct GripSTRUCT {
+  std::string RES;        // "GRIPPER: OK", "GRIPPER: ERROR (...)".
+  std::string STATE;      // "REACHED" (target within tolerance), "STALLED" (fingers stopped before the target -> object grasped), "EFFORT" (effort limit).
+  double T_EXEC;          // [s] From the command to the completion.
+};
+
+// GRIPPER COMMAND PATH -> MoveG without MoveIt!2 planning/execution:
+// The gripper controllers are read ONCE from move_group (moveit_simple_controller_manager parameters), and every MoveG target
+// (registry joint values) is sent straight to the GripperCommand controller(s) that own the END-EFFECTOR joints. Joints without
+// a controller are mimic joints (followed by the hardware/simulation). The completion is detected from /joint_states:
+//   - REACHED: Every gripper joint within TOL of its target.
+//   - STALLED: The fingers stopped (|velocity| < VEL_TOL for STALL_TIME) before the target -> Object grasped.
+//   - EFFORT: |effort| >= MAX_EFFORT in any gripper joint (MAX_EFFORT = 0.0 -> Not checked, and not limited in the controller).
+class GripperCommander
+{
+public:
+    GripperCommander();
+
+    bool CONFIGURE(const rclcpp::Node::SharedPtr & node, const RegistrySTRUCT & REG, double TOL, double MAX_EFFORT, double TIMEOUT,
+                   const std::string & SERVER = "/move_group");
+    bool ACTIVE() const;
+
+    GripSTRUCT COMMAND(const std::vector<double> & JP);
+    void STOP();
+
+    // Gripper commands + completion times:
+    std::string STATS();
+
+private:
+    using GC = control_msgs::action::GripperCommand;
+
+    struct Controller {
+        std::string NAME;
+        std::vector<size_t> IDX;        // Registry index of the controller joints.
+        rclcpp_action::Client<GC>::SharedPtr CLIENT;
+    };
+
+    void JointStateCallback(const sensor_msgs::msg::JointState::SharedPtr MSG);
+
+    RegistrySTRUCT REG_;
+    std::vector<Controller> CONTROLLERS_;
+    rclcpp::Subscription<sensor_msgs::msg::JointState>::SharedPtr SUB_;
+    double TOL_;
+    double MAX_EFFORT_;
+    double TIMEOUT_;
+    std::atomic<bool> CANCEL_;
+
+    // Latest measured state of the gripper joints (registry order) + number of received messages:
+    std::vector<double> POS_;
+    std::vector<double> VEL_;
+    std::vector<double> EFF_;
+    uint64_t N_MSG_;
+    std::mutex STATE_MUTEX_;
+
+    int N_;
+    int N_STALLED_;
+    double T_SUM_;
+    double T_MAX_;
+    std::mutex MUTEX_;
+};
+
+#endif /* GRIPCMD_H */
@@ -0,0 +1,61 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef HANDOFF_H
+#define HANDOFF_H
+
+// Include standard libraries:
+#include <string>
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+
+// Include the DIRECT EXECUTION BACKEND:
+#include "ros2srrc_execution/directexec.h"
+
+struct HandoffSTRUCT {
+  std::string RES;
+  bool HANDOFF;     // true -> The step was handed off before execute() returned.
+  double T_EXEC;    // [s] Wall time until the step was considered finished.
+  double T_SAVED;   // [s] Trajectory duration - hand-off time (lower bound: settling and result latency not included).
+};
+
+// EXECUTION with EARLY HAND-OFF (DIRECT EXECUTION BACKEND only):
+// The plan is executed in its own thread, and the measured joint values and velocities are compared against the last trajectory point.
+// As soon as all the joints are within TOL [rad] of the goal and below MAX_VELOCITY (after half of the trajectory duration), the step is
+// considered finished and the start state of MGI is set to the measured state (zero velocity), so that the next step is planned from it
+// while the controller settles. The next goal is sent directly to the controller, which replaces the remaining part of the current one.
+// move_group does not preempt a running execution (the next execute() is rejected), so there is no hand-off through MGI.execute().
+// TOL must not exceed trajectory_execution/allowed_start_tolerance.
+//   - TOL = 0.0 or DIRECT = nullptr -> Plain execute() (direct backend if not nullptr, MGI.execute() otherwise).
+HandoffSTRUCT HandoffExecute(moveit::planning_interface::MoveGroupInterface & MGI, const moveit::planning_interface::MoveGroupInterface::Plan & PLAN, double TOL,
+                             DirectExecutor * DIRECT = nullptr);
+
+#endif /* HANDOFF_H */
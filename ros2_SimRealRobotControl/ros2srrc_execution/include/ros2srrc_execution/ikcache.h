@@ -0,0 +1,92 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef IKCACHE_H
+#define IKCACHE_H
+
+// Include standard libraries:
+#include <list>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+// Include the ROS2 MSG messages:
+#include "geometry_msgs/msg/pose.hpp"
+
+// IK/TARGET RESOLUTION CACHE:
+// Maps (planning group + absolute End-Effector pose, rounded to TOL) -> Joint-space solution that was executed last time.
+// Repeated absolute pose targets (fixture locations, place slots...) are then planned as joint targets, and the IK search is skipped.
+// The cache has a fixed size, and the Least-Recently-Used entry is evicted when it is full.
+// The start configuration of the cached solution is stored too: a cached solution is only used if the current joint values are within
+// START_TOL [rad] of it, since the IK solution (branch) depends on the start state. If planning to a cached solution fails, the entry
+// must be removed (ERASE) and the pose target planned as usual.
+class IKCache
+{
+public:
+    IKCache(size_t SIZE = 256, double TOL = 1e-4, double START_TOL = 0.05);
+
+    void CONFIGURE(size_t SIZE, double TOL);
+
+    // Returns true (+ joint values in JP) if the pose target was already resolved from (near) the START joint values:
+    bool GET(const std::string & GROUP, const geometry_msgs::msg::Pose & POSE, const std::vector<double> & START, std::vector<double> & JP);
+    void PUT(const std::string & GROUP, const geometry_msgs::msg::Pose & POSE, const std::vector<double> & START, const std::vector<double> & JP);
+    void ERASE(const std::string & GROUP, const geometry_msgs::msg::Pose & POSE);
+    void CLEAR();
+
+    // HIT STATISTICS:
+    size_t HITS();
+    size_t MISSES();
+    size_t EVICTIONS();
+    std::string STATS();
+
+private:
+    std::string KEY(const std::string & GROUP, const geometry_msgs::msg::Pose & POSE) const;
+
+    struct Entry {
+        std::vector<double> START;
+        std::vector<double> JP;
+    };
+
+    size_t SIZE_;
+    double TOL_;
+    double START_TOL_;
+    size_t HITS_;
+    size_t MISSES_;
+    size_t EVICTIONS_;
+
+    // LRU list (most recent first) + hash map to the list entries:
+    std::list<std::pair<std::string, Entry>> LRU_;
+    std::unordered_map<std::string, std::list<std::pair<std::string, Entry>>::iterator> MAP_;
+    std::mutex MUTEX_;
+};
+
+#endif /* IKCACHE_H */
@@ -43,6 +43,9 @@
 #include <moveit/move_group_interface/move_group_interface_improved.h>
 #include <moveit/planning_scene_interface/planning_scene_interface.h>
 
+// Include the ROBOT/END-EFFECTOR REGISTRY:
+#include "ros2srrc_execution/robotregistry.h"
+
 // Include the move ROS2 ACTION:
 #include "ros2srrc_data/action/move.hpp"
 
@@ -54,6 +57,6 @@ struct MoveJSTRUCT {
   std::vector<double> JP;
 };
 
-MoveJSTRUCT MoveJAction(ros2srrc_data::msg::Joints JOINTS, std::vector<double> JP, std::string param_ROB);
+MoveJSTRUCT MoveJAction(ros2srrc_data::msg::Joints JOINTS, std::vector<double> JP, const RegistrySTRUCT & REG);
 
 #endif /* MOVEJ_H */
\ No newline at end of file
@@ -0,0 +1,71 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef MOVELFAST_H
+#define MOVELFAST_H
+
+// Include standard libraries:
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+#include <moveit_msgs/srv/get_planning_scene.hpp>
+
+// CARTESIAN LIMITS -> Same as Pilz LIN (pilz_cartesian_limits.yaml, robot_description_planning.cartesian_limits):
+struct MoveLFastLIMITS {
+  double TRANS_VEL = 1.0;   // [m/s]
+  double TRANS_ACC = 2.25;  // [m/s^2]
+  double ROT_VEL = 1.57;    // [rad/s]
+};
+
+struct MoveLFastSTRUCT {
+  std::string RES;
+  moveit::planning_interface::MoveGroupInterface::Plan PLAN;
+  double T_PLAN;  // [s]
+};
+
+// MoveL FAST PATH -> Short linear movements are planned locally, without calling the Pilz LIN planner:
+//   1. The Cartesian segment (current pose -> TARGET_POSE) is interpolated (EEF_STEP).
+//   2. IK is solved for all the waypoints in one batch, each one seeded with the previous solution. Every IK solution is checked
+//      for collisions against the current move_group planning scene (SCENE_CLIENT -> /get_planning_scene), like Pilz LIN does.
+//   3. Joint continuity is checked (max. joint jump between consecutive waypoints).
+//   4. The joint path is time-parameterized (TOTG, SPEED) and slowed down (uniform time scaling) until the End-Effector stays within
+//      the Cartesian limits of Pilz LIN: LIMITS.TRANS_VEL * SPEED, LIMITS.TRANS_ACC and LIMITS.ROT_VEL * SPEED.
+// RES -> "PLANNING: OK", "FASTPATH: SKIP" (segment longer than MAX_LENGTH) or "FASTPATH: ERROR (...)" (planning scene not
+// available, IK/collision/continuity check failed). In both SKIP and ERROR cases, the movement must be planned with Pilz LIN.
+MoveLFastSTRUCT MoveLFastAction(geometry_msgs::msg::Pose TARGET_POSE, moveit::planning_interface::MoveGroupInterface & MGI,
+                                const moveit::core::JointModelGroup * JMG, double SPEED, double MAX_LENGTH, const MoveLFastLIMITS & LIMITS,
+                                const rclcpp::Client<moveit_msgs::srv::GetPlanningScene>::SharedPtr & SCENE_CLIENT);
+
+#endif /* MOVELFAST_H */
@@ -0,0 +1,76 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef PATHSMOOTH_H
+#define PATHSMOOTH_H
+
+// Include standard libraries:
+#include <string>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+#include <moveit_msgs/srv/get_planning_scene.hpp>
+
+struct SmoothSTRUCT {
+  std::string RES;
+  double LENGTH_BEFORE;   // [rad] Joint-space path length.
+  double LENGTH_AFTER;
+  double T_BEFORE;        // [s] Trajectory duration.
+  double T_AFTER;
+  int N_BEFORE;           // Number of waypoints.
+  int N_AFTER;
+};
+
+// PATH POST-PROCESSING for sampling-based (OMPL) plans -> Pilz plans are already short and smooth, and are not post-processed:
+//   1. SHORTCUTTING: ITERATIONS random shortcuts between two waypoints of the path, kept if the straight joint-space segment is
+//      collision-free (checked every RESOLUTION [rad] against the current move_group planning scene).
+//   2. B-SPLINE SMOOTHING: Cubic B-spline subdivision of the shortcut path (start and goal fixed), kept if collision-free.
+//   3. TIME-OPTIMAL parameterization (TOTG, SPEED and ACCEL scaling factors).
+// The plan is only replaced if the post-processed path is not longer than the original one.
+class PathSmoother
+{
+public:
+    PathSmoother();
+
+    void CONFIGURE(const rclcpp::Node::SharedPtr & node, int ITERATIONS, double RESOLUTION);
+    bool ACTIVE() const;
+
+    SmoothSTRUCT SMOOTH(moveit::planning_interface::MoveGroupInterface::Plan & PLAN, moveit::planning_interface::MoveGroupInterface & MGI, double SPEED, double ACCEL);
+
+private:
+    int ITERATIONS_;
+    double RESOLUTION_;
+    rclcpp::Client<moveit_msgs::srv::GetPlanningScene>::SharedPtr CLIENT_;
+};
+
+#endif /* PATHSMOOTH_H */
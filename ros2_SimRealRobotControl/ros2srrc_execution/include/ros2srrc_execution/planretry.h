@@ -0,0 +1,66 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef PLANRETRY_H
+#define PLANRETRY_H
+
+// Include standard libraries:
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+#include <moveit_msgs/srv/get_planning_scene.hpp>
+
+struct RetrySTRUCT {
+  std::string RES;
+  moveit::planning_interface::MoveGroupInterface::Plan PLAN;
+  std::string METHOD;   // Retry that recovered the step -> "seed", "ompl", "waypoint" or "none".
+  int ATTEMPTS;
+  double T_PLAN;        // [s]
+};
+
+// ADAPTIVE PLANNER FALLBACK -> Called after a PTP planning error. The target that is currently set in MGI (joint or pose target)
+// is planned again with the following retries, until one of them succeeds or BUDGET [s] is over:
+//   1. SEED: Pose targets only -> The IK is solved from SEEDS random seeds, and the joint solutions are planned with Pilz PTP. Only
+//      collision-free IK solutions are accepted (current move_group planning scene, SCENE_CLIENT -> /get_planning_scene). If the
+//      planning scene is not available, this retry is skipped.
+//   2. OMPL: Relaxed planner -> "ompl" pipeline, RRTConnect (joint target if an IK solution was found).
+//   3. WAYPOINT: Intermediate waypoint WAYPOINT_Z [m] above the current End-Effector pose -> PTP (current -> waypoint) + PTP
+//      (waypoint -> target), merged and time-parameterized (TOTG, SPEED).
+// The pipeline, planner, planning time and start state of MGI are restored afterwards.
+RetrySTRUCT RetryAction(moveit::planning_interface::MoveGroupInterface & MGI, const moveit::core::JointModelGroup * JMG,
+                        double SPEED, double BUDGET, int SEEDS, double WAYPOINT_Z,
+                        const rclcpp::Client<moveit_msgs::srv::GetPlanningScene>::SharedPtr & SCENE_CLIENT);
+
+#endif /* PLANRETRY_H */
@@ -0,0 +1,96 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef PLANSTRATEGY_H
+#define PLANSTRATEGY_H
+
+// Include standard libraries:
+#include <mutex>
+#include <string>
+#include <utility>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+#include <moveit_msgs/srv/get_motion_plan.hpp>
+
+struct PlanStrategySTRUCT {
+  std::string RES;
+  moveit::planning_interface::MoveGroupInterface::Plan PLAN;
+  std::string WINNER;
+  int N_VALID;
+  int N_CANDIDATES;
+  double T_PLAN;       // [s] Wall time until the plan was selected.
+  double DURATION;     // [s] Duration of the selected trajectory.
+};
+
+// PLANNING STRATEGY (multi-planner/multi-seed racing):
+// The MotionPlanRequest that MoveGroupInterface::plan() would send is built once, and one copy per CANDIDATE ("pipeline/planner",
+// e.g. "move_group/PTP" or "ompl/RRTConnectkConfigDefault") is sent to the move_group /plan_kinematic_path service from its own thread.
+// Repeated OMPL candidates act as different random seeds, and are reported as separate slots ("ompl/RRTConnectkConfigDefault#2").
+// Once the plan is selected, the remaining requests are dropped (their responses are not waited for) and the threads are joined.
+//   - MODE "latency": The first valid plan is taken.
+//   - MODE "cycletime": All the valid plans obtained within BUDGET [s] are compared, and the shortest-duration trajectory is taken.
+//   - MODE "off": Not active -> plan_ROB() is used as usual.
+class PlanStrategy
+{
+public:
+    PlanStrategy();
+
+    void CONFIGURE(const rclcpp::Node::SharedPtr & node, const std::string & MODE, const std::vector<std::string> & CANDIDATES, double BUDGET);
+    bool ACTIVE() const;
+
+    PlanStrategySTRUCT PLAN(moveit::planning_interface::MoveGroupInterface & MGI);
+
+    // WIN RATE + PLANNING TIME STATISTICS (per candidate):
+    std::string STATS();
+
+private:
+    struct CandidateSTATS {
+        int ATTEMPTS = 0;
+        int VALID = 0;
+        int WINS = 0;
+        double T_SUM = 0.0;
+    };
+
+    std::string MODE_;
+    std::vector<std::pair<std::string, std::string>> CANDIDATES_;
+    std::vector<std::string> LABELS_;
+    double BUDGET_;
+    int GOALS_;
+    rclcpp::Client<moveit_msgs::srv::GetMotionPlan>::SharedPtr CLIENT_;
+    std::vector<CandidateSTATS> STATS_;   // One per candidate slot (same order as CANDIDATES_).
+    std::mutex MUTEX_;
+};
+
+#endif /* PLANSTRATEGY_H */
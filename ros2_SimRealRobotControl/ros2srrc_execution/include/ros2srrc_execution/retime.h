@@ -0,0 +1,55 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef RETIME_H
+#define RETIME_H
+
+// Include standard libraries:
+#include <string>
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+
+struct RetimeSTRUCT {
+  std::string RES;
+  double T_BEFORE;
+  double T_AFTER;
+};
+
+// POST-PLANNING RETIMING:
+// Time-optimal reparameterization (TOTG) of the planned trajectory, under the velocity/acceleration limits of the robot model (joint_limits.yaml).
+//   - SPEED: Velocity scaling factor (0,1].
+//   - ACCEL: Acceleration scaling factor (0,1]. 0.0 -> 1.0 (default).
+//   - JERK: Jerk limit [rad/s^3] for all joints. 0.0 -> No jerk limit (TOTG only). Otherwise, the TOTG output is smoothed with Ruckig.
+//     MoveIt!2 < 2.8 (Humble): Ruckig takes scaling factors only, the jerk limits come from joint_limits.yaml (max_jerk).
+// If the retiming fails, the original plan is kept.
+RetimeSTRUCT RetimeAction(moveit::planning_interface::MoveGroupInterface::Plan & PLAN, moveit::planning_interface::MoveGroupInterface & MGI, double SPEED, double ACCEL, double JERK);
+
+#endif /* RETIME_H */
@@ -0,0 +1,71 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef ROBOTREGISTRY_H
+#define ROBOTREGISTRY_H
+
+// Include standard libraries:
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit/robot_model/robot_model.h>
+
+// ROBOT/END-EFFECTOR REGISTRY:
+// Compact per-group arrays, built ONCE at startup from the loaded RobotModel (URDF + SRDF + robot_description_planning/joint_limits.yaml).
+// The Move* helpers only compare against these arrays -> Adding a robot/gripper needs no code change.
+//   - JOINTS: Variable names, in the JointModelGroup order (= JP vector order).
+//   - LL, UL: Position limits [rad] or [m]. Unbounded (continuous) joints -> -inf/+inf.
+//   - MIMIC: Ratio of every variable w.r.t. the MoveG gripper value -> URDF <mimic> multiplier, or the
+//            optional "mimic_factor" key of the joint in joint_limits.yaml (default: 1.0).
+//   - GP_LL, GP_UL: Gripper value range, so that every MIMIC[i] * VALUE stays within [LL[i], UL[i]].
+struct RegistrySTRUCT {
+  std::string RES;
+  std::string GROUP;
+  std::vector<std::string> JOINTS;
+  std::vector<double> LL;
+  std::vector<double> UL;
+  std::vector<double> MIMIC;
+  double GP_LL;
+  double GP_UL;
+};
+
+RegistrySTRUCT RegistryLoad(const rclcpp::Node::SharedPtr & node, const moveit::core::JointModelGroup * JMG);
+
+// Returns true if all JP values are within [LL, UL]:
+bool RegistryCheck(const RegistrySTRUCT & REG, const std::vector<double> & JP);
+
+// Index of a joint in the registry -> "jointN" (N = 1, 2...) or the joint name in the model. Returns -1 if not found:
+int RegistryIndex(const RegistrySTRUCT & REG, const std::string & JOINT);
+
+#endif /* ROBOTREGISTRY_H */
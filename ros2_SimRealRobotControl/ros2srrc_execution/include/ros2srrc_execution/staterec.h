@@ -0,0 +1,107 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef STATEREC_H
+#define STATEREC_H
+
+// Include standard libraries:
+#include <cstddef>
+#include <cstdint>
+#include <string>
+#include <vector>
+
+// STATE RECORD FILE -> Fixed-width records in a preallocated, memory-mapped file:
+//   - HEADER (4096 bytes): RecHeader (below).
+//   - RECORDS: CAPACITY x (1 + WIDTH) float64 values -> [T, DATA(WIDTH)]. T = time stamp [s].
+// COUNT is updated (release store) after every record, so that a reader can map a file that is still being written.
+// The layout is read by python/staterec.py as zero-copy NumPy arrays.
+struct RecHeader {
+  char MAGIC[8];          // "SRRCREC1".
+  uint32_t VERSION;
+  uint32_t WIDTH;         // DATA values per record.
+  uint64_t CAPACITY;      // Records in the file.
+  uint64_t COUNT;         // Records written.
+  uint32_t N;             // Number of names in NAMES.
+  uint32_t RESERVED;
+  char NAMES[4056];       // Channel layout (joint names/fields), '\n'-separated.
+};
+static_assert(sizeof(RecHeader) == 4096, "RecHeader must be 4096 bytes (one page).");
+
+// STATE RECORDER (one per channel: joint_states, Robpose, controller state...):
+// The file is preallocated and mapped ONCE. NEXT() returns a pointer to the DATA of the next record in the mapping, which the caller
+// fills in place, and COMMIT() publishes it -> No allocation and no system call per record.
+// ROLLOVER: When the file is full, the recording continues in the next file of the sequence (<PREFIX>_<CHANNEL>_<NNNN>.bin). If
+// MAX_FILES > 0, the oldest file is deleted when the sequence exceeds MAX_FILES files. OPEN() deletes the files of a previous recording
+// with the same PREFIX and CHANNEL first.
+class StateRecorder
+{
+public:
+    StateRecorder();
+    ~StateRecorder();
+
+    bool OPEN(const std::string & PREFIX, const std::string & CHANNEL, const std::vector<std::string> & NAMES, uint32_t WIDTH,
+              uint64_t CAPACITY, int MAX_FILES);
+    bool ACTIVE() const;
+
+    double * NEXT(double T);
+    void COMMIT();
+    void CLOSE();
+
+    // RECORD STATISTICS (records, files, write time):
+    std::string STATS();
+
+private:
+    bool MAP_(int IDX);
+    void UNMAP_();
+    std::string PATH_(int IDX) const;
+
+    std::string PREFIX_;
+    std::string CHANNEL_;
+    std::vector<std::string> NAMES_;
+    uint32_t WIDTH_;
+    uint64_t CAPACITY_;
+    int MAX_FILES_;
+
+    int FD_;
+    int FILE_IDX_;
+    size_t SIZE_;
+    RecHeader * HEADER_;
+    double * RECORDS_;
+    uint64_t COUNT_;
+
+    uint64_t TOTAL_;
+    uint64_t N_STATS_;
+    double T_WRITE_SUM_;
+    double T_WRITE_MAX_;
+    double T_WRITE_START_;
+    double T_START_;
+};
+
+#endif /* STATEREC_H */
@@ -0,0 +1,100 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef TRAJSTORE_H
+#define TRAJSTORE_H
+
+// Include standard libraries:
+#include <cstdint>
+#include <map>
+#include <mutex>
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit_msgs/msg/robot_trajectory.hpp>
+#include <moveit_msgs/srv/get_planning_scene.hpp>
+
+// Include the ROS2 MSG messages:
+#include "ros2srrc_data/msg/action.hpp"
+
+// TRAJECTORY STORE (record/replay of executed trajectories):
+// Every entry maps a STEP KEY (step number + hash of the serialized step) -> Executed RobotTrajectory + start joint values + planning
+// scene fingerprint (world objects and attached objects). The store is saved to/loaded from a binary file (serialized ROS 2 messages).
+//   - MODE "record": Every successfully executed step is stored, and the file is saved at the end of the program.
+//   - MODE "replay": The stored trajectory is executed directly (no planning) if the measured start state is within TOL [rad] of the
+//     recorded one and the scene fingerprint is the same. Otherwise, the step is planned as usual.
+// If the scene fingerprint cannot be obtained (/get_planning_scene not available), the step is neither replayed nor recorded.
+//   - MODE "off": Not active.
+class TrajectoryStore
+{
+public:
+    TrajectoryStore();
+
+    void CONFIGURE(const rclcpp::Node::SharedPtr & node, const std::string & MODE, const std::string & FILE, double TOL);
+    std::string MODE() const;
+
+    std::string KEY(int STEP, const ros2srrc_data::msg::Action & ACTION) const;
+    // Planning scene fingerprint -> false if it could not be obtained from move_group:
+    bool SCENE(uint64_t & FINGERPRINT);
+
+    // Returns "REPLAY: OK" (+ trajectory in TRAJ), "REPLAY: NOT RECORDED", "REPLAY: NO PLANNING SCENE" (SCENE_OK = false),
+    // "REPLAY: START STATE CHANGED" or "REPLAY: SCENE CHANGED":
+    std::string GET(const std::string & KEY, const std::vector<double> & START, bool SCENE_OK, uint64_t SCENE, moveit_msgs::msg::RobotTrajectory & TRAJ);
+    void PUT(const std::string & KEY, const std::vector<double> & START, uint64_t SCENE, const moveit_msgs::msg::RobotTrajectory & TRAJ);
+
+    bool LOAD();
+    bool SAVE();
+
+    // REPLAY/RECORD STATISTICS:
+    std::string STATS();
+
+private:
+    struct Entry {
+        std::vector<double> START;
+        uint64_t SCENE = 0;
+        moveit_msgs::msg::RobotTrajectory TRAJ;
+    };
+
+    std::string MODE_;
+    std::string FILE_;
+    double TOL_;
+    int REPLAYED_;
+    int FALLBACK_;
+    int RECORDED_;
+    std::map<std::string, Entry> ENTRIES_;
+    rclcpp::Client<moveit_msgs::srv::GetPlanningScene>::SharedPtr CLIENT_;
+    std::mutex MUTEX_;
+};
+
+#endif /* TRAJSTORE_H */
@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+
+# exec_benchmark.launch.py:
+# Execute-call overhead benchmark (MoveIt!2 execution vs. DIRECT backend). Requires the robot interface (Gazebo or bringup) to be running.
+# COMMAND -> ros2 launch ros2srrc_execution exec_benchmark.launch.py ROBOT:=ur5 EE:=none N:=10
+
+# Import libraries:
+import os
+from ament_index_python.packages import get_package_share_directory
+from launch import LaunchDescription
+from launch.actions import DeclareLaunchArgument, OpaqueFunction
+from launch.substitutions import LaunchConfiguration
+from launch_ros.actions import Node
+import sys
+import yaml
+
+# XACRO CACHE (ros2srrc_execution/python/xacrocache.py):
+sys.path.append(os.path.join(get_package_share_directory("ros2srrc_execution"), "python"))
+from xacrocache import ProcessXacro
+
+def launch_setup(context, *args, **kwargs):
+
+    ROBOT = LaunchConfiguration("ROBOT").perform(context)
+    EE = LaunchConfiguration("EE").perform(context)
+    LAYOUT = LaunchConfiguration("LAYOUT").perform(context)
+    N = int(LaunchConfiguration("N").perform(context))
+    AMPLITUDE = float(LaunchConfiguration("AMPLITUDE").perform(context))
+
+    # ROBOT DESCRIPTION -> Same xacro mappings as the running interface:
+    xacro_file = os.path.join(get_package_share_directory("ros2srrc_" + ROBOT + "_gazebo"), "urdf", ROBOT + ".urdf.xacro")
+    robot_description = {"robot_description": ProcessXacro(xacro_file, mappings={
+        "cell_layout_1": str(LAYOUT == "1").lower(),
+        "cell_layout_2": str(LAYOUT == "2").lower(),
+        "cell_layout_3": str(LAYOUT == "3").lower(),
+        "EE_no": str(EE == "none").lower(),
+        "EE_robotiq": str(EE == "robotiq_2f85").lower(),
+        }, log=print)}
+
+    # SRDF + kinematics.yaml + joint_limits.yaml:
+    moveit2_path = get_package_share_directory("ros2srrc_" + ROBOT + "_moveit2")
+    SRDF = ROBOT + ".srdf" if (EE == "none") else ROBOT + "robotiq.srdf"
+    with open(os.path.join(moveit2_path, "config", SRDF), "r") as file:
+        robot_description_semantic = {"robot_description_semantic": file.read()}
+    with open(os.path.join(moveit2_path, "config", "kinematics.yaml"), "r") as file:
+        kinematics_yaml = yaml.safe_load(file)
+    with open(os.path.join(moveit2_path, "config", "joint_limits.yaml"), "r") as file:
+        joint_limits = {"robot_description_planning": yaml.safe_load(file)}
+
+    benchmark = Node(
+        package="ros2srrc_execution",
+        executable="exec_benchmark",
+        output="screen",
+        parameters=[robot_description, robot_description_semantic, kinematics_yaml, joint_limits, {"use_sim_time": True}, {"ROB_PARAM": ROBOT}, {"N": N}, {"AMPLITUDE": AMPLITUDE}],
+    )
+
+    return [benchmark]
+
+def generate_launch_description():
+    return LaunchDescription([
+        DeclareLaunchArgument("ROBOT", default_value="ur5", description="Robot model: ur3 - ur5."),
+        DeclareLaunchArgument("EE", default_value="none", description="End-effector: none - robotiq_2f85."),
+        DeclareLaunchArgument("LAYOUT", default_value="1", description="Cell layout: 1 - 2 - 3."),
+        DeclareLaunchArgument("N", default_value="10", description="Number of executions (x2 trajectories) per backend."),
+        DeclareLaunchArgument("AMPLITUDE", default_value="0.2", description="Last joint displacement, in radians."),
+        OpaqueFunction(function=launch_setup),
+    ])
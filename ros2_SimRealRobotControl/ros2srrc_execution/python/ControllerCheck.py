@@ -0,0 +1,142 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+
+# ControllerCheck.py:
+# ROS2_CONTROL comparison -> Robotiq 2f-85 with 6 GripperActionControllers (Option N2) vs. 1 controller + mimic joints (Option N3):
+#   - LAUNCH-TO-READY: Time from the first /clock message (Gazebo running) and from the script start, to every controller active
+#     (joint_state_broadcaster, ur_controller and the gripper controller/s), from /controller_manager/list_controllers.
+#   - UPDATE LOAD: The controller_manager (Humble) does not publish its update time. Every controller runs in the Gazebo update
+#     loop, so their cost is measured as the REAL-TIME FACTOR (sim time / wall time, from /clock), together with the wall period
+#     of /joint_states (published by the joint_state_broadcaster once per controller_manager update).
+#
+# USAGE -> Run it at the same time as the launch file (Gazebo/MoveIt!2 interface), once per gripper configuration:
+#   ros2 run ros2srrc_execution ControllerCheck.py --gripper 6 --duration 30
+#   ros2 run ros2srrc_execution ControllerCheck.py --gripper 1 --duration 30
+
+# Import required libraries:
+import argparse
+import time
+import numpy as np
+import rclpy
+from rclpy.node import Node
+from rosgraph_msgs.msg import Clock
+from sensor_msgs.msg import JointState
+from controller_manager_msgs.srv import ListControllers
+
+GRIPPER_CONTROLLERS = {
+    "6": ["robotiq_controller_LKJ", "robotiq_controller_RKJ", "robotiq_controller_LIKJ", "robotiq_controller_RIKJ", "robotiq_controller_LFTJ", "robotiq_controller_RFTJ"],
+    "1": ["robotiq_controller"],
+}
+
+class ControllerCheck(Node):
+
+    def __init__(self):
+        super().__init__("ros2srrc_ControllerCheck")
+        self.T_CLOCK = None
+        self.CLOCK = []          # (wall time, sim time)
+        self.JOINT_STATES = []   # wall time
+        self.create_subscription(Clock, "/clock", self.ClockCallback, 10)
+        self.create_subscription(JointState, "/joint_states", self.JointStateCallback, 10)
+        self.CLIENT = self.create_client(ListControllers, "/controller_manager/list_controllers")
+
+    def ClockCallback(self, MSG):
+        T = time.monotonic()
+        if (self.T_CLOCK is None):
+            self.T_CLOCK = T
+        self.CLOCK.append((T, MSG.clock.sec + 1e-9 * MSG.clock.nanosec))
+
+    def JointStateCallback(self, MSG):
+        self.JOINT_STATES.append(time.monotonic())
+
+    def ActiveControllers(self):
+        if not self.CLIENT.service_is_ready():
+            return([])
+        FUTURE = self.CLIENT.call_async(ListControllers.Request())
+        rclpy.spin_until_future_complete(self, FUTURE, timeout_sec=1.0)
+        if (FUTURE.result() is None):
+            return([])
+        return([C.name for C in FUTURE.result().controller if C.state == "active"])
+
+def main():
+
+    parser = argparse.ArgumentParser(description="ROS2_CONTROL comparison: launch-to-ready time + update load (real-time factor).")
+    parser.add_argument("--gripper", type=str, default="6", choices=["6", "1"], help="Gripper controllers: 6 (one per joint) - 1 (mimic joints).")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measurement time once all the controllers are active [s].")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Max. waiting time for the controllers [s].")
+    args, unknown = parser.parse_known_args()
+
+    rclpy.init()
+    node = ControllerCheck()
+    EXPECTED = ["joint_state_broadcaster", "ur_controller"] + GRIPPER_CONTROLLERS[args.gripper]
+
+    print("")
+    print("ros2srrc_execution --> ROS2_CONTROL CHECK (" + str(len(EXPECTED)) + " controllers: " + ", ".join(EXPECTED) + ")")
+    print("")
+
+    # 1. LAUNCH-TO-READY:
+    T_START = time.monotonic()
+    READY = None
+    while rclpy.ok() and (time.monotonic() - T_START) < args.timeout:
+        rclpy.spin_once(node, timeout_sec=0.1)
+        ACTIVE = node.ActiveControllers()
+        if all(C in ACTIVE for C in EXPECTED):
+            READY = time.monotonic()
+            break
+
+    if (READY is None):
+        print("ERROR: The controllers were not active after " + str(args.timeout) + "s.")
+        node.destroy_node()
+        rclpy.shutdown()
+        return
+
+    print("LAUNCH-TO-READY -> From script start: %.2fs, from Gazebo (first /clock): %s" % (READY - T_START, ("%.2fs" % (READY - node.T_CLOCK)) if (node.T_CLOCK is not None) else "n/a"))
+
+    # 2. UPDATE LOAD -> Real-time factor + /joint_states wall period, with all the controllers running:
+    node.CLOCK = []
+    node.JOINT_STATES = []
+    T_END = time.monotonic() + args.duration
+    while rclpy.ok() and time.monotonic() < T_END:
+        rclpy.spin_once(node, timeout_sec=0.1)
+
+    if (len(node.CLOCK) < 2 or len(node.JOINT_STATES) < 2):
+        print("ERROR: No /clock or /joint_states messages received.")
+    else:
+        CLOCK = np.array(node.CLOCK)
+        RTF = (CLOCK[-1, 1] - CLOCK[0, 1]) / (CLOCK[-1, 0] - CLOCK[0, 0])
+        PERIOD = 1000.0 * np.diff(np.array(node.JOINT_STATES))
+        print("UPDATE LOAD -> Real-time factor: %.3f | /joint_states period [ms] mean: %.2f, std: %.2f, p99: %.2f, max: %.2f (%d messages in %.0fs)"
+              % (RTF, PERIOD.mean(), PERIOD.std(), np.percentile(PERIOD, 99), PERIOD.max(), len(node.JOINT_STATES), args.duration))
+
+    print("")
+    node.destroy_node()
+    rclpy.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+
+# ProgramResolver.py:
+# OFFLINE RELATIVE-MOVE RESOLVER -> Propagates the End-Effector pose (tool0, world frame) through a whole program (.txt),
+# without ROS 2/MoveIt!2, and emits a fully ABSOLUTE program:
+#   - MoveJ, MoveR -> MoveJ (absolute joint values).
+#   - MoveXYZW, MoveXYZ, MoveYPR, MoveROT, MoveRP -> MoveXYZW (absolute pose). These are all planned with PTP in move.cpp/sequence.cpp.
+#   - MoveL -> MoveL (kept relative, since it is planned with LIN).
+#   - Every robot movement gets 2 extra keys (ignored by sequence.py): 'target' (absolute pose) + 'joints' (expected joint values, IK closest to the previous step).
+# The quaternion/rotation math is the same as in movel.cpp, movexyzw.cpp, movexyz.cpp, moveypr.cpp, moverot.cpp and moverp.cpp,
+# vectorized over all the steps of the program. FK/IK -> urkinematics.py.
+#
+# COMMANDS:
+#   python3 ProgramResolver.py --robot ur5 --program ur5cubePP                     # Resolve -> programs/ur5cubePP_absolute.txt
+#   python3 ProgramResolver.py --robot ur5 --program ur5cubePP --verify            # + Check against the C++ helpers.
+#   python3 ProgramResolver.py --verify                                            # Check the helpers only (random inputs).
+# NOTE: The program must start with a MoveJ step, otherwise the initial joint values must be given with --start.
+
+# Import required libraries:
+import argparse
+import ast
+import math
+import os
+import sys
+import numpy as np
+
+from urkinematics import FK, IKNearest, MatrixToPose, PoseToMatrix, Transform, CELL_BASE, UR_LIMITS
+
+# Declaration of CONSTANT VALUES for angle transformation (DEG->RAD), same value as the C++ helpers:
+pi = 3.14159265358979
+k = pi/180.0
+
+JOINTS = ["joint1", "joint2", "joint3", "joint4", "joint5", "joint6"]
+POSE_ACTIONS = ["MoveL", "MoveXYZW", "MoveXYZ", "MoveYPR", "MoveROT", "MoveRP"]
+JOINT_ACTIONS = ["MoveJ", "MoveR"]
+
+# ===================================================================================== #
+# ====================== VECTORIZED QUATERNION / ROTATION MATH ======================== #
+
+# Euler angles (...,3) -> (yaw, pitch, roll) [deg] to Quaternion (...,4) -> (x,y,z,w):
+def EulerToQuat(YPR):
+    YPR = np.asarray(YPR, dtype=float)
+    cy = np.cos(k*YPR[...,0] * 0.5)
+    sy = np.sin(k*YPR[...,0] * 0.5)
+    cp = np.cos(k*YPR[...,1] * 0.5)
+    sp = np.sin(k*YPR[...,1] * 0.5)
+    cr = np.cos(k*YPR[...,2] * 0.5)
+    sr = np.sin(k*YPR[...,2] * 0.5)
+    return(np.stack([
+        sr * cp * cy - cr * sp * sy,
+        cr * sp * cy + sr * cp * sy,
+        cr * cp * sy - sr * sp * cy,
+        cr * cp * cy + sr * sp * sy,
+    ], axis=-1))
+
+# Quaternion (...,4) -> Euler angles (...,3) -> (yaw, pitch, roll) [deg]. Inverse of EulerToQuat:
+def QuatToEuler(Q):
+    Q = np.asarray(Q, dtype=float)
+    x, y, z, w = Q[...,0], Q[...,1], Q[...,2], Q[...,3]
+    roll = np.arctan2(2.0*(w*x + y*z), 1.0 - 2.0*(x*x + y*y))
+    pitch = np.arcsin(np.clip(2.0*(w*y - z*x), -1.0, 1.0))
+    yaw = np.arctan2(2.0*(w*z + x*y), 1.0 - 2.0*(y*y + z*z))
+    return(np.stack([yaw, pitch, roll], axis=-1) / k)
+
+# Quaternion multiplication A*B (...,4):
+def QuatMul(A, B):
+    Ax, Ay, Az, Aw = A[...,0], A[...,1], A[...,2], A[...,3]
+    Bx, By, Bz, Bw = B[...,0], B[...,1], B[...,2], B[...,3]
+    return(np.stack([
+        Aw*Bx + Ax*Bw + Ay*Bz - Az*By,
+        Aw*By - Ax*Bz + Ay*Bw + Az*Bx,
+        Aw*Bz + Ax*By - Ay*Bx + Az*Bw,
+        Aw*Bw - Ax*Bx - Ay*By - Az*Bz,
+    ], axis=-1))
+
+# Quaternion (...,4) -> Rotation matrix (...,3,3):
+def QuatToRot(Q):
+    Q = Q / np.linalg.norm(Q, axis=-1, keepdims=True)
+    return(PoseToMatrix(np.zeros(Q.shape[:-1] + (3,)), Q)[...,:3,:3])
+
+# Euler angles (...,3) -> (yaw, pitch, roll) [deg] to Rotation matrix (...,3,3) -> 1.ROLL + 2.PITCH + 3.YAW:
+def EulerToRot(YPR):
+    YPR = np.asarray(YPR, dtype=float)
+    cy, sy = np.cos(k*YPR[...,0]), np.sin(k*YPR[...,0])
+    cp, sp = np.cos(k*YPR[...,1]), np.sin(k*YPR[...,1])
+    cr, sr = np.cos(k*YPR[...,2]), np.sin(k*YPR[...,2])
+    return(np.stack([
+        np.stack([cy*cp, cy*sp*sr - sy*cr, cy*sp*cr + sy*sr], axis=-1),
+        np.stack([sy*cp, sy*sp*sr + cy*cr, sy*sp*cr - cy*sr], axis=-1),
+        np.stack([-sp, cp*sr, cp*cr], axis=-1),
+    ], axis=-2))
+
+# ===================================================================================== #
+# ============================== RESOLVER (whole program) ============================= #
+
+# Step VALUE -> (x,y,z) and (yaw,pitch,roll) arrays:
+def StepXYZ(STEP):
+    V = STEP.get("value", {})
+    return([V.get("x", 0.0), V.get("y", 0.0), V.get("z", 0.0)])
+
+def StepYPR(STEP):
+    V = STEP.get("value", {})
+    return([V.get("yaw", 0.0), V.get("pitch", 0.0), V.get("roll", 0.0)])
+
+# POSE ACTION -> New pose (P, QU) from the current pose, vectorized (...,3)/(...,4):
+#   XYZ: step position, QB: step rotation (quaternion), XR: MoveRP displaced point (local frame).
+def PoseStep(ACTION, P, QU, XYZ, QB, XR):
+    if ACTION == "MoveL":
+        return(P + XYZ, QU)
+    elif ACTION == "MoveXYZW":
+        return(XYZ, QB)
+    elif ACTION == "MoveXYZ":
+        return(XYZ, QU)
+    elif ACTION == "MoveYPR":
+        return(P, QB)
+    elif ACTION == "MoveROT":
+        return(P, QuatMul(QU, QB))
+    elif ACTION == "MoveRP":
+        return(P + np.einsum("...ij,...j->...i", QuatToRot(QU), XR), QuatMul(QU, QB))
+
+# RESOLVE -> List of dicts (one per step): {'action', 'pose': (XYZ, QUAT), 'q': joint values [rad], 'status'}
+def Resolve(ROBOT, PROGRAM, Q0, BASE):
+
+    N = len(PROGRAM)
+
+    # 1. VECTORIZED pre-computation over ALL steps:
+    XYZ = np.array([StepXYZ(S) for S in PROGRAM], dtype=float).reshape(N,3)
+    YPR = np.array([StepYPR(S) for S in PROGRAM], dtype=float).reshape(N,3)
+    QB = EulerToQuat(YPR)                                    # Relative/absolute rotations (quaternion).
+    REUL = EulerToRot(YPR)                                   # MoveRP -> rotation around a point.
+    XR = XYZ - np.einsum("nij,nj->ni", REUL, XYZ)            # MoveRP -> displaced End-Effector point (local frame).
+    IS_J = np.array([S["action"] == "MoveJ" for S in PROGRAM], dtype=bool)
+    QJ = np.array([[S["value"][j] for j in JOINTS] if S["action"] == "MoveJ" else [0.0]*6 for S in PROGRAM], dtype=float).reshape(N,6) * k
+    TJ = FK(ROBOT, QJ, BASE=BASE)                            # FK of ALL MoveJ steps in one call.
+
+    # 2. PROPAGATION:
+    Q = np.asarray(Q0, dtype=float)
+    P, QU = MatrixToPose(FK(ROBOT, Q, BASE=BASE))
+    RESOLVED = []
+
+    for i, STEP in enumerate(PROGRAM):
+
+        ACTION = STEP["action"]
+        STATUS = "OK"
+
+        if ACTION == "MoveJ":
+            Q = QJ[i].copy()
+            P, QU = MatrixToPose(TJ[i])
+
+        elif ACTION == "MoveR":
+            J = STEP["value"]["joint"]
+            if J in JOINTS:
+                QN = Q.copy()
+                QN[JOINTS.index(J)] = QN[JOINTS.index(J)] + STEP["value"]["value"] * k
+                if np.all((QN >= UR_LIMITS["LL"]) & (QN <= UR_LIMITS["UL"])):
+                    Q = QN
+                    P, QU = MatrixToPose(FK(ROBOT, Q, BASE=BASE))
+                else:
+                    STATUS = "LIMITS: ERROR"
+            else:
+                STATUS = "LIMITS: JointName INPUT ERROR"
+
+        elif ACTION in POSE_ACTIONS:
+
+            P, QU = PoseStep(ACTION, P, QU, XYZ[i], QB[i], XR[i])
+
+            # Expected joint values -> IK closest to the previous step:
+            QN, OK = IKNearest(ROBOT, PoseToMatrix(P, QU), Q, BASE=BASE)
+            if OK:
+                Q = QN
+            else:
+                STATUS = "IK: ERROR"
+
+        else:
+            RESOLVED.append({"action": ACTION, "pose": None, "q": None, "status": STATUS})
+            continue
+
+        RESOLVED.append({"action": ACTION, "pose": (P.copy(), QU.copy()), "q": Q.copy(), "status": STATUS})
+
+    return(RESOLVED)
+
+# RESOLVED steps -> ABSOLUTE program (list of dicts, same format as the .txt programs):
+def AbsoluteProgram(PROGRAM, RESOLVED):
+
+    ABS = []
+    for STEP, R in zip(PROGRAM, RESOLVED):
+
+        if R["pose"] is None:
+            ABS.append(STEP)
+            continue
+
+        P, QU = R["pose"]
+        NEW = {}
+        if STEP["action"] in JOINT_ACTIONS:
+            NEW["action"] = "MoveJ"
+            NEW["value"] = {j: round(float(R["q"][n] / k), 5) for n, j in enumerate(JOINTS)}
+        elif STEP["action"] == "MoveL":
+            NEW["action"] = "MoveL"
+            NEW["value"] = STEP["value"]
+        else:
+            E = QuatToEuler(QU)
+            NEW["action"] = "MoveXYZW"
+            NEW["value"] = {"x": round(float(P[0]), 6), "y": round(float(P[1]), 6), "z": round(float(P[2]), 6),
+                            "yaw": round(float(E[0]), 5), "pitch": round(float(E[1]), 5), "roll": round(float(E[2]), 5)}
+        NEW["speed"] = STEP.get("speed", 1.0)
+        for KEY in ("accel", "jerk"):
+            if KEY in STEP:
+                NEW[KEY] = STEP[KEY]
+        NEW["target"] = {"x": round(float(P[0]), 6), "y": round(float(P[1]), 6), "z": round(float(P[2]), 6),
+                         "qx": round(float(QU[0]), 6), "qy": round(float(QU[1]), 6), "qz": round(float(QU[2]), 6), "qw": round(float(QU[3]), 6)}
+        NEW["joints"] = {j: round(float(R["q"][n] / k), 5) for n, j in enumerate(JOINTS)}
+        ABS.append(NEW)
+
+    return(ABS)
+
+# ===================================================================================== #
+# ========================= VERIFICATION against the C++ helpers ====================== #
+# Literal (scalar) transcription of movel.cpp, movexyzw.cpp, movexyz.cpp, moveypr.cpp, moverot.cpp and moverp.cpp.
+# POSE -> [x, y, z, qx, qy, qz, qw]
+
+def CPP_Euler(yaw, pitch, roll):
+    cy = math.cos(k*yaw * 0.5)
+    sy = math.sin(k*yaw * 0.5)
+    cp = math.cos(k*pitch * 0.5)
+    sp = math.sin(k*pitch * 0.5)
+    cr = math.cos(k*roll * 0.5)
+    sr = math.sin(k*roll * 0.5)
+    return(sr * cp * cy - cr * sp * sy, cr * sp * cy + sr * cp * sy, cr * cp * sy - sr * sp * cy, cr * cp * cy + sr * sp * sy)
+
+def CPP_QuatMul(Ax, Ay, Az, Aw, Bx, By, Bz, Bw):
+    w = Aw*Bw - Ax*Bx - Ay*By - Az*Bz
+    x = Aw*Bx + Ax*Bw + Ay*Bz - Az*By
+    y = Aw*By - Ax*Bz + Ay*Bw + Az*Bx
+    z = Aw*Bz + Ax*By - Ay*Bx + Az*Bw
+    return(x, y, z, w)
+
+def CPP_MoveL(G, POSE):
+    return([POSE[0] + G["x"], POSE[1] + G["y"], POSE[2] + G["z"]] + POSE[3:])
+
+def CPP_MoveXYZW(G, POSE):
+    return([G["x"], G["y"], G["z"]] + list(CPP_Euler(G["yaw"], G["pitch"], G["roll"])))
+
+def CPP_MoveXYZ(G, POSE):
+    return([G["x"], G["y"], G["z"]] + POSE[3:])
+
+def CPP_MoveYPR(G, POSE):
+    return(POSE[:3] + list(CPP_Euler(G["yaw"], G["pitch"], G["roll"])))
+
+def CPP_MoveROT(G, POSE):
+    B = CPP_Euler(G["yaw"], G["pitch"], G["roll"])
+    return(POSE[:3] + list(CPP_QuatMul(*POSE[3:], *B)))
+
+def CPP_MoveRP(G, POSE):
+    x, y, z, yaw, pitch, roll = G["x"], G["y"], G["z"], G["yaw"], G["pitch"], G["roll"]
+    Ax, Ay, Az, Aw = POSE[3:]
+    ROT = CPP_QuatMul(Ax, Ay, Az, Aw, *CPP_Euler(yaw, pitch, roll))
+    Ex, Ey, Ez = POSE[:3]
+    norm = math.sqrt((Ax*Ax)+(Ay*Ay)+(Az*Az)+(Aw*Aw))
+    Qx, Qy, Qz, Qw = Ax/norm, Ay/norm, Az/norm, Aw/norm
+    R_00 = 1 - 2*(Qy*Qy) - 2*(Qz*Qz)
+    R_01 = 2*(Qx*Qy) - 2*(Qw*Qz)
+    R_02 = 2*(Qx*Qz) + 2*(Qw*Qy)
+    R_10 = 2*(Qx*Qy) + 2*(Qw*Qz)
+    R_11 = 1 - 2*(Qx*Qx) - 2*(Qz*Qz)
+    R_12 = 2*(Qy*Qz) - 2*(Qw*Qx)
+    R_20 = 2*(Qx*Qz) - 2*(Qw*Qy)
+    R_21 = 2*(Qy*Qz) + 2*(Qw*Qx)
+    R_22 = 1 - 2*(Qx*Qx) - 2*(Qy*Qy)
+    rEUL00 = math.cos(k*yaw)*math.cos(k*pitch)
+    rEUL01 = math.cos(k*yaw)*math.sin(k*pitch)*math.sin(k*roll) - math.sin(k*yaw)*math.cos(k*roll)
+    rEUL02 = math.cos(k*yaw)*math.sin(k*pitch)*math.cos(k*roll) + math.sin(k*yaw)*math.sin(k*roll)
+    rEUL10 = math.sin(k*yaw)*math.cos(k*pitch)
+    rEUL11 = math.sin(k*yaw)*math.sin(k*pitch)*math.sin(k*roll) + math.cos(k*yaw)*math.cos(k*roll)
+    rEUL12 = math.sin(k*yaw)*math.sin(k*pitch)*math.cos(k*roll) - math.cos(k*yaw)*math.sin(k*roll)
+    rEUL20 = -math.sin(k*pitch)
+    rEUL21 = math.cos(k*pitch)*math.sin(k*roll)
+    rEUL22 = math.cos(k*pitch)*math.cos(k*roll)
+    xR = x - rEUL00*x - rEUL01*y - rEUL02*z
+    yR = y - rEUL10*x - rEUL11*y - rEUL12*z
+    zR = z - rEUL20*x - rEUL21*y - rEUL22*z
+    Px = Ex + R_00*xR + R_01*yR + R_02*zR
+    Py = Ey + R_10*xR + R_11*yR + R_12*zR
+    Pz = Ez + R_20*xR + R_21*yR + R_22*zR
+    return([Px, Py, Pz] + list(ROT))
+
+CPP_HELPERS = {"MoveL": CPP_MoveL, "MoveXYZW": CPP_MoveXYZW, "MoveXYZ": CPP_MoveXYZ, "MoveYPR": CPP_MoveYPR, "MoveROT": CPP_MoveROT, "MoveRP": CPP_MoveRP}
+
+# Random step value for a given action:
+def RandomStep(ACTION, rng):
+    XYZ = {"x": rng.uniform(-0.5, 0.5), "y": rng.uniform(-0.5, 0.5), "z": rng.uniform(-0.5, 0.5)}
+    YPR = {"yaw": rng.uniform(-180.0, 180.0), "pitch": rng.uniform(-90.0, 90.0), "roll": rng.uniform(-180.0, 180.0)}
+    if ACTION in ("MoveL", "MoveXYZ"):
+        V = XYZ
+    elif ACTION in ("MoveYPR", "MoveROT"):
+        V = YPR
+    else:
+        V = {**XYZ, **YPR}
+    return({"action": ACTION, "value": V, "speed": 1.0})
+
+# CHECK 1 -> Every pose action, vectorized resolver vs. C++ helper, random poses/steps + FK/pose conversion round trip.
+# CHECK 2 -> (optional) Whole program: pose chain propagated with the C++ helpers vs. resolver + FK(IK) consistency.
+def Verify(ROBOT, PROGRAM, Q0, BASE, TOL, SAMPLES=2000):
+
+    rng = np.random.default_rng(0)
+    PASSED = True
+
+    print("VERIFICATION -> Resolver vs. C++ helpers (tolerance: " + str(TOL) + "):")
+    for ACTION in POSE_ACTIONS:
+
+        # Random initial poses (FK) + random steps -> resolver math, all samples at once:
+        P0, QU0 = MatrixToPose(FK(ROBOT, rng.uniform(-np.pi, np.pi, (SAMPLES,6)), BASE=BASE))
+        STEPS = [RandomStep(ACTION, rng) for n in range(SAMPLES)]
+        XYZ = np.array([StepXYZ(S) for S in STEPS])
+        YPR = np.array([StepYPR(S) for S in STEPS])
+        P, QU = PoseStep(ACTION, P0, QU0, XYZ, EulerToQuat(YPR), XYZ - np.einsum("nij,nj->ni", EulerToRot(YPR), XYZ))
+
+        # C++ helpers, one sample at a time:
+        REF = np.array([CPP_HELPERS[ACTION](STEPS[n]["value"], list(P0[n]) + list(QU0[n])) for n in range(SAMPLES)])
+        ERR = float(np.max(np.abs(np.concatenate([P, QU], axis=-1) - REF)))
+        OK = ERR <= TOL
+        PASSED = PASSED and OK
+        print("   - " + ACTION.ljust(8) + " -> max. error: " + "{:.2e}".format(ERR) + (" [OK]" if OK else " [FAILED]"))
+
+    # FK -> Pose (MatrixToPose) must rebuild the FK matrix (random + tool-down configurations, 180deg rotations):
+    QR = rng.uniform(-np.pi, np.pi, (SAMPLES,6))
+    QT = QR.copy()
+    QT[:,3] = -np.pi/2.0 - QT[:,1] - QT[:,2]
+    QT[:,4] = -np.pi/2.0
+    T = FK(ROBOT, np.concatenate([QR, QT]), BASE=BASE)
+    ERR = float(np.max(np.abs(PoseToMatrix(*MatrixToPose(T)) - T)))
+    OK = ERR <= 1e-9
+    PASSED = PASSED and OK
+    print("   - FK -> Pose -> Matrix round trip -> max. error: " + "{:.2e}".format(ERR) + (" [OK]" if OK else " [FAILED]"))
+
+    # Euler <-> Quaternion round trip (MoveXYZW output of the absolute program):
+    YPR = np.stack([rng.uniform(-180.0, 180.0, SAMPLES), rng.uniform(-89.0, 89.0, SAMPLES), rng.uniform(-180.0, 180.0, SAMPLES)], axis=-1)
+    ERR = float(np.max(np.abs(QuatToEuler(EulerToQuat(YPR)) - YPR)))
+    OK = ERR <= 1e-6
+    PASSED = PASSED and OK
+    print("   - Euler<->Quaternion round trip -> max. error [deg]: " + "{:.2e}".format(ERR) + (" [OK]" if OK else " [FAILED]"))
+
+    if PROGRAM is not None:
+
+        RESOLVED = Resolve(ROBOT, PROGRAM, Q0, BASE)
+        P0, QU0 = MatrixToPose(FK(ROBOT, np.asarray(Q0), BASE=BASE))
+        POSE = list(P0) + list(QU0)
+        ERR_CPP = 0.0
+        ERR_IK = 0.0
+        for STEP, R in zip(PROGRAM, RESOLVED):
+            if R["pose"] is None:
+                continue
+            if STEP["action"] in CPP_HELPERS:
+                POSE = CPP_HELPERS[STEP["action"]](STEP["value"], POSE)
+                ERR_CPP = max(ERR_CPP, float(np.max(np.abs(np.concatenate(R["pose"]) - np.array(POSE)))))
+            else:
+                P, QU = MatrixToPose(FK(ROBOT, R["q"], BASE=BASE))
+                POSE = list(P) + list(QU)
+            if R["status"] == "OK":
+                T = FK(ROBOT, R["q"], BASE=BASE)
+                ERR_IK = max(ERR_IK, float(np.max(np.abs(T - PoseToMatrix(*R["pose"])))))
+        OK = ERR_CPP <= TOL and ERR_IK <= TOL
+        PASSED = PASSED and OK
+        print("   - PROGRAM -> pose chain max. error: " + "{:.2e}".format(ERR_CPP) + ", FK(IK) max. error: " + "{:.2e}".format(ERR_IK) + (" [OK]" if OK else " [FAILED]"))
+        for n, R in enumerate(RESOLVED):
+            if R["status"] != "OK":
+                print("     WARNING: STEP " + str(n+1) + " (" + R["action"] + ") -> " + R["status"])
+
+    print("VERIFICATION " + ("PASSED." if PASSED else "FAILED."))
+    return(PASSED)
+
+# ===================================================================================== #
+# ======================================== MAIN ======================================= #
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Offline relative-move resolver: program (.txt) -> absolute program.")
+    parser.add_argument("--robot", type=str, default="ur5", help="Robot model: ur3 - ur5.")
+    parser.add_argument("--program", type=str, default="", help="Program name (programs folder, without .txt) or path to the .txt file.")
+    parser.add_argument("--layout", type=str, default="cell_layout_1", help="Cell layout (world -> base_link): cell_layout_1, cell_layout_2, cell_layout_3.")
+    parser.add_argument("--start", type=str, default="", help="Initial joint values [deg], e.g.: \"[0.0, -90.0, 0.0, -90.0, 0.0, 0.0]\".")
+    parser.add_argument("--output", type=str, default="", help="Output file (default: <program>_absolute.txt, next to the program).")
+    parser.add_argument("--verify", action="store_true", help="Verify the resolver against the C++ helpers.")
+    parser.add_argument("--tol", type=float, default=1e-9, help="Verification tolerance.")
+    args, unknown = parser.parse_known_args()
+
+    print("")
+    print(" --- Cranfield University --- ")
+    print("        (c) IFRA Group        ")
+    print("")
+    print("ros2srrc_execution --> OFFLINE PROGRAM RESOLVER")
+    print("Python script -> ProgramResolver.py")
+    print("")
+
+    if args.robot not in ("ur3", "ur5"):
+        print("ERROR: Robot model must be ur3 or ur5.")
+        sys.exit(1)
+    BASE = Transform(*CELL_BASE[args.layout])
+
+    # 1. READ PROGRAM:
+    PROGRAM = None
+    Q0 = None
+    if args.program != "":
+
+        filepath = args.program
+        if not os.path.exists(filepath):
+            filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "programs", args.program + ".txt")
+        if not os.path.exists(filepath):
+            filepath = os.path.join(os.path.expanduser('~'), 'teamproject_2', 'src', 'ros2_SimRealRobotControl', 'ros2srrc_execution', 'programs', args.program + ".txt")
+        if not os.path.exists(filepath):
+            print("ERROR: " + args.program + " file (program) not found.")
+            sys.exit(1)
+
+        PROGRAM = []
+        with open(filepath) as file:
+            for line in file.readlines():
+                if line.strip() != "":
+                    PROGRAM.append(ast.literal_eval(line))
+
+        # Initial joint values -> --start, or first MoveJ of the program:
+        if args.start != "":
+            Q0 = np.array(ast.literal_eval(args.start), dtype=float) * k
+        elif len(PROGRAM) > 0 and PROGRAM[0]["action"] == "MoveJ":
+            Q0 = np.array([PROGRAM[0]["value"][j] for j in JOINTS], dtype=float) * k
+        else:
+            print("ERROR: The program does not start with MoveJ -> Initial joint values must be given with --start.")
+            sys.exit(1)
+
+    # 2. VERIFY (optional):
+    if args.verify:
+        PASSED = Verify(args.robot, PROGRAM, Q0, BASE, args.tol)
+        print("")
+        if not PASSED:
+            sys.exit(1)
+
+    # 3. RESOLVE + WRITE ABSOLUTE PROGRAM:
+    if PROGRAM is not None:
+
+        RESOLVED = Resolve(args.robot, PROGRAM, Q0, BASE)
+        ABS = AbsoluteProgram(PROGRAM, RESOLVED)
+
+        output = args.output
+        if output == "":
+            output = os.path.splitext(filepath)[0] + "_absolute.txt"
+        with open(output, "w") as file:
+            for STEP in ABS:
+                file.write(str(STEP) + "\n")
+
+        for n, R in enumerate(RESOLVED):
+            if R["status"] != "OK":
+                print("WARNING: STEP " + str(n+1) + " (" + R["action"] + ") -> " + R["status"])
+        print("Program resolved (" + str(len(ABS)) + " steps) -> " + output)
+
+if __name__ == "__main__":
+    main()
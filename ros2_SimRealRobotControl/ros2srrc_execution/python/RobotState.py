@@ -3,7 +3,10 @@
 # Generic ROS2 Python library:
 import rclpy
 from rclpy.node import Node
+from rclpy.qos import qos_profile_sensor_data
 import time
+import argparse
+import numpy as np
 
 # For GAZEBO -> Link States:
 from gazebo_msgs.srv import GetEntityState
@@ -12,8 +15,18 @@ from geometry_msgs.msg import Pose
 from geometry_msgs.msg import Point
 from geometry_msgs.msg import Quaternion
 
+# For TF2 -> EEPose (robot_state_publisher, Gazebo + Bringup):
+from tf2_ros import TransformException
+from tf2_ros.buffer import Buffer
+from tf2_ros.transform_listener import TransformListener
+from rclpy.duration import Duration
+from rclpy.time import Time
+
 # For /joint_states:
 from sensor_msgs.msg import JointState
+
+# Pose (xyz + quaternion) <-> 4x4 transforms:
+from urkinematics import InvT, MatrixToPose, PoseToMatrix
 k = 180.0/3.14159265359
 
 ######################################################################################################
@@ -32,6 +45,48 @@ class serviceClientGET(Node):
         self.req.reference_frame = ref
         self.future = self.cli.call_async(self.req)    
 
+    # CONCURRENT -> All the requests are sent at once, and the node is spun until every response has arrived:
+    def GET_ALL(self, names, ref):
+        FUTURES = []
+        for name in names:
+            req = GetEntityState.Request()
+            req.name = name
+            req.reference_frame = ref
+            FUTURES.append(self.cli.call_async(req))
+        while rclpy.ok() and not all(F.done() for F in FUTURES):
+            rclpy.spin_once(self, timeout_sec=0.1)
+        return([F.result() for F in FUTURES])
+
+# Gazebo entity state -> 4x4 transform (relative to the reference frame of the request):
+def StateToMatrix(STATE):
+    P = STATE.pose
+    return(PoseToMatrix([P.position.x, P.position.y, P.position.z], [P.orientation.x, P.orientation.y, P.orientation.z, P.orientation.w]))
+
+# EEPose (GAZEBO) -> TCP relative to BASE_TF (position + orientation), both links requested concurrently:
+def GazeboEEPose(node):
+    TCP, BASE = node.GET_ALL(["TCP", "BASE_TF"], "")
+    if (TCP is None or BASE is None or not TCP.success or not BASE.success):
+        return(None)
+    return(MatrixToPose(InvT(StateToMatrix(BASE)) @ StateToMatrix(TCP)))
+
+######################################################################################################
+
+# Create NODE + TF2 LISTENER -> EEPose from the TF tree (robot_state_publisher), for both Gazebo and Bringup.
+# The TransformListener spins its own thread, so every query is a buffer lookup (no service round-trip).
+# NOTE: TIP defaults to wrist_3_link -> The TCP link has the same origin, but its (zero-range prismatic) joint is not
+# published in /joint_states, and therefore it does not appear in the TF tree.
+class EEPoseTF(Node):
+    def __init__(self):
+        super().__init__("r3m_EEPOSE")
+        self.BUFFER = Buffer()
+        self.LISTENER = TransformListener(self.BUFFER, self, spin_thread=True)
+
+    def GET(self, BASE, TIP, TIMEOUT=5.0):
+        TF = self.BUFFER.lookup_transform(BASE, TIP, Time(), timeout=Duration(seconds=TIMEOUT))
+        t = TF.transform.translation
+        r = TF.transform.rotation
+        return(np.array([t.x, t.y, t.z]), np.array([r.x, r.y, r.z, r.w]))
+
 ######################################################################################################
 
 # Create NODE + SUBSCRIBER for /joint_states:
@@ -68,6 +123,163 @@ class CreateSubscriber(Node):
         RESULT = "JointValues are -> 'joint1': " + str(round(J1, 4)) + ", 'joint2': " + str(round(J2, 4)) + ", 'joint3': " + str(round(J3, 4)) + ", 'joint4': " + str(round(J4, 4)) + ", 'joint5': " + str(round(J5, 4)) + ", 'joint6': " + str(round(J6, 4))
         print(RESULT)
 
+######################################################################################################
+
+# Create NODE + SUBSCRIBER for /joint_states -> CONTINUOUS MONITOR:
+#   - The message layout (joint names) is mapped to the robot joint order ONCE, and only checked again when it changes.
+#   - Positions are converted to a NumPy array in one step, and stored in a RING BUFFER (time stamps + joint values).
+#   - Velocity/acceleration statistics are derived from the buffer (finite differences) in the print timer, not per message,
+#     so that the callback stays in the microsecond range (1kHz /joint_states -> 1ms budget per message).
+JOINT_INDEX = {
+    "shoulder_pan_joint": 0, "joint_1": 0,
+    "shoulder_lift_joint": 1, "joint_2": 1,
+    "elbow_joint": 2, "joint_3": 2,
+    "wrist_1_joint": 3, "joint_4": 3,
+    "wrist_2_joint": 4, "joint_5": 4,
+    "wrist_3_joint": 5, "joint_6": 5,
+}
+
+class JointStateMonitor(Node):
+    def __init__(self, SIZE=2000, PERIOD=1.0):
+        # Declare NODE:
+        super().__init__("r3m_MONITOR")
+
+        # RING BUFFER:
+        self.SIZE = SIZE
+        self.T = np.zeros(SIZE)
+        self.Q = np.zeros((SIZE, 6))
+        self.HEAD = 0
+        self.COUNT = 0
+
+        # Message layout -> Index map:
+        self.LAYOUT = None
+        self.IDX = None
+
+        # Callback statistics (per print period):
+        self.N_MSG = 0
+        self.N_SKIPPED = 0
+        self.T_CALLBACK = 0.0
+        self.T_CALLBACK_MAX = 0.0
+
+        # Declare SUBSCRIBER + print TIMER:
+        self.subscription = self.create_subscription(JointState, "joint_states", self.listener_callback, qos_profile_sensor_data)
+        self.timer = self.create_timer(PERIOD, self.print_callback)
+
+    def Layout(self, NAMES):
+        IDX = [-1] * 6
+        for j in range(len(NAMES)):
+            if (NAMES[j] in JOINT_INDEX):
+                IDX[JOINT_INDEX[NAMES[j]]] = j
+        self.LAYOUT = list(NAMES)
+        self.IDX = np.array(IDX) if (min(IDX) >= 0) else None
+
+    def listener_callback(self, MSG):
+        T0 = time.perf_counter()
+
+        if (MSG.name != self.LAYOUT):
+            self.Layout(MSG.name)
+        if (self.IDX is None or len(MSG.position) != len(self.LAYOUT)):
+            self.N_SKIPPED = self.N_SKIPPED + 1
+            return
+
+        T = MSG.header.stamp.sec + 1e-9 * MSG.header.stamp.nanosec
+        if (T == 0.0):
+            T = self.get_clock().now().nanoseconds * 1e-9
+        self.T[self.HEAD] = T
+        self.Q[self.HEAD] = np.asarray(MSG.position)[self.IDX]
+        self.HEAD = (self.HEAD + 1) % self.SIZE
+        self.COUNT = min(self.COUNT + 1, self.SIZE)
+
+        DT = time.perf_counter() - T0
+        self.N_MSG = self.N_MSG + 1
+        self.T_CALLBACK = self.T_CALLBACK + DT
+        self.T_CALLBACK_MAX = max(self.T_CALLBACK_MAX, DT)
+
+    # Buffer contents, oldest first:
+    def History(self):
+        ORDER = (self.HEAD - self.COUNT + np.arange(self.COUNT)) % self.SIZE
+        return(self.T[ORDER], self.Q[ORDER])
+
+    # Derived statistics -> Message rate, max. |velocity| and max. |acceleration| per joint, over the buffer:
+    def Stats(self):
+        T, Q = self.History()
+        if (len(T) < 3):
+            return(None)
+        DT = np.diff(T)
+        VALID = DT > 0.0
+        V = np.diff(Q, axis=0)[VALID] / DT[VALID, None]
+        TV = 0.5 * (T[1:] + T[:-1])[VALID]
+        DTV = np.diff(TV)
+        A = np.diff(V, axis=0)[DTV > 0.0] / DTV[DTV > 0.0, None]
+        RATE = (len(T) - 1) / (T[-1] - T[0]) if (T[-1] > T[0]) else 0.0
+        return({
+            "Q": Q[-1],
+            "RATE": RATE,
+            "V_MAX": np.abs(V).max(axis=0) if len(V) else np.zeros(6),
+            "A_MAX": np.abs(A).max(axis=0) if len(A) else np.zeros(6),
+            "V_RMS": np.sqrt((V ** 2).mean(axis=0)) if len(V) else np.zeros(6),
+        })
+
+    def print_callback(self):
+        S = self.Stats()
+        if (S is None):
+            print("[MONITOR] Waiting for /joint_states...")
+            return
+        FMT = lambda X: "[" + ", ".join("%.2f" % x for x in X) + "]"
+        print("[MONITOR] JointValues [deg]: " + FMT(S["Q"] * k))
+        print("          Velocity [deg/s] -> max: " + FMT(S["V_MAX"] * k) + ", rms: " + FMT(S["V_RMS"] * k))
+        print("          Acceleration [deg/s2] -> max: " + FMT(S["A_MAX"] * k))
+        print("          Buffer: %d/%d states, %.1fHz | Callback: %d msgs, mean %.1fus, max %.1fus, %d skipped" % (
+              self.COUNT, self.SIZE, S["RATE"], self.N_MSG, 1e6 * self.T_CALLBACK / max(self.N_MSG, 1), 1e6 * self.T_CALLBACK_MAX, self.N_SKIPPED))
+        self.N_MSG = 0
+        self.N_SKIPPED = 0
+        self.T_CALLBACK = 0.0
+        self.T_CALLBACK_MAX = 0.0
+
+# BENCHMARK -> Monitor callback on synthetic 1kHz /joint_states messages (robot + gripper joints, shuffled layout):
+def MonitorBenchmark(N):
+    NAMES = ["robotiq_85_left_knuckle_joint", "wrist_3_joint", "shoulder_pan_joint", "elbow_joint", "robotiq_85_right_knuckle_joint",
+             "shoulder_lift_joint", "wrist_1_joint", "wrist_2_joint"]
+    MONITOR = JointStateMonitor()
+    MSG = JointState()
+    MSG.name = NAMES
+    T0 = time.perf_counter()
+    for i in range(N):
+        MSG.header.stamp.sec = i // 1000
+        MSG.header.stamp.nanosec = (i % 1000) * 1000000
+        MSG.position = [0.001 * i] * len(NAMES)
+        MONITOR.listener_callback(MSG)
+    T_TOTAL = time.perf_counter() - T0
+    S = MONITOR.Stats()
+    print("MONITOR BENCHMARK -> %d messages: %.0f msgs/s (%.1fus/msg) | buffer rate: %.1fHz, max velocity: %.4frad/s" % (
+          N, N / T_TOTAL, 1e6 * T_TOTAL / N, S["RATE"], S["V_MAX"].max()))
+    MONITOR.destroy_node()
+
+# BENCHMARK -> EEPose queries/second (TF2 lookup, or Gazebo concurrent vs. sequential requests):
+def EEPoseBenchmark(N, SOURCE, BASE, TIP):
+    if (SOURCE == "tf"):
+        EEPose_node = EEPoseTF()
+        EEPose_node.GET(BASE, TIP)
+        T0 = time.perf_counter()
+        for i in range(N):
+            EEPose_node.GET(BASE, TIP)
+        print("EEPOSE BENCHMARK (TF2: %s -> %s) -> %d queries: %.0f queries/s" % (BASE, TIP, N, N / (time.perf_counter() - T0)))
+    else:
+        EEPose_node = serviceClientGET()
+        T0 = time.perf_counter()
+        for i in range(N):
+            GazeboEEPose(EEPose_node)
+        T_CONC = time.perf_counter() - T0
+        T0 = time.perf_counter()
+        for i in range(N):
+            for name in ["TCP", "BASE_TF"]:
+                EEPose_node.GET(name, "")
+                while rclpy.ok() and not EEPose_node.future.done():
+                    rclpy.spin_once(EEPose_node, timeout_sec=0.1)
+        T_SEQ = time.perf_counter() - T0
+        print("EEPOSE BENCHMARK (Gazebo: TCP + BASE_TF) -> %d queries: concurrent %.1f queries/s, sequential %.1f queries/s" % (N, N / T_CONC, N / T_SEQ))
+    EEPose_node.destroy_node()
+
 
 
 # ==================================================================================================================================== #
@@ -105,7 +317,17 @@ def main(args=None):
     #    else:
     #        print ("  Please select a valid option!")
 
-    OPTION = "JointValues"
+    # OPTION -> Command-line argument (default: JointValues, single reading):
+    parser = argparse.ArgumentParser(description="Robot state: joint values (single reading or continuous monitor) and end-effector pose.")
+    parser.add_argument("--option", type=str, default="JointValues", choices=["JointValues", "Monitor", "EEPose"], help="Operation.")
+    parser.add_argument("--buffer", type=int, default=2000, help="Monitor -> Ring buffer size (states).")
+    parser.add_argument("--period", type=float, default=1.0, help="Monitor -> Print period [s].")
+    parser.add_argument("--source", type=str, default="tf", choices=["tf", "gazebo"], help="EEPose -> TF2 tree (Gazebo + Bringup) or Gazebo entity states.")
+    parser.add_argument("--base", type=str, default="base_link", help="EEPose (tf) -> Reference frame.")
+    parser.add_argument("--tip", type=str, default="wrist_3_link", help="EEPose (tf) -> End-effector frame.")
+    parser.add_argument("--benchmark", type=int, default=0, help="Monitor/EEPose -> Run N callbacks (synthetic messages) or N queries, and exit.")
+    ARGS, unknown = parser.parse_known_args()
+    OPTION = ARGS.option
     print("")
 
     # 3. Execute OPERATION:
@@ -119,49 +341,50 @@ def main(args=None):
         JointValues_node.destroy_node
         rclpy.shutdown()
 
-    # NOT WORKING! - ROTATION between BASE_TF, TCP and world frame must be considered!
-    #   3.2 - GET end-effector POSE:  --  {POSITION only, ORIENTATION to be added in the future}
+    #   3.2 - CONTINUOUS MONITOR (Ctrl+C to exit):
+    elif (OPTION == "Monitor"):
+
+        if (ARGS.benchmark > 0):
+            MonitorBenchmark(ARGS.benchmark)
+            rclpy.shutdown()
+            return
+
+        Monitor_node = JointStateMonitor(ARGS.buffer, ARGS.period)
+        try:
+            rclpy.spin(Monitor_node)
+        except KeyboardInterrupt:
+            pass
+        Monitor_node.destroy_node()
+        rclpy.shutdown()
+
+    #   3.3 - GET end-effector POSE (POSITION + ORIENTATION, relative to the robot base):
     elif (OPTION == "EEPose"):
-        
-        EEPose_node = serviceClientGET()
-        
-        # A. GET TCP relative to world:
-        EEPose_node.GET("TCP", "")
-        while rclpy.ok():
-            rclpy.spin_once(EEPose_node)
-            if EEPose_node.future.done():
-                try:
-                    response = EEPose_node.future.result()
-                except Exception as exc:
-                    EEPose_node.get_logger().info("GET STATE: Service call failed: " + str(exc))
-                break
-
-        TCP_x = response.state.pose.position.x
-        TCP_y = response.state.pose.position.y
-        TCP_z = response.state.pose.position.z
-
-        # B. GET BASE relative to world:
-        EEPose_node.GET("BASE_TF", "")
-        while rclpy.ok():
-            rclpy.spin_once(EEPose_node)
-            if EEPose_node.future.done():
-                try:
-                    response = EEPose_node.future.result()
-                except Exception as exc:
-                    EEPose_node.get_logger().info("GET STATE: Service call failed: " + str(exc))
-                break
-        
-        BASE_x = response.state.pose.position.x
-        BASE_y = response.state.pose.position.y
-        BASE_z = response.state.pose.position.z
 
-        # C. CALCULATE TCP relative to BASE:
-        x = TCP_x - BASE_x
-        y = TCP_y - BASE_y
-        z = TCP_z - BASE_z
+        if (ARGS.benchmark > 0):
+            EEPoseBenchmark(ARGS.benchmark, ARGS.source, ARGS.base, ARGS.tip)
+            rclpy.shutdown()
+            return
 
-        RESULT = "EEPose is -> 'x': " + str(round(x, 4)) + ", 'y': " + str(round(y, 4)) + ", 'z': " + str(round(z, 4))
-        print(RESULT)
+        if (ARGS.source == "tf"):
+            EEPose_node = EEPoseTF()
+            try:
+                POSE = EEPose_node.GET(ARGS.base, ARGS.tip)
+            except TransformException as exc:
+                EEPose_node.get_logger().info("GET EEPOSE: TF lookup failed: " + str(exc))
+                POSE = None
+        else:
+            EEPose_node = serviceClientGET()
+            POSE = GazeboEEPose(EEPose_node)
+            if (POSE is None):
+                EEPose_node.get_logger().info("GET STATE: Service call failed.")
+
+        if (POSE is not None):
+            XYZ, Q = POSE
+            RESULT = "EEPose is -> 'x': " + str(round(XYZ[0], 4)) + ", 'y': " + str(round(XYZ[1], 4)) + ", 'z': " + str(round(XYZ[2], 4)) + ", 'qx': " + str(round(Q[0], 4)) + ", 'qy': " + str(round(Q[1], 4)) + ", 'qz': " + str(round(Q[2], 4)) + ", 'qw': " + str(round(Q[3], 4))
+            print(RESULT)
+
+        EEPose_node.destroy_node()
+        rclpy.shutdown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+
+# StateReplay.py:
+# REPLAY of a STATE RECORDER recording (recorder node) -> The joint_states and robpose records are merged in time order and
+# republished at the recorded timing, scaled by --speed (1.0 = real time, 2.0 = twice as fast, 0 = as fast as possible).
+# The records are read from the memory-mapped files (staterec.py), so long recordings do not need to be loaded into memory.
+#
+# USAGE:
+#   ros2 run ros2srrc_execution StateReplay.py --path /tmp/ros2srrc_record --speed 1.0
+#   ros2 run ros2srrc_execution StateReplay.py --path /tmp/ros2srrc_record --speed 5.0 --topic joint_states   # e.g. RViz, no robot.
+
+# Import required libraries:
+import argparse
+import time
+import numpy as np
+import rclpy
+from rclpy.node import Node
+from sensor_msgs.msg import JointState
+from ros2srrc_data.msg import Robpose
+from staterec import Recording
+
+class StateReplay(Node):
+
+    def __init__(self, TOPIC):
+        super().__init__("ros2srrc_StateReplay")
+        self.JS_PUB = self.create_publisher(JointState, TOPIC, 10)
+        self.POSE_PUB = self.create_publisher(Robpose, "Robpose_replay", 10)
+
+    def PublishJointState(self, F, i):
+        MSG = JointState()
+        MSG.header.stamp = self.get_clock().now().to_msg()
+        MSG.name = F.NAMES
+        MSG.position = F.Field(0)[i].tolist()
+        if not F.NAN_V:
+            MSG.velocity = F.Field(1)[i].tolist()
+        if not F.NAN_E:
+            MSG.effort = F.Field(2)[i].tolist()
+        self.JS_PUB.publish(MSG)
+
+    def PublishRobpose(self, F, i):
+        D = F.DATA[i]
+        self.POSE_PUB.publish(Robpose(x=D[0], y=D[1], z=D[2], qx=D[3], qy=D[4], qz=D[5], qw=D[6]))
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Replay of a state recording (joint_states + robpose).")
+    parser.add_argument("--path", type=str, default="/tmp/ros2srrc_record", help="Recording prefix (PATH parameter of the recorder node).")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed: 1.0 = real time, 0 = as fast as possible.")
+    parser.add_argument("--topic", type=str, default="joint_states_replay", help="JointState topic.")
+    args, unknown = parser.parse_known_args()
+
+    # 1. FILES -> Every record is an event (file, index), merged in time order. Only the time stamps are copied:
+    FILES = [(F, 0) for F in Recording(args.path, "joint_states")] + [(F, 1) for F in Recording(args.path, "robpose")]
+    if (len(FILES) == 0):
+        print("StateReplay -> No recording found at " + args.path + "_<channel>_<NNNN>.bin")
+        return
+    for F, CH in FILES:
+        if (CH == 0):
+            F.NAN_V = bool(np.isnan(F.Field(1)).all())
+            F.NAN_E = bool(np.isnan(F.Field(2)).all())
+    # COUNT is read once per file -> T, FILE and IDX stay consistent if the recorder is still writing:
+    COUNT = [F.COUNT for F, CH in FILES]
+    T = np.concatenate([F.RECORDS[:N, 0] for N, (F, CH) in zip(COUNT, FILES)])
+    if (len(T) == 0):
+        print("StateReplay -> The recording at " + args.path + " contains no records.")
+        return
+    FILE = np.concatenate([np.full(N, j) for j, N in enumerate(COUNT)])
+    IDX = np.concatenate([np.arange(N) for N in COUNT])
+    ORDER = np.argsort(T, kind="stable")
+    T = T[ORDER] - T[ORDER[0]]
+    print("StateReplay -> %d records, %.1fs recorded, speed: %s" % (len(T), T[-1], str(args.speed) if args.speed > 0 else "max."))
+
+    # 2. REPLAY:
+    rclpy.init()
+    node = StateReplay(args.topic)
+    LAG = np.zeros(len(T))
+    T0 = time.monotonic()
+    try:
+        for n in range(len(T)):
+            if (args.speed > 0):
+                T_TARGET = T0 + T[n] / args.speed
+                DT = T_TARGET - time.monotonic()
+                if (DT > 0):
+                    time.sleep(DT)
+                LAG[n] = time.monotonic() - T_TARGET
+            F, CH = FILES[FILE[ORDER[n]]]
+            if (CH == 0):
+                node.PublishJointState(F, IDX[ORDER[n]])
+            else:
+                node.PublishRobpose(F, IDX[ORDER[n]])
+    except KeyboardInterrupt:
+        pass
+    T_TOTAL = time.monotonic() - T0
+
+    print("StateReplay -> %d records in %.2fs (%.0f msgs/s), lag mean: %.3fms, max: %.3fms" % (
+          n + 1, T_TOTAL, (n + 1) / T_TOTAL, 1e3 * LAG[:n + 1].mean(), 1e3 * LAG[:n + 1].max()))
+    node.destroy_node()
+    rclpy.shutdown()
+
+if __name__ == "__main__":
+    main()
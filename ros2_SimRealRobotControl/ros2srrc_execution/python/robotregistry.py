@@ -0,0 +1,203 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+
+# robotregistry.py:
+# ROBOT/END-EFFECTOR REGISTRY (Python counterpart of robotregistry.cpp) -> Compact per-group arrays, built ONCE from the
+# URDF + SRDF + joint_limits.yaml that MoveIt!2 (move_group) has loaded:
+#   - JOINTS: Variable names, in the MoveIt!2 JointModelGroup order (depth-first, child joints sorted by name).
+#   - LL, UL: Position limits [rad] or [m]. Continuous joints -> -inf/+inf.
+#   - MIMIC: Ratio of every variable w.r.t. the MoveG gripper value (URDF <mimic> multiplier, or "mimic_factor" in joint_limits.yaml).
+#   - GP: Gripper value range (LL, UL), with all MIMIC ratios applied.
+#
+# USAGE:
+#   from robotregistry import FetchModel, Registry, CheckStep
+#   URDF, SRDF, PLANNING = FetchModel(node)          # node -> any rclpy Node.
+#   REGISTRY = Registry(URDF, SRDF, PLANNING)        # {GROUP: {"JOINTS", "LL", "UL", "MIMIC", "GP"}}
+#   CheckStep(REGISTRY["ur5_arm"], REGISTRY["robotiq_2f85"], {"action": "MoveJ", "value": {...}, "speed": 1.0})
+
+# Import required libraries:
+import xml.etree.ElementTree as ET
+import numpy as np
+import rclpy
+from rcl_interfaces.srv import GetParameters, ListParameters
+from rcl_interfaces.msg import ParameterType
+
+# ===== FETCH MODEL from move_group ===== #
+def _Call(node, CLIENT, REQUEST, TIMEOUT):
+    if not CLIENT.wait_for_service(timeout_sec=TIMEOUT):
+        return(None)
+    FUTURE = CLIENT.call_async(REQUEST)
+    rclpy.spin_until_future_complete(node, FUTURE, timeout_sec=TIMEOUT)
+    return(FUTURE.result())
+
+def _Value(V):
+    if (V.type == ParameterType.PARAMETER_DOUBLE):
+        return(V.double_value)
+    elif (V.type == ParameterType.PARAMETER_INTEGER):
+        return(float(V.integer_value))
+    elif (V.type == ParameterType.PARAMETER_BOOL):
+        return(V.bool_value)
+    elif (V.type == ParameterType.PARAMETER_STRING):
+        return(V.string_value)
+    return(None)
+
+def FetchModel(node, SERVER="/move_group", TIMEOUT=5.0):
+
+    # 1. robot_description_planning.* parameter names:
+    LIST = ListParameters.Request()
+    LIST.prefixes = ["robot_description_planning"]
+    RES = _Call(node, node.create_client(ListParameters, SERVER + "/list_parameters"), LIST, TIMEOUT)
+    if (RES is None):
+        return(None, None, None)
+    NAMES = list(RES.result.names)
+
+    # 2. Values -> URDF, SRDF and joint_limits:
+    GET = GetParameters.Request()
+    GET.names = ["robot_description", "robot_description_semantic"] + NAMES
+    RES = _Call(node, node.create_client(GetParameters, SERVER + "/get_parameters"), GET, TIMEOUT)
+    if (RES is None):
+        return(None, None, None)
+    VALUES = [_Value(V) for V in RES.values]
+
+    PLANNING = dict(zip(NAMES, VALUES[2:]))
+    return(VALUES[0], VALUES[1], PLANNING)
+
+# ===== REGISTRY ===== #
+def _JointOrder(URDF):
+    # MoveIt!2 joint order -> Depth-first from the root link, the child joints of every link sorted by name (urdfdom).
+    CHILDREN = {}
+    PARENTS = set()
+    CHILD_LINKS = set()
+    for J in URDF.findall("joint"):
+        PARENT = J.find("parent").get("link")
+        CHILDREN.setdefault(PARENT, []).append(J)
+        PARENTS.add(PARENT)
+        CHILD_LINKS.add(J.find("child").get("link"))
+    ROOTS = sorted(PARENTS - CHILD_LINKS)
+
+    ORDER = []
+    STACK = [J for R in ROOTS for J in sorted(CHILDREN.get(R, []), key=lambda X: X.get("name"), reverse=True)]
+    while STACK:
+        J = STACK.pop()
+        ORDER.append(J)
+        STACK.extend(sorted(CHILDREN.get(J.find("child").get("link"), []), key=lambda X: X.get("name"), reverse=True))
+    return(ORDER)
+
+def _GroupJoints(SRDF, NAME, JOINTS):
+    # Joint names of a SRDF group -> <joint>, <chain> and <group> (subgroup) elements:
+    GROUP = next((G for G in SRDF.findall("group") if G.get("name") == NAME), None)
+    if (GROUP is None):
+        return(set())
+    NAMES = set(J.get("name") for J in GROUP.findall("joint"))
+    for C in GROUP.findall("chain"):
+        LINK = C.get("tip_link")
+        while (LINK != C.get("base_link")):
+            J = next((J for J in JOINTS if J.find("child").get("link") == LINK), None)
+            if (J is None):
+                break
+            NAMES.add(J.get("name"))
+            LINK = J.find("parent").get("link")
+    for S in GROUP.findall("group"):
+        NAMES = NAMES | _GroupJoints(SRDF, S.get("name"), JOINTS)
+    return(NAMES)
+
+def Registry(URDF, SRDF, PLANNING=None):
+
+    PLANNING = {} if PLANNING is None else PLANNING
+    URDF = ET.fromstring(URDF)
+    SRDF = ET.fromstring(SRDF)
+    JOINTS = _JointOrder(URDF)
+
+    REGISTRY = {}
+    for G in SRDF.findall("group"):
+
+        NAMES = _GroupJoints(SRDF, G.get("name"), JOINTS)
+        ENTRY = {"JOINTS": [], "LL": [], "UL": [], "MIMIC": []}
+
+        for J in JOINTS:
+            if (J.get("name") not in NAMES or J.get("type") in ("fixed", "floating", "planar")):
+                continue
+            NAME = J.get("name")
+            KEY = "robot_description_planning.joint_limits." + NAME + "."
+
+            # 1. JOINT LIMITS -> URDF <limit>, overridden by joint_limits.yaml (has_position_limits):
+            LIMIT = J.find("limit")
+            LL, UL = -np.inf, np.inf
+            if (J.get("type") != "continuous" and LIMIT is not None):
+                LL, UL = float(LIMIT.get("lower", 0.0)), float(LIMIT.get("upper", 0.0))
+            if (PLANNING.get(KEY + "has_position_limits") == True):
+                LL = PLANNING.get(KEY + "min_position", LL)
+                UL = PLANNING.get(KEY + "max_position", UL)
+
+            # 2. MIMIC RATIO -> URDF <mimic>, or "mimic_factor" in joint_limits.yaml:
+            MIMIC = J.find("mimic")
+            if (MIMIC is not None):
+                F = float(MIMIC.get("multiplier", 1.0))
+            else:
+                F = float(PLANNING.get(KEY + "mimic_factor", 1.0))
+
+            ENTRY["JOINTS"].append(NAME)
+            ENTRY["LL"].append(LL)
+            ENTRY["UL"].append(UL)
+            ENTRY["MIMIC"].append(F)
+
+        for K in ("LL", "UL", "MIMIC"):
+            ENTRY[K] = np.array(ENTRY[K], dtype=float)
+
+        # 3. GRIPPER RANGE -> Intersection of [LL/F, UL/F] for all variables:
+        F = ENTRY["MIMIC"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            A, B = ENTRY["LL"] / F, ENTRY["UL"] / F
+        ON = (F != 0.0)
+        ENTRY["GP"] = (float(np.max(np.minimum(A, B)[ON], initial=-np.inf)), float(np.min(np.maximum(A, B)[ON], initial=np.inf)))
+
+        REGISTRY[G.get("name")] = ENTRY
+
+    return(REGISTRY)
+
+# ===== PROGRAM STEP CHECK ===== #
+# Same checks as MoveJAction/MoveGAction (C++) -> MoveJ values [deg] against the ROBOT limits, MoveG value against the gripper range.
+# MoveR depends on the current joint values, and it is checked by the ACTION SERVER only.
+def CheckStep(ROB, EE, STEP):
+
+    if (STEP["action"] == "MoveJ" and ROB is not None):
+        N = len(ROB["JOINTS"])
+        Q = np.radians([STEP["value"]["joint" + str(i + 1)] for i in range(N)])
+        if np.all((Q >= ROB["LL"]) & (Q <= ROB["UL"])):
+            return("LIMITS: OK")
+        return("LIMITS: ERROR")
+
+    elif (STEP["action"] == "MoveG" and EE is not None):
+        VAL = STEP["value"]["value"]
+        if (EE["GP"][0] <= VAL <= EE["GP"][1]):
+            return("LIMITS: OK")
+        return("LIMITS: ERROR (EE)")
+
+    return("LIMITS: OK")
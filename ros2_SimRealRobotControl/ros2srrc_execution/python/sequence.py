@@ -48,9 +48,15 @@ from ros2srrc_data.msg import Xyzypr
 from ros2srrc_data.msg import Ypr
 from ros2srrc_data.msg import Linkattacher
 
+# Import ROBOT/END-EFFECTOR REGISTRY:
+from robotregistry import FetchModel, Registry, CheckStep
+
 # Define GLOBAL VARIABLE -> RES:
 RES = "null"
 
+# Define GLOBAL VARIABLE -> ROBOT/END-EFFECTOR REGISTRY (loaded from move_group):
+REGISTRY = {}
+
 # ===== ACTION CLIENT ===== #
 class ACsequence(Node):
     
@@ -144,8 +150,8 @@ class RobotPARAM(Node):
         else:
             self.get_logger().info('ROBOT_MODEL ROS2 Parameter received: ' + PARAM_ROBOT)
 
-            # Check value:
-            if (PARAM_ROBOT == "ur5" or PARAM_ROBOT == "ur3"):
+            # Check value -> ROBOT planning group (<ROBOT_MODEL>_arm) in the REGISTRY:
+            if ((PARAM_ROBOT + "_arm") in REGISTRY):
                 None # do nothing.
             else:
                 self.get_logger().info('ERROR: The Robot model defined is not in the system.')
@@ -170,10 +176,8 @@ class eePARAM(Node):
         else:
             self.get_logger().info('EE_MODEL ROS2 Parameter received: ' + PARAM_EE)
             
-            if (PARAM_EE == "egp64" or
-                PARAM_EE == "robotiq_2f85" or
-                PARAM_EE == "robotiq_hande" or
-                PARAM_EE == "none"):
+            # Check value -> END-EFFECTOR planning group in the REGISTRY:
+            if (PARAM_EE in REGISTRY or PARAM_EE == "none"):
                 None # do nothing.
             else:
                 self.get_logger().info('ERROR: The End-Effector model defined is not in the system.')
@@ -227,8 +231,9 @@ class CloseProgram():
 
 def main(args=None):
     
-    # Import global variable RES:
+    # Import global variables RES and REGISTRY:
     global RES
+    global REGISTRY
     
     # 1. INITIALISE ROS NODE:
     rclpy.init(args=args)
@@ -252,6 +257,15 @@ def main(args=None):
     global PARAM_GzBr
     global P_CHECK_GzBr
 
+    # ROBOT/END-EFFECTOR REGISTRY -> URDF + SRDF + joint_limits.yaml loaded by move_group:
+    registryNODE = rclpy.create_node('ros2srrc_registry')
+    URDF, SRDF, PLANNING = FetchModel(registryNODE)
+    registryNODE.destroy_node()
+    if (URDF is None or SRDF is None):
+        print("ERROR: The robot model could not be obtained from move_group. Is the MoveIt!2 interface running?")
+        CloseProgram.CLOSE()
+    REGISTRY = Registry(URDF, SRDF, PLANNING)
+
     paramNODE = ProgramPARAM()
     while (P_CHECK_PROGRAM == False):
         rclpy.spin_once(paramNODE)
@@ -309,13 +323,29 @@ def main(args=None):
             i = i + 1
         file.close()
 
-    # 5. CONVERT TO Action[] and call ACsequence():
+    # 5. CHECK PROGRAM against the ROBOT/END-EFFECTOR REGISTRY (MoveJ/MoveG limits):
+    for i in range (1, len(readSEQ)+1):
+        CHECK = CheckStep(REGISTRY.get(PARAM_ROBOT + "_arm"), REGISTRY.get(PARAM_EE), readSEQ[str(i)])
+        if (CHECK != "LIMITS: OK"):
+            print("[ERROR]: Program -> " + PR_NAME + " <- Step " + str(i) + " (" + readSEQ[str(i)]['action'] + "): " + CHECK)
+            nodeLOG.get_logger().info("ERROR: " + PR_NAME + " program, step " + str(i) + " -> " + CHECK)
+            print("Closing... BYE!")
+            time.sleep(5)
+            exit()
+
+    # 6. CONVERT TO Action[] and call ACsequence():
     SEQUENCE = []
     for i in range (1, len(readSEQ)+1):
 
         ACTION = Action()
         ACTION.action = readSEQ[str(i)]['action']
 
+        # OPTIONAL -> Acceleration scaling factor + jerk limit [rad/s^3] for the trajectory retiming:
+        if ('accel' in readSEQ[str(i)]):
+            ACTION.accel = float(readSEQ[str(i)]['accel'])
+        if ('jerk' in readSEQ[str(i)]):
+            ACTION.jerk = float(readSEQ[str(i)]['jerk'])
+
         if (ACTION.action == "MoveJ"):
             ACTION.speed = readSEQ[str(i)]['speed']
             MoveJ_VAR = Joints()
@@ -410,7 +440,7 @@ def main(args=None):
         
         SEQUENCE.append(ACTION)
     
-    # 6. CALL ROS2 Action -> SEQUENCE:
+    # 7. CALL ROS2 Action -> SEQUENCE:
     SEQ_CLIENT.send_goal(SEQUENCE, PARAM_ROBOT, PARAM_EE, PARAM_GzBr)
             
     while rclpy.ok():
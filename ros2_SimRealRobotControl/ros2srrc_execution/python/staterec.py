@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+
+# staterec.py:
+# Reader for the STATE RECORDER files (recorder node, staterec.h) -> Zero-copy NumPy arrays over the memory-mapped records.
+# File layout: HEADER (4096 bytes) + COUNT x (1 + WIDTH) float64 records -> [T, DATA(WIDTH)].
+# Files of a recording: <PREFIX>_<CHANNEL>_<NNNN>.bin (CHANNEL: joint_states, robpose, controller).
+#
+# USAGE:
+#   from staterec import StateFile, Recording
+#   F = StateFile("/tmp/ros2srrc_record_joint_states_0000.bin")
+#   F.T, F.DATA, F.NAMES                      # (N,), (N,WIDTH), layout -> Views of the file (no copy).
+#   F.Field(0)                                # joint_states: positions (N,K); Field(1) velocities, Field(2) efforts.
+#   FILES = Recording("/tmp/ros2srrc_record", "joint_states")   # All the files of the sequence, in order.
+#   T, DATA = Concat(FILES)                   # Whole recording (copy).
+
+# Import required libraries:
+import glob
+import numpy as np
+
+MAGIC = b"SRRCREC1"
+HEADER_SIZE = 4096
+HEADER_DTYPE = np.dtype([
+    ("MAGIC", "S8"), ("VERSION", "<u4"), ("WIDTH", "<u4"), ("CAPACITY", "<u8"), ("COUNT", "<u8"), ("N", "<u4"), ("RESERVED", "<u4"),
+    ("NAMES", "S4056"),
+])
+
+class StateFile():
+
+    def __init__(self, PATH):
+        self.PATH = PATH
+        self.MAP = np.memmap(PATH, dtype=np.uint8, mode="r")
+        self.HEADER = self.MAP[:HEADER_SIZE].view(HEADER_DTYPE)[0]
+        if (bytes(self.HEADER["MAGIC"]) != MAGIC):
+            raise ValueError(PATH + " is not a state record file.")
+        self.WIDTH = int(self.HEADER["WIDTH"])
+        self.CAPACITY = int(self.HEADER["CAPACITY"])
+        self.NAMES = bytes(self.HEADER["NAMES"]).decode().split("\n")[:int(self.HEADER["N"])]
+        ROWS = (len(self.MAP) - HEADER_SIZE) // (8 * (1 + self.WIDTH))
+        self.RECORDS = self.MAP[HEADER_SIZE:HEADER_SIZE + 8 * (1 + self.WIDTH) * ROWS].view("<f8").reshape(ROWS, 1 + self.WIDTH)
+
+    # Records written -> Read from the header on every access (the file may still be recording):
+    @property
+    def COUNT(self):
+        return(min(int(self.MAP[:HEADER_SIZE].view(HEADER_DTYPE)[0]["COUNT"]), len(self.RECORDS)))
+
+    @property
+    def T(self):
+        return(self.RECORDS[:self.COUNT, 0])
+
+    @property
+    def DATA(self):
+        return(self.RECORDS[:self.COUNT, 1:])
+
+    # Block i of K = len(NAMES) values -> joint_states: 0 position, 1 velocity, 2 effort | controller: 0 desired, 1 actual, 2 error:
+    def Field(self, i):
+        K = len(self.NAMES)
+        return(self.RECORDS[:self.COUNT, 1 + i*K:1 + (i+1)*K])
+
+# All the files of a recording channel, in order:
+def Recording(PREFIX, CHANNEL):
+    return([StateFile(PATH) for PATH in sorted(glob.glob(PREFIX + "_" + CHANNEL + "_[0-9][0-9][0-9][0-9].bin"))])
+
+# Whole recording -> (T, DATA) arrays (a copy, the files are concatenated):
+def Concat(FILES):
+    if (len(FILES) == 0):
+        return(np.zeros(0), np.zeros((0, 0)))
+    return(np.concatenate([F.T for F in FILES]), np.concatenate([F.DATA for F in FILES]))
@@ -0,0 +1,297 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+
+# urkinematics.py:
+# Vectorized (NumPy) kinematics for the Universal Robots arms in ros2_SimRealRobotControl (ur3, ur5).
+#   - Forward kinematics: base_link -> tool0, for whole arrays of joint configurations at once.
+#   - Inverse kinematics: closed-form (Hawkins, 2013), all 8 solutions for whole arrays of poses at once.
+# No ROS 2 / MoveIt!2 needed -> Offline analysis of recorded trajectories and programs.
+#
+# USAGE:
+#   import numpy as np
+#   from urkinematics import FK, IK, IKNearest, MatrixToPose
+#   Q = np.radians(np.array([[0.0, -90.0, 90.0, -90.0, -90.0, 0.0], ...]))   # (N,6) [rad]
+#   T = FK("ur5", Q)                                                          # (N,4,4)
+#   XYZ, QUAT = MatrixToPose(T)                                               # (N,3), (N,4) -> (qx,qy,qz,qw)
+#   QSOL, VALID = IK("ur5", T)                                                # (N,8,6), (N,8)
+#   QN, OK = IKNearest("ur5", T, SEED=Q)                                      # (N,6), (N,)
+
+# Import required libraries:
+import numpy as np
+
+# ===== ROBOT PARAMETERS ===== #
+# DH parameters of the UR arms (same values as the UR description used in the ur3/ur5 URDF files).
+# The URDF base_link frame is the DH base frame rotated by pi around Z.
+UR_PARAMS = {
+    "ur3": {"d1": 0.1519, "a2": -0.24365, "a3": -0.21325, "d4": 0.11235, "d5": 0.08535, "d6": 0.0819},
+    "ur5": {"d1": 0.089159, "a2": -0.425, "a3": -0.39225, "d4": 0.10915, "d5": 0.09465, "d6": 0.0823},
+}
+
+# Joint limits [rad] -> ur3/ur5 URDF (elbow_joint: +-pi, all the other joints: +-2pi):
+UR_LIMITS = {
+    "LL": np.array([-2*np.pi, -2*np.pi, -np.pi, -2*np.pi, -2*np.pi, -2*np.pi]),
+    "UL": np.array([2*np.pi, 2*np.pi, np.pi, 2*np.pi, 2*np.pi, 2*np.pi]),
+}
+
+# world -> base_link (cell layouts of the ur3/ur5 .urdf.xacro files): (xyz, rpy)
+CELL_BASE = {
+    "cell_layout_1": ([0.0, 0.0, 0.0], [0.0, 0.0, 0.0]),
+    "cell_layout_2": ([-0.25, 0.20, 0.762], [0.0, 0.0, -0.7854]),
+    "cell_layout_3": ([-0.25, 0.20, 0.762], [0.0, 0.0, -0.7854]),
+}
+
+ZERO_THRESH = 1e-8
+BASE_ROT = np.array([[-1.0, 0.0, 0.0, 0.0],
+                     [0.0, -1.0, 0.0, 0.0],
+                     [0.0, 0.0, 1.0, 0.0],
+                     [0.0, 0.0, 0.0, 1.0]])
+
+# ===== TRANSFORMS ===== #
+
+# Standard DH transform, vectorized over theta -> (...,4,4):
+def DH(a, alpha, d, theta):
+    theta = np.asarray(theta, dtype=float)
+    ct = np.cos(theta)
+    st = np.sin(theta)
+    ca = np.cos(alpha)
+    sa = np.sin(alpha)
+    T = np.zeros(theta.shape + (4,4))
+    T[...,0,0] = ct
+    T[...,0,1] = -st*ca
+    T[...,0,2] = st*sa
+    T[...,0,3] = a*ct
+    T[...,1,0] = st
+    T[...,1,1] = ct*ca
+    T[...,1,2] = -ct*sa
+    T[...,1,3] = a*st
+    T[...,2,1] = sa
+    T[...,2,2] = ca
+    T[...,2,3] = d
+    T[...,3,3] = 1.0
+    return(T)
+
+# Inverse of (...,4,4) homogeneous transforms:
+def InvT(T):
+    Ti = np.zeros_like(T)
+    Rt = np.swapaxes(T[...,:3,:3], -1, -2)
+    Ti[...,:3,:3] = Rt
+    Ti[...,:3,3] = -np.einsum("...ij,...j->...i", Rt, T[...,:3,3])
+    Ti[...,3,3] = 1.0
+    return(Ti)
+
+# (xyz, rpy) -> 4x4 homogeneous transform (URDF <origin> convention):
+def Transform(xyz, rpy):
+    r, p, y = rpy
+    Rx = np.array([[1.0, 0.0, 0.0], [0.0, np.cos(r), -np.sin(r)], [0.0, np.sin(r), np.cos(r)]])
+    Ry = np.array([[np.cos(p), 0.0, np.sin(p)], [0.0, 1.0, 0.0], [-np.sin(p), 0.0, np.cos(p)]])
+    Rz = np.array([[np.cos(y), -np.sin(y), 0.0], [np.sin(y), np.cos(y), 0.0], [0.0, 0.0, 1.0]])
+    T = np.eye(4)
+    T[:3,:3] = Rz @ Ry @ Rx
+    T[:3,3] = xyz
+    return(T)
+
+# (...,4,4) -> Position (...,3) + Quaternion (...,4) as (qx,qy,qz,qw), with qw >= 0:
+# Shepperd's method -> The largest of |qw|,|qx|,|qy|,|qz| is taken from the diagonal, and the other 3 components from the
+# off-diagonal sums/differences divided by it (well conditioned also near 180deg rotations, where qw ~ 0).
+def MatrixToPose(T):
+    R = T[...,:3,:3]
+    r00, r11, r22 = R[...,0,0], R[...,1,1], R[...,2,2]
+
+    # 4*q_i^2 for (qw,qx,qy,qz) -> Largest component:
+    D = np.stack([1.0 + r00 + r11 + r22,
+                  1.0 + r00 - r11 - r22,
+                  1.0 - r00 + r11 - r22,
+                  1.0 - r00 - r11 + r22], axis=-1)
+    K = np.argmax(D, axis=-1)
+    S = 2.0 * np.sqrt(np.maximum(np.take_along_axis(D, K[...,None], axis=-1)[...,0], ZERO_THRESH))   # 4*|q_K|
+
+    # Off-diagonal differences (-> 4*qw*qi) and sums (-> 4*qi*qj):
+    d_x = R[...,2,1] - R[...,1,2]
+    d_y = R[...,0,2] - R[...,2,0]
+    d_z = R[...,1,0] - R[...,0,1]
+    s_xy = R[...,0,1] + R[...,1,0]
+    s_xz = R[...,0,2] + R[...,2,0]
+    s_yz = R[...,1,2] + R[...,2,1]
+
+    # Candidates (qx,qy,qz,qw) for each choice of the largest component:
+    C = np.stack([
+        np.stack([d_x, d_y, d_z, S*S/4.0], axis=-1),
+        np.stack([S*S/4.0, s_xy, s_xz, d_x], axis=-1),
+        np.stack([s_xy, S*S/4.0, s_yz, d_y], axis=-1),
+        np.stack([s_xz, s_yz, S*S/4.0, d_z], axis=-1),
+    ], axis=-2) / S[...,None,None]
+    q = np.take_along_axis(C, K[...,None,None], axis=-2)[...,0,:]
+
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    q = np.where(q[...,3:4] < 0.0, -q, q)
+    return(T[...,:3,3].copy(), q)
+
+# Position (...,3) + Quaternion (...,4) as (qx,qy,qz,qw) -> (...,4,4):
+def PoseToMatrix(XYZ, QUAT):
+    XYZ = np.asarray(XYZ, dtype=float)
+    q = np.asarray(QUAT, dtype=float)
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    x, y, z, w = q[...,0], q[...,1], q[...,2], q[...,3]
+    T = np.zeros(q.shape[:-1] + (4,4))
+    T[...,0,0] = 1.0 - 2.0*(y*y + z*z)
+    T[...,0,1] = 2.0*(x*y - z*w)
+    T[...,0,2] = 2.0*(x*z + y*w)
+    T[...,1,0] = 2.0*(x*y + z*w)
+    T[...,1,1] = 1.0 - 2.0*(x*x + z*z)
+    T[...,1,2] = 2.0*(y*z - x*w)
+    T[...,2,0] = 2.0*(x*z - y*w)
+    T[...,2,1] = 2.0*(y*z + x*w)
+    T[...,2,2] = 1.0 - 2.0*(x*x + y*y)
+    T[...,:3,3] = XYZ
+    T[...,3,3] = 1.0
+    return(T)
+
+# ===== FORWARD KINEMATICS ===== #
+# Q: (...,6) joint values [rad] -> (...,4,4) pose of tool0 relative to base_link.
+# Optional: BASE (world -> base_link) and TOOL (tool0 -> TCP) 4x4 transforms.
+def FK(ROBOT, Q, BASE=None, TOOL=None):
+    P = UR_PARAMS[ROBOT]
+    Q = np.asarray(Q, dtype=float)
+    T = (BASE_ROT
+         @ DH(0.0, np.pi/2.0, P["d1"], Q[...,0])
+         @ DH(P["a2"], 0.0, 0.0, Q[...,1])
+         @ DH(P["a3"], 0.0, 0.0, Q[...,2])
+         @ DH(0.0, np.pi/2.0, P["d4"], Q[...,3])
+         @ DH(0.0, -np.pi/2.0, P["d5"], Q[...,4])
+         @ DH(0.0, 0.0, P["d6"], Q[...,5]))
+    if BASE is not None:
+        T = BASE @ T
+    if TOOL is not None:
+        T = T @ TOOL
+    return(T)
+
+# ===== INVERSE KINEMATICS ===== #
+# T: (...,4,4) pose of tool0 relative to base_link (BASE/TOOL are removed first, if given).
+# RETURNS: QSOL (...,8,6) joint values [rad] wrapped to [-pi,pi] (NaN if not valid), VALID (...,8).
+def IK(ROBOT, T, BASE=None, TOOL=None, q6_default=0.0):
+    P = UR_PARAMS[ROBOT]
+    d1, a2, a3, d4, d5, d6 = P["d1"], P["a2"], P["a3"], P["d4"], P["d5"], P["d6"]
+
+    T = np.asarray(T, dtype=float)
+    if BASE is not None:
+        T = InvT(BASE) @ T
+    if TOOL is not None:
+        T = T @ InvT(TOOL)
+
+    # 1. Pose in the DH base frame:
+    T06 = BASE_ROT @ T
+    R = T06[...,:3,:3]
+    p = T06[...,:3,3]
+    SHAPE = T06.shape[:-2]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+
+        # 2. SHOULDER PAN (q1) -> (...,2):
+        p05 = p - d6 * R[...,:,2]
+        r05 = np.hypot(p05[...,0], p05[...,1])
+        c_phi = d4 / r05
+        ok1 = (r05 > ZERO_THRESH) & (np.abs(c_phi) <= 1.0 + ZERO_THRESH)
+        phi = np.arccos(np.clip(c_phi, -1.0, 1.0))
+        psi = np.arctan2(p05[...,1], p05[...,0])
+        q1 = np.stack([psi + phi + np.pi/2.0, psi - phi + np.pi/2.0], axis=-1)
+        ok1 = np.broadcast_to(ok1[...,None], q1.shape)
+
+        # 3. WRIST 2 (q5) -> (...,2,2):
+        s1 = np.sin(q1)
+        c1 = np.cos(q1)
+        c5 = (p[...,0,None]*s1 - p[...,1,None]*c1 - d4) / d6
+        ok5 = ok1 & (np.abs(c5) <= 1.0 + ZERO_THRESH)
+        q5a = np.arccos(np.clip(c5, -1.0, 1.0))
+        q5 = np.stack([q5a, -q5a], axis=-1)
+        ok5 = np.broadcast_to(ok5[...,None], q5.shape)
+        q1 = np.broadcast_to(q1[...,None], q5.shape)
+        s1 = np.sin(q1)
+        c1 = np.cos(q1)
+
+        # 4. WRIST 3 (q6) -> (...,2,2):
+        s5 = np.sin(q5)
+        Rb = R[...,None,None,:,:]
+        q6 = np.arctan2((-Rb[...,0,1]*s1 + Rb[...,1,1]*c1) / s5, (Rb[...,0,0]*s1 - Rb[...,1,0]*c1) / s5)
+        q6 = np.where(np.abs(s5) < ZERO_THRESH, q6_default, q6)
+
+        # 5. ELBOW (q3) -> Planar 2R problem (frame 1 to frame 3), (...,2,2,2):
+        T14 = InvT(DH(0.0, np.pi/2.0, d1, q1)) @ T06[...,None,None,:,:] @ InvT(DH(0.0, -np.pi/2.0, d5, q5) @ DH(0.0, 0.0, d6, q6))
+        p13 = T14[...,:3,:3] @ np.array([0.0, -d4, 0.0]) + T14[...,:3,3]
+        L2 = np.sum(p13**2, axis=-1)
+        c3 = (L2 - a2*a2 - a3*a3) / (2.0*a2*a3)
+        ok3 = ok5 & (np.abs(c3) <= 1.0 + ZERO_THRESH)
+        q3a = np.arccos(np.clip(c3, -1.0, 1.0))
+        q3 = np.stack([q3a, -q3a], axis=-1)
+        ok3 = np.broadcast_to(ok3[...,None], q3.shape)
+
+        # 6. SHOULDER LIFT (q2):
+        q2 = np.arctan2(p13[...,1], p13[...,0])[...,None] - np.arctan2(a3*np.sin(q3), a2 + a3*np.cos(q3))
+
+        # 7. WRIST 1 (q4):
+        T14b = np.broadcast_to(T14[...,None,:,:], q3.shape + (4,4))
+        T34 = InvT(DH(a2, 0.0, 0.0, q2) @ DH(a3, 0.0, 0.0, q3)) @ T14b
+        q4 = np.arctan2(T34[...,1,0], T34[...,0,0])
+
+    # 8. SOLUTIONS -> (...,8,6), same order as the C++ solver (q1, q5, q3 branches):
+    Q = np.stack([
+        np.broadcast_to(q1[...,None], q3.shape),
+        q2,
+        q3,
+        q4,
+        np.broadcast_to(q5[...,None], q3.shape),
+        np.broadcast_to(q6[...,None], q3.shape),
+    ], axis=-1)
+    Q = (Q + np.pi) % (2.0*np.pi) - np.pi
+    Q = Q.reshape(SHAPE + (8,6))
+    VALID = ok3.reshape(SHAPE + (8,))
+    Q = np.where(VALID[...,None], Q, np.nan)
+    return(Q, VALID)
+
+# Closest (2pi-harmonized) valid IK solution to SEED, within the joint limits:
+# RETURNS: Q (...,6) (NaN where there is no solution), OK (...).
+def IKNearest(ROBOT, T, SEED, BASE=None, TOOL=None, LL=None, UL=None):
+    LL = UR_LIMITS["LL"] if LL is None else np.asarray(LL)
+    UL = UR_LIMITS["UL"] if UL is None else np.asarray(UL)
+    QSOL, VALID = IK(ROBOT, T, BASE, TOOL)
+    SEED = np.asarray(SEED, dtype=float)[...,None,:]
+
+    # 2pi multiple closest to the seed, then back inside the limits (if possible):
+    with np.errstate(invalid="ignore"):
+        Q = QSOL + 2.0*np.pi*np.round((SEED - QSOL) / (2.0*np.pi))
+        Q = np.where(Q > UL, Q - 2.0*np.pi*np.ceil((Q - UL) / (2.0*np.pi)), Q)
+        Q = np.where(Q < LL, Q + 2.0*np.pi*np.ceil((LL - Q) / (2.0*np.pi)), Q)
+        VALID = VALID & np.all((Q >= LL) & (Q <= UL), axis=-1)
+
+    DIST = np.where(VALID, np.sum((Q - SEED)**2, axis=-1), np.inf)
+    BEST = np.argmin(DIST, axis=-1)
+    OK = np.take_along_axis(VALID, BEST[...,None], axis=-1)[...,0]
+    QN = np.take_along_axis(Q, BEST[...,None,None], axis=-2)[...,0,:]
+    QN = np.where(OK[...,None], QN, np.nan)
+    return(QN, OK)
@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+
+# xacrocache.py:
+# XACRO CACHE -> The XML generated by xacro (robot descriptions in the launch files, objects in SpawnObject.py) is stored on disk and
+# reused while neither the source files nor the xacro mappings change:
+#   - KEY: Source file path + mappings -> One cache entry (<CACHE>/<sha256>.json).
+#   - ENTRY: XML + every file read by xacro (the source file and all its <xacro:include> files) with its size, mtime and sha256.
+#   - VALIDATION: An entry is used only if every file is unchanged -> Same size/mtime, or (if touched) same content hash.
+#     Otherwise, the file is processed again and the entry is replaced.
+# CACHE directory: $ROS2SRRC_XACRO_CACHE, or ~/.ros/ros2srrc_xacro_cache. ROS2SRRC_XACRO_CACHE=off disables the cache.
+#
+# USAGE:
+#   from xacrocache import ProcessXacro
+#   XML = ProcessXacro("/path/to/ur5.urdf.xacro", mappings={"EE_no": "true"}, log=print)
+#   python3 xacrocache.py /path/to/ur5.urdf.xacro EE_no:=true --runs 5    # COLD (no cache) vs. WARM processing time.
+
+# Import required libraries:
+import argparse
+import hashlib
+import json
+import os
+import time
+import xacro
+
+def CacheDir():
+    return(os.environ.get("ROS2SRRC_XACRO_CACHE", os.path.join(os.path.expanduser("~"), ".ros", "ros2srrc_xacro_cache")))
+
+def FileHash(PATH):
+    with open(PATH, "rb") as f:
+        return(hashlib.sha256(f.read()).hexdigest())
+
+def EntryPath(PATH, mappings):
+    KEY = json.dumps([os.path.abspath(PATH), sorted((str(k), str(v)) for k, v in mappings.items())])
+    return(os.path.join(CacheDir(), hashlib.sha256(KEY.encode()).hexdigest() + ".json"))
+
+# Cached XML, or None if there is no (valid) entry:
+def LoadEntry(ENTRY):
+    try:
+        with open(ENTRY, "r") as f:
+            DATA = json.load(f)
+        for PATH, (SIZE, MTIME, SHA) in DATA["deps"].items():
+            ST = os.stat(PATH)
+            if (ST.st_size != SIZE):
+                return(None)
+            if (ST.st_mtime_ns != MTIME and FileHash(PATH) != SHA):
+                return(None)
+        return(DATA["xml"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return(None)
+
+def SaveEntry(ENTRY, XML, DEPS):
+    DATA = {"xml": XML, "deps": {}}
+    for PATH in DEPS:
+        ST = os.stat(PATH)
+        DATA["deps"][PATH] = (ST.st_size, ST.st_mtime_ns, FileHash(PATH))
+    os.makedirs(os.path.dirname(ENTRY), exist_ok=True)
+    TMP = ENTRY + "." + str(os.getpid()) + ".tmp"
+    with open(TMP, "w") as f:
+        json.dump(DATA, f)
+    os.replace(TMP, ENTRY)
+
+# xacro -> XML (cached):
+def ProcessXacro(PATH, mappings=None, log=None):
+    mappings = mappings or {}
+    T0 = time.monotonic()
+
+    # The included files are tracked by xacro in all_includes -> Without it, the dependencies are unknown and nothing is cached:
+    CACHE = (os.environ.get("ROS2SRRC_XACRO_CACHE", "") != "off") and hasattr(xacro, "all_includes")
+    ENTRY = EntryPath(PATH, mappings)
+
+    if CACHE:
+        XML = LoadEntry(ENTRY)
+        if (XML is not None):
+            if log is not None:
+                log("XACRO CACHE -> HIT: " + os.path.basename(PATH) + " (%.3fs)" % (time.monotonic() - T0))
+            return(XML)
+        del xacro.all_includes[:]
+
+    XML = xacro.process_file(PATH, mappings=mappings).toxml()
+
+    if CACHE:
+        DEPS = [os.path.abspath(PATH)] + [os.path.abspath(f) for f in xacro.all_includes]
+        try:
+            SaveEntry(ENTRY, XML, sorted(set(DEPS)))
+        except OSError:
+            pass
+    if log is not None:
+        log("XACRO CACHE -> " + ("MISS" if CACHE else "OFF") + ": " + os.path.basename(PATH) + " (%.3fs)" % (time.monotonic() - T0))
+    return(XML)
+
+# BENCHMARK -> COLD (entry removed, full xacro processing) vs. WARM (cache hit) time, RUNS times each:
+def main():
+    parser = argparse.ArgumentParser(description="XACRO CACHE: cold vs. warm processing time.")
+    parser.add_argument("file", type=str, help=".xacro/.urdf file.")
+    parser.add_argument("mappings", nargs="*", help="xacro mappings -> name:=value.")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per mode.")
+    args = parser.parse_args()
+
+    mappings = dict(M.split(":=", 1) for M in args.mappings)
+    ENTRY = EntryPath(args.file, mappings)
+    T = {"COLD": [], "WARM": []}
+    for i in range(args.runs):
+        if os.path.exists(ENTRY):
+            os.remove(ENTRY)
+        T0 = time.monotonic()
+        ProcessXacro(args.file, mappings)
+        T["COLD"].append(time.monotonic() - T0)
+        T0 = time.monotonic()
+        ProcessXacro(args.file, mappings)
+        T["WARM"].append(time.monotonic() - T0)
+    for MODE in ["COLD", "WARM"]:
+        print("XACRO CACHE (%s) -> %s: mean %.4fs, min %.4fs, max %.4fs" % (os.path.basename(args.file), MODE,
+              sum(T[MODE]) / len(T[MODE]), min(T[MODE]), max(T[MODE])))
+    print("Entry: " + ENTRY)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/directexec.h"
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <future>
+#include <memory>
+#include <string>
+#include <thread>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+#include "rclcpp_action/rclcpp_action.hpp"
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+
+// Declaration of CONSTANT VALUES:
+const double PARAM_TIMEOUT = 5.0;     // [s]
+const double GOAL_TIMEOUT = 1.0;      // [s] Goal acceptance.
+const double POLL_PERIOD = 0.005;     // [s]
+
+DirectExecutor::DirectExecutor() : SCALING_(1.2), MARGIN_(0.5), START_TOL_(0.01), STOP_ID_(0), N_(0), OVERHEAD_SUM_(0.0), OVERHEAD_MAX_(0.0)
+{
+}
+
+bool DirectExecutor::CONFIGURE(const rclcpp::Node::SharedPtr & node, const std::string & SERVER)
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    CONTROLLERS_.clear();
+
+    // 1. move_group PARAMETERS -> Parameter client (the node is spun by its executor):
+    auto PARAMS = std::make_shared<rclcpp::AsyncParametersClient>(node, SERVER);
+    if (!PARAMS->wait_for_service(std::chrono::duration<double>(PARAM_TIMEOUT))){
+        return false;
+    }
+    auto GET = [&PARAMS](const std::vector<std::string> & NAMES){
+        auto FUTURE = PARAMS->get_parameters(NAMES);
+        if (FUTURE.wait_for(std::chrono::duration<double>(PARAM_TIMEOUT)) != std::future_status::ready){
+            return(std::vector<rclcpp::Parameter>());
+        }
+        return(FUTURE.get());
+    };
+
+    // 2. trajectory_execution -> Same time limit and start tolerance as move_group:
+    for (const rclcpp::Parameter & P : GET({"trajectory_execution.allowed_execution_duration_scaling",
+                                            "trajectory_execution.allowed_goal_duration_margin",
+                                            "trajectory_execution.allowed_start_tolerance"})){
+        if (P.get_type() != rclcpp::ParameterType::PARAMETER_DOUBLE){
+            continue;
+        }
+        if (P.get_name() == "trajectory_execution.allowed_execution_duration_scaling"){
+            SCALING_ = P.as_double();
+        } else if (P.get_name() == "trajectory_execution.allowed_goal_duration_margin"){
+            MARGIN_ = P.as_double();
+        } else {
+            START_TOL_ = P.as_double();
+        }
+    }
+
+    // 3. CONTROLLERS -> moveit_simple_controller_manager (name, action_ns, type, joints):
+    const std::string NS = "moveit_simple_controller_manager.";
+    std::vector<rclcpp::Parameter> NAMES = GET({NS + "controller_names"});
+    if (NAMES.empty() || NAMES[0].get_type() != rclcpp::ParameterType::PARAMETER_STRING_ARRAY){
+        return false;
+    }
+
+    for (const std::string & NAME : NAMES[0].as_string_array()){
+
+        std::vector<rclcpp::Parameter> P = GET({NS + NAME + ".action_ns", NS + NAME + ".type", NS + NAME + ".joints"});
+        if (P.size() != 3 || P[0].get_type() != rclcpp::ParameterType::PARAMETER_STRING || P[1].get_type() != rclcpp::ParameterType::PARAMETER_STRING ||
+            P[2].get_type() != rclcpp::ParameterType::PARAMETER_STRING_ARRAY){
+            continue;
+        }
+
+        Controller C;
+        C.NAME = NAME;
+        C.TYPE = P[1].as_string();
+        C.JOINTS = P[2].as_string_array();
+        const std::string ACTION = "/" + NAME + "/" + P[0].as_string();
+        if (C.TYPE == "FollowJointTrajectory"){
+            C.FJT_CLIENT = rclcpp_action::create_client<FJT>(node, ACTION);
+        } else if (C.TYPE == "GripperCommand"){
+            C.GC_CLIENT = rclcpp_action::create_client<GC>(node, ACTION);
+        } else {
+            continue;
+        }
+        CONTROLLERS_.push_back(C);
+    }
+
+    return(!CONTROLLERS_.empty());
+}
+
+bool DirectExecutor::ACTIVE() const
+{
+    return(!CONTROLLERS_.empty());
+}
+
+DirectSTRUCT DirectExecutor::EXECUTE(moveit::planning_interface::MoveGroupInterface & MGI, const moveit::planning_interface::MoveGroupInterface::Plan & PLAN)
+{
+    DirectSTRUCT RESULT;
+    RESULT.RES = "EXECUTION: ERROR";
+    RESULT.T_CALL = 0.0;
+    RESULT.DURATION = 0.0;
+    auto T0 = std::chrono::steady_clock::now();
+    const unsigned long STOP_ID = STOP_ID_;
+
+    // 1. VALIDATION -> Trajectory (positions for every joint, increasing time stamps):
+    const trajectory_msgs::msg::JointTrajectory & JT = PLAN.trajectory_.joint_trajectory;
+    if (JT.points.empty()){
+        RESULT.RES = "VALIDATION: ERROR (empty trajectory)";
+        return(RESULT);
+    }
+    double T_PREV = -1.0;
+    for (const auto & POINT : JT.points){
+        double T = rclcpp::Duration(POINT.time_from_start).seconds();
+        if (POINT.positions.size() != JT.joint_names.size() || T <= T_PREV){
+            RESULT.RES = "VALIDATION: ERROR (time stamps/positions)";
+            return(RESULT);
+        }
+        T_PREV = T;
+    }
+    RESULT.DURATION = T_PREV;
+
+    // 2. VALIDATION -> Every joint handled by a controller:
+    std::vector<int> OWNER(JT.joint_names.size(), -1);
+    for (size_t j = 0; j < JT.joint_names.size(); j++){
+        for (size_t c = 0; c < CONTROLLERS_.size() && OWNER[j] < 0; c++){
+            if (std::find(CONTROLLERS_[c].JOINTS.begin(), CONTROLLERS_[c].JOINTS.end(), JT.joint_names[j]) != CONTROLLERS_[c].JOINTS.end()){
+                OWNER[j] = c;
+            }
+        }
+        if (OWNER[j] < 0){
+            RESULT.RES = "VALIDATION: ERROR (no controller for " + JT.joint_names[j] + ")";
+            return(RESULT);
+        }
+    }
+
+    // 3. VALIDATION -> Start point vs. measured state:
+    moveit::core::RobotStatePtr STATE = MGI.getCurrentState(1.0);
+    if (!STATE){
+        RESULT.RES = "VALIDATION: ERROR (no current state)";
+        return(RESULT);
+    }
+    for (size_t j = 0; j < JT.joint_names.size(); j++){
+        if (std::fabs(STATE->getVariablePosition(JT.joint_names[j]) - JT.points[0].positions[j]) > START_TOL_){
+            RESULT.RES = "VALIDATION: ERROR (start state, " + JT.joint_names[j] + ")";
+            return(RESULT);
+        }
+    }
+
+    // 4. GOALS -> One per controller involved:
+    std::vector<rclcpp_action::ClientGoalHandle<FJT>::SharedPtr> FJT_GOALS;
+    std::vector<rclcpp_action::ClientGoalHandle<GC>::SharedPtr> GC_GOALS;
+    std::vector<size_t> FJT_OWNERS, GC_OWNERS;
+    bool SENT = true;
+
+    for (size_t c = 0; c < CONTROLLERS_.size() && SENT; c++){
+
+        std::vector<size_t> IDX;
+        for (size_t j = 0; j < OWNER.size(); j++){
+            if (OWNER[j] == (int)c){
+                IDX.push_back(j);
+            }
+        }
+        if (IDX.empty()){
+            continue;
+        }
+        const Controller & C = CONTROLLERS_[c];
+
+        if (C.FJT_CLIENT){
+
+            // FollowJointTrajectory -> Sub-trajectory of the controller joints:
+            FJT::Goal GOAL;
+            for (size_t j : IDX){
+                GOAL.trajectory.joint_names.push_back(JT.joint_names[j]);
+            }
+            for (const auto & POINT : JT.points){
+                trajectory_msgs::msg::JointTrajectoryPoint P;
+                P.time_from_start = POINT.time_from_start;
+                for (size_t j : IDX){
+                    P.positions.push_back(POINT.positions[j]);
+                    if (POINT.velocities.size() == JT.joint_names.size()){
+                        P.velocities.push_back(POINT.velocities[j]);
+                    }
+                    if (POINT.accelerations.size() == JT.joint_names.size()){
+                        P.accelerations.push_back(POINT.accelerations[j]);
+                    }
+                }
+                GOAL.trajectory.points.push_back(P);
+            }
+
+            auto FUTURE = C.FJT_CLIENT->async_send_goal(GOAL);
+            if (FUTURE.wait_for(std::chrono::duration<double>(GOAL_TIMEOUT)) != std::future_status::ready || !FUTURE.get()){
+                SENT = false;
+            } else {
+                FJT_GOALS.push_back(FUTURE.get());
+                FJT_OWNERS.push_back(c);
+            }
+
+        } else {
+
+            // GripperCommand -> Last position of the controller (command) joint, the first one in its list. The rest are mimic joints:
+            size_t CMD = IDX[0];
+            for (size_t j : IDX){
+                if (JT.joint_names[j] == C.JOINTS[0]){
+                    CMD = j;
+                }
+            }
+            GC::Goal GOAL;
+            GOAL.command.position = JT.points.back().positions[CMD];
+            GOAL.command.max_effort = 0.0;
+
+            auto FUTURE = C.GC_CLIENT->async_send_goal(GOAL);
+            if (FUTURE.wait_for(std::chrono::duration<double>(GOAL_TIMEOUT)) != std::future_status::ready || !FUTURE.get()){
+                SENT = false;
+            } else {
+                GC_GOALS.push_back(FUTURE.get());
+                GC_OWNERS.push_back(c);
+            }
+
+        }
+    }
+
+    // 5. MONITOR -> Results, within the move_group time limit:
+    std::vector<std::shared_future<rclcpp_action::ClientGoalHandle<FJT>::WrappedResult>> FJT_RESULTS;
+    std::vector<std::shared_future<rclcpp_action::ClientGoalHandle<GC>::WrappedResult>> GC_RESULTS;
+    for (size_t k = 0; k < FJT_GOALS.size(); k++){
+        FJT_RESULTS.push_back(CONTROLLERS_[FJT_OWNERS[k]].FJT_CLIENT->async_get_result(FJT_GOALS[k]));
+    }
+    for (size_t k = 0; k < GC_GOALS.size(); k++){
+        GC_RESULTS.push_back(CONTROLLERS_[GC_OWNERS[k]].GC_CLIENT->async_get_result(GC_GOALS[k]));
+    }
+
+    const double LIMIT = RESULT.DURATION * SCALING_ + MARGIN_;
+    bool TIMEOUT = false;
+    while (SENT){
+        bool DONE = true;
+        for (auto & F : FJT_RESULTS){
+            DONE = DONE && (F.wait_for(std::chrono::seconds(0)) == std::future_status::ready);
+        }
+        for (auto & F : GC_RESULTS){
+            DONE = DONE && (F.wait_for(std::chrono::seconds(0)) == std::future_status::ready);
+        }
+        if (DONE){
+            break;
+        }
+        if (STOP_ID_ != STOP_ID || std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count() > LIMIT){
+            TIMEOUT = true;
+            break;
+        }
+        std::this_thread::sleep_for(std::chrono::duration<double>(POLL_PERIOD));
+    }
+
+    // 6. Goal rejected/timeout/canceled -> Cancel every goal that was sent:
+    if (!SENT || TIMEOUT){
+        for (size_t k = 0; k < FJT_GOALS.size(); k++){
+            CONTROLLERS_[FJT_OWNERS[k]].FJT_CLIENT->async_cancel_goal(FJT_GOALS[k]);
+        }
+        for (size_t k = 0; k < GC_GOALS.size(); k++){
+            CONTROLLERS_[GC_OWNERS[k]].GC_CLIENT->async_cancel_goal(GC_GOALS[k]);
+        }
+        RESULT.T_CALL = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+        return(RESULT);
+    }
+
+    // 7. RESULT -> All the goals succeeded:
+    bool SUCCESS = true;
+    for (auto & F : FJT_RESULTS){
+        auto R = F.get();
+        SUCCESS = SUCCESS && (R.code == rclcpp_action::ResultCode::SUCCEEDED) && R.result && (R.result->error_code == FJT::Result::SUCCESSFUL);
+    }
+    for (auto & F : GC_RESULTS){
+        SUCCESS = SUCCESS && (F.get().code == rclcpp_action::ResultCode::SUCCEEDED);
+    }
+    RESULT.T_CALL = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+
+    if (SUCCESS){
+        RESULT.RES = "EXECUTION: OK";
+        std::lock_guard<std::mutex> LOCK(MUTEX_);
+        double OVERHEAD = RESULT.T_CALL - RESULT.DURATION;
+        N_ = N_ + 1;
+        OVERHEAD_SUM_ = OVERHEAD_SUM_ + OVERHEAD;
+        OVERHEAD_MAX_ = std::max(OVERHEAD_MAX_, OVERHEAD);
+    }
+    return(RESULT);
+}
+
+void DirectExecutor::STOP()
+{
+    STOP_ID_++;
+}
+
+std::string DirectExecutor::STATS()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    char BUFFER[160];
+    snprintf(BUFFER, sizeof(BUFFER), "DIRECT EXECUTION -> %d trajectories, execute-call overhead (wall time - duration): mean %.1fms, max %.1fms",
+             N_, (N_ > 0) ? (1000.0 * OVERHEAD_SUM_ / N_) : 0.0, 1000.0 * OVERHEAD_MAX_);
+    return(std::string(BUFFER));
+}
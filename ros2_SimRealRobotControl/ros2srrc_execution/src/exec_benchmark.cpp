@@ -0,0 +1,173 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+// exec_benchmark.cpp:
+// EXECUTION BENCHMARK -> Execute-call overhead (wall time - trajectory duration) of MoveIt!2 (move_group) vs. the DIRECT backend.
+// The same two short PTP trajectories (last joint +/- AMPLITUDE) are planned once, and executed N times with each backend.
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <memory>
+#include <string>
+#include <thread>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+
+// Include the DIRECT EXECUTION BACKEND:
+#include "ros2srrc_execution/directexec.h"
+
+// Declaration of CONSTANT VALUES:
+const double SETTLE_TIME = 0.5;   // [s] Pause between executions (not measured).
+
+void PrintResult(const rclcpp::Logger & logger, const std::string & NAME, std::vector<double> T)
+{
+    std::sort(T.begin(), T.end());
+    double MEAN = 0.0;
+    for (double t : T){
+        MEAN = MEAN + t;
+    }
+    MEAN = MEAN / T.size();
+    double MEDIAN = T[T.size() / 2];
+    double P99 = T[(T.size() * 99) / 100];
+
+    RCLCPP_INFO(logger, "%s -> %zu executions | OVERHEAD [ms] mean: %.1f, median: %.1f, p99: %.1f, max: %.1f",
+                NAME.c_str(), T.size(), 1000.0 * MEAN, 1000.0 * MEDIAN, 1000.0 * P99, 1000.0 * T.back());
+}
+
+// ===================================================================================== //
+// ======================================= MAIN ======================================== //
+// ===================================================================================== //
+
+int main(int argc, char ** argv)
+{
+    // Initialise MAIN NODE:
+    rclcpp::init(argc, argv);
+    auto const node = std::make_shared<rclcpp::Node>(
+        "ros2srrc_exec_benchmark", rclcpp::NodeOptions().automatically_declare_parameters_from_overrides(true));
+    auto const logger = node->get_logger();
+    rclcpp::executors::SingleThreadedExecutor executor;
+    executor.add_node(node);
+    std::thread([&executor]() { executor.spin(); }).detach();
+
+    // Obtain parameters:
+    std::string ROB_PARAM = "ur5";
+    int N = 10;
+    double AMPLITUDE = 0.2;
+    double SPEED = 1.0;
+    node->get_parameter("ROB_PARAM", ROB_PARAM);
+    node->get_parameter("N", N);
+    node->get_parameter("AMPLITUDE", AMPLITUDE);
+    node->get_parameter("SPEED", SPEED);
+
+    // MoveGroupInterface + DIRECT backend:
+    using moveit::planning_interface::MoveGroupInterface;
+    MoveGroupInterface MGI(node, ROB_PARAM + "_arm");
+    MGI.setPlanningPipelineId("move_group");
+    MGI.setPlannerId("PTP");
+    MGI.setMaxVelocityScalingFactor(SPEED);
+    MGI.setMaxAccelerationScalingFactor(1.0);
+
+    DirectExecutor DIRECT;
+    if (!DIRECT.CONFIGURE(node)){
+        RCLCPP_ERROR(logger, "The controllers could not be read from move_group.");
+        rclcpp::shutdown();
+        return 1;
+    }
+
+    // PLAN -> A: current -> last joint + AMPLITUDE, B: back to the current joint values:
+    std::vector<double> J0 = MGI.getCurrentJointValues();
+    std::vector<double> J1 = J0;
+    J1.back() = J1.back() + AMPLITUDE;
+
+    MoveGroupInterface::Plan A, B;
+    MGI.setJointValueTarget(J1);
+    bool OK = (MGI.plan(A) == moveit::planning_interface::MoveItErrorCode::SUCCESS);
+
+    moveit::core::RobotState S1(*MGI.getCurrentState(10));
+    S1.setJointGroupPositions(ROB_PARAM + "_arm", J1);
+    MGI.setStartState(S1);
+    MGI.setJointValueTarget(J0);
+    OK = OK && (MGI.plan(B) == moveit::planning_interface::MoveItErrorCode::SUCCESS);
+    MGI.setStartStateToCurrentState();
+
+    if (!OK){
+        RCLCPP_ERROR(logger, "The benchmark trajectories could not be planned.");
+        rclcpp::shutdown();
+        return 1;
+    }
+
+    // EXECUTE -> N x (A + B) per backend:
+    RCLCPP_INFO(logger, "EXECUTION BENCHMARK -> Group: %s_arm, %d x 2 trajectories per backend (last joint +/- %.3frad).", ROB_PARAM.c_str(), N, AMPLITUDE);
+    std::vector<double> T_MOVEIT, T_DIRECT;
+
+    for (int k = 0; k < N; k++){
+        for (int BACKEND = 0; BACKEND < 2; BACKEND++){
+            for (const MoveGroupInterface::Plan * P : {&A, &B}){
+
+                double DURATION = rclcpp::Duration(P->trajectory_.joint_trajectory.points.back().time_from_start).seconds();
+
+                auto t0 = std::chrono::steady_clock::now();
+                bool SUCCESS;
+                if (BACKEND == 0){
+                    SUCCESS = (MGI.execute(*P) == moveit::planning_interface::MoveItErrorCode::SUCCESS);
+                } else {
+                    SUCCESS = (DIRECT.EXECUTE(MGI, *P).RES == "EXECUTION: OK");
+                }
+                auto t1 = std::chrono::steady_clock::now();
+
+                if (!SUCCESS){
+                    RCLCPP_ERROR(logger, "Execution failed (%s backend).", (BACKEND == 0) ? "MoveIt!2" : "DIRECT");
+                    rclcpp::shutdown();
+                    return 1;
+                }
+                double OVERHEAD = std::chrono::duration<double>(t1 - t0).count() - DURATION;
+                if (BACKEND == 0){
+                    T_MOVEIT.push_back(OVERHEAD);
+                } else {
+                    T_DIRECT.push_back(OVERHEAD);
+                }
+
+                std::this_thread::sleep_for(std::chrono::duration<double>(SETTLE_TIME));
+            }
+        }
+    }
+
+    PrintResult(logger, "MoveIt!2 (move_group)", T_MOVEIT);
+    PrintResult(logger, "DIRECT (controllers)  ", T_DIRECT);
+
+    rclcpp::shutdown();
+    return 0;
+}
@@ -0,0 +1,278 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/gripcmd.h"
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <functional>
+#include <future>
+#include <memory>
+#include <string>
+#include <thread>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+#include "rclcpp_action/rclcpp_action.hpp"
+
+// Declaration of CONSTANT VALUES:
+const double PARAM_TIMEOUT = 5.0;     // [s]
+const double GOAL_TIMEOUT = 1.0;      // [s] Goal acceptance.
+const double POLL_PERIOD = 0.005;     // [s]
+const double VEL_TOL = 0.01;          // [rad/s] Fingers stopped.
+const double STALL_TIME = 0.2;        // [s] Fingers stopped for STALL_TIME -> STALLED.
+
+GripperCommander::GripperCommander() : TOL_(0.01), MAX_EFFORT_(0.0), TIMEOUT_(5.0), CANCEL_(false), N_MSG_(0), N_(0), N_STALLED_(0), T_SUM_(0.0), T_MAX_(0.0)
+{
+}
+
+bool GripperCommander::CONFIGURE(const rclcpp::Node::SharedPtr & node, const RegistrySTRUCT & REG, double TOL, double MAX_EFFORT, double TIMEOUT,
+                                 const std::string & SERVER)
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    CONTROLLERS_.clear();
+    REG_ = REG;
+    TOL_ = TOL;
+    MAX_EFFORT_ = MAX_EFFORT;
+    TIMEOUT_ = TIMEOUT;
+    if (REG_.JOINTS.empty()){
+        return false;
+    }
+
+    // 1. move_group PARAMETERS -> Parameter client (the node is spun by its executor):
+    auto PARAMS = std::make_shared<rclcpp::AsyncParametersClient>(node, SERVER);
+    if (!PARAMS->wait_for_service(std::chrono::duration<double>(PARAM_TIMEOUT))){
+        return false;
+    }
+    auto GET = [&PARAMS](const std::vector<std::string> & NAMES){
+        auto FUTURE = PARAMS->get_parameters(NAMES);
+        if (FUTURE.wait_for(std::chrono::duration<double>(PARAM_TIMEOUT)) != std::future_status::ready){
+            return(std::vector<rclcpp::Parameter>());
+        }
+        return(FUTURE.get());
+    };
+
+    // 2. CONTROLLERS -> GripperCommand controllers that own END-EFFECTOR joints:
+    const std::string NS = "moveit_simple_controller_manager.";
+    std::vector<rclcpp::Parameter> NAMES = GET({NS + "controller_names"});
+    if (NAMES.empty() || NAMES[0].get_type() != rclcpp::ParameterType::PARAMETER_STRING_ARRAY){
+        return false;
+    }
+
+    for (const std::string & NAME : NAMES[0].as_string_array()){
+
+        std::vector<rclcpp::Parameter> P = GET({NS + NAME + ".action_ns", NS + NAME + ".type", NS + NAME + ".joints"});
+        if (P.size() != 3 || P[0].get_type() != rclcpp::ParameterType::PARAMETER_STRING || P[1].get_type() != rclcpp::ParameterType::PARAMETER_STRING ||
+            P[2].get_type() != rclcpp::ParameterType::PARAMETER_STRING_ARRAY){
+            continue;
+        }
+
+        Controller C;
+        C.NAME = NAME;
+        for (const std::string & JOINT : P[2].as_string_array()){
+            auto IT = std::find(REG_.JOINTS.begin(), REG_.JOINTS.end(), JOINT);
+            if (IT != REG_.JOINTS.end()){
+                C.IDX.push_back(IT - REG_.JOINTS.begin());
+            }
+        }
+        if (C.IDX.empty()){
+            continue;
+        }
+
+        // A gripper joint owned by a non-GripperCommand controller -> Not supported, MoveG is planned and executed with MoveIt!2:
+        if (P[1].as_string() != "GripperCommand"){
+            CONTROLLERS_.clear();
+            return false;
+        }
+        C.CLIENT = rclcpp_action::create_client<GC>(node, "/" + NAME + "/" + P[0].as_string());
+        CONTROLLERS_.push_back(C);
+    }
+
+    // 3. JOINT STATES -> Completion detection:
+    {
+        std::lock_guard<std::mutex> SLOCK(STATE_MUTEX_);
+        POS_.assign(REG_.JOINTS.size(), 0.0);
+        VEL_.assign(REG_.JOINTS.size(), 0.0);
+        EFF_.assign(REG_.JOINTS.size(), 0.0);
+        N_MSG_ = 0;
+    }
+    if (!SUB_){
+        SUB_ = node->create_subscription<sensor_msgs::msg::JointState>(
+            "/joint_states", rclcpp::SensorDataQoS(), std::bind(&GripperCommander::JointStateCallback, this, std::placeholders::_1));
+    }
+
+    return(!CONTROLLERS_.empty());
+}
+
+bool GripperCommander::ACTIVE() const
+{
+    return(!CONTROLLERS_.empty());
+}
+
+void GripperCommander::JointStateCallback(const sensor_msgs::msg::JointState::SharedPtr MSG)
+{
+    std::lock_guard<std::mutex> LOCK(STATE_MUTEX_);
+    bool FOUND = false;
+    for (size_t j = 0; j < MSG->name.size() && j < MSG->position.size(); j++){
+        auto IT = std::find(REG_.JOINTS.begin(), REG_.JOINTS.end(), MSG->name[j]);
+        if (IT == REG_.JOINTS.end()){
+            continue;
+        }
+        size_t k = IT - REG_.JOINTS.begin();
+        POS_[k] = MSG->position[j];
+        VEL_[k] = (j < MSG->velocity.size()) ? MSG->velocity[j] : 0.0;
+        EFF_[k] = (j < MSG->effort.size()) ? MSG->effort[j] : 0.0;
+        FOUND = true;
+    }
+    if (FOUND){
+        N_MSG_ = N_MSG_ + 1;
+    }
+}
+
+GripSTRUCT GripperCommander::COMMAND(const std::vector<double> & JP)
+{
+    GripSTRUCT RESULT;
+    RESULT.RES = "GRIPPER: ERROR";
+    RESULT.STATE = "";
+    RESULT.T_EXEC = 0.0;
+    auto T0 = std::chrono::steady_clock::now();
+    CANCEL_ = false;
+
+    if (JP.size() < REG_.JOINTS.size()){
+        RESULT.RES = "GRIPPER: ERROR (target size)";
+        return(RESULT);
+    }
+    uint64_t N_START;
+    {
+        std::lock_guard<std::mutex> LOCK(STATE_MUTEX_);
+        N_START = N_MSG_;
+    }
+
+    // 1. GOALS -> Sent to all the gripper controllers at once, then accepted:
+    std::vector<std::shared_future<rclcpp_action::ClientGoalHandle<GC>::SharedPtr>> FUTURES;
+    for (const Controller & C : CONTROLLERS_){
+        GC::Goal GOAL;
+        GOAL.command.position = JP[C.IDX[0]];
+        GOAL.command.max_effort = MAX_EFFORT_;
+        FUTURES.push_back(C.CLIENT->async_send_goal(GOAL));
+    }
+    std::vector<rclcpp_action::ClientGoalHandle<GC>::SharedPtr> GOALS;
+    for (auto & F : FUTURES){
+        if (F.wait_for(std::chrono::duration<double>(GOAL_TIMEOUT)) != std::future_status::ready || !F.get()){
+            break;
+        }
+        GOALS.push_back(F.get());
+    }
+    auto CANCEL_GOALS = [this, &GOALS](){
+        for (size_t k = 0; k < GOALS.size(); k++){
+            CONTROLLERS_[k].CLIENT->async_cancel_goal(GOALS[k]);
+        }
+    };
+    if (GOALS.size() != CONTROLLERS_.size()){
+        CANCEL_GOALS();
+        RESULT.RES = "GRIPPER: ERROR (goal rejected)";
+        return(RESULT);
+    }
+
+    // 2. MONITOR -> Measured gripper joints (new /joint_states messages only):
+    double T_STILL = -1.0;
+    while (RESULT.STATE == ""){
+
+        std::this_thread::sleep_for(std::chrono::duration<double>(POLL_PERIOD));
+        double T = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+
+        if (CANCEL_){
+            CANCEL_GOALS();
+            RESULT.RES = "GRIPPER: ERROR (canceled)";
+            RESULT.T_EXEC = T;
+            return(RESULT);
+        }
+        if (T > TIMEOUT_){
+            CANCEL_GOALS();
+            RESULT.RES = "GRIPPER: ERROR (timeout)";
+            RESULT.T_EXEC = T;
+            return(RESULT);
+        }
+
+        std::lock_guard<std::mutex> LOCK(STATE_MUTEX_);
+        if (N_MSG_ == N_START){
+            continue;
+        }
+
+        bool REACHED = true;
+        bool MOVING = false;
+        bool EFFORT = false;
+        for (size_t k = 0; k < REG_.JOINTS.size(); k++){
+            REACHED = REACHED && (std::fabs(POS_[k] - JP[k]) <= TOL_);
+            MOVING = MOVING || (std::fabs(VEL_[k]) > VEL_TOL);
+            EFFORT = EFFORT || (MAX_EFFORT_ > 0.0 && std::fabs(EFF_[k]) >= MAX_EFFORT_);
+        }
+
+        if (REACHED){
+            RESULT.STATE = "REACHED";
+        } else if (EFFORT){
+            RESULT.STATE = "EFFORT";
+        } else if (MOVING){
+            T_STILL = -1.0;
+        } else if (T_STILL < 0.0){
+            T_STILL = T;
+        } else if (T - T_STILL >= STALL_TIME && T >= 2 * STALL_TIME){
+            RESULT.STATE = "STALLED";
+        }
+    }
+
+    // 3. RESULT -> The goals stay active, so that the controllers keep holding the gripper (grasp force):
+    RESULT.RES = "GRIPPER: OK";
+    RESULT.T_EXEC = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    N_ = N_ + 1;
+    N_STALLED_ = N_STALLED_ + ((RESULT.STATE != "REACHED") ? 1 : 0);
+    T_SUM_ = T_SUM_ + RESULT.T_EXEC;
+    T_MAX_ = std::max(T_MAX_, RESULT.T_EXEC);
+    return(RESULT);
+}
+
+void GripperCommander::STOP()
+{
+    CANCEL_ = true;
+}
+
+std::string GripperCommander::STATS()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    char BUFFER[160];
+    snprintf(BUFFER, sizeof(BUFFER), "GRIPPER COMMANDS -> %d commands (%d stopped by an object/effort), completion time: mean %.3fs, max %.3fs",
+             N_, N_STALLED_, (N_ > 0) ? (T_SUM_ / N_) : 0.0, T_MAX_);
+    return(std::string(BUFFER));
+}
@@ -0,0 +1,132 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/handoff.h"
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <future>
+#include <memory>
+#include <string>
+#include <thread>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+
+// Declaration of CONSTANT VALUES:
+const double POLL_PERIOD = 0.01;      // [s]
+const double MIN_PROGRESS = 0.5;      // Min. fraction of the trajectory duration before a hand-off.
+const double MAX_VELOCITY = 0.05;     // [rad/s] Max. measured joint velocity at the hand-off (the next step starts from zero velocity).
+
+// EXECUTION with EARLY HAND-OFF:
+HandoffSTRUCT HandoffExecute (moveit::planning_interface::MoveGroupInterface & MGI, const moveit::planning_interface::MoveGroupInterface::Plan & PLAN, double TOL,
+                              DirectExecutor * DIRECT){
+
+    using moveit::planning_interface::MoveItErrorCode;
+
+    HandoffSTRUCT RESULT;
+    RESULT.HANDOFF = false;
+    RESULT.T_SAVED = 0.0;
+    auto T0 = std::chrono::steady_clock::now();
+
+    // EXECUTE -> Direct backend or move_group:
+    auto RUN = [&MGI, DIRECT](const moveit::planning_interface::MoveGroupInterface::Plan & P){
+        if (DIRECT != nullptr){
+            return(DIRECT->EXECUTE(MGI, P).RES == "EXECUTION: OK");
+        }
+        return(MGI.execute(P) == MoveItErrorCode::SUCCESS);
+    };
+
+    // 1. No hand-off -> Plain execute(). move_group rejects a new execute() while the previous one is running, so the hand-off
+    //    is only possible with the direct backend:
+    const auto & POINTS = PLAN.trajectory_.joint_trajectory.points;
+    if (TOL <= 0.0 || DIRECT == nullptr || POINTS.empty()){
+        RESULT.RES = RUN(PLAN) ? "EXECUTION: OK" : "EXECUTION: ERROR";
+        RESULT.T_EXEC = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+        return(RESULT);
+    }
+
+    const std::vector<std::string> & NAMES = PLAN.trajectory_.joint_trajectory.joint_names;
+    const std::vector<double> & GOAL = POINTS.back().positions;
+    const double DURATION = rclcpp::Duration(POINTS.back().time_from_start).seconds();
+
+    // 2. EXECUTE -> Own thread, the result is only needed if the step is not handed off:
+    auto DONE = std::make_shared<std::promise<bool>>();
+    std::future<bool> FUTURE = DONE->get_future();
+    std::thread([RUN, PLAN, DONE]() {
+        DONE->set_value(RUN(PLAN));
+    }).detach();
+
+    // 3. MONITOR -> Measured joint values vs. goal, and measured joint velocities:
+    while (true){
+
+        if (FUTURE.wait_for(std::chrono::duration<double>(POLL_PERIOD)) == std::future_status::ready){
+            RESULT.RES = FUTURE.get() ? "EXECUTION: OK" : "EXECUTION: ERROR";
+            break;
+        }
+
+        double T = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+        if (T < MIN_PROGRESS * DURATION){
+            continue;
+        }
+
+        moveit::core::RobotStatePtr STATE = MGI.getCurrentState(POLL_PERIOD);
+        if (!STATE){
+            continue;
+        }
+        double ERR = 0.0;
+        double VEL = 0.0;
+        for (size_t j = 0; j < NAMES.size(); j++){
+            ERR = std::max(ERR, std::fabs(STATE->getVariablePosition(NAMES[j]) - GOAL[j]));
+            VEL = std::max(VEL, std::fabs(STATE->getVariableVelocity(NAMES[j])));
+        }
+
+        if (ERR <= TOL && VEL <= MAX_VELOCITY){
+            STATE->zeroVelocities();
+            STATE->zeroAccelerations();
+            MGI.setStartState(*STATE);
+            RESULT.RES = "EXECUTION: OK";
+            RESULT.HANDOFF = true;
+            RESULT.T_SAVED = std::max(0.0, DURATION - T);
+            break;
+        }
+    }
+
+    // 4. RETURN RESULT:
+    RESULT.T_EXEC = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+    return(RESULT);
+
+};
@@ -0,0 +1,180 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/ikcache.h"
+
+// Include standard libraries:
+#include <cmath>
+#include <string>
+#include <vector>
+
+IKCache::IKCache(size_t SIZE, double TOL, double START_TOL) : SIZE_(SIZE), TOL_(TOL), START_TOL_(START_TOL), HITS_(0), MISSES_(0), EVICTIONS_(0)
+{
+}
+
+void IKCache::CONFIGURE(size_t SIZE, double TOL)
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    SIZE_ = SIZE;
+    TOL_ = TOL;
+    LRU_.clear();
+    MAP_.clear();
+}
+
+// KEY -> Planning group + pose ROUNDED to the tolerance.
+// The quaternion is normalised and its sign is fixed (qw >= 0), since q and -q represent the same orientation.
+std::string IKCache::KEY(const std::string & GROUP, const geometry_msgs::msg::Pose & POSE) const
+{
+    double qx = POSE.orientation.x;
+    double qy = POSE.orientation.y;
+    double qz = POSE.orientation.z;
+    double qw = POSE.orientation.w;
+    double norm = sqrt(qx*qx + qy*qy + qz*qz + qw*qw);
+    if (norm < 1e-9){
+        norm = 1.0;
+    }
+    double sign = (qw < 0.0) ? -1.0 : 1.0;
+
+    const double VALUES[7] = {
+        POSE.position.x, POSE.position.y, POSE.position.z,
+        sign*qx/norm, sign*qy/norm, sign*qz/norm, sign*qw/norm
+    };
+
+    std::string K = GROUP;
+    for (double V : VALUES){
+        K = K + "|" + std::to_string(std::llround(V / TOL_));
+    }
+    return(K);
+}
+
+bool IKCache::GET(const std::string & GROUP, const geometry_msgs::msg::Pose & POSE, const std::vector<double> & START, std::vector<double> & JP)
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+
+    auto IT = MAP_.find(KEY(GROUP, POSE));
+    if (IT == MAP_.end()){
+        MISSES_ = MISSES_ + 1;
+        return false;
+    }
+
+    // Resolved from another start configuration -> The IK solution (branch) may differ, MISS:
+    const Entry & E = IT->second->second;
+    if (E.START.size() != START.size()){
+        MISSES_ = MISSES_ + 1;
+        return false;
+    }
+    for (size_t j = 0; j < START.size(); j++){
+        if (std::fabs(E.START[j] - START[j]) > START_TOL_){
+            MISSES_ = MISSES_ + 1;
+            return false;
+        }
+    }
+
+    // Move entry to the front (most recently used):
+    LRU_.splice(LRU_.begin(), LRU_, IT->second);
+    JP = E.JP;
+    HITS_ = HITS_ + 1;
+    return true;
+}
+
+void IKCache::PUT(const std::string & GROUP, const geometry_msgs::msg::Pose & POSE, const std::vector<double> & START, const std::vector<double> & JP)
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+
+    if (SIZE_ == 0 || JP.empty()){
+        return;
+    }
+
+    std::string K = KEY(GROUP, POSE);
+    auto IT = MAP_.find(K);
+    if (IT != MAP_.end()){
+        IT->second->second.START = START;
+        IT->second->second.JP = JP;
+        LRU_.splice(LRU_.begin(), LRU_, IT->second);
+        return;
+    }
+
+    // Evict LEAST RECENTLY USED entry:
+    if (LRU_.size() >= SIZE_){
+        MAP_.erase(LRU_.back().first);
+        LRU_.pop_back();
+        EVICTIONS_ = EVICTIONS_ + 1;
+    }
+
+    LRU_.emplace_front(K, Entry{START, JP});
+    MAP_[K] = LRU_.begin();
+}
+
+void IKCache::ERASE(const std::string & GROUP, const geometry_msgs::msg::Pose & POSE)
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+
+    auto IT = MAP_.find(KEY(GROUP, POSE));
+    if (IT != MAP_.end()){
+        LRU_.erase(IT->second);
+        MAP_.erase(IT);
+    }
+}
+
+void IKCache::CLEAR()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    LRU_.clear();
+    MAP_.clear();
+}
+
+size_t IKCache::HITS()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    return(HITS_);
+}
+
+size_t IKCache::MISSES()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    return(MISSES_);
+}
+
+size_t IKCache::EVICTIONS()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    return(EVICTIONS_);
+}
+
+std::string IKCache::STATS()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    size_t TOTAL = HITS_ + MISSES_;
+    double RATE = (TOTAL > 0) ? (100.0 * HITS_ / TOTAL) : 0.0;
+    char BUFFER[160];
+    snprintf(BUFFER, sizeof(BUFFER), "IK CACHE -> hits: %zu, misses: %zu (hit rate: %.1f%%), entries: %zu/%zu, evictions: %zu",
+             HITS_, MISSES_, RATE, LRU_.size(), SIZE_, EVICTIONS_);
+    return(std::string(BUFFER));
+}
@@ -37,6 +37,14 @@
 #include "ros2srrc_execution/moverot.h"
 #include "ros2srrc_execution/moverp.h"
 #include "ros2srrc_execution/moveg.h"
+#include "ros2srrc_execution/ikcache.h"
+#include "ros2srrc_execution/retime.h"
+#include "ros2srrc_execution/movelfast.h"
+#include "ros2srrc_execution/robotregistry.h"
+#include "ros2srrc_execution/planstrategy.h"
+#include "ros2srrc_execution/pathsmooth.h"
+#include "ros2srrc_execution/directexec.h"
+#include "ros2srrc_execution/gripcmd.h"
 
 // Include standard libraries:
 #include <string>
@@ -73,9 +81,42 @@ moveit::planning_interface::MoveGroupInterface move_group_interface_EE;
 const moveit::core::JointModelGroup* joint_model_group_ROB;
 const moveit::core::JointModelGroup* joint_model_group_EE;
 
+// Declaration of GLOBAL VARIABLES --> ROBOT/END-EFFECTOR REGISTRY (joint order, limits, gripper range, mimic ratios):
+RegistrySTRUCT REG_ROB;
+RegistrySTRUCT REG_EE;
+
 // Declaration of GLOBAL VARIABLE --> RES:
 std::string RES = "none";
 
+// Declaration of GLOBAL VARIABLE --> IK/TARGET RESOLUTION CACHE:
+IKCache IK_CACHE;
+
+// Declaration of GLOBAL VARIABLE --> TRAJECTORY RETIMING (ON/OFF):
+bool RETIMING = true;
+
+// Declaration of GLOBAL VARIABLES --> PLANNING STRATEGY for pose targets (+ last result, for feedback/log):
+PlanStrategy PLAN_STRATEGY;
+std::string PLAN_INFO = "";
+
+// Declaration of GLOBAL VARIABLES --> PATH POST-PROCESSING for sampling-based (non-Pilz) plans + flag of the last plan:
+PathSmoother PATH_SMOOTHER;
+bool SAMPLED_PLAN = false;
+
+// Declaration of GLOBAL VARIABLES --> EXECUTION BACKEND ("moveit" -> move_group, "direct" -> controllers):
+DirectExecutor DIRECT_EXEC;
+bool EXEC_DIRECT = false;
+
+// Declaration of GLOBAL VARIABLES --> GRIPPER COMMAND PATH ("moveit" -> MoveG planned/executed by MoveIt!2, "direct" -> gripper controllers):
+GripperCommander GRIPPER_CMD;
+bool GRIP_DIRECT = false;
+
+// Declaration of GLOBAL VARIABLES --> MoveL FAST PATH (max. segment length [m], 0.0 -> OFF, Pilz Cartesian limits) + Pilz LIN planning time (average):
+double MOVEL_FAST_MAXDIST = 0.0;
+MoveLFastLIMITS MOVEL_FAST_LIMITS;
+rclcpp::Client<moveit_msgs::srv::GetPlanningScene>::SharedPtr MOVEL_FAST_SCENE;
+double T_LIN_AVG = 0.0;
+int N_LIN = 0;
+
 
 // ======================================================================================================================== //
 // ==================== PARAM: ROBOT + END-EFFECTOR ==================== //
@@ -141,6 +182,35 @@ moveit::planning_interface::MoveGroupInterface::Plan plan_ROB() {
         return(my_plan);
     }
 
+};
+// ROBOT, POSE TARGETS -> PLANNING STRATEGY (parallel planners/seeds) if active, plan_ROB() otherwise:
+moveit::planning_interface::MoveGroupInterface::Plan plan_POSE() {
+
+    if (!PLAN_STRATEGY.ACTIVE()){
+        return(plan_ROB());
+    }
+
+    PlanStrategySTRUCT PlanRES = PLAN_STRATEGY.PLAN(move_group_interface_ROB);
+    RES = PlanRES.RES;
+
+    char BUFFER[200];
+    snprintf(BUFFER, sizeof(BUFFER), ":Planning strategy -> %s, %d/%d valid, %.1fms (trajectory: %.3fs).",
+             PlanRES.WINNER.c_str(), PlanRES.N_VALID, PlanRES.N_CANDIDATES, 1000.0 * PlanRES.T_PLAN, PlanRES.DURATION);
+    PLAN_INFO = BUFFER;
+    SAMPLED_PLAN = (RES == "PLANNING: OK" && PlanRES.WINNER.rfind("move_group/", 0) != 0);
+    return(PlanRES.PLAN);
+
+};
+// EXECUTION -> Direct backend (controllers) or move_group:
+bool execute_PLAN(moveit::planning_interface::MoveGroupInterface & MGI, moveit::planning_interface::MoveGroupInterface::Plan & PLAN) {
+
+    if (EXEC_DIRECT){
+        DirectSTRUCT ExecRES = DIRECT_EXEC.EXECUTE(MGI, PLAN);
+        RCLCPP_INFO(rclcpp::get_logger("MOVE_INTERFACE"), "%s (%.3fs, trajectory: %.3fs). %s", ExecRES.RES.c_str(), ExecRES.T_CALL, ExecRES.DURATION, DIRECT_EXEC.STATS().c_str());
+        return(ExecRES.RES == "EXECUTION: OK");
+    }
+    return(MGI.execute(PLAN) == moveit::planning_interface::MoveItErrorCode::SUCCESS);
+
 };
 // END-EFFECTOR:
 moveit::planning_interface::MoveGroupInterface::Plan plan_EE() {
@@ -233,6 +303,12 @@ private:
         if (param_EE != "none"){
             move_group_interface_EE.stop();
         }
+        if (EXEC_DIRECT){
+            DIRECT_EXEC.STOP();
+        }
+        if (GRIP_DIRECT){
+            GRIPPER_CMD.STOP();
+        }
 
         (void)goal_handle;
         return rclcpp_action::CancelResponse::ACCEPT;
@@ -260,7 +336,7 @@ private:
             current_state->copyJointGroupPositions(joint_model_group_ROB, JP);
             
             // 2. CALL MoveJAction for CALCULATIONS:
-            MoveJSTRUCT MoveJRES = MoveJAction(goal->movej, JP, param_ROB);
+            MoveJSTRUCT MoveJRES = MoveJAction(goal->movej, JP, REG_ROB);
             JP = MoveJRES.JP;
             move_group_interface_ROB.setJointValueTarget(JP);
             
@@ -282,14 +358,36 @@ private:
             
             // 2. CALL MoveLAction for CALCULATIONS:
             auto TARGET_POSE = MoveLAction(goal->movel, POSE);
-            move_group_interface_ROB.setPoseTarget(TARGET_POSE);
-            
-            // 3. Assign SPEED and PLANNING METHOD (PTP, LIN, CIRC):
-            move_group_interface_ROB.setMaxVelocityScalingFactor(goal->speed);
-            move_group_interface_ROB.setPlannerId("LIN");
 
-            // 4. PLAN:
-            MyPlan = plan_ROB();
+            // 3. FAST PATH -> Cartesian interpolation + batch IK (short segments):
+            MoveLFastSTRUCT MoveLFastRES;
+            MoveLFastRES.RES = "FASTPATH: SKIP";
+            if (MOVEL_FAST_MAXDIST > 0.0){
+                MoveLFastRES = MoveLFastAction(TARGET_POSE, move_group_interface_ROB, joint_model_group_ROB, goal->speed, MOVEL_FAST_MAXDIST, MOVEL_FAST_LIMITS, MOVEL_FAST_SCENE);
+            }
+
+            if (MoveLFastRES.RES == "PLANNING: OK"){
+
+                MyPlan = MoveLFastRES.PLAN;
+                RES = "PLANNING: OK";
+                RCLCPP_INFO(this->get_logger(), "%s - MoveL: Fast path, planning time %.1fms (Pilz LIN average: %.1fms).", param_ROB.c_str(), 1000.0 * MoveLFastRES.T_PLAN, 1000.0 * T_LIN_AVG);
+
+            } else {
+
+                // 4. FALLBACK -> Pilz LIN, assign SPEED and PLANNING METHOD (PTP, LIN, CIRC):
+                move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+                move_group_interface_ROB.setMaxVelocityScalingFactor(goal->speed);
+                move_group_interface_ROB.setPlannerId("LIN");
+
+                // 5. PLAN:
+                MyPlan = plan_ROB();
+                if (RES == "PLANNING: OK"){
+                    N_LIN = N_LIN + 1;
+                    T_LIN_AVG = T_LIN_AVG + (MyPlan.planning_time_ - T_LIN_AVG) / N_LIN;
+                }
+                RCLCPP_INFO(this->get_logger(), "%s - MoveL: Pilz LIN (%s), planning time %.1fms.", param_ROB.c_str(), MoveLFastRES.RES.c_str(), 1000.0 * MyPlan.planning_time_);
+
+            }
 
         } else if (action == "MoveR" && param_ROB != "none"){
 
@@ -299,7 +397,7 @@ private:
             current_state->copyJointGroupPositions(joint_model_group_ROB, JP);
             
             // 2. CALL MoveRAction for CALCULATIONS:
-            MoveRSTRUCT MoveRRES = MoveRAction(goal->mover, JP, param_ROB);
+            MoveRSTRUCT MoveRRES = MoveRAction(goal->mover, JP, REG_ROB);
             JP = MoveRRES.JP;
             move_group_interface_ROB.setJointValueTarget(JP);
             
@@ -318,14 +416,37 @@ private:
             
             // 1. CALL MoveXYZWAction for CALCULATIONS:
             auto TARGET_POSE = MoveXYZWAction(goal->movexyzw);
-            move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+
+            // 2. IK CACHE -> If the pose has already been resolved from (near) the current joint values, plan to the cached JOINT TARGET:
+            std::vector<double> START = move_group_interface_ROB.getCurrentJointValues();
+            std::vector<double> JP;
+            bool CACHED = IK_CACHE.GET(param_ROB + "_arm", TARGET_POSE, START, JP);
+            if (CACHED){
+                move_group_interface_ROB.setJointValueTarget(JP);
+            } else {
+                move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+            }
             
-            // 2. Assign SPEED and PLANNING METHOD (PTP, LIN, CIRC):
+            // 3. Assign SPEED and PLANNING METHOD (PTP, LIN, CIRC):
             move_group_interface_ROB.setMaxVelocityScalingFactor(goal->speed);
             move_group_interface_ROB.setPlannerId("PTP");
 
-            // 3. PLAN:
-            MyPlan = plan_ROB();
+            // 4. PLAN:
+            MyPlan = plan_POSE();
+
+            // 5. IK CACHE -> Cached JOINT TARGET failed: the entry is removed, and the POSE TARGET is planned as usual:
+            if (CACHED && RES != "PLANNING: OK"){
+                IK_CACHE.ERASE(param_ROB + "_arm", TARGET_POSE);
+                move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+                MyPlan = plan_POSE();
+                CACHED = false;
+            }
+
+            // 6. IK CACHE -> Store the resolved JOINT TARGET (last trajectory point) and the start configuration:
+            if (!CACHED && RES == "PLANNING: OK" && !MyPlan.trajectory_.joint_trajectory.points.empty()){
+                IK_CACHE.PUT(param_ROB + "_arm", TARGET_POSE, START, MyPlan.trajectory_.joint_trajectory.points.back().positions);
+            }
+            RCLCPP_INFO(this->get_logger(), "%s", IK_CACHE.STATS().c_str());
         
         } else if (action == "MoveXYZ" && param_ROB != "none"){
             
@@ -341,7 +462,7 @@ private:
             move_group_interface_ROB.setPlannerId("PTP");
 
             // 4. PLAN:
-            MyPlan = plan_ROB();
+            MyPlan = plan_POSE();
         
         } else if (action == "MoveROT" && param_ROB != "none"){
             
@@ -357,7 +478,7 @@ private:
             move_group_interface_ROB.setPlannerId("PTP");
 
             // 4. PLAN:
-            MyPlan = plan_ROB();
+            MyPlan = plan_POSE();
         
         } else if (action == "MoveYPR" && param_ROB != "none"){
             
@@ -373,7 +494,7 @@ private:
             move_group_interface_ROB.setPlannerId("PTP");
 
             // 4. PLAN:
-            MyPlan = plan_ROB();
+            MyPlan = plan_POSE();
         
         } else if (action == "MoveRP" && param_ROB != "none"){
             
@@ -389,7 +510,7 @@ private:
             move_group_interface_ROB.setPlannerId("PTP");
 
             // 4. PLAN:
-            MyPlan = plan_ROB();
+            MyPlan = plan_POSE();
         
         } else if (action == "MoveG" && param_EE != "none"){
             
@@ -399,7 +520,7 @@ private:
             current_state->copyJointGroupPositions(joint_model_group_EE, JP);
             
             // 2. CALL MoveGAction for CALCULATIONS:
-            MoveGSTRUCT MoveGRES = MoveGAction(goal->moveg, JP, param_EE);
+            MoveGSTRUCT MoveGRES = MoveGAction(goal->moveg, JP, REG_EE);
             JP = MoveGRES.JP;
             move_group_interface_EE.setJointValueTarget(JP);
             
@@ -407,8 +528,12 @@ private:
             move_group_interface_EE.setMaxVelocityScalingFactor(goal->speed);
             move_group_interface_EE.setPlannerId("PTP");
 
-            // 4. PLAN:
-            if (MoveGRES.RES == "LIMITS: OK"){
+            // 4. PLAN, or GRIPPER COMMAND -> Target sent straight to the gripper controllers (no planning):
+            if (MoveGRES.RES == "LIMITS: OK" && GRIP_DIRECT){
+                GripSTRUCT GripRES = GRIPPER_CMD.COMMAND(JP);
+                RES = GripRES.RES;
+                RCLCPP_INFO(this->get_logger(), "%s - %s: %s %s (%.3fs). %s", param_EE.c_str(), action.c_str(), RES.c_str(), GripRES.STATE.c_str(), GripRES.T_EXEC, GRIPPER_CMD.STATS().c_str());
+            } else if (MoveGRES.RES == "LIMITS: OK"){
                 MyPlan = plan_EE();
             } else {
                 RES = "LIMITS: ERROR (EE)";
@@ -416,10 +541,32 @@ private:
         
         }
 
+        // PLANNING STRATEGY -> Selected candidate + win rates (pose targets):
+        if (PLAN_INFO != ""){
+            RCLCPP_INFO(this->get_logger(), "%s - %s%s", param_ROB.c_str(), action.c_str(), PLAN_INFO.c_str());
+            RCLCPP_INFO(this->get_logger(), "%s", PLAN_STRATEGY.STATS().c_str());
+            PLAN_INFO = "";
+        }
+
+        // PATH POST-PROCESSING -> Shortcutting + B-spline smoothing + TOTG, for sampling-based (non-Pilz) plans only:
+        if (RES == "PLANNING: OK" && SAMPLED_PLAN && PATH_SMOOTHER.ACTIVE()){
+            SmoothSTRUCT SmoothRES = PATH_SMOOTHER.SMOOTH(MyPlan, move_group_interface_ROB, goal->speed, 1.0);
+            RCLCPP_INFO(this->get_logger(), "%s - %s: %s -> Length: %.3frad -> %.3frad, duration: %.3fs -> %.3fs (%d -> %d waypoints)", param_ROB.c_str(), action.c_str(),
+                        SmoothRES.RES.c_str(), SmoothRES.LENGTH_BEFORE, SmoothRES.LENGTH_AFTER, SmoothRES.T_BEFORE, SmoothRES.T_AFTER, SmoothRES.N_BEFORE, SmoothRES.N_AFTER);
+        }
+        SAMPLED_PLAN = false;
+
+        // RETIMING -> Time-optimal reparameterization of the ROBOT trajectory (no jerk limit for /Move). Not for MoveL, TOTG would break
+        // the Cartesian limits of Pilz LIN (and of the fast path):
+        if (RES == "PLANNING: OK" && action != "MoveG" && action != "MoveL" && RETIMING == true){
+            RetimeSTRUCT RetimeRES = RetimeAction(MyPlan, move_group_interface_ROB, goal->speed, 1.0, 0.0);
+            RCLCPP_INFO(this->get_logger(), "%s - %s: %s (%.3fs -> %.3fs)", param_ROB.c_str(), action.c_str(), RetimeRES.RES.c_str(), RetimeRES.T_BEFORE, RetimeRES.T_AFTER);
+        }
+
         // EXECUTE:
         if (RES == "PLANNING: OK"){
 
-            bool ExecSUCCESS = (move_group_interface_ROB.execute(MyPlan) == moveit::planning_interface::MoveItErrorCode::SUCCESS);
+            bool ExecSUCCESS = execute_PLAN(move_group_interface_ROB, MyPlan);
 
             if (goal_handle->is_canceling()) {
                 RCLCPP_INFO(this->get_logger(), "Goal canceled.");
@@ -439,7 +586,7 @@ private:
             }
 
         } else if (RES == "PLANNING: OK (EE)"){
-            move_group_interface_EE.execute(MyPlan);
+            execute_PLAN(move_group_interface_EE, MyPlan);
 
             if (goal_handle->is_canceling()) {
                 RCLCPP_INFO(this->get_logger(), "Goal canceled.");
@@ -452,6 +599,24 @@ private:
                 goal_handle->succeed(result);
             }
             
+        } else if (RES.rfind("GRIPPER:", 0) == 0){
+
+            // GRIPPER COMMAND -> Already executed:
+            if (goal_handle->is_canceling()) {
+                RCLCPP_INFO(this->get_logger(), "Goal canceled.");
+                result->result = action + ":CANCELED";
+                goal_handle->canceled(result);
+                return;
+            } else if (RES == "GRIPPER: OK"){
+                RCLCPP_INFO(this->get_logger(), "%s - %s: Movement executed!", param_EE.c_str(), action.c_str());
+                result->result = action + ":SUCCESS";
+                goal_handle->succeed(result);
+            } else {
+                RCLCPP_INFO(this->get_logger(), "%s - %s: Gripper command failed!", param_EE.c_str(), action.c_str());
+                result->result = action + ":FAILED. Reason -> Gripper command error.";
+                goal_handle->succeed(result);
+            }
+
         } else if (RES == "PLANNING: ERROR"){
             RCLCPP_INFO(this->get_logger(), "%s - %s: Planning failed!", param_ROB.c_str(), action.c_str());
             result->result = action + ":FAILED. Reason -> Planning failed.";
@@ -503,6 +668,58 @@ int main(int argc, char ** argv)
     executor.add_node(node2);
     std::thread([&executor]() { executor.spin(); }).detach();
 
+    // IK/TARGET RESOLUTION CACHE -> Size and rounding tolerance (optional parameters):
+    int IK_CACHE_SIZE = 256;
+    double IK_CACHE_TOL = 1e-4;
+    node2->get_parameter("IK_CACHE_SIZE", IK_CACHE_SIZE);
+    node2->get_parameter("IK_CACHE_TOL", IK_CACHE_TOL);
+    if (IK_CACHE_SIZE < 0 || IK_CACHE_TOL <= 0.0){
+        RCLCPP_ERROR(logger, "IK cache -> Invalid SIZE (%d) or TOLERANCE (%.1e), default values are used.", IK_CACHE_SIZE, IK_CACHE_TOL);
+        IK_CACHE_SIZE = 256;
+        IK_CACHE_TOL = 1e-4;
+    }
+    IK_CACHE.CONFIGURE(IK_CACHE_SIZE, IK_CACHE_TOL);
+    RCLCPP_INFO(logger, "IK cache initialised -> SIZE: %d, TOLERANCE: %.1e", IK_CACHE_SIZE, IK_CACHE_TOL);
+
+    // TRAJECTORY RETIMING -> ON/OFF (optional parameter, default: ON):
+    node2->get_parameter("RETIMING", RETIMING);
+    RCLCPP_INFO(logger, "Trajectory retiming -> %s", RETIMING ? "ON" : "OFF");
+
+    // MoveL FAST PATH -> Max. segment length (optional parameter, default: 0.0m -> OFF) and Pilz Cartesian limits (pilz_cartesian_limits.yaml):
+    node2->get_parameter("MOVEL_FAST_MAXDIST", MOVEL_FAST_MAXDIST);
+    if (MOVEL_FAST_MAXDIST > 0.0){
+        MoveLFastLIMITS LIMITS;
+        node2->get_parameter("robot_description_planning.cartesian_limits.max_trans_vel", LIMITS.TRANS_VEL);
+        node2->get_parameter("robot_description_planning.cartesian_limits.max_trans_acc", LIMITS.TRANS_ACC);
+        node2->get_parameter("robot_description_planning.cartesian_limits.max_rot_vel", LIMITS.ROT_VEL);
+        if (LIMITS.TRANS_VEL > 0.0 && LIMITS.TRANS_ACC > 0.0 && LIMITS.ROT_VEL > 0.0){
+            MOVEL_FAST_LIMITS = LIMITS;
+        } else {
+            RCLCPP_ERROR(logger, "MoveL fast path -> Invalid Cartesian limits, default values are used.");
+        }
+        MOVEL_FAST_SCENE = node2->create_client<moveit_msgs::srv::GetPlanningScene>("/get_planning_scene");
+    }
+    RCLCPP_INFO(logger, "MoveL fast path -> Max. segment length: %.3fm (Cartesian limits: %.2fm/s, %.2fm/s^2, %.2frad/s)", MOVEL_FAST_MAXDIST,
+                MOVEL_FAST_LIMITS.TRANS_VEL, MOVEL_FAST_LIMITS.TRANS_ACC, MOVEL_FAST_LIMITS.ROT_VEL);
+
+    // PLANNING STRATEGY (pose targets) -> Mode, candidates ("pipeline/planner") and time budget (optional parameters):
+    std::string PLAN_MODE = "off";
+    std::vector<std::string> PLAN_CANDIDATES = {"move_group/PTP", "ompl/RRTConnectkConfigDefault", "ompl/RRTConnectkConfigDefault"};
+    double PLAN_BUDGET = 1.0;
+    node2->get_parameter("PLAN_STRATEGY", PLAN_MODE);
+    node2->get_parameter("PLAN_CANDIDATES", PLAN_CANDIDATES);
+    node2->get_parameter("PLAN_BUDGET", PLAN_BUDGET);
+    PLAN_STRATEGY.CONFIGURE(node2, PLAN_MODE, PLAN_CANDIDATES, PLAN_BUDGET);
+    RCLCPP_INFO(logger, "Planning strategy -> %s (%zu candidates, budget: %.2fs)", PLAN_STRATEGY.ACTIVE() ? PLAN_MODE.c_str() : "OFF", PLAN_CANDIDATES.size(), PLAN_BUDGET);
+
+    // PATH POST-PROCESSING (non-Pilz plans) -> Shortcutting iterations (0 -> OFF) and collision-check resolution [rad] (optional parameters):
+    int SMOOTH_ITERATIONS = 100;
+    double SMOOTH_RESOLUTION = 0.05;
+    node2->get_parameter("SMOOTH_ITERATIONS", SMOOTH_ITERATIONS);
+    node2->get_parameter("SMOOTH_RESOLUTION", SMOOTH_RESOLUTION);
+    PATH_SMOOTHER.CONFIGURE(node2, SMOOTH_ITERATIONS, SMOOTH_RESOLUTION);
+    RCLCPP_INFO(logger, "Path post-processing (non-Pilz plans) -> %s (%d shortcut iterations, resolution: %.3frad)", PATH_SMOOTHER.ACTIVE() ? "ON" : "OFF", SMOOTH_ITERATIONS, SMOOTH_RESOLUTION);
+
     // CREATE -> MoveGroupInterface(s):
     using moveit::planning_interface::MoveGroupInterface;
     // 1. ROBOT:
@@ -517,6 +734,9 @@ int main(int argc, char ** argv)
 
         joint_model_group_ROB = move_group_interface_ROB.getCurrentState()->getJointModelGroup(name);
         RCLCPP_INFO(logger, "MoveGroupInterface object created for ROBOT: %s", param_ROB.c_str());
+
+        REG_ROB = RegistryLoad(node2, joint_model_group_ROB);
+        RCLCPP_INFO(logger, "%s -> ROBOT: %s, %zu joints.", REG_ROB.RES.c_str(), REG_ROB.GROUP.c_str(), REG_ROB.JOINTS.size());
     }
     // 2. END-EFFECTOR:
     if (param_EE != "none" && param_ENV != "bringup"){
@@ -526,7 +746,38 @@ int main(int argc, char ** argv)
         move_group_interface_EE.setMaxAccelerationScalingFactor(1.0);
         joint_model_group_EE = move_group_interface_EE.getCurrentState()->getJointModelGroup(param_EE);
         RCLCPP_INFO(logger, "MoveGroupInterface object created for END-EFFECTOR: %s", param_EE.c_str());
+
+        REG_EE = RegistryLoad(node2, joint_model_group_EE);
+        RCLCPP_INFO(logger, "%s -> END-EFFECTOR: %s, %zu joints, gripper range [%.4f, %.4f].", REG_EE.RES.c_str(), REG_EE.GROUP.c_str(), REG_EE.JOINTS.size(), REG_EE.GP_LL, REG_EE.GP_UL);
+    }
+
+    // EXECUTION BACKEND -> "moveit" (default) or "direct" (optional parameter, selected per environment in the launch files):
+    std::string EXEC_BACKEND = "moveit";
+    node2->get_parameter("EXEC_BACKEND", EXEC_BACKEND);
+    if (EXEC_BACKEND == "direct"){
+        EXEC_DIRECT = DIRECT_EXEC.CONFIGURE(node2);
+        if (!EXEC_DIRECT){
+            RCLCPP_ERROR(logger, "Execution backend -> The controllers could not be read from move_group, MoveIt!2 execution is used.");
+        }
+    }
+    RCLCPP_INFO(logger, "Execution backend -> %s", EXEC_DIRECT ? "DIRECT (FollowJointTrajectory/GripperCommand controllers)" : "MoveIt!2 (move_group)");
+
+    // GRIPPER COMMAND PATH -> "moveit" (default) or "direct", position tolerance [rad], max. effort (0.0 -> not limited) and timeout [s] (optional parameters):
+    std::string GRIPPER_BACKEND = "moveit";
+    double GRIPPER_TOL = 0.01;
+    double GRIPPER_MAX_EFFORT = 0.0;
+    double GRIPPER_TIMEOUT = 5.0;
+    node2->get_parameter("GRIPPER_BACKEND", GRIPPER_BACKEND);
+    node2->get_parameter("GRIPPER_TOL", GRIPPER_TOL);
+    node2->get_parameter("GRIPPER_MAX_EFFORT", GRIPPER_MAX_EFFORT);
+    node2->get_parameter("GRIPPER_TIMEOUT", GRIPPER_TIMEOUT);
+    if (GRIPPER_BACKEND == "direct" && param_EE != "none" && param_ENV != "bringup"){
+        GRIP_DIRECT = GRIPPER_CMD.CONFIGURE(node2, REG_EE, GRIPPER_TOL, GRIPPER_MAX_EFFORT, GRIPPER_TIMEOUT);
+        if (!GRIP_DIRECT){
+            RCLCPP_ERROR(logger, "Gripper command path -> No GripperCommand controllers found for %s, MoveG is planned with MoveIt!2.", param_EE.c_str());
+        }
     }
+    RCLCPP_INFO(logger, "Gripper command path -> %s", GRIP_DIRECT ? "DIRECT (GripperCommand controllers)" : "MoveIt!2 (plan + execute)");
 
     // CREATE -> PlanningSceneInterface:
     using moveit::planning_interface::PlanningSceneInterface;
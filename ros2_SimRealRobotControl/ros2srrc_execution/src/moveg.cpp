@@ -46,7 +46,7 @@
 #include "ros2srrc_data/action/move.hpp"
 
 // MoveG:
-MoveGSTRUCT MoveGAction (double VAL, std::vector<double> JP, std::string param_EE){
+MoveGSTRUCT MoveGAction (double VAL, std::vector<double> JP, const RegistrySTRUCT & REG){
 
     MoveGSTRUCT RESULT;
     
@@ -54,48 +54,16 @@ MoveGSTRUCT MoveGAction (double VAL, std::vector<double> JP, std::string param_E
     double GP = VAL;
 
     // 2. CALCULATIONS:
-
-    // GRIPPERS in ros2_SimRealRobotControl repository:
-    //  - Schunk EGP-64 parallel gripper. NAME -> "egp64"
-    //  - Robotiq 2f-85 parallel gripper. NAME -> "robotiq_2f85"
-    //  - Robotiq Hand-E parallel gripper. NAME -> "robotiq_hande"
-
-    // Check GRIPPER LIMITS:
-    double GPupper, GPlower = 0.0;
-    bool LimitCheck = false;
-    if (param_EE == "egp64"){
-        GPupper = 0.025;
-        GPlower = 0.0;
-    } else if (param_EE == "robotiq_2f85"){
-        GPupper = 0.8;
-        GPlower = 0.0;
-    } else if (param_EE == "robotiq_hande"){
-        GPupper = 0.025;
-        GPlower = 0.0;
-    };
-    if (GP <= GPupper && GP >= GPlower) {
-        // Do nothing, check complete.
-    } else {
-        LimitCheck = true;
-    }
+    // Check GRIPPER LIMITS -> Gripper value range in the END-EFFECTOR REGISTRY (all MIMIC ratios applied):
+    bool LimitCheck = (GP < REG.GP_LL || GP > REG.GP_UL || JP.size() < REG.MIMIC.size());
 
     // 3. SET TARGET and RETURN:
     if (LimitCheck == false){
         
-        if (param_EE == "egp64"){
-            JP[0] = GP;
-            JP[1] = GP;
-        } else if (param_EE == "robotiq_2f85"){
-            JP[0] = GP;
-            JP[1] = -GP;
-            JP[2] = GP;
-            JP[3] = GP;
-            JP[4] = -GP;
-            JP[5] = GP;
-        } else if (param_EE == "robotiq_hande"){
-            JP[0] = GP;
-            JP[1] = GP;
-        };
+        // Every gripper joint follows the gripper value with its MIMIC ratio (e.g. Robotiq 2f-85 -> +1/-1):
+        for (size_t i = 0; i < REG.MIMIC.size(); i++){
+            JP[i] = REG.MIMIC[i] * GP;
+        }
 
         RESULT.RES = "LIMITS: OK";
         RESULT.JP = JP;
@@ -108,4 +76,4 @@ MoveGSTRUCT MoveGAction (double VAL, std::vector<double> JP, std::string param_E
     // 4. RETURN RESULT:
     return(RESULT);
 
-};
\ No newline at end of file
+};
@@ -31,6 +31,7 @@
 #include "ros2srrc_execution/movej.h"
 
 // Include standard libraries:
+#include <algorithm>
 #include <string>
 #include <vector>
 
@@ -53,138 +54,30 @@ const double pi = 3.14159265358979;
 const double k = pi/180.0;
 
 // MoveJ:
-MoveJSTRUCT MoveJAction (ros2srrc_data::msg::Joints JOINTS, std::vector<double> JP, std::string param_ROB){
+MoveJSTRUCT MoveJAction (ros2srrc_data::msg::Joints JOINTS, std::vector<double> JP, const RegistrySTRUCT & REG){
 
     MoveJSTRUCT RESULT;
-    double j1UL, j1LL, j2UL, j2LL, j3UL, j3LL, j4UL, j4LL, j5UL, j5LL, j6UL, j6LL = 0.0;
-    double j1, j2, j3, j4, j5, j6 = 0.0;
 
     // 1. Obtain variables:
     auto MoveJgoal = JOINTS;
+    const double INPUT[6] = {MoveJgoal.joint1, MoveJgoal.joint2, MoveJgoal.joint3, MoveJgoal.joint4, MoveJgoal.joint5, MoveJgoal.joint6};
 
     // 2. CALCULATIONS:
-    // Declare joint value variables:
-    j1 = MoveJgoal.joint1;
-    j2 = MoveJgoal.joint2;
-    j3 = MoveJgoal.joint3;
-    j4 = MoveJgoal.joint4;
-    if (param_ROB != "dobot"){
-        j5 = MoveJgoal.joint5;
-        j6 = MoveJgoal.joint6;
+    // Joint values (DEG->RAD), in the ROBOT REGISTRY order -> Only the first REG.JOINTS.size() inputs are used (e.g. 4 for a 4-DOF robot):
+    std::vector<double> TARGET = JP;
+    size_t N = std::min(REG.JOINTS.size(), TARGET.size());
+    N = std::min(N, static_cast<size_t>(6));
+    for (size_t i = 0; i < N; i++){
+        TARGET[i] = INPUT[i] * k;
     }
 
-    // ROBOTS in ros2_SimRealRobotControl repository:
-    //  - ABB IRB-120 industrial robot manipulator. NAME -> "irb120"
-    //  - Universal Robots - UR3. NAME -> "ur3"
-    //  - Universal Robots - UR10e. NAME -> "ur10e"
-    //  - Dobot Magician. NAME -> "dobot"
-
-    // ***** JOINT VALUES (MAX/MIN) ***** //
-    if (param_ROB == "irb120"){
-        j1UL = 165;
-        j1LL = -165;
-        j2UL = 110;
-        j2LL = -110;
-        j3UL = 70;
-        j3LL = -110;
-        j4UL = 160;
-        j4LL = -160;
-        j5UL = 120;
-        j5LL = -120;
-        j6UL = 400;
-        j6LL = -400;
-    } else if (param_ROB == "ur3"){
-        j1UL = 360;
-        j1LL = -360;
-        j2UL = 360;
-        j2LL = -360;
-        j3UL = 180;
-        j3LL = -180;
-        j4UL = 360;
-        j4LL = -360;
-        j5UL = 360;
-        j5LL = -360;
-        j6UL = 360;
-        j6LL = -360;
-    } else if (param_ROB == "ur5"){
-        j1UL = 360;
-        j1LL = -360;
-        j2UL = 360;
-        j2LL = -360;
-        j3UL = 180;
-        j3LL = -180;
-        j4UL = 360;
-        j4LL = -360;
-        j5UL = 360;
-        j5LL = -360;
-        j6UL = 360;
-        j6LL = -360;
-    } else if (param_ROB == "dobot"){
-        j1UL = 120;
-        j1LL = -120;
-        j2UL = 90;
-        j2LL = -5;
-        j3UL = 90;
-        j3LL = -15;
-        j4UL = 140;
-        j4LL = -140;
-    };
-
-    // Check if INPUT JOINT VALUES are within the JOINT LIMIT VALUES:
-    bool LimitCheck = false;
-    
-    if (j1 <= j1UL && j1 >= j1LL && LimitCheck == false) {
-        // Do nothing, check complete.
-    } else {
-        LimitCheck = true;
-    }
-    if (j2 <= j2UL && j2 >= j2LL && LimitCheck == false) {
-        // Do nothing, check complete.
-    } else {
-        LimitCheck = true;
-    }
-    if (j3 <= j3UL && j3 >= j3LL && LimitCheck == false) {
-        // Do nothing, check complete.
-    } else {
-        LimitCheck = true;
-    }
-    if (j4 <= j4UL && j4 >= j4LL && LimitCheck == false) {
-        // Do nothing, check complete.
-    } else {
-        LimitCheck = true;
-    }
-
-    if (param_ROB != "dobot"){
-
-        if (j5 <= j5UL && j5 >= j5LL && LimitCheck == false) {
-            // Do nothing, check complete.
-        } else {
-            LimitCheck = true;
-        }
-        if (j6 <= j6UL && j6 >= j6LL && LimitCheck == false) {
-            // Do nothing, check complete.
-        } else {
-            LimitCheck = true;
-        }
-
-    }
+    // 3. Check if INPUT JOINT VALUES are within the JOINT LIMIT VALUES (ROBOT REGISTRY):
+    bool LimitCheck = !RegistryCheck(REG, TARGET);
 
     // 4. SET TARGET and RETURN:
     if (LimitCheck == false){
-        
-        JP[0] = MoveJgoal.joint1 * k;
-        JP[1] = MoveJgoal.joint2 * k;
-        JP[2] = MoveJgoal.joint3 * k;
-        JP[3] = MoveJgoal.joint4 * k;
-
-        if (param_ROB != "dobot"){
-            JP[4] = MoveJgoal.joint5 * k;
-            JP[5] = MoveJgoal.joint6 * k; 
-        }
-
         RESULT.RES = "LIMITS: OK";
-        RESULT.JP = JP;
-
+        RESULT.JP = TARGET;
     } else {
         RESULT.RES = "LIMITS: ERROR";
         RESULT.JP = JP;
@@ -193,4 +86,4 @@ MoveJSTRUCT MoveJAction (ros2srrc_data::msg::Joints JOINTS, std::vector<double>
     // 5. RETURN RESULT:
     return(RESULT);
 
-};
\ No newline at end of file
+};
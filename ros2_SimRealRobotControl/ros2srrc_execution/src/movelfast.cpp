@@ -0,0 +1,209 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/movelfast.h"
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <future>
+#include <string>
+#include <vector>
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+#include <moveit/planning_scene/planning_scene.h>
+#include <moveit/robot_state/conversions.h>
+#include <moveit/robot_trajectory/robot_trajectory.h>
+#include <moveit/trajectory_processing/time_optimal_trajectory_generation.h>
+#include <moveit_msgs/msg/planning_scene_components.hpp>
+#include <moveit_msgs/srv/get_planning_scene.hpp>
+
+// Declaration of CONSTANT VALUES -> Interpolation and continuity check:
+const double EEF_STEP = 0.005;     // Max. translation between waypoints [m].
+const double ROT_STEP = 0.05;      // Max. rotation between waypoints [rad].
+const double MAX_JUMP = 0.15;      // Max. joint displacement between consecutive waypoints [rad].
+const double IK_TIMEOUT = 0.005;   // [s]
+const double SCENE_TIMEOUT = 1.0;  // [s]
+
+// MoveL FAST PATH:
+MoveLFastSTRUCT MoveLFastAction (geometry_msgs::msg::Pose TARGET_POSE, moveit::planning_interface::MoveGroupInterface & MGI,
+                                 const moveit::core::JointModelGroup * JMG, double SPEED, double MAX_LENGTH, const MoveLFastLIMITS & LIMITS,
+                                 const rclcpp::Client<moveit_msgs::srv::GetPlanningScene>::SharedPtr & SCENE_CLIENT){
+
+    MoveLFastSTRUCT RESULT;
+    auto T0 = std::chrono::steady_clock::now();
+
+    // 1. START and TARGET poses (End-Effector link, model frame):
+    moveit::core::RobotStatePtr STATE = MGI.getCurrentState(10);
+    const std::string EE = MGI.getEndEffectorLink();
+    const Eigen::Isometry3d T_START = STATE->getGlobalLinkTransform(EE);
+    Eigen::Isometry3d T_TARGET = Eigen::Isometry3d::Identity();
+    T_TARGET.translation() = Eigen::Vector3d(TARGET_POSE.position.x, TARGET_POSE.position.y, TARGET_POSE.position.z);
+    T_TARGET.linear() = Eigen::Quaterniond(TARGET_POSE.orientation.w, TARGET_POSE.orientation.x, TARGET_POSE.orientation.y, TARGET_POSE.orientation.z).normalized().toRotationMatrix();
+
+    const Eigen::Quaterniond Q_START(T_START.linear());
+    const Eigen::Quaterniond Q_TARGET(T_TARGET.linear());
+    const double LENGTH = (T_TARGET.translation() - T_START.translation()).norm();
+    const double ANGLE = Q_START.angularDistance(Q_TARGET);
+
+    if (LENGTH > MAX_LENGTH){
+        RESULT.RES = "FASTPATH: SKIP";
+        RESULT.T_PLAN = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+        return(RESULT);
+    }
+
+    // 2. Current PLANNING SCENE (world objects, attached objects, ACM) -> From move_group. No scene -> No fast path:
+    auto REQUEST = std::make_shared<moveit_msgs::srv::GetPlanningScene::Request>();
+    REQUEST->components.components = moveit_msgs::msg::PlanningSceneComponents::SCENE_SETTINGS
+                                   | moveit_msgs::msg::PlanningSceneComponents::ROBOT_STATE
+                                   | moveit_msgs::msg::PlanningSceneComponents::ROBOT_STATE_ATTACHED_OBJECTS
+                                   | moveit_msgs::msg::PlanningSceneComponents::WORLD_OBJECT_NAMES
+                                   | moveit_msgs::msg::PlanningSceneComponents::WORLD_OBJECT_GEOMETRY
+                                   | moveit_msgs::msg::PlanningSceneComponents::OCTOMAP
+                                   | moveit_msgs::msg::PlanningSceneComponents::TRANSFORMS
+                                   | moveit_msgs::msg::PlanningSceneComponents::ALLOWED_COLLISION_MATRIX
+                                   | moveit_msgs::msg::PlanningSceneComponents::LINK_PADDING_AND_SCALING;
+    if (!SCENE_CLIENT || !SCENE_CLIENT->wait_for_service(std::chrono::duration<double>(SCENE_TIMEOUT))){
+        RESULT.RES = "FASTPATH: ERROR (no planning scene)";
+        RESULT.T_PLAN = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+        return(RESULT);
+    }
+    auto FUTURE = SCENE_CLIENT->async_send_request(REQUEST);
+    if (FUTURE.wait_for(std::chrono::duration<double>(SCENE_TIMEOUT)) != std::future_status::ready){
+        RESULT.RES = "FASTPATH: ERROR (no planning scene)";
+        RESULT.T_PLAN = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+        return(RESULT);
+    }
+    planning_scene::PlanningScene SCENE(MGI.getRobotModel());
+    SCENE.setPlanningSceneMsg(FUTURE.get()->scene);
+
+    // IK solutions are only accepted if the robot (+ attached objects) does not collide in the planning scene:
+    bool COLLISION = false;
+    moveit::core::GroupStateValidityCallbackFn VALID = [&SCENE, &COLLISION](moveit::core::RobotState * S, const moveit::core::JointModelGroup * G, const double * Q){
+        S->setJointGroupPositions(G, Q);
+        S->update();
+        COLLISION = SCENE.isStateColliding(*S, G->getName());
+        return(!COLLISION);
+    };
+
+    // 3. CARTESIAN INTERPOLATION:
+    int N = std::max(1, (int)std::ceil(std::max(LENGTH / EEF_STEP, ANGLE / ROT_STEP)));
+
+    // 4. BATCH IK (seed -> previous waypoint) + COLLISION and CONTINUITY CHECKS:
+    robot_trajectory::RobotTrajectory TRAJ(MGI.getRobotModel(), JMG);
+    TRAJ.addSuffixWayPoint(*STATE, 0.0);
+
+    // The attached objects (if any) are taken from the scene, the joint values from the current state:
+    moveit::core::RobotState WP(SCENE.getCurrentState());
+    WP.setVariablePositions(STATE->getVariablePositions());
+    WP.update();
+    std::vector<double> PREV, JP;
+    STATE->copyJointGroupPositions(JMG, PREV);
+
+    for (int i = 1; i <= N; i++){
+
+        double s = (double)i / N;
+        Eigen::Isometry3d T_WP = Eigen::Isometry3d::Identity();
+        T_WP.translation() = T_START.translation() + s * (T_TARGET.translation() - T_START.translation());
+        T_WP.linear() = Q_START.slerp(s, Q_TARGET).toRotationMatrix();
+
+        if (!WP.setFromIK(JMG, T_WP, EE, IK_TIMEOUT, VALID)){
+            RESULT.RES = COLLISION ? "FASTPATH: ERROR (collision)" : "FASTPATH: ERROR";
+            RESULT.T_PLAN = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+            return(RESULT);
+        }
+
+        WP.copyJointGroupPositions(JMG, JP);
+        for (size_t j = 0; j < JP.size(); j++){
+            if (std::fabs(JP[j] - PREV[j]) > MAX_JUMP){
+                RESULT.RES = "FASTPATH: ERROR";
+                RESULT.T_PLAN = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+                return(RESULT);
+            }
+        }
+        PREV = JP;
+
+        TRAJ.addSuffixWayPoint(WP, 0.0);
+    }
+
+    // 5. TIME PARAMETERIZATION:
+    trajectory_processing::TimeOptimalTrajectoryGeneration TOTG;
+    if (!TOTG.computeTimeStamps(TRAJ, SPEED, 1.0)){
+        RESULT.RES = "FASTPATH: ERROR";
+        RESULT.T_PLAN = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+        return(RESULT);
+    }
+
+    // 6. CARTESIAN LIMITS -> The waypoints are equally spaced (LENGTH/N, ANGLE/N), so the End-Effector velocity of every segment is
+    //    given by its duration. Uniform time scaling by K divides the velocities by K and the accelerations by K^2:
+    const double V_MAX = LIMITS.TRANS_VEL * SPEED;
+    const double W_MAX = LIMITS.ROT_VEL * SPEED;
+    double K = 1.0;
+    double V_PREV = 0.0;
+    double DT_PREV = 0.0;
+    for (size_t i = 1; i < TRAJ.getWayPointCount(); i++){
+        double DT = TRAJ.getWayPointDurationFromPrevious(i);
+        if (DT <= 0.0){
+            continue;
+        }
+        double V = (LENGTH / N) / DT;
+        K = std::max(K, V / V_MAX);
+        K = std::max(K, ((ANGLE / N) / DT) / W_MAX);
+        K = std::max(K, std::sqrt((std::fabs(V - V_PREV) / (0.5 * (DT + DT_PREV))) / LIMITS.TRANS_ACC));
+        V_PREV = V;
+        DT_PREV = DT;
+    }
+    // Stop at the end of the segment:
+    if (DT_PREV > 0.0){
+        K = std::max(K, std::sqrt((V_PREV / (0.5 * DT_PREV)) / LIMITS.TRANS_ACC));
+    }
+
+    // 7. RobotTrajectory -> Plan:
+    moveit::core::robotStateToRobotStateMsg(*STATE, RESULT.PLAN.start_state_);
+    TRAJ.getRobotTrajectoryMsg(RESULT.PLAN.trajectory_);
+    for (auto & POINT : RESULT.PLAN.trajectory_.joint_trajectory.points){
+        POINT.time_from_start = rclcpp::Duration::from_seconds(K * rclcpp::Duration(POINT.time_from_start).seconds());
+        for (double & V : POINT.velocities){
+            V = V / K;
+        }
+        for (double & A : POINT.accelerations){
+            A = A / (K * K);
+        }
+    }
+    RESULT.T_PLAN = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+    RESULT.PLAN.planning_time_ = RESULT.T_PLAN;
+    RESULT.RES = "PLANNING: OK";
+
+    // 8. RETURN RESULT:
+    return(RESULT);
+
+};
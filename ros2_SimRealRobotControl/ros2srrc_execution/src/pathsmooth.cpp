@@ -0,0 +1,267 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/pathsmooth.h"
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <future>
+#include <memory>
+#include <random>
+#include <string>
+#include <vector>
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+#include <moveit/planning_scene/planning_scene.h>
+#include <moveit/robot_state/conversions.h>
+#include <moveit/robot_trajectory/robot_trajectory.h>
+#include <moveit/trajectory_processing/time_optimal_trajectory_generation.h>
+#include <moveit_msgs/msg/planning_scene_components.hpp>
+#include <moveit_msgs/srv/get_planning_scene.hpp>
+
+// Declaration of CONSTANT VALUES:
+const int SMOOTH_PASSES = 2;          // B-spline subdivision passes.
+const double PATH_TOLERANCE = 0.01;   // TOTG blending tolerance [rad].
+const double SCENE_TIMEOUT = 2.0;     // [s]
+
+typedef std::vector<std::vector<double>> PATH;
+
+// Joint-space path length:
+static double PathLength(const PATH & P)
+{
+    double L = 0.0;
+    for (size_t i = 1; i < P.size(); i++){
+        double D = 0.0;
+        for (size_t j = 0; j < P[i].size(); j++){
+            D = D + (P[i][j] - P[i-1][j]) * (P[i][j] - P[i-1][j]);
+        }
+        L = L + std::sqrt(D);
+    }
+    return(L);
+}
+
+// Straight joint-space segment A -> B, checked every RESOLUTION [rad] (max. joint displacement):
+static bool SegmentValid(const planning_scene::PlanningScene & SCENE, moveit::core::RobotState & STATE, const moveit::core::JointModelGroup * JMG,
+                         const std::vector<double> & A, const std::vector<double> & B, double RESOLUTION)
+{
+    double MAX_D = 0.0;
+    for (size_t j = 0; j < A.size(); j++){
+        MAX_D = std::max(MAX_D, std::fabs(B[j] - A[j]));
+    }
+    int STEPS = std::max(1, (int)std::ceil(MAX_D / RESOLUTION));
+
+    std::vector<double> Q(A.size());
+    for (int k = 1; k <= STEPS; k++){
+        double s = (double)k / STEPS;
+        for (size_t j = 0; j < A.size(); j++){
+            Q[j] = A[j] + s * (B[j] - A[j]);
+        }
+        STATE.setJointGroupPositions(JMG, Q);
+        STATE.update();
+        if (SCENE.isStateColliding(STATE, JMG->getName())){
+            return false;
+        }
+    }
+    return true;
+}
+
+static bool PathValid(const planning_scene::PlanningScene & SCENE, moveit::core::RobotState & STATE, const moveit::core::JointModelGroup * JMG,
+                      const PATH & P, double RESOLUTION)
+{
+    for (size_t i = 1; i < P.size(); i++){
+        if (!SegmentValid(SCENE, STATE, JMG, P[i-1], P[i], RESOLUTION)){
+            return false;
+        }
+    }
+    return true;
+}
+
+PathSmoother::PathSmoother() : ITERATIONS_(0), RESOLUTION_(0.05)
+{
+}
+
+void PathSmoother::CONFIGURE(const rclcpp::Node::SharedPtr & node, int ITERATIONS, double RESOLUTION)
+{
+    ITERATIONS_ = std::max(0, ITERATIONS);
+    RESOLUTION_ = (RESOLUTION > 0.0) ? RESOLUTION : 0.05;
+    if (ACTIVE()){
+        CLIENT_ = node->create_client<moveit_msgs::srv::GetPlanningScene>("/get_planning_scene");
+    }
+}
+
+bool PathSmoother::ACTIVE() const
+{
+    return(ITERATIONS_ > 0);
+}
+
+SmoothSTRUCT PathSmoother::SMOOTH(moveit::planning_interface::MoveGroupInterface::Plan & PLAN, moveit::planning_interface::MoveGroupInterface & MGI, double SPEED, double ACCEL)
+{
+    SmoothSTRUCT RESULT;
+    RESULT.RES = "SMOOTHING: ERROR";
+    RESULT.LENGTH_BEFORE = 0.0;
+    RESULT.LENGTH_AFTER = 0.0;
+    RESULT.T_BEFORE = 0.0;
+    RESULT.T_AFTER = 0.0;
+    RESULT.N_BEFORE = PLAN.trajectory_.joint_trajectory.points.size();
+    RESULT.N_AFTER = RESULT.N_BEFORE;
+
+    // 1. Check INPUT values:
+    if (SPEED <= 0.0 || SPEED > 1.0){
+        SPEED = 1.0;
+    }
+    if (ACCEL <= 0.0 || ACCEL > 1.0){
+        ACCEL = 1.0;
+    }
+    if (!ACTIVE() || RESULT.N_BEFORE < 3){
+        return(RESULT);
+    }
+
+    // 2. Plan -> RobotTrajectory + joint-space PATH (JointModelGroup order):
+    const moveit::core::RobotModelConstPtr & MODEL = MGI.getRobotModel();
+    const moveit::core::JointModelGroup * JMG = MODEL->getJointModelGroup(MGI.getName());
+    moveit::core::RobotState START(MODEL);
+    START.setToDefaultValues();
+    moveit::core::robotStateMsgToRobotState(PLAN.start_state_, START);
+
+    robot_trajectory::RobotTrajectory TRAJ(MODEL, JMG);
+    TRAJ.setRobotTrajectoryMsg(START, PLAN.trajectory_);
+    RESULT.T_BEFORE = TRAJ.getDuration();
+
+    PATH P;
+    for (size_t i = 0; i < TRAJ.getWayPointCount(); i++){
+        std::vector<double> Q;
+        TRAJ.getWayPoint(i).copyJointGroupPositions(JMG, Q);
+        P.push_back(Q);
+    }
+    RESULT.LENGTH_BEFORE = PathLength(P);
+    RESULT.LENGTH_AFTER = RESULT.LENGTH_BEFORE;
+    RESULT.T_AFTER = RESULT.T_BEFORE;
+
+    // 3. Current PLANNING SCENE (world objects, attached objects, ACM) -> From move_group:
+    auto REQUEST = std::make_shared<moveit_msgs::srv::GetPlanningScene::Request>();
+    REQUEST->components.components = moveit_msgs::msg::PlanningSceneComponents::SCENE_SETTINGS
+                                   | moveit_msgs::msg::PlanningSceneComponents::ROBOT_STATE
+                                   | moveit_msgs::msg::PlanningSceneComponents::ROBOT_STATE_ATTACHED_OBJECTS
+                                   | moveit_msgs::msg::PlanningSceneComponents::WORLD_OBJECT_NAMES
+                                   | moveit_msgs::msg::PlanningSceneComponents::WORLD_OBJECT_GEOMETRY
+                                   | moveit_msgs::msg::PlanningSceneComponents::OCTOMAP
+                                   | moveit_msgs::msg::PlanningSceneComponents::TRANSFORMS
+                                   | moveit_msgs::msg::PlanningSceneComponents::ALLOWED_COLLISION_MATRIX
+                                   | moveit_msgs::msg::PlanningSceneComponents::LINK_PADDING_AND_SCALING
+                                   | moveit_msgs::msg::PlanningSceneComponents::OBJECT_COLORS;
+    if (!CLIENT_->wait_for_service(std::chrono::duration<double>(SCENE_TIMEOUT))){
+        return(RESULT);
+    }
+    auto FUTURE = CLIENT_->async_send_request(REQUEST);
+    if (FUTURE.wait_for(std::chrono::duration<double>(SCENE_TIMEOUT)) != std::future_status::ready){
+        return(RESULT);
+    }
+    planning_scene::PlanningScene SCENE(MODEL);
+    SCENE.setPlanningSceneMsg(FUTURE.get()->scene);
+
+    // The attached objects (if any) are taken from the scene, the joint values from the PATH:
+    moveit::core::RobotState STATE(SCENE.getCurrentState());
+    STATE.setVariablePositions(START.getVariablePositions());
+
+    // 4. SHORTCUTTING -> Random (deterministic seed) pairs of waypoints:
+    std::mt19937 RNG(42);
+    for (int k = 0; k < ITERATIONS_ && P.size() > 2; k++){
+        std::uniform_int_distribution<size_t> DIST(0, P.size() - 1);
+        size_t a = DIST(RNG);
+        size_t b = DIST(RNG);
+        if (a > b){
+            std::swap(a, b);
+        }
+        if (b - a < 2){
+            continue;
+        }
+        if (SegmentValid(SCENE, STATE, JMG, P[a], P[b], RESOLUTION_)){
+            P.erase(P.begin() + a + 1, P.begin() + b);
+        }
+    }
+
+    // 5. B-SPLINE SMOOTHING -> Cubic subdivision (edge points: (P[i] + P[i+1])/2, vertex points: (P[i-1] + 6*P[i] + P[i+1])/8):
+    for (int pass = 0; pass < SMOOTH_PASSES && P.size() > 2; pass++){
+
+        PATH S;
+        S.push_back(P.front());
+        for (size_t i = 0; i + 1 < P.size(); i++){
+            if (i > 0){
+                std::vector<double> V(P[i].size());
+                for (size_t j = 0; j < V.size(); j++){
+                    V[j] = (P[i-1][j] + 6.0 * P[i][j] + P[i+1][j]) / 8.0;
+                }
+                S.push_back(V);
+            }
+            std::vector<double> E(P[i].size());
+            for (size_t j = 0; j < E.size(); j++){
+                E[j] = 0.5 * (P[i][j] + P[i+1][j]);
+            }
+            S.push_back(E);
+        }
+        S.push_back(P.back());
+
+        if (!PathValid(SCENE, STATE, JMG, S, RESOLUTION_)){
+            break;
+        }
+        P = S;
+    }
+
+    // 6. New RobotTrajectory -> TIME-OPTIMAL parameterization:
+    double LENGTH = PathLength(P);
+    if (LENGTH > RESULT.LENGTH_BEFORE){
+        return(RESULT);
+    }
+
+    robot_trajectory::RobotTrajectory SMOOTHED(MODEL, JMG);
+    moveit::core::RobotState WP(START);
+    for (const std::vector<double> & Q : P){
+        WP.setJointGroupPositions(JMG, Q);
+        WP.update();
+        SMOOTHED.addSuffixWayPoint(WP, 0.0);
+    }
+    trajectory_processing::TimeOptimalTrajectoryGeneration TOTG(PATH_TOLERANCE);
+    if (!TOTG.computeTimeStamps(SMOOTHED, SPEED, ACCEL)){
+        return(RESULT);
+    }
+
+    // 7. RobotTrajectory -> Plan:
+    SMOOTHED.getRobotTrajectoryMsg(PLAN.trajectory_);
+    RESULT.LENGTH_AFTER = LENGTH;
+    RESULT.T_AFTER = SMOOTHED.getDuration();
+    RESULT.N_AFTER = PLAN.trajectory_.joint_trajectory.points.size();
+    RESULT.RES = "SMOOTHING: OK";
+
+    // 8. RETURN RESULT:
+    return(RESULT);
+}
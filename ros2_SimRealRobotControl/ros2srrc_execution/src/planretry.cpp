@@ -0,0 +1,242 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/planretry.h"
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <future>
+#include <memory>
+#include <string>
+#include <vector>
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+#include <moveit/planning_scene/planning_scene.h>
+#include <moveit/robot_trajectory/robot_trajectory.h>
+#include <moveit/trajectory_processing/time_optimal_trajectory_generation.h>
+#include <moveit_msgs/msg/planning_scene_components.hpp>
+#include <moveit_msgs/srv/get_planning_scene.hpp>
+
+// Declaration of CONSTANT VALUES:
+const double IK_TIMEOUT = 0.05;                            // [s]
+const double SCENE_TIMEOUT = 1.0;                          // [s]
+const std::string OMPL_PIPELINE = "ompl";
+const std::string OMPL_PLANNER = "RRTConnectkConfigDefault";
+
+// PLANNER FALLBACK + RETRIES:
+RetrySTRUCT RetryAction (moveit::planning_interface::MoveGroupInterface & MGI, const moveit::core::JointModelGroup * JMG,
+                         double SPEED, double BUDGET, int SEEDS, double WAYPOINT_Z,
+                         const rclcpp::Client<moveit_msgs::srv::GetPlanningScene>::SharedPtr & SCENE_CLIENT){
+
+    using moveit::planning_interface::MoveItErrorCode;
+
+    RetrySTRUCT RESULT;
+    RESULT.RES = "PLANNING: ERROR";
+    RESULT.METHOD = "none";
+    RESULT.ATTEMPTS = 0;
+    RESULT.T_PLAN = 0.0;
+
+    auto T0 = std::chrono::steady_clock::now();
+    auto LEFT = [&T0, BUDGET]() {
+        return(BUDGET - std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count());
+    };
+
+    // 1. MGI settings (restored at the end) + TARGET -> Obtained from the MotionPlanRequest that plan() sends:
+    const std::string PIPELINE = MGI.getPlanningPipelineId();
+    const std::string PLANNER = MGI.getPlannerId();
+    const double PLANNING_TIME = MGI.getPlanningTime();
+    const std::string EE = MGI.getEndEffectorLink();
+
+    moveit_msgs::msg::MotionPlanRequest REQUEST;
+    MGI.constructMotionPlanRequest(REQUEST);
+    if (REQUEST.goal_constraints.empty()){
+        return(RESULT);
+    }
+    const moveit_msgs::msg::Constraints & GOAL = REQUEST.goal_constraints[0];
+
+    moveit::core::RobotStatePtr CURRENT = MGI.getCurrentState(10);
+    std::vector<double> JP_TARGET;
+    bool HAS_JP = false;
+    bool IS_POSE = false;
+    geometry_msgs::msg::Pose POSE_TARGET;
+
+    if (!GOAL.joint_constraints.empty()){
+        moveit::core::RobotState S(*CURRENT);
+        for (const auto & JC : GOAL.joint_constraints){
+            S.setVariablePosition(JC.joint_name, JC.position);
+        }
+        S.copyJointGroupPositions(JMG, JP_TARGET);
+        HAS_JP = true;
+    } else if (!GOAL.position_constraints.empty() && !GOAL.orientation_constraints.empty() &&
+               !GOAL.position_constraints[0].constraint_region.primitive_poses.empty()){
+        POSE_TARGET.position = GOAL.position_constraints[0].constraint_region.primitive_poses[0].position;
+        POSE_TARGET.orientation = GOAL.orientation_constraints[0].orientation;
+        IS_POSE = true;
+    } else {
+        return(RESULT);
+    }
+
+    // 2. SEED -> Random IK seeds, collision-free joint solutions planned with the same planner. The planning scene (world objects,
+    //    attached objects, ACM) is obtained from move_group, no scene -> No SEED retry:
+    std::shared_ptr<planning_scene::PlanningScene> SCENE;
+    if (IS_POSE && SEEDS > 0 && SCENE_CLIENT && SCENE_CLIENT->wait_for_service(std::chrono::duration<double>(std::min(SCENE_TIMEOUT, std::max(LEFT(), 0.0))))){
+        auto SCENE_REQUEST = std::make_shared<moveit_msgs::srv::GetPlanningScene::Request>();
+        SCENE_REQUEST->components.components = moveit_msgs::msg::PlanningSceneComponents::SCENE_SETTINGS
+                                             | moveit_msgs::msg::PlanningSceneComponents::ROBOT_STATE
+                                             | moveit_msgs::msg::PlanningSceneComponents::ROBOT_STATE_ATTACHED_OBJECTS
+                                             | moveit_msgs::msg::PlanningSceneComponents::WORLD_OBJECT_NAMES
+                                             | moveit_msgs::msg::PlanningSceneComponents::WORLD_OBJECT_GEOMETRY
+                                             | moveit_msgs::msg::PlanningSceneComponents::OCTOMAP
+                                             | moveit_msgs::msg::PlanningSceneComponents::TRANSFORMS
+                                             | moveit_msgs::msg::PlanningSceneComponents::ALLOWED_COLLISION_MATRIX
+                                             | moveit_msgs::msg::PlanningSceneComponents::LINK_PADDING_AND_SCALING;
+        auto FUTURE = SCENE_CLIENT->async_send_request(SCENE_REQUEST);
+        if (FUTURE.wait_for(std::chrono::duration<double>(SCENE_TIMEOUT)) == std::future_status::ready){
+            SCENE = std::make_shared<planning_scene::PlanningScene>(MGI.getRobotModel());
+            SCENE->setPlanningSceneMsg(FUTURE.get()->scene);
+        }
+    }
+
+    if (SCENE){
+
+        // IK solutions are only accepted if the robot (+ attached objects) does not collide in the planning scene:
+        moveit::core::GroupStateValidityCallbackFn VALID = [&SCENE](moveit::core::RobotState * S, const moveit::core::JointModelGroup * G, const double * Q){
+            S->setJointGroupPositions(G, Q);
+            S->update();
+            return(!SCENE->isStateColliding(*S, G->getName()));
+        };
+
+        moveit::core::RobotState S(SCENE->getCurrentState());
+        S.setVariablePositions(CURRENT->getVariablePositions());
+        for (int k = 0; k < SEEDS && LEFT() > 0.0; k++){
+
+            S.setToRandomPositions(JMG);
+            if (!S.setFromIK(JMG, POSE_TARGET, EE, IK_TIMEOUT, VALID)){
+                continue;
+            }
+            std::vector<double> JP;
+            S.copyJointGroupPositions(JMG, JP);
+            if (!HAS_JP){
+                JP_TARGET = JP;
+                HAS_JP = true;
+            }
+
+            RESULT.ATTEMPTS = RESULT.ATTEMPTS + 1;
+            MGI.setJointValueTarget(JP);
+            if (MGI.plan(RESULT.PLAN) == MoveItErrorCode::SUCCESS){
+                RESULT.RES = "PLANNING: OK";
+                RESULT.METHOD = "seed";
+                break;
+            }
+        }
+    }
+
+    // 3. OMPL -> Relaxed planner (RRTConnect), with the remaining budget as planning time:
+    if (RESULT.RES != "PLANNING: OK" && LEFT() > 0.0){
+
+        MGI.setPlanningPipelineId(OMPL_PIPELINE);
+        MGI.setPlannerId(OMPL_PLANNER);
+        MGI.setPlanningTime(std::max(LEFT(), 0.1));
+        if (HAS_JP){
+            MGI.setJointValueTarget(JP_TARGET);
+        } else {
+            MGI.setPoseTarget(POSE_TARGET);
+        }
+
+        RESULT.ATTEMPTS = RESULT.ATTEMPTS + 1;
+        if (MGI.plan(RESULT.PLAN) == MoveItErrorCode::SUCCESS){
+            RESULT.RES = "PLANNING: OK";
+            RESULT.METHOD = "ompl";
+        }
+
+        MGI.setPlanningPipelineId(PIPELINE);
+        MGI.setPlannerId(PLANNER);
+        MGI.setPlanningTime(PLANNING_TIME);
+    }
+
+    // 4. WAYPOINT -> Current pose + WAYPOINT_Z, then target. Both segments merged and time-parameterized:
+    if (RESULT.RES != "PLANNING: OK" && LEFT() > 0.0 && WAYPOINT_Z > 0.0){
+
+        const Eigen::Isometry3d T_EE = CURRENT->getGlobalLinkTransform(EE);
+        const Eigen::Quaterniond Q_EE(T_EE.linear());
+        geometry_msgs::msg::Pose WP;
+        WP.position.x = T_EE.translation().x();
+        WP.position.y = T_EE.translation().y();
+        WP.position.z = T_EE.translation().z() + WAYPOINT_Z;
+        WP.orientation.x = Q_EE.x();
+        WP.orientation.y = Q_EE.y();
+        WP.orientation.z = Q_EE.z();
+        WP.orientation.w = Q_EE.w();
+
+        RESULT.ATTEMPTS = RESULT.ATTEMPTS + 1;
+        moveit::planning_interface::MoveGroupInterface::Plan A;
+        MGI.setPoseTarget(WP);
+        if (MGI.plan(A) == MoveItErrorCode::SUCCESS && !A.trajectory_.joint_trajectory.points.empty()){
+
+            moveit::core::RobotState S_WP(*CURRENT);
+            S_WP.setVariablePositions(A.trajectory_.joint_trajectory.joint_names, A.trajectory_.joint_trajectory.points.back().positions);
+            MGI.setStartState(S_WP);
+            if (HAS_JP){
+                MGI.setJointValueTarget(JP_TARGET);
+            } else {
+                MGI.setPoseTarget(POSE_TARGET);
+            }
+
+            moveit::planning_interface::MoveGroupInterface::Plan B;
+            bool SUCCESS_B = (MGI.plan(B) == MoveItErrorCode::SUCCESS);
+            MGI.setStartStateToCurrentState();
+
+            if (SUCCESS_B){
+                robot_trajectory::RobotTrajectory TRAJ(MGI.getRobotModel(), JMG);
+                TRAJ.setRobotTrajectoryMsg(*CURRENT, A.trajectory_);
+                robot_trajectory::RobotTrajectory TRAJ_B(MGI.getRobotModel(), JMG);
+                TRAJ_B.setRobotTrajectoryMsg(S_WP, B.trajectory_);
+                TRAJ.append(TRAJ_B, 0.0, 1);
+
+                trajectory_processing::TimeOptimalTrajectoryGeneration TOTG;
+                if (TOTG.computeTimeStamps(TRAJ, SPEED, 1.0)){
+                    RESULT.PLAN.start_state_ = A.start_state_;
+                    TRAJ.getRobotTrajectoryMsg(RESULT.PLAN.trajectory_);
+                    RESULT.PLAN.planning_time_ = A.planning_time_ + B.planning_time_;
+                    RESULT.RES = "PLANNING: OK";
+                    RESULT.METHOD = "waypoint";
+                }
+            }
+        }
+    }
+
+    // 5. RETURN RESULT:
+    MGI.setStartStateToCurrentState();
+    RESULT.T_PLAN = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+    return(RESULT);
+
+};
@@ -0,0 +1,250 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/planstrategy.h"
+
+// Include standard libraries:
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <memory>
+#include <string>
+#include <thread>
+#include <vector>
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+#include <moveit_msgs/msg/move_it_error_codes.hpp>
+#include <moveit_msgs/srv/get_motion_plan.hpp>
+
+// Declaration of CONSTANT VALUES:
+const double POLL_PERIOD = 0.01;      // [s] Planning threads -> Check for a selected plan.
+
+// Result of every candidate -> Shared between the planning threads and PLAN():
+struct RaceSLOT {
+    std::string NAME;
+    bool DONE = false;
+    bool VALID = false;
+    double T = 0.0;
+    double DURATION = 0.0;
+    moveit_msgs::msg::MotionPlanResponse RESPONSE;
+};
+struct RaceSTATE {
+    std::mutex MUTEX;
+    std::condition_variable CV;
+    std::vector<RaceSLOT> SLOTS;
+    std::atomic<bool> STOP{false};   // Plan selected -> The slots are not written anymore.
+};
+
+PlanStrategy::PlanStrategy() : MODE_("off"), BUDGET_(1.0), GOALS_(0)
+{
+}
+
+void PlanStrategy::CONFIGURE(const rclcpp::Node::SharedPtr & node, const std::string & MODE, const std::vector<std::string> & CANDIDATES, double BUDGET)
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    MODE_ = MODE;
+    BUDGET_ = (BUDGET > 0.0) ? BUDGET : 1.0;
+    CANDIDATES_.clear();
+    LABELS_.clear();
+    GOALS_ = 0;
+
+    // "pipeline/planner" -> (pipeline, planner). No pipeline -> "move_group" (Pilz):
+    for (const std::string & C : CANDIDATES){
+        size_t SEP = C.find('/');
+        if (SEP == std::string::npos){
+            CANDIDATES_.push_back({"move_group", C});
+        } else {
+            CANDIDATES_.push_back({C.substr(0, SEP), C.substr(SEP + 1)});
+        }
+
+        // Slot label -> "pipeline/planner", "#n" for the n-th repetition of the same candidate:
+        std::string LABEL = CANDIDATES_.back().first + "/" + CANDIDATES_.back().second;
+        int N = 1;
+        for (size_t k = 0; k + 1 < CANDIDATES_.size(); k++){
+            N = N + (CANDIDATES_[k] == CANDIDATES_.back());
+        }
+        LABELS_.push_back((N > 1) ? (LABEL + "#" + std::to_string(N)) : LABEL);
+    }
+    STATS_.assign(CANDIDATES_.size(), CandidateSTATS());
+
+    if (ACTIVE()){
+        CLIENT_ = node->create_client<moveit_msgs::srv::GetMotionPlan>("/plan_kinematic_path");
+    }
+}
+
+bool PlanStrategy::ACTIVE() const
+{
+    return((MODE_ == "latency" || MODE_ == "cycletime") && !CANDIDATES_.empty());
+}
+
+PlanStrategySTRUCT PlanStrategy::PLAN(moveit::planning_interface::MoveGroupInterface & MGI)
+{
+    PlanStrategySTRUCT RESULT;
+    RESULT.RES = "PLANNING: ERROR";
+    RESULT.WINNER = "none";
+    RESULT.N_VALID = 0;
+    RESULT.N_CANDIDATES = CANDIDATES_.size();
+    RESULT.T_PLAN = 0.0;
+    RESULT.DURATION = 0.0;
+
+    // 1. Base request -> Target, start state and scaling factors, exactly as MGI.plan() would send them:
+    moveit_msgs::msg::MotionPlanRequest BASE;
+    MGI.constructMotionPlanRequest(BASE);
+    BASE.allowed_planning_time = BUDGET_;
+
+    // 2. RACE -> One thread per candidate:
+    auto STATE = std::make_shared<RaceSTATE>();
+    STATE->SLOTS.resize(CANDIDATES_.size());
+    auto T0 = std::chrono::steady_clock::now();
+    auto CLIENT = CLIENT_;
+    double WAIT = BUDGET_ + 0.5;
+    std::vector<std::thread> THREADS;
+
+    for (size_t k = 0; k < CANDIDATES_.size(); k++){
+
+        STATE->SLOTS[k].NAME = LABELS_[k];
+        auto REQUEST = std::make_shared<moveit_msgs::srv::GetMotionPlan::Request>();
+        REQUEST->motion_plan_request = BASE;
+        REQUEST->motion_plan_request.pipeline_id = CANDIDATES_[k].first;
+        REQUEST->motion_plan_request.planner_id = CANDIDATES_[k].second;
+
+        // The response is polled, so that the thread stops waiting as soon as a plan is selected (latency mode):
+        THREADS.emplace_back([CLIENT, REQUEST, STATE, k, T0, WAIT]() {
+            auto FUTURE = CLIENT->async_send_request(REQUEST);
+            bool READY = false;
+            while (!READY && !STATE->STOP && std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count() < WAIT){
+                READY = (FUTURE.wait_for(std::chrono::duration<double>(POLL_PERIOD)) == std::future_status::ready);
+            }
+            if (!READY){
+                CLIENT->remove_pending_request(FUTURE);
+            }
+
+            std::lock_guard<std::mutex> LOCK(STATE->MUTEX);
+            if (STATE->STOP){
+                return;
+            }
+            RaceSLOT & SLOT = STATE->SLOTS[k];
+            SLOT.DONE = true;
+            SLOT.T = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+            if (READY){
+                SLOT.RESPONSE = FUTURE.get()->motion_plan_response;
+                const auto & POINTS = SLOT.RESPONSE.trajectory.joint_trajectory.points;
+                SLOT.VALID = (SLOT.RESPONSE.error_code.val == moveit_msgs::msg::MoveItErrorCodes::SUCCESS && !POINTS.empty());
+                if (SLOT.VALID){
+                    SLOT.DURATION = rclcpp::Duration(POINTS.back().time_from_start).seconds();
+                }
+            }
+            STATE->CV.notify_all();
+        });
+    }
+
+    // 3. WAIT -> First valid plan (latency) or all candidates (cycletime), within the time budget. Then the race is stopped, and the
+    //    threads still waiting for a response drop it and return (the slots are not written after STOP):
+    std::unique_lock<std::mutex> LOCK(STATE->MUTEX);
+    bool LATENCY = (MODE_ == "latency");
+    STATE->CV.wait_until(LOCK, T0 + std::chrono::duration_cast<std::chrono::steady_clock::duration>(std::chrono::duration<double>(WAIT)), [&STATE, LATENCY]() {
+        bool ALL = true;
+        for (const RaceSLOT & SLOT : STATE->SLOTS){
+            if (LATENCY && SLOT.VALID){
+                return true;
+            }
+            ALL = ALL && SLOT.DONE;
+        }
+        return ALL;
+    });
+    STATE->STOP = true;
+    LOCK.unlock();
+    for (std::thread & T : THREADS){
+        T.join();
+    }
+
+    // 4. SELECT -> Fastest valid plan (latency) or shortest-duration valid plan (cycletime):
+    int BEST = -1;
+    for (size_t k = 0; k < STATE->SLOTS.size(); k++){
+        const RaceSLOT & SLOT = STATE->SLOTS[k];
+        if (!SLOT.VALID){
+            continue;
+        }
+        RESULT.N_VALID = RESULT.N_VALID + 1;
+        if (BEST < 0){
+            BEST = k;
+        } else if (LATENCY && SLOT.T < STATE->SLOTS[BEST].T){
+            BEST = k;
+        } else if (!LATENCY && SLOT.DURATION < STATE->SLOTS[BEST].DURATION){
+            BEST = k;
+        }
+    }
+    RESULT.T_PLAN = std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count();
+
+    if (BEST >= 0){
+        const RaceSLOT & SLOT = STATE->SLOTS[BEST];
+        RESULT.RES = "PLANNING: OK";
+        RESULT.WINNER = SLOT.NAME;
+        RESULT.DURATION = SLOT.DURATION;
+        RESULT.PLAN.start_state_ = SLOT.RESPONSE.trajectory_start;
+        RESULT.PLAN.trajectory_ = SLOT.RESPONSE.trajectory;
+        RESULT.PLAN.planning_time_ = SLOT.RESPONSE.planning_time;
+    }
+
+    // 5. STATISTICS -> Only the candidates that finished before the selection are counted as valid:
+    std::lock_guard<std::mutex> STATS_LOCK(MUTEX_);
+    GOALS_ = GOALS_ + 1;
+    for (size_t k = 0; k < STATE->SLOTS.size(); k++){
+        const RaceSLOT & SLOT = STATE->SLOTS[k];
+        CandidateSTATS & S = STATS_[k];
+        S.ATTEMPTS = S.ATTEMPTS + 1;
+        if (SLOT.VALID){
+            S.VALID = S.VALID + 1;
+            S.T_SUM = S.T_SUM + SLOT.T;
+        }
+        if (static_cast<int>(k) == BEST){
+            S.WINS = S.WINS + 1;
+        }
+    }
+
+    return(RESULT);
+}
+
+std::string PlanStrategy::STATS()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    std::string S = "PLANNING STRATEGY (" + MODE_ + ") -> GOALS: " + std::to_string(GOALS_);
+    for (size_t k = 0; k < STATS_.size(); k++){
+        const CandidateSTATS & ENTRY = STATS_[k];
+        char BUFFER[200];
+        double WIN_RATE = (GOALS_ > 0) ? (100.0 * ENTRY.WINS / GOALS_) : 0.0;
+        double T_AVG = (ENTRY.VALID > 0) ? (1000.0 * ENTRY.T_SUM / ENTRY.VALID) : 0.0;
+        snprintf(BUFFER, sizeof(BUFFER), " | %s: WIN RATE %.1f%% (%d), VALID %d/%d, AVG. TIME %.1fms",
+                 LABELS_[k].c_str(), WIN_RATE, ENTRY.WINS, ENTRY.VALID, ENTRY.ATTEMPTS, T_AVG);
+        S = S + BUFFER;
+    }
+    return(S);
+}
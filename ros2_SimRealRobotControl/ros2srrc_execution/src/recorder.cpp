@@ -0,0 +1,253 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+// recorder.cpp:
+// STATE RECORDER NODE -> Records /joint_states, /Robpose and the controller state (/<CONTROLLER>/state) during long runs (cycle-time
+// analysis), into memory-mapped record files (staterec.h) -> One file sequence per channel: <PATH>_<CHANNEL>_<NNNN>.bin.
+//   - joint_states: [position(K), velocity(K), effort(K)] of the recorded joints (NaN if not in the message).
+//   - robpose: [x, y, z, qx, qy, qz, qw].
+//   - controller: [desired(K), actual(K), error(K)] positions of the controller joints.
+// Every record is stamped with its receive time (node clock: wall time, or sim time with use_sim_time:=true).
+// The message layout (joint names) is mapped to the recorded joints once, and again only if it changes. Every record is written in
+// place into the mapping -> No allocation per message.
+// The files are read with python/staterec.py (zero-copy NumPy arrays) and replayed with python/StateReplay.py.
+
+// Include standard libraries:
+#include <chrono>
+#include <cmath>
+#include <functional>
+#include <memory>
+#include <string>
+#include <vector>
+using namespace std::chrono_literals;
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include the ROS2 MESSAGES:
+#include <sensor_msgs/msg/joint_state.hpp>
+#include <control_msgs/msg/joint_trajectory_controller_state.hpp>
+#include "ros2srrc_data/msg/robpose.hpp"
+
+// Include the STATE RECORDER:
+#include "ros2srrc_execution/staterec.h"
+
+// Index map -> Recorded NAMES to their position in the message LAYOUT (-1 if missing):
+static void IndexMap(const std::vector<std::string> & NAMES, const std::vector<std::string> & LAYOUT, std::vector<int> & IDX)
+{
+    IDX.assign(NAMES.size(), -1);
+    for (size_t k = 0; k < NAMES.size(); k++){
+        for (size_t j = 0; j < LAYOUT.size(); j++){
+            if (LAYOUT[j] == NAMES[k]){
+                IDX[k] = j;
+                break;
+            }
+        }
+    }
+}
+
+// Copy the values of the recorded joints into the record (NaN if missing):
+static void Fill(double * R, const std::vector<int> & IDX, const std::vector<double> & V)
+{
+    for (size_t k = 0; k < IDX.size(); k++){
+        R[k] = (IDX[k] >= 0 && static_cast<size_t>(IDX[k]) < V.size()) ? V[IDX[k]] : NAN;
+    }
+}
+
+class StateRecorderNode : public rclcpp::Node
+{
+public:
+  StateRecorderNode()
+  : Node("ros2srrc_recorder")
+  {
+    // Obtain parameters:
+    PATH_ = this->declare_parameter("PATH", std::string("/tmp/ros2srrc_record"));
+    RECORDS_ = this->declare_parameter("RECORDS", 360000);
+    MAX_FILES_ = this->declare_parameter("MAX_FILES", 0);
+    CONTROLLER_ = this->declare_parameter("CONTROLLER", std::string("ur_controller"));
+    JOINTS_ = this->declare_parameter("JOINTS", std::vector<std::string>{""});
+    double STATS_PERIOD = this->declare_parameter("STATS_PERIOD", 10.0);
+    if (JOINTS_.size() == 1 && JOINTS_[0].empty()){
+        JOINTS_.clear();
+    }
+    RCLCPP_INFO(this->get_logger(), "STATE RECORDER -> %s_<channel>_<NNNN>.bin, %ld records/file, max. files: %ld (0 = all).",
+                PATH_.c_str(), RECORDS_, MAX_FILES_);
+
+    // Subscribers + STATS timer:
+    JS_SUB_ = this->create_subscription<sensor_msgs::msg::JointState>(
+        "joint_states", rclcpp::SensorDataQoS(), std::bind(&StateRecorderNode::JointStates, this, std::placeholders::_1));
+    POSE_SUB_ = this->create_subscription<ros2srrc_data::msg::Robpose>(
+        "Robpose", 10, std::bind(&StateRecorderNode::Robpose, this, std::placeholders::_1));
+    CTRL_SUB_ = this->create_subscription<control_msgs::msg::JointTrajectoryControllerState>(
+        "/" + CONTROLLER_ + "/state", rclcpp::SensorDataQoS(), std::bind(&StateRecorderNode::ControllerState, this, std::placeholders::_1));
+    timer_ = this->create_wall_timer(std::chrono::duration<double>(STATS_PERIOD), std::bind(&StateRecorderNode::Stats, this));
+  }
+
+private:
+
+  // TIME STAMP -> Receive time (node clock) for ALL the channels: Robpose has no header, and the header stamps of the other
+  // channels may come from a different clock (sim time in Gazebo), which would break the merged timeline of StateReplay.py.
+  double Stamp()
+  {
+    return(this->now().seconds());
+  }
+
+  void JointStates(const sensor_msgs::msg::JointState::SharedPtr MSG)
+  {
+    // 1. LAYOUT -> Recorded joints (JOINTS param, or all joints of the first message) + index map:
+    if (MSG->name != JS_LAYOUT_){
+        JS_LAYOUT_ = MSG->name;
+        if (JOINTS_.empty()){
+            JOINTS_ = MSG->name;
+        }
+        IndexMap(JOINTS_, JS_LAYOUT_, JS_IDX_);
+    }
+    if (!JS_.ACTIVE() && !Open(JS_, "joint_states", JOINTS_, 3 * JOINTS_.size())){
+        return;
+    }
+
+    // 2. RECORD -> [position, velocity, effort]:
+    const size_t K = JOINTS_.size();
+    double * R = JS_.NEXT(Stamp());
+    if (R == nullptr){
+        return;
+    }
+    Fill(R, JS_IDX_, MSG->position);
+    Fill(R + K, JS_IDX_, MSG->velocity);
+    Fill(R + 2 * K, JS_IDX_, MSG->effort);
+    JS_.COMMIT();
+  }
+
+  void Robpose(const ros2srrc_data::msg::Robpose::SharedPtr MSG)
+  {
+    if (!POSE_.ACTIVE() && !Open(POSE_, "robpose", {"x", "y", "z", "qx", "qy", "qz", "qw"}, 7)){
+        return;
+    }
+    double * R = POSE_.NEXT(Stamp());
+    if (R == nullptr){
+        return;
+    }
+    R[0] = MSG->x;
+    R[1] = MSG->y;
+    R[2] = MSG->z;
+    R[3] = MSG->qx;
+    R[4] = MSG->qy;
+    R[5] = MSG->qz;
+    R[6] = MSG->qw;
+    POSE_.COMMIT();
+  }
+
+  void ControllerState(const control_msgs::msg::JointTrajectoryControllerState::SharedPtr MSG)
+  {
+    // 1. LAYOUT -> Controller joints of the first message + index map:
+    if (MSG->joint_names != CTRL_LAYOUT_){
+        CTRL_LAYOUT_ = MSG->joint_names;
+        if (CTRL_JOINTS_.empty()){
+            CTRL_JOINTS_ = MSG->joint_names;
+        }
+        IndexMap(CTRL_JOINTS_, CTRL_LAYOUT_, CTRL_IDX_);
+    }
+    if (!CTRL_.ACTIVE() && !Open(CTRL_, "controller", CTRL_JOINTS_, 3 * CTRL_JOINTS_.size())){
+        return;
+    }
+
+    // 2. RECORD -> [desired, actual, error] positions:
+    const size_t K = CTRL_JOINTS_.size();
+    double * R = CTRL_.NEXT(Stamp());
+    if (R == nullptr){
+        return;
+    }
+    Fill(R, CTRL_IDX_, MSG->desired.positions);
+    Fill(R + K, CTRL_IDX_, MSG->actual.positions);
+    Fill(R + 2 * K, CTRL_IDX_, MSG->error.positions);
+    CTRL_.COMMIT();
+  }
+
+  bool Open(StateRecorder & REC, const std::string & CHANNEL, const std::vector<std::string> & NAMES, uint32_t WIDTH)
+  {
+    if (FAILED_){
+        return false;
+    }
+    if (!REC.OPEN(PATH_, CHANNEL, NAMES, WIDTH, RECORDS_, MAX_FILES_)){
+        RCLCPP_ERROR(this->get_logger(), "STATE RECORDER -> The %s record file could not be created (%s_%s_0000.bin).",
+                     CHANNEL.c_str(), PATH_.c_str(), CHANNEL.c_str());
+        FAILED_ = true;
+        return false;
+    }
+    RCLCPP_INFO(this->get_logger(), "STATE RECORDER -> Recording %s (%zu names, %u values/record).", CHANNEL.c_str(), NAMES.size(), WIDTH);
+    return true;
+  }
+
+  void Stats()
+  {
+    for (StateRecorder * REC : {&JS_, &POSE_, &CTRL_}){
+        if (REC->ACTIVE()){
+            RCLCPP_INFO(this->get_logger(), "%s", REC->STATS().c_str());
+        }
+    }
+  }
+
+  std::string PATH_;
+  int64_t RECORDS_;
+  int64_t MAX_FILES_;
+  std::string CONTROLLER_;
+  std::vector<std::string> JOINTS_;
+  std::vector<std::string> CTRL_JOINTS_;
+  bool FAILED_ = false;
+
+  StateRecorder JS_;
+  StateRecorder POSE_;
+  StateRecorder CTRL_;
+  std::vector<std::string> JS_LAYOUT_;
+  std::vector<std::string> CTRL_LAYOUT_;
+  std::vector<int> JS_IDX_;
+  std::vector<int> CTRL_IDX_;
+
+  rclcpp::Subscription<sensor_msgs::msg::JointState>::SharedPtr JS_SUB_;
+  rclcpp::Subscription<ros2srrc_data::msg::Robpose>::SharedPtr POSE_SUB_;
+  rclcpp::Subscription<control_msgs::msg::JointTrajectoryControllerState>::SharedPtr CTRL_SUB_;
+  rclcpp::TimerBase::SharedPtr timer_;
+};
+
+// ===================================================================================== //
+// ======================================= MAIN ======================================== //
+// ===================================================================================== //
+
+int main(int argc, char ** argv)
+{
+    rclcpp::init(argc, argv);
+    auto node = std::make_shared<StateRecorderNode>();
+    rclcpp::spin(node);
+
+    // The record files are closed (synced + truncated to the last record) when the node is destroyed:
+    node.reset();
+    rclcpp::shutdown();
+    return 0;
+}
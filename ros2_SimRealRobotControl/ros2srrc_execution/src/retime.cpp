@@ -0,0 +1,117 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/retime.h"
+
+// Include standard libraries:
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+// Include MoveIt!2:
+#include <moveit/move_group_interface/move_group_interface_improved.h>
+#include <moveit/robot_state/conversions.h>
+#include <moveit/robot_trajectory/robot_trajectory.h>
+#include <moveit/trajectory_processing/time_optimal_trajectory_generation.h>
+#include <moveit/trajectory_processing/ruckig_traj_smoothing.h>
+#include <moveit/version.h>
+
+// RETIMING:
+RetimeSTRUCT RetimeAction (moveit::planning_interface::MoveGroupInterface::Plan & PLAN, moveit::planning_interface::MoveGroupInterface & MGI, double SPEED, double ACCEL, double JERK){
+
+    RetimeSTRUCT RESULT;
+    RESULT.T_BEFORE = 0.0;
+    RESULT.T_AFTER = 0.0;
+
+    // 1. Check INPUT values:
+    if (SPEED <= 0.0 || SPEED > 1.0){
+        SPEED = 1.0;
+    }
+    if (ACCEL <= 0.0 || ACCEL > 1.0){
+        ACCEL = 1.0;
+    }
+    if (PLAN.trajectory_.joint_trajectory.points.size() < 2){
+        RESULT.RES = "RETIMING: ERROR";
+        return(RESULT);
+    }
+
+    // 2. Plan -> RobotTrajectory:
+    const moveit::core::RobotModelConstPtr & MODEL = MGI.getRobotModel();
+    moveit::core::RobotState START(MODEL);
+    START.setToDefaultValues();
+    moveit::core::robotStateMsgToRobotState(PLAN.start_state_, START);
+
+    robot_trajectory::RobotTrajectory TRAJ(MODEL, MGI.getName());
+    TRAJ.setRobotTrajectoryMsg(START, PLAN.trajectory_);
+    RESULT.T_BEFORE = TRAJ.getDuration();
+
+    // 3. TIME-OPTIMAL reparameterization (velocity + acceleration limits):
+    trajectory_processing::TimeOptimalTrajectoryGeneration TOTG;
+    bool SUCCESS = TOTG.computeTimeStamps(TRAJ, SPEED, ACCEL);
+
+    // 4. JERK LIMIT (optional) -> Ruckig smoothing, same velocity/acceleration limits as TOTG. The overload with explicit per-joint limits
+    //    is not available before MoveIt!2 2.8 (Humble): there, only the scaling factors are passed, and the jerk limits are taken from
+    //    joint_limits.yaml (max_jerk):
+    if (SUCCESS && JERK > 0.0){
+
+#if MOVEIT_VERSION_MAJOR > 2 || (MOVEIT_VERSION_MAJOR == 2 && MOVEIT_VERSION_MINOR >= 8)
+        const moveit::core::JointModelGroup * JMG = MODEL->getJointModelGroup(MGI.getName());
+        std::unordered_map<std::string, double> VEL_LIMITS, ACC_LIMITS, JERK_LIMITS;
+        for (const std::string & JOINT : JMG->getActiveJointModelNames()){
+            const moveit::core::VariableBounds & BOUNDS = MODEL->getVariableBounds(JOINT);
+            if (BOUNDS.velocity_bounded_){
+                VEL_LIMITS[JOINT] = BOUNDS.max_velocity_ * SPEED;
+            }
+            if (BOUNDS.acceleration_bounded_){
+                ACC_LIMITS[JOINT] = BOUNDS.max_acceleration_ * ACCEL;
+            }
+            JERK_LIMITS[JOINT] = JERK;
+        }
+
+        SUCCESS = trajectory_processing::RuckigSmoothing::applySmoothing(TRAJ, VEL_LIMITS, ACC_LIMITS, JERK_LIMITS);
+#else
+        SUCCESS = trajectory_processing::RuckigSmoothing::applySmoothing(TRAJ, SPEED, ACCEL);
+#endif
+    }
+
+    // 5. RobotTrajectory -> Plan (only if the retiming succeeded):
+    if (SUCCESS){
+        TRAJ.getRobotTrajectoryMsg(PLAN.trajectory_);
+        RESULT.T_AFTER = TRAJ.getDuration();
+        RESULT.RES = "RETIMING: OK";
+    } else {
+        RESULT.T_AFTER = RESULT.T_BEFORE;
+        RESULT.RES = "RETIMING: ERROR";
+    }
+
+    // 6. RETURN RESULT:
+    return(RESULT);
+
+};
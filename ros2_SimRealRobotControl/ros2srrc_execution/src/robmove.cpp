@@ -41,6 +41,12 @@
 #include <moveit/move_group_interface/move_group_interface_improved.h>
 #include <moveit/planning_scene_interface/planning_scene_interface.h>
 
+// Include the IK/TARGET RESOLUTION CACHE:
+#include "ros2srrc_execution/ikcache.h"
+
+// Include the PATH POST-PROCESSING (non-Pilz plans):
+#include "ros2srrc_execution/pathsmooth.h"
+
 // Declaration of GLOBAL VARIABLE --> MoveIt!2 Interface:
 moveit::planning_interface::MoveGroupInterface move_group_interface_ROB;
 
@@ -50,6 +56,12 @@ std::string param_ROB = "none";
 // Declaration of GLOBAL VARIABLE --> RES:
 auto RES = "none";
 
+// Declaration of GLOBAL VARIABLE --> IK/TARGET RESOLUTION CACHE:
+IKCache IK_CACHE;
+
+// Declaration of GLOBAL VARIABLE --> PATH POST-PROCESSING for sampling-based (non-Pilz) plans:
+PathSmoother PATH_SMOOTHER;
+
 // =============================================================================== //
 //  PARAM -> ROBOT:
 
@@ -168,13 +180,50 @@ private:
         TARGET_POSE.orientation.z = GOAL->qz;
         TARGET_POSE.orientation.w = GOAL->qw;
 
-        move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+        // IK CACHE -> Only for PTP movements (LIN needs the Cartesian target to interpolate the path), resolved from (near) the current joint values:
+        std::vector<double> START = move_group_interface_ROB.getCurrentJointValues();
+        std::vector<double> JP;
+        bool CACHED = (GOAL->type == "PTP") && IK_CACHE.GET(param_ROB + "_arm", TARGET_POSE, START, JP);
+        if (CACHED){
+            move_group_interface_ROB.setJointValueTarget(JP);
+        } else {
+            move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+        }
 
-        move_group_interface_ROB.setPlannerId(GOAL->type);
+        // PLANNER -> "PTP"/"LIN" (Pilz, "move_group" pipeline) or "pipeline/planner" (e.g. "ompl/RRTConnectkConfigDefault"):
+        size_t SEP = GOAL->type.find('/');
+        bool SAMPLED_PLAN = (SEP != std::string::npos && GOAL->type.substr(0, SEP) != "move_group");
+        if (SEP == std::string::npos){
+            move_group_interface_ROB.setPlannerId(GOAL->type);
+        } else {
+            move_group_interface_ROB.setPlanningPipelineId(GOAL->type.substr(0, SEP));
+            move_group_interface_ROB.setPlannerId(GOAL->type.substr(SEP + 1));
+        }
         move_group_interface_ROB.setMaxVelocityScalingFactor(GOAL->speed);
 
         MyPlan = plan_ROB();
 
+        // IK CACHE -> Cached JOINT TARGET failed: the entry is removed, and the POSE TARGET is planned as usual:
+        if (CACHED && RES != "PLANNING: OK"){
+            IK_CACHE.ERASE(param_ROB + "_arm", TARGET_POSE);
+            move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+            MyPlan = plan_ROB();
+            CACHED = false;
+        }
+        move_group_interface_ROB.setPlanningPipelineId("move_group");
+
+        // PATH POST-PROCESSING -> Shortcutting + B-spline smoothing + TOTG, for sampling-based (non-Pilz) plans only:
+        if (RES == "PLANNING: OK" && SAMPLED_PLAN && PATH_SMOOTHER.ACTIVE()){
+            SmoothSTRUCT SmoothRES = PATH_SMOOTHER.SMOOTH(MyPlan, move_group_interface_ROB, GOAL->speed, 1.0);
+            RCLCPP_INFO(this->get_logger(), "%s -> Length: %.3frad -> %.3frad, duration: %.3fs -> %.3fs (%d -> %d waypoints)", SmoothRES.RES.c_str(),
+                        SmoothRES.LENGTH_BEFORE, SmoothRES.LENGTH_AFTER, SmoothRES.T_BEFORE, SmoothRES.T_AFTER, SmoothRES.N_BEFORE, SmoothRES.N_AFTER);
+        }
+
+        if (!CACHED && RES == "PLANNING: OK" && !MyPlan.trajectory_.joint_trajectory.points.empty()){
+            IK_CACHE.PUT(param_ROB + "_arm", TARGET_POSE, START, MyPlan.trajectory_.joint_trajectory.points.back().positions);
+        }
+        RCLCPP_INFO(this->get_logger(), "%s", IK_CACHE.STATS().c_str());
+
         if (RES == "PLANNING: OK"){
 
             bool ExecSUCCESS = (move_group_interface_ROB.execute(MyPlan) == moveit::planning_interface::MoveItErrorCode::SUCCESS);
@@ -234,6 +283,25 @@ int main(int argc, char **argv)
     executor.add_node(MoveIt2_NODE);
     std::thread([&executor]() { executor.spin(); }).detach();
 
+    // IK/TARGET RESOLUTION CACHE -> Size and rounding tolerance (optional parameters):
+    int IK_CACHE_SIZE = 256;
+    double IK_CACHE_TOL = 1e-4;
+    MoveIt2_NODE->get_parameter("IK_CACHE_SIZE", IK_CACHE_SIZE);
+    MoveIt2_NODE->get_parameter("IK_CACHE_TOL", IK_CACHE_TOL);
+    if (IK_CACHE_SIZE < 0 || IK_CACHE_TOL <= 0.0){
+        RCLCPP_ERROR(logger, "IK cache -> Invalid SIZE (%d) or TOLERANCE (%.1e), default values are used.", IK_CACHE_SIZE, IK_CACHE_TOL);
+        IK_CACHE_SIZE = 256;
+        IK_CACHE_TOL = 1e-4;
+    }
+    IK_CACHE.CONFIGURE(IK_CACHE_SIZE, IK_CACHE_TOL);
+
+    // PATH POST-PROCESSING (non-Pilz plans) -> Shortcutting iterations (0 -> OFF) and collision-check resolution [rad] (optional parameters):
+    int SMOOTH_ITERATIONS = 100;
+    double SMOOTH_RESOLUTION = 0.05;
+    MoveIt2_NODE->get_parameter("SMOOTH_ITERATIONS", SMOOTH_ITERATIONS);
+    MoveIt2_NODE->get_parameter("SMOOTH_RESOLUTION", SMOOTH_RESOLUTION);
+    PATH_SMOOTHER.CONFIGURE(MoveIt2_NODE, SMOOTH_ITERATIONS, SMOOTH_RESOLUTION);
+
     // MoveGroupInterface_ROB:
     using moveit::planning_interface::MoveGroupInterface;
     auto ROBname = param_ROB + "_arm";
@@ -0,0 +1,136 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/robotregistry.h"
+
+// Include standard libraries:
+#include <algorithm>
+#include <cctype>
+#include <cmath>
+#include <limits>
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit/robot_model/robot_model.h>
+
+// REGISTRY -> LOAD:
+RegistrySTRUCT RegistryLoad (const rclcpp::Node::SharedPtr & node, const moveit::core::JointModelGroup * JMG){
+
+    RegistrySTRUCT RESULT;
+    const double INF = std::numeric_limits<double>::infinity();
+    RESULT.GP_LL = -INF;
+    RESULT.GP_UL = INF;
+
+    if (JMG == nullptr){
+        RESULT.RES = "REGISTRY: ERROR";
+        return(RESULT);
+    }
+    RESULT.GROUP = JMG->getName();
+    const moveit::core::RobotModel & MODEL = JMG->getParentModel();
+
+    for (const std::string & NAME : JMG->getVariableNames()){
+
+        // 1. JOINT LIMITS -> VariableBounds (URDF, overridden by joint_limits.yaml if has_position_limits is set):
+        const moveit::core::VariableBounds & BOUNDS = MODEL.getVariableBounds(NAME);
+        double LL = -INF;
+        double UL = INF;
+        if (BOUNDS.position_bounded_){
+            LL = BOUNDS.min_position_;
+            UL = BOUNDS.max_position_;
+        }
+
+        // 2. MIMIC RATIO -> URDF <mimic>, or the "mimic_factor" key in joint_limits.yaml:
+        double F = 1.0;
+        const moveit::core::JointModel * JM = MODEL.getJointOfVariable(NAME);
+        if (JM != nullptr && JM->getMimic() != nullptr){
+            F = JM->getMimicFactor();
+        } else {
+            node->get_parameter("robot_description_planning.joint_limits." + NAME + ".mimic_factor", F);
+        }
+
+        // 3. GRIPPER RANGE -> Intersection of [LL/F, UL/F] for all variables:
+        if (F > 0.0){
+            RESULT.GP_LL = std::max(RESULT.GP_LL, LL / F);
+            RESULT.GP_UL = std::min(RESULT.GP_UL, UL / F);
+        } else if (F < 0.0){
+            RESULT.GP_LL = std::max(RESULT.GP_LL, UL / F);
+            RESULT.GP_UL = std::min(RESULT.GP_UL, LL / F);
+        }
+
+        RESULT.JOINTS.push_back(NAME);
+        RESULT.LL.push_back(LL);
+        RESULT.UL.push_back(UL);
+        RESULT.MIMIC.push_back(F);
+    }
+
+    RESULT.RES = "REGISTRY: OK";
+    return(RESULT);
+
+};
+
+// REGISTRY -> LIMIT CHECK:
+bool RegistryCheck (const RegistrySTRUCT & REG, const std::vector<double> & JP){
+
+    if (JP.size() < REG.JOINTS.size()){
+        return false;
+    }
+    for (size_t i = 0; i < REG.JOINTS.size(); i++){
+        if (JP[i] < REG.LL[i] || JP[i] > REG.UL[i]){
+            return false;
+        }
+    }
+    return true;
+
+};
+
+// REGISTRY -> JOINT INDEX:
+int RegistryIndex (const RegistrySTRUCT & REG, const std::string & JOINT){
+
+    // 1. Joint name in the model:
+    auto IT = std::find(REG.JOINTS.begin(), REG.JOINTS.end(), JOINT);
+    if (IT != REG.JOINTS.end()){
+        return(IT - REG.JOINTS.begin());
+    }
+
+    // 2. "jointN" -> N = 1, 2... (ros2srrc_data/Joint naming):
+    if (JOINT.size() > 5 && JOINT.compare(0, 5, "joint") == 0 && std::all_of(JOINT.begin() + 5, JOINT.end(), ::isdigit)){
+        int N = std::stoi(JOINT.substr(5));
+        if (N >= 1 && N <= static_cast<int>(REG.JOINTS.size())){
+            return(N - 1);
+        }
+    }
+
+    return(-1);
+
+};
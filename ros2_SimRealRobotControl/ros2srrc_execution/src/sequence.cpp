@@ -37,17 +37,30 @@
 #include "ros2srrc_execution/moverot.h"
 #include "ros2srrc_execution/moverp.h"
 #include "ros2srrc_execution/moveg.h"
+#include "ros2srrc_execution/ikcache.h"
+#include "ros2srrc_execution/retime.h"
+#include "ros2srrc_execution/movelfast.h"
+#include "ros2srrc_execution/robotregistry.h"
+#include "ros2srrc_execution/planstrategy.h"
+#include "ros2srrc_execution/pathsmooth.h"
+#include "ros2srrc_execution/handoff.h"
+#include "ros2srrc_execution/trajstore.h"
+#include "ros2srrc_execution/directexec.h"
+#include "ros2srrc_execution/gripcmd.h"
+#include "ros2srrc_execution/planretry.h"
 
 // Include for ATTACHER/DETACHER:
 #include <linkattacher_msgs/srv/attach_link.hpp>   
 #include <linkattacher_msgs/srv/detach_link.hpp>
 
 // Include standard libraries:
+#include <algorithm>
 #include <string>
 #include "std_msgs/msg/string.hpp"
 #include <vector>
 #include <unistd.h> 
 #include <ctime>
+#include <chrono>
 
 // Include RCLCPP and RCLCPP_ACTION:
 #include "rclcpp/rclcpp.hpp"
@@ -81,9 +94,55 @@ moveit::planning_interface::MoveGroupInterface move_group_interface_EE;
 const moveit::core::JointModelGroup* joint_model_group_ROB;
 const moveit::core::JointModelGroup* joint_model_group_EE;
 
+// Declaration of GLOBAL VARIABLES --> ROBOT/END-EFFECTOR REGISTRY (joint order, limits, gripper range, mimic ratios):
+RegistrySTRUCT REG_ROB;
+RegistrySTRUCT REG_EE;
+
 // Declaration of GLOBAL VARIABLE --> RES:
 std::string RES = "none";
 
+// Declaration of GLOBAL VARIABLE --> IK/TARGET RESOLUTION CACHE:
+IKCache IK_CACHE;
+
+// Declaration of GLOBAL VARIABLE --> TRAJECTORY RETIMING (ON/OFF):
+bool RETIMING = true;
+
+// Declaration of GLOBAL VARIABLES --> PLANNING STRATEGY for pose targets (+ last result, for feedback/log):
+PlanStrategy PLAN_STRATEGY;
+std::string PLAN_INFO = "";
+
+// Declaration of GLOBAL VARIABLES --> PATH POST-PROCESSING for sampling-based (non-Pilz) plans + flag of the last plan:
+PathSmoother PATH_SMOOTHER;
+bool SAMPLED_PLAN = false;
+
+// Declaration of GLOBAL VARIABLES --> PLANNING RETRIES (per-step budget [s], 0.0 -> OFF + global deadline [s] per program):
+double RETRY_BUDGET = 0.0;
+double RETRY_DEADLINE = 20.0;
+int RETRY_SEEDS = 3;
+double RETRY_WAYPOINT_Z = 0.10;
+rclcpp::Client<moveit_msgs::srv::GetPlanningScene>::SharedPtr RETRY_SCENE;
+
+// Declaration of GLOBAL VARIABLE --> TRAJECTORY STORE (record/replay of executed trajectories):
+TrajectoryStore TRAJ_STORE;
+
+// Declaration of GLOBAL VARIABLE --> EARLY HAND-OFF window around the goal [rad] (0.0 -> OFF):
+double HANDOFF_TOL = 0.0;
+
+// Declaration of GLOBAL VARIABLES --> EXECUTION BACKEND ("moveit" -> move_group, "direct" -> controllers):
+DirectExecutor DIRECT_EXEC;
+bool EXEC_DIRECT = false;
+
+// Declaration of GLOBAL VARIABLES --> GRIPPER COMMAND PATH ("moveit" -> MoveG planned/executed by MoveIt!2, "direct" -> gripper controllers):
+GripperCommander GRIPPER_CMD;
+bool GRIP_DIRECT = false;
+
+// Declaration of GLOBAL VARIABLES --> MoveL FAST PATH (max. segment length [m], 0.0 -> OFF, Pilz Cartesian limits) + Pilz LIN planning time (average):
+double MOVEL_FAST_MAXDIST = 0.0;
+MoveLFastLIMITS MOVEL_FAST_LIMITS;
+rclcpp::Client<moveit_msgs::srv::GetPlanningScene>::SharedPtr MOVEL_FAST_SCENE;
+double T_LIN_AVG = 0.0;
+int N_LIN = 0;
+
 // Declaration of GLOBAL VARIABLES --> Attacher & Detacher:
 std::shared_ptr<rclcpp::Node> AttacherNode;
 std::shared_ptr<rclcpp::Node> DetacherNode;
@@ -150,6 +209,24 @@ moveit::planning_interface::MoveGroupInterface::Plan plan_ROB() {
         return(my_plan);
     }
 
+};
+// ROBOT, POSE TARGETS -> PLANNING STRATEGY (parallel planners/seeds) if active, plan_ROB() otherwise:
+moveit::planning_interface::MoveGroupInterface::Plan plan_POSE() {
+
+    if (!PLAN_STRATEGY.ACTIVE()){
+        return(plan_ROB());
+    }
+
+    PlanStrategySTRUCT PlanRES = PLAN_STRATEGY.PLAN(move_group_interface_ROB);
+    RES = PlanRES.RES;
+
+    char BUFFER[200];
+    snprintf(BUFFER, sizeof(BUFFER), ":Planning strategy -> %s, %d/%d valid, %.1fms (trajectory: %.3fs).",
+             PlanRES.WINNER.c_str(), PlanRES.N_VALID, PlanRES.N_CANDIDATES, 1000.0 * PlanRES.T_PLAN, PlanRES.DURATION);
+    PLAN_INFO = BUFFER;
+    SAMPLED_PLAN = (RES == "PLANNING: OK" && PlanRES.WINNER.rfind("move_group/", 0) != 0);
+    return(PlanRES.PLAN);
+
 };
 // END-EFFECTOR:
 moveit::planning_interface::MoveGroupInterface::Plan plan_EE() {
@@ -312,6 +389,12 @@ private:
         if (param_EE != "none"){
             move_group_interface_EE.stop();
         }
+        if (EXEC_DIRECT){
+            DIRECT_EXEC.STOP();
+        }
+        if (GRIP_DIRECT){
+            GRIPPER_CMD.STOP();
+        }
 
         (void)goal_handle;
         return rclcpp_action::CancelResponse::ACCEPT;
@@ -334,6 +417,19 @@ private:
         // DECLARE PLAN:
         moveit::planning_interface::MoveGroupInterface::Plan MyPlan;
 
+        // CYCLE TIME -> Robot trajectory durations (planned vs. retimed) + program execution time:
+        double T_PLANNED = 0.0;
+        double T_RETIMED = 0.0;
+        auto T_START = std::chrono::steady_clock::now();
+
+        // EARLY HAND-OFF -> Handed-off steps + time saved:
+        int N_HANDOFF = 0;
+        double T_SAVED = 0.0;
+
+        // PLANNING RETRIES -> Time spent (global deadline) + per-step statistics:
+        double T_RETRY = 0.0;
+        std::vector<std::string> RETRY_LOG;
+
         // ===== SEQUENCE EXECUTION ===== //
         int i = 1;
         bool CONTINUE = true;
@@ -348,8 +444,43 @@ private:
                 feedback_msg = " ==================== {STEP " + std::to_string(i) + "}: " + ACTION + " ==================== ";
                 goal_handle->publish_feedback(feedback);
 
+                // REPLAY -> Stored trajectory, if the start state and the planning scene have not changed (planning is skipped):
+                bool MOTION = (ACTION != "Attach" && ACTION != "Detach" && !(ACTION == "MoveG" && GRIP_DIRECT));
+                moveit::planning_interface::MoveGroupInterface & MGI_STEP = (ACTION == "MoveG") ? move_group_interface_EE : move_group_interface_ROB;
+                std::string STEP_KEY = "";
+                std::vector<double> STEP_START;
+                uint64_t STEP_SCENE = 0;
+                bool STEP_SCENE_OK = false;
+                bool REPLAYED = false;
+                std::string GRIP_INFO = "";
+                if (TRAJ_STORE.MODE() != "off" && MOTION){
+
+                    STEP_KEY = TRAJ_STORE.KEY(i, STEP);
+                    STEP_START = MGI_STEP.getCurrentJointValues();
+                    STEP_SCENE_OK = TRAJ_STORE.SCENE(STEP_SCENE);
+
+                    if (TRAJ_STORE.MODE() == "replay"){
+                        moveit::planning_interface::MoveGroupInterface::Plan StoredPlan;
+                        std::string ReplayRES = TRAJ_STORE.GET(STEP_KEY, STEP_START, STEP_SCENE_OK, STEP_SCENE, StoredPlan.trajectory_);
+                        REPLAYED = (ReplayRES == "REPLAY: OK");
+                        if (REPLAYED){
+                            MyPlan = StoredPlan;
+                            RES = "PLANNING: OK";
+                            feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + ":Stored trajectory replayed, planning skipped.";
+                        } else {
+                            feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + ":" + ReplayRES + ", planning.";
+                        }
+                        goal_handle->publish_feedback(feedback);
+                    }
+
+                }
+
                 // b) PLAN:
-                if (ACTION == "MoveJ"){
+                if (REPLAYED){
+
+                    // Stored trajectory -> Nothing to plan.
+
+                } else if (ACTION == "MoveJ"){
                 
                     // 1. Define JP VECTOR:
                     std::vector<double> JP;
@@ -357,7 +488,7 @@ private:
                     current_state->copyJointGroupPositions(joint_model_group_ROB, JP);
                     
                     // 2. CALL MoveJAction for CALCULATIONS:
-                    MoveJSTRUCT MoveJRES = MoveJAction(STEP.movej, JP, param_ROB);
+                    MoveJSTRUCT MoveJRES = MoveJAction(STEP.movej, JP, REG_ROB);
                     JP = MoveJRES.JP;
                     move_group_interface_ROB.setJointValueTarget(JP);
                     
@@ -380,14 +511,39 @@ private:
                     
                     // 2. CALL MoveLAction for CALCULATIONS:
                     auto TARGET_POSE = MoveLAction(STEP.movel, POSE);
-                    move_group_interface_ROB.setPoseTarget(TARGET_POSE);
-                    
-                    // 3. Assign SPEED and PLANNING METHOD (PTP, LIN, CIRC):
-                    move_group_interface_ROB.setMaxVelocityScalingFactor(STEP.speed);
-                    move_group_interface_ROB.setPlannerId("LIN");
 
-                    // 4. PLAN:
-                    MyPlan = plan_ROB();
+                    // 3. FAST PATH -> Cartesian interpolation + batch IK (short segments):
+                    MoveLFastSTRUCT MoveLFastRES;
+                    MoveLFastRES.RES = "FASTPATH: SKIP";
+                    if (MOVEL_FAST_MAXDIST > 0.0){
+                        MoveLFastRES = MoveLFastAction(TARGET_POSE, move_group_interface_ROB, joint_model_group_ROB, STEP.speed, MOVEL_FAST_MAXDIST, MOVEL_FAST_LIMITS, MOVEL_FAST_SCENE);
+                    }
+
+                    char BUFFER[160];
+                    if (MoveLFastRES.RES == "PLANNING: OK"){
+
+                        MyPlan = MoveLFastRES.PLAN;
+                        RES = "PLANNING: OK";
+                        snprintf(BUFFER, sizeof(BUFFER), ":Fast path, planning time %.1fms (Pilz LIN average: %.1fms).", 1000.0 * MoveLFastRES.T_PLAN, 1000.0 * T_LIN_AVG);
+
+                    } else {
+
+                        // 4. FALLBACK -> Pilz LIN, assign SPEED and PLANNING METHOD (PTP, LIN, CIRC):
+                        move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+                        move_group_interface_ROB.setMaxVelocityScalingFactor(STEP.speed);
+                        move_group_interface_ROB.setPlannerId("LIN");
+
+                        // 5. PLAN:
+                        MyPlan = plan_ROB();
+                        if (RES == "PLANNING: OK"){
+                            N_LIN = N_LIN + 1;
+                            T_LIN_AVG = T_LIN_AVG + (MyPlan.planning_time_ - T_LIN_AVG) / N_LIN;
+                        }
+                        snprintf(BUFFER, sizeof(BUFFER), ":Pilz LIN (%s), planning time %.1fms.", MoveLFastRES.RES.c_str(), 1000.0 * MyPlan.planning_time_);
+
+                    }
+                    feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + BUFFER;
+                    goal_handle->publish_feedback(feedback);
 
                 } else if (ACTION == "MoveR"){
 
@@ -397,7 +553,7 @@ private:
                     current_state->copyJointGroupPositions(joint_model_group_ROB, JP);
                     
                     // 2. CALL MoveRAction for CALCULATIONS:
-                    MoveRSTRUCT MoveRRES = MoveRAction(STEP.mover, JP, param_ROB);
+                    MoveRSTRUCT MoveRRES = MoveRAction(STEP.mover, JP, REG_ROB);
                     JP = MoveRRES.JP;
                     move_group_interface_ROB.setJointValueTarget(JP);
                     
@@ -417,14 +573,36 @@ private:
                     
                     // 1. CALL MoveXYZWAction for CALCULATIONS:
                     auto TARGET_POSE = MoveXYZWAction(STEP.movexyzw);
-                    move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+
+                    // 2. IK CACHE -> If the pose has already been resolved from (near) the current joint values, plan to the cached JOINT TARGET:
+                    std::vector<double> START = move_group_interface_ROB.getCurrentJointValues();
+                    std::vector<double> JP;
+                    bool CACHED = IK_CACHE.GET(param_ROB + "_arm", TARGET_POSE, START, JP);
+                    if (CACHED){
+                        move_group_interface_ROB.setJointValueTarget(JP);
+                    } else {
+                        move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+                    }
                     
-                    // 2. Assign SPEED and PLANNING METHOD (PTP, LIN, CIRC):
+                    // 3. Assign SPEED and PLANNING METHOD (PTP, LIN, CIRC):
                     move_group_interface_ROB.setMaxVelocityScalingFactor(STEP.speed);
                     move_group_interface_ROB.setPlannerId("PTP");
 
-                    // 3. PLAN:
-                    MyPlan = plan_ROB();
+                    // 4. PLAN:
+                    MyPlan = plan_POSE();
+
+                    // 5. IK CACHE -> Cached JOINT TARGET failed: the entry is removed, and the POSE TARGET is planned as usual:
+                    if (CACHED && RES != "PLANNING: OK"){
+                        IK_CACHE.ERASE(param_ROB + "_arm", TARGET_POSE);
+                        move_group_interface_ROB.setPoseTarget(TARGET_POSE);
+                        MyPlan = plan_POSE();
+                        CACHED = false;
+                    }
+
+                    // 6. IK CACHE -> Store the resolved JOINT TARGET (last trajectory point) and the start configuration:
+                    if (!CACHED && RES == "PLANNING: OK" && !MyPlan.trajectory_.joint_trajectory.points.empty()){
+                        IK_CACHE.PUT(param_ROB + "_arm", TARGET_POSE, START, MyPlan.trajectory_.joint_trajectory.points.back().positions);
+                    }
                 
                 } else if (ACTION == "MoveXYZ"){
                     
@@ -440,7 +618,7 @@ private:
                     move_group_interface_ROB.setPlannerId("PTP");
 
                     // 4. PLAN:
-                    MyPlan = plan_ROB();
+                    MyPlan = plan_POSE();
                 
                 } else if (ACTION == "MoveROT"){
                     
@@ -456,7 +634,7 @@ private:
                     move_group_interface_ROB.setPlannerId("PTP");
 
                     // 4. PLAN:
-                    MyPlan = plan_ROB();
+                    MyPlan = plan_POSE();
                 
                 } else if (ACTION == "MoveRP"){
                     
@@ -472,7 +650,7 @@ private:
                     move_group_interface_ROB.setPlannerId("PTP");
 
                     // 4. PLAN:
-                    MyPlan = plan_ROB();
+                    MyPlan = plan_POSE();
                 
                 } else if (ACTION == "MoveG"){
                     
@@ -482,7 +660,7 @@ private:
                     current_state->copyJointGroupPositions(joint_model_group_EE, JP);
                     
                     // 2. CALL MoveGAction for CALCULATIONS:
-                    MoveGSTRUCT MoveGRES = MoveGAction(STEP.moveg, JP, param_EE);
+                    MoveGSTRUCT MoveGRES = MoveGAction(STEP.moveg, JP, REG_EE);
                     JP = MoveGRES.JP;
                     move_group_interface_EE.setJointValueTarget(JP);
                     
@@ -490,8 +668,14 @@ private:
                     move_group_interface_EE.setMaxVelocityScalingFactor(STEP.speed);
                     move_group_interface_EE.setPlannerId("PTP");
 
-                    // 4. PLAN:
-                    if (MoveGRES.RES == "LIMITS: OK"){
+                    // 4. PLAN, or GRIPPER COMMAND -> Target sent straight to the gripper controllers (no planning):
+                    if (MoveGRES.RES == "LIMITS: OK" && GRIP_DIRECT){
+                        GripSTRUCT GripRES = GRIPPER_CMD.COMMAND(JP);
+                        RES = GripRES.RES;
+                        char BUFFER[128];
+                        snprintf(BUFFER, sizeof(BUFFER), ":Gripper command -> %s (%.3fs).", (RES == "GRIPPER: OK") ? GripRES.STATE.c_str() : RES.c_str(), GripRES.T_EXEC);
+                        GRIP_INFO = BUFFER;
+                    } else if (MoveGRES.RES == "LIMITS: OK"){
                         MyPlan = plan_EE();
                     } else {
                         RES = "LIMITS: ERROR (EE)";
@@ -500,13 +684,94 @@ private:
                 
                 }
 
-                // c) EXECUTE and RETURN RESULT (step feedback):
+                // PLANNING STRATEGY -> Selected candidate (pose targets):
+                if (PLAN_INFO != ""){
+                    feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + PLAN_INFO;
+                    goal_handle->publish_feedback(feedback);
+                    PLAN_INFO = "";
+                }
+
+                // PLANNING RETRIES -> Seeds, relaxed planner (OMPL) and intermediate waypoint, within the step budget and global deadline.
+                // MoveL is not retried (its linear path would not be guaranteed by the fallbacks):
+                bool RETRY_ACTION = (ACTION == "MoveJ" || ACTION == "MoveR" || ACTION == "MoveXYZW" || ACTION == "MoveXYZ" || ACTION == "MoveROT" || ACTION == "MoveRP");
+                if (RES == "PLANNING: ERROR" && RETRY_ACTION && RETRY_BUDGET > 0.0){
+
+                    char BUFFER[160];
+                    double T_LEFT = RETRY_DEADLINE - T_RETRY;
+                    if (T_LEFT > 0.0){
+
+                        RetrySTRUCT RetryRES = RetryAction(move_group_interface_ROB, joint_model_group_ROB, STEP.speed, std::min(RETRY_BUDGET, T_LEFT), RETRY_SEEDS, RETRY_WAYPOINT_Z, RETRY_SCENE);
+                        T_RETRY = T_RETRY + RetryRES.T_PLAN;
+                        RES = RetryRES.RES;
+                        if (RES == "PLANNING: OK"){
+                            MyPlan = RetryRES.PLAN;
+                            SAMPLED_PLAN = (RetryRES.METHOD == "ompl");
+                            snprintf(BUFFER, sizeof(BUFFER), ":Planning ERROR -> %d retries, recovered with %s (%.3fs).", RetryRES.ATTEMPTS, RetryRES.METHOD.c_str(), RetryRES.T_PLAN);
+                        } else {
+                            snprintf(BUFFER, sizeof(BUFFER), ":Planning ERROR -> %d retries, not recovered (%.3fs).", RetryRES.ATTEMPTS, RetryRES.T_PLAN);
+                        }
+
+                    } else {
+                        snprintf(BUFFER, sizeof(BUFFER), ":Planning ERROR -> Retry deadline (%.1fs) exceeded, no retries.", RETRY_DEADLINE);
+                    }
+
+                    feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + BUFFER;
+                    goal_handle->publish_feedback(feedback);
+                    RETRY_LOG.push_back("{STEP " + std::to_string(i) + "}: " + ACTION + BUFFER);
+
+                }
+
+                // PATH POST-PROCESSING -> Shortcutting + B-spline smoothing + TOTG, for sampling-based (non-Pilz) plans only:
+                if (RES == "PLANNING: OK" && SAMPLED_PLAN && PATH_SMOOTHER.ACTIVE()){
+
+                    SmoothSTRUCT SmoothRES = PATH_SMOOTHER.SMOOTH(MyPlan, move_group_interface_ROB, STEP.speed, STEP.accel);
+
+                    char BUFFER[200];
+                    if (SmoothRES.RES == "SMOOTHING: OK"){
+                        snprintf(BUFFER, sizeof(BUFFER), ":Path post-processing OK -> Length: %.3frad -> %.3frad, duration: %.3fs -> %.3fs (%d -> %d waypoints).",
+                                 SmoothRES.LENGTH_BEFORE, SmoothRES.LENGTH_AFTER, SmoothRES.T_BEFORE, SmoothRES.T_AFTER, SmoothRES.N_BEFORE, SmoothRES.N_AFTER);
+                    } else {
+                        snprintf(BUFFER, sizeof(BUFFER), ":Path post-processing ERROR, planned path kept -> Length: %.3frad, duration: %.3fs.", SmoothRES.LENGTH_BEFORE, SmoothRES.T_BEFORE);
+                    }
+                    feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + BUFFER;
+                    goal_handle->publish_feedback(feedback);
+
+                }
+                SAMPLED_PLAN = false;
+
+                // c) RETIMING -> Time-optimal reparameterization of the ROBOT trajectory. Not for MoveL: TOTG works in joint space and
+                //    would break the Cartesian velocity/acceleration limits of Pilz LIN (and of the fast path):
+                if (RES == "PLANNING: OK" && ACTION != "MoveG" && ACTION != "MoveL" && RETIMING == true && !REPLAYED){
+
+                    RetimeSTRUCT RetimeRES = RetimeAction(MyPlan, move_group_interface_ROB, STEP.speed, STEP.accel, STEP.jerk);
+                    T_PLANNED = T_PLANNED + RetimeRES.T_BEFORE;
+                    T_RETIMED = T_RETIMED + RetimeRES.T_AFTER;
+
+                    char BUFFER[128];
+                    if (RetimeRES.RES == "RETIMING: OK"){
+                        snprintf(BUFFER, sizeof(BUFFER), ":Retiming OK (%.3fs -> %.3fs).", RetimeRES.T_BEFORE, RetimeRES.T_AFTER);
+                    } else {
+                        snprintf(BUFFER, sizeof(BUFFER), ":Retiming ERROR, planned trajectory kept (%.3fs).", RetimeRES.T_BEFORE);
+                    }
+                    feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + BUFFER;
+                    goal_handle->publish_feedback(feedback);
+
+                }
+
+                // Start state set by a hand-off (previous step) -> Back to the current state:
+                move_group_interface_ROB.setStartStateToCurrentState();
+
+                // d) EXECUTE and RETURN RESULT (step feedback):
                 if (RES == "PLANNING: OK" || RES == "PLANNING: OK (EE)"){
 
                     feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + ":Planning OK.";
                     goal_handle->publish_feedback(feedback);
 
-                    bool ExecSUCCESS = (move_group_interface_ROB.execute(MyPlan) == moveit::planning_interface::MoveItErrorCode::SUCCESS);
+                    // EARLY HAND-OFF -> Only for robot steps followed by an ABSOLUTE robot target (MoveJ, MoveXYZW): relative targets are
+                    // computed from the current pose/joint values, and would inherit the residual error of the hand-off:
+                    bool HANDOFF = (ACTION != "MoveG" && (size_t)i < SEQ.size() && (SEQ[i].action == "MoveJ" || SEQ[i].action == "MoveXYZW"));
+                    HandoffSTRUCT ExecRES = HandoffExecute(move_group_interface_ROB, MyPlan, HANDOFF ? HANDOFF_TOL : 0.0, EXEC_DIRECT ? &DIRECT_EXEC : nullptr);
+                    bool ExecSUCCESS = (ExecRES.RES == "EXECUTION: OK");
 
                     if (goal_handle->is_canceling()) {
                         feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + ":Canceled.";
@@ -516,7 +781,24 @@ private:
                         return;
                     } 
                     
-                    if (ExecSUCCESS){
+                    // RECORD -> Executed trajectory + start state and scene fingerprints (not recorded without a scene fingerprint):
+                    if (ExecSUCCESS && TRAJ_STORE.MODE() == "record" && MOTION){
+                        if (STEP_SCENE_OK){
+                            TRAJ_STORE.PUT(STEP_KEY, STEP_START, STEP_SCENE, MyPlan.trajectory_);
+                        } else {
+                            feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + ":Planning scene not available, trajectory not recorded.";
+                            goal_handle->publish_feedback(feedback);
+                        }
+                    }
+
+                    if (ExecSUCCESS && ExecRES.HANDOFF){
+                        N_HANDOFF = N_HANDOFF + 1;
+                        T_SAVED = T_SAVED + ExecRES.T_SAVED;
+                        char BUFFER[128];
+                        snprintf(BUFFER, sizeof(BUFFER), ":Movement within goal tolerance after %.3fs, handed off (%.3fs saved).", ExecRES.T_EXEC, ExecRES.T_SAVED);
+                        feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + BUFFER;
+                        goal_handle->publish_feedback(feedback);
+                    } else if (ExecSUCCESS){
                         feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + ":Movement executed, SUCCESS.";
                         goal_handle->publish_feedback(feedback);
                     } else {
@@ -525,6 +807,28 @@ private:
                         CONTINUE = false;
                     }
                     
+                } else if (RES.rfind("GRIPPER:", 0) == 0){
+
+                    // GRIPPER COMMAND -> Already executed (b):
+                    if (goal_handle->is_canceling()) {
+                        feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + ":Canceled.";
+                        goal_handle->publish_feedback(feedback);
+                        goal_handle->canceled(result);
+                        CONTINUE = false;
+                        return;
+                    }
+
+                    feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + GRIP_INFO;
+                    goal_handle->publish_feedback(feedback);
+                    if (RES == "GRIPPER: OK"){
+                        feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + ":Movement executed, SUCCESS.";
+                        goal_handle->publish_feedback(feedback);
+                    } else {
+                        feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + ":Gripper command failed, ERROR.";
+                        goal_handle->publish_feedback(feedback);
+                        CONTINUE = false;
+                    }
+
                 } else if (RES == "PLANNING: ERROR" || RES == "PLANNING: ERROR (EE)"){
                     feedback_msg = "{STEP " + std::to_string(i) + "}: " + ACTION + ":Planning ERROR.";
                     goal_handle->publish_feedback(feedback);
@@ -582,6 +886,56 @@ private:
 
         }
 
+        // IK CACHE -> Statistics:
+        RCLCPP_INFO(this->get_logger(), "%s", IK_CACHE.STATS().c_str());
+
+        // PLANNING STRATEGY -> Win rates and planning times:
+        if (PLAN_STRATEGY.ACTIVE()){
+            RCLCPP_INFO(this->get_logger(), "%s", PLAN_STRATEGY.STATS().c_str());
+        }
+
+        // PLANNING RETRIES -> Statistics (per step):
+        if (!RETRY_LOG.empty()){
+            RCLCPP_INFO(this->get_logger(), "PLANNING RETRIES -> %zu step(s), %.3fs of %.1fs (deadline):", RETRY_LOG.size(), T_RETRY, RETRY_DEADLINE);
+            for (const std::string & LINE : RETRY_LOG){
+                RCLCPP_INFO(this->get_logger(), "  %s", LINE.c_str());
+            }
+        }
+
+        // TRAJECTORY STORE -> Save (record mode) + statistics:
+        if (TRAJ_STORE.MODE() != "off"){
+            if (TRAJ_STORE.MODE() == "record" && !TRAJ_STORE.SAVE()){
+                RCLCPP_ERROR(this->get_logger(), "TRAJECTORY STORE -> The recorded trajectories could not be saved.");
+            }
+            RCLCPP_INFO(this->get_logger(), "%s", TRAJ_STORE.STATS().c_str());
+        }
+
+        // EXECUTION BACKEND -> Execute-call overhead (direct backend):
+        if (GRIP_DIRECT){
+            RCLCPP_INFO(this->get_logger(), "%s", GRIPPER_CMD.STATS().c_str());
+        }
+        if (EXEC_DIRECT){
+            RCLCPP_INFO(this->get_logger(), "%s", DIRECT_EXEC.STATS().c_str());
+        }
+
+        // EARLY HAND-OFF -> Report:
+        if (HANDOFF_TOL > 0.0){
+            char BUFFER[128];
+            snprintf(BUFFER, sizeof(BUFFER), "EARLY HAND-OFF -> %d step(s) handed off, %.3fs saved (trajectory end - hand-off).", N_HANDOFF, T_SAVED);
+            RCLCPP_INFO(this->get_logger(), "%s", BUFFER);
+            feedback_msg = BUFFER;
+            goal_handle->publish_feedback(feedback);
+        }
+
+        // CYCLE TIME -> Report:
+        double T_PROGRAM = std::chrono::duration<double>(std::chrono::steady_clock::now() - T_START).count();
+        double GAIN = (T_PLANNED > 0.0) ? (100.0 * (T_PLANNED - T_RETIMED) / T_PLANNED) : 0.0;
+        char BUFFER[160];
+        snprintf(BUFFER, sizeof(BUFFER), "CYCLE TIME -> Robot motion: %.3fs planned, %.3fs retimed (gain: %.1f%%). Program execution time: %.3fs.", T_PLANNED, T_RETIMED, GAIN, T_PROGRAM);
+        RCLCPP_INFO(this->get_logger(), "%s", BUFFER);
+        feedback_msg = BUFFER;
+        goal_handle->publish_feedback(feedback);
+
         // RETURN -> RESULT:
         result->result = "EXECUTION FINISHED.";
         goal_handle->succeed(result);
@@ -621,6 +975,84 @@ int main(int argc, char ** argv)
     executor.add_node(node2);
     std::thread([&executor]() { executor.spin(); }).detach();
 
+    // IK/TARGET RESOLUTION CACHE -> Size and rounding tolerance (optional parameters):
+    int IK_CACHE_SIZE = 256;
+    double IK_CACHE_TOL = 1e-4;
+    node2->get_parameter("IK_CACHE_SIZE", IK_CACHE_SIZE);
+    node2->get_parameter("IK_CACHE_TOL", IK_CACHE_TOL);
+    if (IK_CACHE_SIZE < 0 || IK_CACHE_TOL <= 0.0){
+        RCLCPP_ERROR(logger, "IK cache -> Invalid SIZE (%d) or TOLERANCE (%.1e), default values are used.", IK_CACHE_SIZE, IK_CACHE_TOL);
+        IK_CACHE_SIZE = 256;
+        IK_CACHE_TOL = 1e-4;
+    }
+    IK_CACHE.CONFIGURE(IK_CACHE_SIZE, IK_CACHE_TOL);
+    RCLCPP_INFO(logger, "IK cache initialised -> SIZE: %d, TOLERANCE: %.1e", IK_CACHE_SIZE, IK_CACHE_TOL);
+
+    // TRAJECTORY RETIMING -> ON/OFF (optional parameter, default: ON):
+    node2->get_parameter("RETIMING", RETIMING);
+    RCLCPP_INFO(logger, "Trajectory retiming -> %s", RETIMING ? "ON" : "OFF");
+
+    // MoveL FAST PATH -> Max. segment length (optional parameter, default: 0.0m -> OFF) and Pilz Cartesian limits (pilz_cartesian_limits.yaml):
+    node2->get_parameter("MOVEL_FAST_MAXDIST", MOVEL_FAST_MAXDIST);
+    if (MOVEL_FAST_MAXDIST > 0.0){
+        MoveLFastLIMITS LIMITS;
+        node2->get_parameter("robot_description_planning.cartesian_limits.max_trans_vel", LIMITS.TRANS_VEL);
+        node2->get_parameter("robot_description_planning.cartesian_limits.max_trans_acc", LIMITS.TRANS_ACC);
+        node2->get_parameter("robot_description_planning.cartesian_limits.max_rot_vel", LIMITS.ROT_VEL);
+        if (LIMITS.TRANS_VEL > 0.0 && LIMITS.TRANS_ACC > 0.0 && LIMITS.ROT_VEL > 0.0){
+            MOVEL_FAST_LIMITS = LIMITS;
+        } else {
+            RCLCPP_ERROR(logger, "MoveL fast path -> Invalid Cartesian limits, default values are used.");
+        }
+        MOVEL_FAST_SCENE = node2->create_client<moveit_msgs::srv::GetPlanningScene>("/get_planning_scene");
+    }
+    RCLCPP_INFO(logger, "MoveL fast path -> Max. segment length: %.3fm (Cartesian limits: %.2fm/s, %.2fm/s^2, %.2frad/s)", MOVEL_FAST_MAXDIST,
+                MOVEL_FAST_LIMITS.TRANS_VEL, MOVEL_FAST_LIMITS.TRANS_ACC, MOVEL_FAST_LIMITS.ROT_VEL);
+
+    // PLANNING STRATEGY (pose targets) -> Mode, candidates ("pipeline/planner") and time budget (optional parameters):
+    std::string PLAN_MODE = "off";
+    std::vector<std::string> PLAN_CANDIDATES = {"move_group/PTP", "ompl/RRTConnectkConfigDefault", "ompl/RRTConnectkConfigDefault"};
+    double PLAN_BUDGET = 1.0;
+    node2->get_parameter("PLAN_STRATEGY", PLAN_MODE);
+    node2->get_parameter("PLAN_CANDIDATES", PLAN_CANDIDATES);
+    node2->get_parameter("PLAN_BUDGET", PLAN_BUDGET);
+    PLAN_STRATEGY.CONFIGURE(node2, PLAN_MODE, PLAN_CANDIDATES, PLAN_BUDGET);
+    RCLCPP_INFO(logger, "Planning strategy -> %s (%zu candidates, budget: %.2fs)", PLAN_STRATEGY.ACTIVE() ? PLAN_MODE.c_str() : "OFF", PLAN_CANDIDATES.size(), PLAN_BUDGET);
+
+    // PATH POST-PROCESSING (non-Pilz plans) -> Shortcutting iterations (0 -> OFF) and collision-check resolution [rad] (optional parameters):
+    int SMOOTH_ITERATIONS = 100;
+    double SMOOTH_RESOLUTION = 0.05;
+    node2->get_parameter("SMOOTH_ITERATIONS", SMOOTH_ITERATIONS);
+    node2->get_parameter("SMOOTH_RESOLUTION", SMOOTH_RESOLUTION);
+    PATH_SMOOTHER.CONFIGURE(node2, SMOOTH_ITERATIONS, SMOOTH_RESOLUTION);
+    RCLCPP_INFO(logger, "Path post-processing (non-Pilz plans) -> %s (%d shortcut iterations, resolution: %.3frad)", PATH_SMOOTHER.ACTIVE() ? "ON" : "OFF", SMOOTH_ITERATIONS, SMOOTH_RESOLUTION);
+
+    // TRAJECTORY STORE -> Mode ("off", "record", "replay"), file and start state tolerance [rad] (optional parameters):
+    std::string TRAJ_STORE_MODE = "off";
+    std::string TRAJ_STORE_FILE = "";
+    double TRAJ_STORE_TOL = 0.01;
+    node2->get_parameter("TRAJ_STORE", TRAJ_STORE_MODE);
+    node2->get_parameter("TRAJ_STORE_FILE", TRAJ_STORE_FILE);
+    node2->get_parameter("TRAJ_STORE_TOL", TRAJ_STORE_TOL);
+    TRAJ_STORE.CONFIGURE(node2, TRAJ_STORE_MODE, TRAJ_STORE_FILE, TRAJ_STORE_TOL);
+    RCLCPP_INFO(logger, "%s", TRAJ_STORE.STATS().c_str());
+
+    // EARLY HAND-OFF -> Window around the goal (optional parameter, default: 0.0 -> OFF). Must not exceed allowed_start_tolerance:
+    node2->get_parameter("HANDOFF_TOL", HANDOFF_TOL);
+    RCLCPP_INFO(logger, "Early hand-off -> %s (window: %.4frad)", (HANDOFF_TOL > 0.0) ? "ON" : "OFF", HANDOFF_TOL);
+
+    // PLANNING RETRIES -> Per-step budget (default: 0.0 -> OFF), global deadline, number of IK seeds and waypoint height (optional parameters):
+    node2->get_parameter("RETRY_BUDGET", RETRY_BUDGET);
+    node2->get_parameter("RETRY_DEADLINE", RETRY_DEADLINE);
+    node2->get_parameter("RETRY_SEEDS", RETRY_SEEDS);
+    node2->get_parameter("RETRY_WAYPOINT_Z", RETRY_WAYPOINT_Z);
+    if (RETRY_BUDGET > 0.0){
+        RETRY_SCENE = node2->create_client<moveit_msgs::srv::GetPlanningScene>("/get_planning_scene");
+        RCLCPP_INFO(logger, "Planning retries -> Budget: %.2fs/step, deadline: %.1fs, %d seeds, waypoint: +%.3fm", RETRY_BUDGET, RETRY_DEADLINE, RETRY_SEEDS, RETRY_WAYPOINT_Z);
+    } else {
+        RCLCPP_INFO(logger, "Planning retries -> OFF");
+    }
+
     // CREATE -> MoveGroupInterface(s):
     using moveit::planning_interface::MoveGroupInterface;
     // 1. ROBOT:
@@ -642,6 +1074,9 @@ int main(int argc, char ** argv)
 
         joint_model_group_ROB = move_group_interface_ROB.getCurrentState()->getJointModelGroup(name);
         RCLCPP_INFO(logger, "MoveGroupInterface object created for ROBOT: %s", param_ROB.c_str());
+
+        REG_ROB = RegistryLoad(node2, joint_model_group_ROB);
+        RCLCPP_INFO(logger, "%s -> ROBOT: %s, %zu joints.", REG_ROB.RES.c_str(), REG_ROB.GROUP.c_str(), REG_ROB.JOINTS.size());
     }
     // 2. END-EFFECTOR:
     if (param_EE != "none" && param_ENV != "bringup"){
@@ -651,7 +1086,42 @@ int main(int argc, char ** argv)
         move_group_interface_EE.setMaxAccelerationScalingFactor(1.0);
         joint_model_group_EE = move_group_interface_EE.getCurrentState()->getJointModelGroup(param_EE);
         RCLCPP_INFO(logger, "MoveGroupInterface object created for END-EFFECTOR: %s", param_EE.c_str());
+
+        REG_EE = RegistryLoad(node2, joint_model_group_EE);
+        RCLCPP_INFO(logger, "%s -> END-EFFECTOR: %s, %zu joints, gripper range [%.4f, %.4f].", REG_EE.RES.c_str(), REG_EE.GROUP.c_str(), REG_EE.JOINTS.size(), REG_EE.GP_LL, REG_EE.GP_UL);
+    }
+
+    // EXECUTION BACKEND -> "moveit" (default) or "direct" (optional parameter, selected per environment in the launch files):
+    std::string EXEC_BACKEND = "moveit";
+    node2->get_parameter("EXEC_BACKEND", EXEC_BACKEND);
+    if (EXEC_BACKEND == "direct"){
+        EXEC_DIRECT = DIRECT_EXEC.CONFIGURE(node2);
+        if (!EXEC_DIRECT){
+            RCLCPP_ERROR(logger, "Execution backend -> The controllers could not be read from move_group, MoveIt!2 execution is used.");
+        }
+    }
+    RCLCPP_INFO(logger, "Execution backend -> %s", EXEC_DIRECT ? "DIRECT (FollowJointTrajectory/GripperCommand controllers)" : "MoveIt!2 (move_group)");
+    if (HANDOFF_TOL > 0.0 && !EXEC_DIRECT){
+        RCLCPP_WARN(logger, "Early hand-off -> Requires the DIRECT execution backend (move_group does not preempt a running execution), hand-off OFF.");
+        HANDOFF_TOL = 0.0;
+    }
+
+    // GRIPPER COMMAND PATH -> "moveit" (default) or "direct", position tolerance [rad], max. effort (0.0 -> not limited) and timeout [s] (optional parameters):
+    std::string GRIPPER_BACKEND = "moveit";
+    double GRIPPER_TOL = 0.01;
+    double GRIPPER_MAX_EFFORT = 0.0;
+    double GRIPPER_TIMEOUT = 5.0;
+    node2->get_parameter("GRIPPER_BACKEND", GRIPPER_BACKEND);
+    node2->get_parameter("GRIPPER_TOL", GRIPPER_TOL);
+    node2->get_parameter("GRIPPER_MAX_EFFORT", GRIPPER_MAX_EFFORT);
+    node2->get_parameter("GRIPPER_TIMEOUT", GRIPPER_TIMEOUT);
+    if (GRIPPER_BACKEND == "direct" && param_EE != "none" && param_ENV != "bringup"){
+        GRIP_DIRECT = GRIPPER_CMD.CONFIGURE(node2, REG_EE, GRIPPER_TOL, GRIPPER_MAX_EFFORT, GRIPPER_TIMEOUT);
+        if (!GRIP_DIRECT){
+            RCLCPP_ERROR(logger, "Gripper command path -> No GripperCommand controllers found for %s, MoveG is planned with MoveIt!2.", param_EE.c_str());
+        }
     }
+    RCLCPP_INFO(logger, "Gripper command path -> %s", GRIP_DIRECT ? "DIRECT (GripperCommand controllers)" : "MoveIt!2 (plan + execute)");
 
     // CREATE -> PlanningSceneInterface:
     using moveit::planning_interface::PlanningSceneInterface;
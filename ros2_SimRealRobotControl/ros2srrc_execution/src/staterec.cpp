@@ -0,0 +1,237 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+// staterec.cpp:
+// STATE RECORDER -> Memory-mapped, fixed-width record files with rollover (see staterec.h).
+
+#include "ros2srrc_execution/staterec.h"
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <cstdio>
+#include <cstring>
+#include <string>
+#include <vector>
+
+// Include POSIX (file + memory mapping):
+#include <fcntl.h>
+#include <glob.h>
+#include <sys/mman.h>
+#include <unistd.h>
+
+// Declaration of CONSTANT VALUES:
+const char MAGIC[8] = {'S', 'R', 'R', 'C', 'R', 'E', 'C', '1'};
+const uint32_t VERSION = 1;
+
+static double NOW()
+{
+    return(std::chrono::duration<double>(std::chrono::steady_clock::now().time_since_epoch()).count());
+}
+
+StateRecorder::StateRecorder()
+: WIDTH_(0), CAPACITY_(0), MAX_FILES_(0), FD_(-1), FILE_IDX_(-1), SIZE_(0), HEADER_(nullptr), RECORDS_(nullptr), COUNT_(0),
+  TOTAL_(0), N_STATS_(0), T_WRITE_SUM_(0.0), T_WRITE_MAX_(0.0), T_WRITE_START_(0.0), T_START_(0.0)
+{
+}
+
+StateRecorder::~StateRecorder()
+{
+    CLOSE();
+}
+
+bool StateRecorder::OPEN(const std::string & PREFIX, const std::string & CHANNEL, const std::vector<std::string> & NAMES, uint32_t WIDTH,
+                         uint64_t CAPACITY, int MAX_FILES)
+{
+    CLOSE();
+
+    // The channel layout must fit in the header:
+    std::string LAYOUT;
+    for (const std::string & NAME : NAMES){
+        LAYOUT = LAYOUT + NAME + "\n";
+    }
+    if (WIDTH == 0 || CAPACITY == 0 || LAYOUT.size() >= sizeof(RecHeader::NAMES)){
+        return false;
+    }
+
+    PREFIX_ = PREFIX;
+    CHANNEL_ = CHANNEL;
+    NAMES_ = NAMES;
+    WIDTH_ = WIDTH;
+    CAPACITY_ = CAPACITY;
+    MAX_FILES_ = MAX_FILES;
+    TOTAL_ = 0;
+    N_STATS_ = 0;
+    T_WRITE_SUM_ = 0.0;
+    T_WRITE_MAX_ = 0.0;
+    T_START_ = NOW();
+
+    // Files of a previous recording with the same PREFIX/CHANNEL are deleted, the reader would merge them with the new ones:
+    glob_t OLD;
+    if (glob((PREFIX_ + "_" + CHANNEL_ + "_[0-9][0-9][0-9][0-9].bin").c_str(), 0, nullptr, &OLD) == 0){
+        for (size_t i = 0; i < OLD.gl_pathc; i++){
+            unlink(OLD.gl_pathv[i]);
+        }
+    }
+    globfree(&OLD);
+
+    return(MAP_(0));
+}
+
+bool StateRecorder::ACTIVE() const
+{
+    return(HEADER_ != nullptr);
+}
+
+std::string StateRecorder::PATH_(int IDX) const
+{
+    char BUFFER[16];
+    snprintf(BUFFER, sizeof(BUFFER), "_%04d.bin", IDX);
+    return(PREFIX_ + "_" + CHANNEL_ + BUFFER);
+}
+
+// Create + preallocate + map the file IDX of the sequence:
+bool StateRecorder::MAP_(int IDX)
+{
+    SIZE_ = sizeof(RecHeader) + CAPACITY_ * (1 + WIDTH_) * sizeof(double);
+    std::string PATH = PATH_(IDX);
+
+    FD_ = open(PATH.c_str(), O_RDWR | O_CREAT | O_TRUNC, 0644);
+    if (FD_ < 0){
+        return false;
+    }
+    if (posix_fallocate(FD_, 0, SIZE_) != 0 && ftruncate(FD_, SIZE_) != 0){
+        close(FD_);
+        FD_ = -1;
+        return false;
+    }
+
+    void * P = mmap(nullptr, SIZE_, PROT_READ | PROT_WRITE, MAP_SHARED, FD_, 0);
+    if (P == MAP_FAILED){
+        close(FD_);
+        FD_ = -1;
+        return false;
+    }
+
+    HEADER_ = static_cast<RecHeader *>(P);
+    RECORDS_ = reinterpret_cast<double *>(static_cast<char *>(P) + sizeof(RecHeader));
+    std::memset(HEADER_, 0, sizeof(RecHeader));
+    std::memcpy(HEADER_->MAGIC, MAGIC, sizeof(MAGIC));
+    HEADER_->VERSION = VERSION;
+    HEADER_->WIDTH = WIDTH_;
+    HEADER_->CAPACITY = CAPACITY_;
+    HEADER_->N = NAMES_.size();
+    size_t POS = 0;
+    for (const std::string & NAME : NAMES_){
+        std::memcpy(HEADER_->NAMES + POS, NAME.data(), NAME.size());
+        POS = POS + NAME.size();
+        HEADER_->NAMES[POS++] = '\n';
+    }
+    COUNT_ = 0;
+    FILE_IDX_ = IDX;
+
+    // ROLLOVER -> Keep (at most) the last MAX_FILES files:
+    if (MAX_FILES_ > 0 && IDX >= MAX_FILES_){
+        unlink(PATH_(IDX - MAX_FILES_).c_str());
+    }
+    return true;
+}
+
+void StateRecorder::UNMAP_()
+{
+    if (HEADER_ != nullptr){
+        msync(HEADER_, SIZE_, MS_SYNC);
+        munmap(HEADER_, SIZE_);
+        // The unused (preallocated) space of the last file is released -> The file ends at the last record:
+        size_t USED = sizeof(RecHeader) + COUNT_ * (1 + WIDTH_) * sizeof(double);
+        int RES = (COUNT_ < CAPACITY_) ? ftruncate(FD_, USED) : 0;
+        (void) RES;
+        HEADER_ = nullptr;
+        RECORDS_ = nullptr;
+    }
+    if (FD_ >= 0){
+        close(FD_);
+        FD_ = -1;
+    }
+}
+
+// Pointer to the DATA (WIDTH values) of the next record. The time stamp is written here:
+double * StateRecorder::NEXT(double T)
+{
+    T_WRITE_START_ = NOW();
+    if (HEADER_ == nullptr){
+        return(nullptr);
+    }
+    if (COUNT_ == CAPACITY_){
+        UNMAP_();
+        if (!MAP_(FILE_IDX_ + 1)){
+            return(nullptr);
+        }
+    }
+    double * R = RECORDS_ + COUNT_ * (1 + WIDTH_);
+    R[0] = T;
+    return(R + 1);
+}
+
+// Publish the record -> COUNT is stored after the record data:
+void StateRecorder::COMMIT()
+{
+    if (HEADER_ == nullptr){
+        return;
+    }
+    COUNT_++;
+    TOTAL_++;
+    __atomic_store_n(&HEADER_->COUNT, COUNT_, __ATOMIC_RELEASE);
+
+    double DT = NOW() - T_WRITE_START_;
+    N_STATS_++;
+    T_WRITE_SUM_ = T_WRITE_SUM_ + DT;
+    T_WRITE_MAX_ = std::max(T_WRITE_MAX_, DT);
+}
+
+void StateRecorder::CLOSE()
+{
+    UNMAP_();
+}
+
+std::string StateRecorder::STATS()
+{
+    double T = NOW() - T_START_;
+    char BUFFER[320];
+    snprintf(BUFFER, sizeof(BUFFER), "STATE RECORDER (%s) -> %llu records (%.1fHz), file %s [%llu/%llu], write mean: %.2fus, max: %.2fus",
+             CHANNEL_.c_str(), static_cast<unsigned long long>(TOTAL_), (T > 0.0) ? TOTAL_ / T : 0.0, PATH_(std::max(FILE_IDX_, 0)).c_str(),
+             static_cast<unsigned long long>(COUNT_), static_cast<unsigned long long>(CAPACITY_),
+             (N_STATS_ > 0) ? 1e6 * T_WRITE_SUM_ / N_STATS_ : 0.0, 1e6 * T_WRITE_MAX_);
+    N_STATS_ = 0;
+    T_WRITE_SUM_ = 0.0;
+    T_WRITE_MAX_ = 0.0;
+    return(std::string(BUFFER));
+}
@@ -0,0 +1,334 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_execution/trajstore.h"
+
+// Include standard libraries:
+#include <chrono>
+#include <cmath>
+#include <cstdlib>
+#include <cstdio>
+#include <cstring>
+#include <fstream>
+#include <future>
+#include <map>
+#include <memory>
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+#include "rclcpp/serialization.hpp"
+#include "rclcpp/serialized_message.hpp"
+
+// Include MoveIt!2:
+#include <moveit_msgs/msg/planning_scene_components.hpp>
+#include <moveit_msgs/msg/robot_trajectory.hpp>
+#include <moveit_msgs/srv/get_planning_scene.hpp>
+
+// Declaration of CONSTANT VALUES:
+const char MAGIC[8] = {'S', 'R', 'R', 'C', 'T', 'R', 'J', '1'};
+const double SCENE_TIMEOUT = 1.0;   // [s]
+const double SCENE_ROUND = 1e-4;    // Rounding of the object poses/dimensions [m].
+
+// FNV-1a (64 bit) -> Stable across runs and builds:
+static uint64_t FNV(const void * DATA, size_t LENGTH, uint64_t H = 14695981039346656037ULL)
+{
+    const unsigned char * P = static_cast<const unsigned char *>(DATA);
+    for (size_t i = 0; i < LENGTH; i++){
+        H = (H ^ P[i]) * 1099511628211ULL;
+    }
+    return(H);
+}
+static uint64_t FNV(const std::string & S, uint64_t H)
+{
+    return(FNV(S.data(), S.size(), H));
+}
+static uint64_t FNV(double V, uint64_t H)
+{
+    long long R = std::llround(V / SCENE_ROUND);
+    return(FNV(&R, sizeof(R), H));
+}
+
+// ROS 2 message <-> bytes:
+template <typename T>
+static std::string Serialize(const T & MSG)
+{
+    rclcpp::Serialization<T> SER;
+    rclcpp::SerializedMessage BYTES;
+    SER.serialize_message(&MSG, &BYTES);
+    const rcl_serialized_message_t & RAW = BYTES.get_rcl_serialized_message();
+    return(std::string(reinterpret_cast<const char *>(RAW.buffer), RAW.buffer_length));
+}
+template <typename T>
+static void Deserialize(const std::string & DATA, T & MSG)
+{
+    rclcpp::Serialization<T> SER;
+    rclcpp::SerializedMessage BYTES(DATA.size());
+    rcl_serialized_message_t & RAW = BYTES.get_rcl_serialized_message();
+    std::memcpy(RAW.buffer, DATA.data(), DATA.size());
+    RAW.buffer_length = DATA.size();
+    SER.deserialize_message(&BYTES, &MSG);
+}
+
+// Binary file helpers:
+static void WriteU64(std::ofstream & F, uint64_t V)
+{
+    F.write(reinterpret_cast<const char *>(&V), sizeof(V));
+}
+static void WriteSTR(std::ofstream & F, const std::string & S)
+{
+    WriteU64(F, S.size());
+    F.write(S.data(), S.size());
+}
+static bool ReadU64(std::ifstream & F, uint64_t & V)
+{
+    return(static_cast<bool>(F.read(reinterpret_cast<char *>(&V), sizeof(V))));
+}
+static bool ReadSTR(std::ifstream & F, std::string & S)
+{
+    uint64_t N;
+    if (!ReadU64(F, N)){
+        return false;
+    }
+    S.resize(N);
+    return(static_cast<bool>(F.read(&S[0], N)));
+}
+
+TrajectoryStore::TrajectoryStore() : MODE_("off"), TOL_(0.01), REPLAYED_(0), FALLBACK_(0), RECORDED_(0)
+{
+}
+
+void TrajectoryStore::CONFIGURE(const rclcpp::Node::SharedPtr & node, const std::string & MODE, const std::string & FILE, double TOL)
+{
+    {
+        std::lock_guard<std::mutex> LOCK(MUTEX_);
+        MODE_ = (MODE == "record" || MODE == "replay") ? MODE : "off";
+        TOL_ = (TOL > 0.0) ? TOL : 0.01;
+        FILE_ = FILE;
+        if (FILE_.empty()){
+            const char * HOME = std::getenv("HOME");
+            FILE_ = std::string(HOME ? HOME : ".") + "/.ros/ros2srrc_trajectories.bin";
+        }
+        ENTRIES_.clear();
+        REPLAYED_ = 0;
+        FALLBACK_ = 0;
+        RECORDED_ = 0;
+    }
+
+    if (MODE_ != "off"){
+        CLIENT_ = node->create_client<moveit_msgs::srv::GetPlanningScene>("/get_planning_scene");
+        LOAD();
+    }
+}
+
+std::string TrajectoryStore::MODE() const
+{
+    return(MODE_);
+}
+
+std::string TrajectoryStore::KEY(int STEP, const ros2srrc_data::msg::Action & ACTION) const
+{
+    char BUFFER[64];
+    snprintf(BUFFER, sizeof(BUFFER), "%d:%016llx", STEP, (unsigned long long)FNV(Serialize(ACTION), 14695981039346656037ULL));
+    return(std::string(BUFFER));
+}
+
+bool TrajectoryStore::SCENE(uint64_t & FINGERPRINT)
+{
+    // 1. World objects + attached objects -> From move_group:
+    auto REQUEST = std::make_shared<moveit_msgs::srv::GetPlanningScene::Request>();
+    REQUEST->components.components = moveit_msgs::msg::PlanningSceneComponents::WORLD_OBJECT_NAMES
+                                   | moveit_msgs::msg::PlanningSceneComponents::WORLD_OBJECT_GEOMETRY
+                                   | moveit_msgs::msg::PlanningSceneComponents::ROBOT_STATE_ATTACHED_OBJECTS;
+    if (!CLIENT_ || !CLIENT_->wait_for_service(std::chrono::duration<double>(SCENE_TIMEOUT))){
+        return(false);
+    }
+    auto FUTURE = CLIENT_->async_send_request(REQUEST);
+    if (FUTURE.wait_for(std::chrono::duration<double>(SCENE_TIMEOUT)) != std::future_status::ready){
+        return(false);
+    }
+    const moveit_msgs::msg::PlanningScene SCENE = FUTURE.get()->scene;
+
+    // 2. FINGERPRINT -> Object ids, shapes and poses (rounded), in a stable order (std::map):
+    std::map<std::string, uint64_t> OBJECTS;
+    auto HASH_OBJECT = [](const moveit_msgs::msg::CollisionObject & CO, uint64_t H){
+        for (const auto & P : CO.primitives){
+            H = FNV(&P.type, sizeof(P.type), H);
+            for (double D : P.dimensions){
+                H = FNV(D, H);
+            }
+        }
+        for (const auto & P : CO.primitive_poses){
+            H = FNV(P.position.x, H); H = FNV(P.position.y, H); H = FNV(P.position.z, H);
+            H = FNV(P.orientation.x, H); H = FNV(P.orientation.y, H); H = FNV(P.orientation.z, H); H = FNV(P.orientation.w, H);
+        }
+        for (const auto & M : CO.meshes){
+            H = FNV(M.vertices.size() * 1.0, H);
+            H = FNV(M.triangles.size() * 1.0, H);
+        }
+        for (const auto & P : CO.mesh_poses){
+            H = FNV(P.position.x, H); H = FNV(P.position.y, H); H = FNV(P.position.z, H);
+            H = FNV(P.orientation.x, H); H = FNV(P.orientation.y, H); H = FNV(P.orientation.z, H); H = FNV(P.orientation.w, H);
+        }
+        H = FNV(CO.pose.position.x, H); H = FNV(CO.pose.position.y, H); H = FNV(CO.pose.position.z, H);
+        H = FNV(CO.pose.orientation.x, H); H = FNV(CO.pose.orientation.y, H); H = FNV(CO.pose.orientation.z, H); H = FNV(CO.pose.orientation.w, H);
+        return(H);
+    };
+    for (const auto & CO : SCENE.world.collision_objects){
+        OBJECTS["world/" + CO.id] = HASH_OBJECT(CO, FNV(CO.header.frame_id, 14695981039346656037ULL));
+    }
+    for (const auto & AO : SCENE.robot_state.attached_collision_objects){
+        OBJECTS["attached/" + AO.object.id] = HASH_OBJECT(AO.object, FNV(AO.link_name, 14695981039346656037ULL));
+    }
+
+    uint64_t H = 14695981039346656037ULL;
+    for (const auto & O : OBJECTS){
+        H = FNV(O.first, H);
+        H = FNV(&O.second, sizeof(O.second), H);
+    }
+    FINGERPRINT = H;
+    return(true);
+}
+
+std::string TrajectoryStore::GET(const std::string & KEY, const std::vector<double> & START, bool SCENE_OK, uint64_t SCENE, moveit_msgs::msg::RobotTrajectory & TRAJ)
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+
+    auto IT = ENTRIES_.find(KEY);
+    if (IT == ENTRIES_.end()){
+        FALLBACK_ = FALLBACK_ + 1;
+        return("REPLAY: NOT RECORDED");
+    }
+
+    if (!SCENE_OK){
+        FALLBACK_ = FALLBACK_ + 1;
+        return("REPLAY: NO PLANNING SCENE");
+    }
+
+    const Entry & E = IT->second;
+    bool SAME_START = (E.START.size() == START.size());
+    for (size_t j = 0; SAME_START && j < START.size(); j++){
+        SAME_START = (std::fabs(E.START[j] - START[j]) <= TOL_);
+    }
+    if (!SAME_START){
+        FALLBACK_ = FALLBACK_ + 1;
+        return("REPLAY: START STATE CHANGED");
+    }
+    if (E.SCENE != SCENE){
+        FALLBACK_ = FALLBACK_ + 1;
+        return("REPLAY: SCENE CHANGED");
+    }
+
+    TRAJ = E.TRAJ;
+    REPLAYED_ = REPLAYED_ + 1;
+    return("REPLAY: OK");
+}
+
+void TrajectoryStore::PUT(const std::string & KEY, const std::vector<double> & START, uint64_t SCENE, const moveit_msgs::msg::RobotTrajectory & TRAJ)
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    Entry & E = ENTRIES_[KEY];
+    E.START = START;
+    E.SCENE = SCENE;
+    E.TRAJ = TRAJ;
+    RECORDED_ = RECORDED_ + 1;
+}
+
+bool TrajectoryStore::LOAD()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+
+    std::ifstream F(FILE_, std::ios::binary);
+    char HEADER[8];
+    if (!F.read(HEADER, sizeof(HEADER)) || std::memcmp(HEADER, MAGIC, sizeof(MAGIC)) != 0){
+        return false;
+    }
+
+    // ENTRY -> KEY, START (N doubles), SCENE, serialized RobotTrajectory:
+    uint64_t N;
+    if (!ReadU64(F, N)){
+        return false;
+    }
+    std::map<std::string, Entry> ENTRIES;
+    for (uint64_t k = 0; k < N; k++){
+        std::string KEY, BYTES;
+        uint64_t N_START;
+        Entry E;
+        if (!ReadSTR(F, KEY) || !ReadU64(F, N_START)){
+            return false;
+        }
+        E.START.resize(N_START);
+        if (!F.read(reinterpret_cast<char *>(E.START.data()), N_START * sizeof(double)) || !ReadU64(F, E.SCENE) || !ReadSTR(F, BYTES)){
+            return false;
+        }
+        Deserialize(BYTES, E.TRAJ);
+        ENTRIES[KEY] = E;
+    }
+
+    ENTRIES_ = ENTRIES;
+    return true;
+}
+
+bool TrajectoryStore::SAVE()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+
+    // Written to a temporary file first -> An interrupted save does not corrupt the store:
+    const std::string TMP = FILE_ + ".tmp";
+    {
+        std::ofstream F(TMP, std::ios::binary | std::ios::trunc);
+        if (!F){
+            return false;
+        }
+        F.write(MAGIC, sizeof(MAGIC));
+        WriteU64(F, ENTRIES_.size());
+        for (const auto & IT : ENTRIES_){
+            WriteSTR(F, IT.first);
+            WriteU64(F, IT.second.START.size());
+            F.write(reinterpret_cast<const char *>(IT.second.START.data()), IT.second.START.size() * sizeof(double));
+            WriteU64(F, IT.second.SCENE);
+            WriteSTR(F, Serialize(IT.second.TRAJ));
+        }
+        if (!F){
+            return false;
+        }
+    }
+    return(std::rename(TMP.c_str(), FILE_.c_str()) == 0);
+}
+
+std::string TrajectoryStore::STATS()
+{
+    std::lock_guard<std::mutex> LOCK(MUTEX_);
+    char BUFFER[256];
+    snprintf(BUFFER, sizeof(BUFFER), "TRAJECTORY STORE (%s) -> replayed: %d, planned (fallback): %d, recorded: %d, entries: %zu (%s)",
+             MODE_.c_str(), REPLAYED_, FALLBACK_, RECORDED_, ENTRIES_.size(), FILE_.c_str());
+    return(std::string(BUFFER));
+}
@@ -0,0 +1,115 @@
+# test_programresolver.py:
+# ProgramResolver -> Resolved poses vs. independently computed FK matrices and known targets (including 180deg tool-down poses).
+
+import ast
+import os
+import sys
+
+import numpy as np
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "python"))
+from urkinematics import FK, PoseToMatrix, Transform, CELL_BASE
+from ProgramResolver import Resolve, JOINTS, k
+
+TOL = 1e-9
+
+
+def MoveJ(Q):
+    return({"action": "MoveJ", "value": {j: float(v) for j, v in zip(JOINTS, Q)}, "speed": 1.0})
+
+
+def RotZYX(YAW, PITCH, ROLL):
+    # (yaw, pitch, roll) [deg] -> Rz(yaw) @ Ry(pitch) @ Rx(roll), built from the elementary rotations:
+    return(Transform([0.0, 0.0, 0.0], [np.radians(ROLL), np.radians(PITCH), np.radians(YAW)])[:3,:3])
+
+
+def Matrix(POSE):
+    return(PoseToMatrix(*POSE))
+
+
+# Tool-down joint configurations [deg] (joint5 = 90 -> tool Z axis pointing down), as in the programs folder:
+TOOL_DOWN = [
+    [-9.13615, -117.5559, -66.32366, -86.14282, 90.0091, 35.86377],
+    [-42.2092, -77.7123, -112.1476, -80.1719, 89.9934, 2.7906],
+    [0.0, -90.0, -90.0, -90.0, 90.0, 0.0],
+    [90.0, -100.0, -80.0, -90.0, 90.0, 180.0],
+    [-135.0, -110.0, -70.0, -90.0, 90.0, -90.0],
+]
+
+
+@pytest.mark.parametrize("ROBOT", ["ur3", "ur5"])
+@pytest.mark.parametrize("LAYOUT", ["cell_layout_1", "cell_layout_2"])
+def test_movej_movel_movej_tool_down(ROBOT, LAYOUT):
+    BASE = Transform(*CELL_BASE[LAYOUT])
+    PROGRAM = []
+    for Q in TOOL_DOWN:
+        PROGRAM += [MoveJ(Q), {"action": "MoveL", "value": {"x": 0.0, "y": 0.0, "z": -0.05}, "speed": 0.2}]
+    PROGRAM.append({"action": "MoveR", "value": {"joint": "joint6", "value": 180.0}, "speed": 1.0})
+
+    RESOLVED = Resolve(ROBOT, PROGRAM, np.array(TOOL_DOWN[0]) * k, BASE)
+
+    for n, (STEP, R) in enumerate(zip(PROGRAM, RESOLVED)):
+        assert R["status"] == "OK"
+        if STEP["action"] == "MoveJ":
+            # Resolved pose == FK of the MoveJ joint values:
+            T_REF = FK(ROBOT, np.array([STEP["value"][j] for j in JOINTS]) * k, BASE=BASE)
+        elif STEP["action"] == "MoveL":
+            # Same orientation, position displaced in world Z:
+            T_REF = FK(ROBOT, np.array([PROGRAM[n-1]["value"][j] for j in JOINTS]) * k, BASE=BASE)
+            T_REF[2,3] = T_REF[2,3] - 0.05
+        else:
+            # MoveR joint6 +180deg from the previous (MoveL) joint values:
+            Q = RESOLVED[n-1]["q"].copy()
+            Q[5] = Q[5] + np.pi
+            T_REF = FK(ROBOT, Q, BASE=BASE)
+        assert np.abs(T_REF[:3,2] - np.array([0.0, 0.0, -1.0])).max() < 1e-3
+        assert np.abs(Matrix(R["pose"]) - T_REF).max() < TOL
+        assert np.abs(FK(ROBOT, R["q"], BASE=BASE) - T_REF).max() < TOL
+
+
+@pytest.mark.parametrize("YPR", [
+    (0.0, 0.0, 180.0), (90.0, 0.0, 180.0), (-90.0, 0.0, 180.0), (180.0, 0.0, 180.0), (45.0, 0.0, 180.0),
+    (0.0, 180.0, 0.0), (30.0, 10.0, 170.0),
+])
+def test_movexyzw_known_targets(YPR):
+    BASE = Transform(*CELL_BASE["cell_layout_1"])
+    TARGET = {"x": 0.35, "y": 0.15, "z": 0.25, "yaw": YPR[0], "pitch": YPR[1], "roll": YPR[2]}
+    PROGRAM = [MoveJ(TOOL_DOWN[2]), {"action": "MoveXYZW", "value": TARGET, "speed": 1.0}]
+
+    R = Resolve("ur5", PROGRAM, np.array(TOOL_DOWN[2]) * k, BASE)[1]
+
+    T_REF = np.eye(4)
+    T_REF[:3,:3] = RotZYX(*YPR)
+    T_REF[:3,3] = [TARGET["x"], TARGET["y"], TARGET["z"]]
+    assert R["status"] == "OK"
+    assert np.abs(Matrix(R["pose"]) - T_REF).max() < TOL
+    assert np.abs(FK("ur5", R["q"], BASE=BASE) - T_REF).max() < TOL
+
+
+def test_moverot_180deg():
+    # Tool-down pose + 180deg rotation around the tool X axis -> Tool pointing up:
+    BASE = Transform(*CELL_BASE["cell_layout_1"])
+    PROGRAM = [MoveJ(TOOL_DOWN[2]), {"action": "MoveROT", "value": {"yaw": 0.0, "pitch": 0.0, "roll": 180.0}, "speed": 1.0}]
+    RESOLVED = Resolve("ur5", PROGRAM, np.array(TOOL_DOWN[2]) * k, BASE)
+
+    T0 = FK("ur5", np.array(TOOL_DOWN[2]) * k, BASE=BASE)
+    T_REF = T0.copy()
+    T_REF[:3,:3] = T0[:3,:3] @ RotZYX(0.0, 0.0, 180.0)
+    assert np.abs(Matrix(RESOLVED[1]["pose"]) - T_REF).max() < TOL
+    assert T_REF[2,2] > 0.999
+
+
+@pytest.mark.parametrize("NAME", ["ur5cubePP", "teamproject_example"])
+def test_program_files(NAME):
+    # Every resolved pose of the shipped programs matches FK of the resolved joint values:
+    with open(os.path.join(HERE, "..", "programs", NAME + ".txt")) as file:
+        PROGRAM = [ast.literal_eval(line) for line in file.readlines() if line.strip() != ""]
+    Q0 = np.array([PROGRAM[0]["value"][j] for j in JOINTS]) * k
+    BASE = Transform(*CELL_BASE["cell_layout_1"])
+
+    for R in Resolve("ur3", PROGRAM, Q0, BASE):
+        if R["pose"] is None or R["status"] != "OK":
+            continue
+        assert np.abs(FK("ur3", R["q"], BASE=BASE) - Matrix(R["pose"])).max() < TOL
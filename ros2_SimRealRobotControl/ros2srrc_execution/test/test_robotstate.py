@@ -0,0 +1,59 @@
+# test_robotstate.py:
+# RobotState.py (--source gazebo) -> EEPose from known Gazebo link states (TCP, BASE_TF), tool-down (180deg) orientations.
+
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("rclpy")
+pytest.importorskip("gazebo_msgs")
+pytest.importorskip("tf2_ros")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python"))
+from RobotState import GazeboEEPose
+
+
+# Gazebo GetEntityState response (only the fields used by RobotState.py):
+def EntityState(XYZ, QUAT):
+    P = SimpleNamespace(position=SimpleNamespace(x=XYZ[0], y=XYZ[1], z=XYZ[2]),
+                        orientation=SimpleNamespace(x=QUAT[0], y=QUAT[1], z=QUAT[2], w=QUAT[3]))
+    return(SimpleNamespace(success=True, pose=P))
+
+
+class GazeboNode:
+    def __init__(self, STATES):
+        self.STATES = STATES
+
+    def GET_ALL(self, names, ref):
+        return([self.STATES[name] for name in names])
+
+
+def QuatZ(ANGLE):
+    return(np.array([0.0, 0.0, np.sin(ANGLE / 2.0), np.cos(ANGLE / 2.0)]))
+
+
+@pytest.mark.parametrize("YAW", [0.0, np.pi / 6.0, np.pi / 2.0, -3.0 * np.pi / 4.0, np.pi])
+def test_gazebo_eepose_tool_down(YAW):
+    # BASE_TF -> cell_layout_2 base (yaw -45deg). TCP -> Tool down (180deg around X), rotated YAW around Z, in the base frame:
+    B_YAW = -0.7854
+    B_XYZ = np.array([-0.25, 0.20, 0.762])
+    REL_XYZ = np.array([0.40, -0.10, 0.15])
+
+    cb, sb = np.cos(B_YAW), np.sin(B_YAW)
+    RB = np.array([[cb, -sb, 0.0], [sb, cb, 0.0], [0.0, 0.0, 1.0]])
+    TCP_XYZ = B_XYZ + RB @ REL_XYZ
+
+    # World TCP quaternion = qz(B_YAW + YAW) * qx(pi) = (cos(a/2), sin(a/2), 0, 0):
+    a = B_YAW + YAW
+    TCP_Q = np.array([np.cos(a / 2.0), np.sin(a / 2.0), 0.0, 0.0])
+
+    node = GazeboNode({"TCP": EntityState(TCP_XYZ, TCP_Q), "BASE_TF": EntityState(B_XYZ, QuatZ(B_YAW))})
+    XYZ, QUAT = GazeboEEPose(node)
+
+    # Expected (base frame): qz(YAW) * qx(pi) = (cos(YAW/2), sin(YAW/2), 0, 0), up to sign:
+    Q_REF = np.array([np.cos(YAW / 2.0), np.sin(YAW / 2.0), 0.0, 0.0])
+    assert np.allclose(XYZ, REL_XYZ, atol=1e-9)
+    assert abs(abs(np.dot(QUAT, Q_REF)) - 1.0) < 1e-9
@@ -0,0 +1,78 @@
+# test_urkinematics.py:
+# MatrixToPose/PoseToMatrix round trips -> Random rotations, exact 180deg rotations and tool-down UR poses.
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python"))
+from urkinematics import FK, MatrixToPose, PoseToMatrix
+
+
+def AxisAngle(AXIS, ANGLE):
+    AXIS = np.asarray(AXIS, dtype=float)
+    AXIS = AXIS / np.linalg.norm(AXIS)
+    return(np.append(AXIS * np.sin(ANGLE / 2.0), np.cos(ANGLE / 2.0)))
+
+
+def SameRotation(QA, QB):
+    # q and -q are the same rotation:
+    return(np.allclose(np.abs(np.sum(QA * QB, axis=-1)), 1.0, atol=1e-9))
+
+
+def test_random_rotations():
+    rng = np.random.default_rng(0)
+    Q = rng.normal(size=(20000, 4))
+    Q = Q / np.linalg.norm(Q, axis=-1, keepdims=True)
+    T = PoseToMatrix(rng.uniform(-1.0, 1.0, size=(20000, 3)), Q)
+
+    XYZ, Q2 = MatrixToPose(T)
+    assert np.allclose(XYZ, T[:,:3,3])
+    assert SameRotation(Q, Q2)
+    assert np.all(Q2[:,3] >= 0.0)
+    assert np.abs(PoseToMatrix(XYZ, Q2) - T).max() < 1e-12
+
+
+@pytest.mark.parametrize("AXIS", [
+    (1, 0, 0), (0, 1, 0), (0, 0, 1),
+    (1, 1, 0), (1, -1, 0), (1, 0, 1), (1, 0, -1), (0, 1, 1), (0, 1, -1),
+    (1, 1, 1), (1, -1, 1), (1, 1, -1), (-1, 1, 1),
+])
+def test_180deg_rotations(AXIS):
+    Q = AxisAngle(AXIS, np.pi)
+    T = PoseToMatrix(np.zeros(3), Q)
+    _, Q2 = MatrixToPose(T)
+    assert SameRotation(Q, Q2)
+    assert np.abs(PoseToMatrix(np.zeros(3), Q2) - T).max() < 1e-12
+
+
+def test_near_180deg_rotation():
+    # q = (cos2, sin2, 0, 0) as (qw,qx,qy,qz) -> qw ~ -0.42:
+    Q = np.array([np.sin(2.0), 0.0, 0.0, np.cos(2.0)])
+    _, Q2 = MatrixToPose(PoseToMatrix(np.zeros(3), Q))
+    assert SameRotation(Q, Q2)
+
+
+def test_tool_down_fk_poses():
+    # Tool-down UR configurations (q4 = -pi/2 - q2 - q3, q5 = -pi/2) with random q1/q6, and 180deg about the base X axis:
+    rng = np.random.default_rng(1)
+    N = 5000
+    Q = np.zeros((N, 6))
+    Q[:,0] = rng.uniform(-np.pi, np.pi, N)
+    Q[:,1] = rng.uniform(-2.0, -1.0, N)
+    Q[:,2] = rng.uniform(1.0, 2.0, N)
+    Q[:,3] = -np.pi/2.0 - Q[:,1] - Q[:,2]
+    Q[:,4] = -np.pi/2.0
+    Q[:,5] = rng.uniform(-np.pi, np.pi, N)
+
+    for ROBOT in ("ur3", "ur5"):
+        T = FK(ROBOT, Q)
+        assert np.allclose(T[:,2,2], -1.0)
+        XYZ, QUAT = MatrixToPose(T)
+        assert np.abs(PoseToMatrix(XYZ, QUAT) - T).max() < 1e-9
+
+    T = PoseToMatrix([0.3, 0.1, 0.2], [1.0, 0.0, 0.0, 0.0])
+    _, QUAT = MatrixToPose(T)
+    assert SameRotation(QUAT, np.array([1.0, 0.0, 0.0, 0.0]))
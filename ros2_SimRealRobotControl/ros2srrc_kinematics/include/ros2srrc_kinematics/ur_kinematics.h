@@ -0,0 +1,74 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef UR_KINEMATICS_H
+#define UR_KINEMATICS_H
+
+// Include standard libraries:
+#include <vector>
+
+// Include Eigen:
+#include <Eigen/Geometry>
+
+namespace ros2srrc_kinematics
+{
+
+// UR DH PARAMETERS -> Same values as the d1, a2, a3, d4, d5 and d6 xacro:properties in urX_common.xacro:
+struct URParams {
+  double d1;
+  double a2;
+  double a3;
+  double d4;
+  double d5;
+  double d6;
+};
+
+// Maximum number of CLOSED-FORM solutions for a single pose:
+const int UR_MAX_SOLUTIONS = 8;
+
+// FORWARD KINEMATICS -> Pose of tool0 relative to base_link, for the 6 joint values q[0..5]:
+Eigen::Isometry3d URForward(const URParams & P, const double * q);
+
+// INVERSE KINEMATICS -> All solutions (max. 8) for the tool0 pose T (relative to base_link).
+// Joint values are returned in [-pi, pi]. When the wrist is singular (sin(q5) = 0), q6 = q6_default.
+// Returns the number of solutions written into q_sols.
+int URInverse(const URParams & P, const Eigen::Isometry3d & T, double q_sols[UR_MAX_SOLUTIONS][6], double q6_default = 0.0);
+
+// Shift every joint value by 2*pi*k (within [LL, UL]) so that it is as close as possible to the SEED.
+// Returns false if any joint value cannot be placed inside its limits.
+bool URHarmonize(double q[6], const std::vector<double> & SEED, const std::vector<double> & LL, const std::vector<double> & UL);
+
+// Index of the solution closest to the SEED (L2 joint-space distance), -1 if none is within limits.
+// Solutions are harmonized in place.
+int URNearestSolution(double q_sols[UR_MAX_SOLUTIONS][6], int num_sols, const std::vector<double> & SEED, const std::vector<double> & LL, const std::vector<double> & UL);
+
+}  // namespace ros2srrc_kinematics
+
+#endif /* UR_KINEMATICS_H */
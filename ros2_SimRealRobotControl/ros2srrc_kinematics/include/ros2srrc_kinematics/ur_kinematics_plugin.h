@@ -0,0 +1,124 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#ifndef UR_KINEMATICS_PLUGIN_H
+#define UR_KINEMATICS_PLUGIN_H
+
+// Include standard libraries:
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit/kinematics_base/kinematics_base.h>
+#include <moveit/robot_model/robot_model.h>
+#include <moveit/robot_state/robot_state.h>
+
+// Include the closed-form UR solver:
+#include "ros2srrc_kinematics/ur_kinematics.h"
+
+namespace ros2srrc_kinematics
+{
+
+// MoveIt!2 kinematics plugin -> Closed-form IK for the UR arms (chain base_link -> tool0).
+// Selected in kinematics.yaml:
+//   urX_arm:
+//     kinematics_solver: ros2srrc_kinematics/URKinematicsPlugin
+//     dh_d1: ... (dh_a2, dh_a3, dh_d4, dh_d5, dh_d6)
+// searchPositionIK: The timeout limits the solution callback checks. KinematicsQueryOptions: lock_redundant_joints has no effect
+// (no redundant joints), return_approximate_solution is not supported (exact solutions only, a warning is logged).
+class URKinematicsPlugin : public kinematics::KinematicsBase
+{
+public:
+    URKinematicsPlugin();
+
+    bool initialize(const rclcpp::Node::SharedPtr & node, const moveit::core::RobotModel & robot_model,
+                    const std::string & group_name, const std::string & base_frame,
+                    const std::vector<std::string> & tip_frames, double search_discretization) override;
+
+    bool getPositionIK(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                       std::vector<double> & solution, moveit_msgs::msg::MoveItErrorCodes & error_code,
+                       const kinematics::KinematicsQueryOptions & options = kinematics::KinematicsQueryOptions()) const override;
+
+    // ALL closed-form solutions (max. 8), sorted by distance to the seed:
+    bool getPositionIK(const std::vector<geometry_msgs::msg::Pose> & ik_poses, const std::vector<double> & ik_seed_state,
+                       std::vector<std::vector<double>> & solutions, kinematics::KinematicsResult & result,
+                       const kinematics::KinematicsQueryOptions & options) const override;
+
+    bool searchPositionIK(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                          double timeout, std::vector<double> & solution, moveit_msgs::msg::MoveItErrorCodes & error_code,
+                          const kinematics::KinematicsQueryOptions & options = kinematics::KinematicsQueryOptions()) const override;
+
+    bool searchPositionIK(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                          double timeout, const std::vector<double> & consistency_limits, std::vector<double> & solution,
+                          moveit_msgs::msg::MoveItErrorCodes & error_code,
+                          const kinematics::KinematicsQueryOptions & options = kinematics::KinematicsQueryOptions()) const override;
+
+    bool searchPositionIK(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                          double timeout, std::vector<double> & solution, const IKCallbackFn & solution_callback,
+                          moveit_msgs::msg::MoveItErrorCodes & error_code,
+                          const kinematics::KinematicsQueryOptions & options = kinematics::KinematicsQueryOptions()) const override;
+
+    bool searchPositionIK(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                          double timeout, const std::vector<double> & consistency_limits, std::vector<double> & solution,
+                          const IKCallbackFn & solution_callback, moveit_msgs::msg::MoveItErrorCodes & error_code,
+                          const kinematics::KinematicsQueryOptions & options = kinematics::KinematicsQueryOptions()) const override;
+
+    bool getPositionFK(const std::vector<std::string> & link_names, const std::vector<double> & joint_angles,
+                       std::vector<geometry_msgs::msg::Pose> & poses) const override;
+
+    const std::vector<std::string> & getJointNames() const override;
+    const std::vector<std::string> & getLinkNames() const override;
+
+private:
+    // Unsupported KinematicsQueryOptions -> Warning (once):
+    void checkOptions(const kinematics::KinematicsQueryOptions & options) const;
+
+    // Closed-form solutions for ik_pose, harmonized and sorted by distance to the seed:
+    int solveSorted(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                    std::vector<std::vector<double>> & solutions) const;
+
+    rclcpp::Node::SharedPtr node_;
+    const moveit::core::JointModelGroup * joint_model_group_;
+    moveit::core::RobotStatePtr state_;
+
+    URParams PARAMS;
+    std::vector<std::string> joint_names_;
+    std::vector<std::string> link_names_;
+    std::vector<double> LL;
+    std::vector<double> UL;
+    bool active_;
+};
+
+}  // namespace ros2srrc_kinematics
+
+#endif /* UR_KINEMATICS_PLUGIN_H */
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+
+# ik_benchmark.launch.py:
+# IK benchmark (URKinematicsPlugin vs. KDLKinematicsPlugin) for the ur3/ur5 robots. No Gazebo/MoveIt!2 needed.
+# COMMAND -> ros2 launch ros2srrc_kinematics ik_benchmark.launch.py ROBOT:=ur5 SAMPLES:=1000
+
+# Import libraries:
+import os
+from ament_index_python.packages import get_package_share_directory
+from launch import LaunchDescription
+from launch.actions import DeclareLaunchArgument, OpaqueFunction
+from launch.substitutions import LaunchConfiguration
+from launch_ros.actions import Node
+import sys
+import yaml
+
+# XACRO CACHE (ros2srrc_execution/python/xacrocache.py):
+sys.path.append(os.path.join(get_package_share_directory("ros2srrc_execution"), "python"))
+from xacrocache import ProcessXacro
+
+def launch_setup(context, *args, **kwargs):
+
+    ROBOT = LaunchConfiguration("ROBOT").perform(context)
+    SAMPLES = int(LaunchConfiguration("SAMPLES").perform(context))
+
+    # ROBOT DESCRIPTION (robot alone, no end-effector):
+    xacro_file = os.path.join(get_package_share_directory("ros2srrc_" + ROBOT + "_gazebo"), "urdf", ROBOT + ".urdf.xacro")
+    robot_description = {"robot_description": ProcessXacro(xacro_file, mappings={
+        "cell_layout_1": "true",
+        "cell_layout_2": "false",
+        "cell_layout_3": "false",
+        "EE_no": "true",
+        "EE_robotiq": "false",
+        }, log=print)}
+
+    # SRDF + kinematics.yaml:
+    moveit2_path = get_package_share_directory("ros2srrc_" + ROBOT + "_moveit2")
+    with open(os.path.join(moveit2_path, "config", ROBOT + ".srdf"), "r") as file:
+        robot_description_semantic = {"robot_description_semantic": file.read()}
+    with open(os.path.join(moveit2_path, "config", "kinematics.yaml"), "r") as file:
+        kinematics_yaml = yaml.safe_load(file)
+
+    benchmark = Node(
+        package="ros2srrc_kinematics",
+        executable="ik_benchmark",
+        output="screen",
+        parameters=[robot_description, robot_description_semantic, kinematics_yaml, {"GROUP": ROBOT + "_arm"}, {"SAMPLES": SAMPLES}],
+    )
+
+    return [benchmark]
+
+def generate_launch_description():
+    return LaunchDescription([
+        DeclareLaunchArgument("ROBOT", default_value="ur5", description="Robot model: ur3 - ur5."),
+        DeclareLaunchArgument("SAMPLES", default_value="1000", description="Number of random reachable poses."),
+        OpaqueFunction(function=launch_setup),
+    ])
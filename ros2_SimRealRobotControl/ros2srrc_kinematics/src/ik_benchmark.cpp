@@ -0,0 +1,182 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+// ik_benchmark.cpp:
+// IK BENCHMARK -> URKinematicsPlugin vs. KDLKinematicsPlugin on random REACHABLE poses.
+// The poses are obtained from the FK of random joint configurations, and both solvers are seeded with another random configuration.
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <memory>
+#include <string>
+#include <vector>
+
+// Include RCLCPP:
+#include "rclcpp/rclcpp.hpp"
+
+// Include MoveIt!2:
+#include <moveit/kinematics_base/kinematics_base.h>
+#include <moveit/robot_model_loader/robot_model_loader.h>
+#include <moveit/robot_state/robot_state.h>
+
+// Include TF2 <-> Eigen conversions:
+#include <tf2_eigen/tf2_eigen.hpp>
+
+// Include PLUGINLIB:
+#include <pluginlib/class_loader.hpp>
+
+struct BenchRESULT {
+    std::string NAME;
+    int SOLVED = 0;
+    double MAX_ERR = 0.0;
+    std::vector<double> TIMES;  // [us]
+};
+
+BenchRESULT RunBenchmark(const std::string & NAME, const kinematics::KinematicsBasePtr & SOLVER,
+                         const std::vector<geometry_msgs::msg::Pose> & POSES, const std::vector<std::vector<double>> & SEEDS,
+                         moveit::core::RobotState & STATE, const moveit::core::JointModelGroup * JMG,
+                         const std::string & BASE, const std::string & TIP)
+{
+    BenchRESULT RESULT;
+    RESULT.NAME = NAME;
+
+    for (size_t i = 0; i < POSES.size(); i++){
+
+        std::vector<double> SOLUTION;
+        moveit_msgs::msg::MoveItErrorCodes ERROR_CODE;
+
+        auto t0 = std::chrono::steady_clock::now();
+        bool OK = SOLVER->searchPositionIK(POSES[i], SEEDS[i], 0.05, SOLUTION, ERROR_CODE);
+        auto t1 = std::chrono::steady_clock::now();
+        RESULT.TIMES.push_back(std::chrono::duration<double, std::micro>(t1 - t0).count());
+
+        if (!OK){
+            continue;
+        }
+
+        // Check the solution -> FK with MoveIt!2 (independent of both solvers):
+        STATE.setJointGroupPositions(JMG, SOLUTION);
+        STATE.updateLinkTransforms();
+        Eigen::Isometry3d T_REACHED = STATE.getGlobalLinkTransform(BASE).inverse() * STATE.getGlobalLinkTransform(TIP);
+        Eigen::Isometry3d T_GOAL;
+        tf2::fromMsg(POSES[i], T_GOAL);
+        double ERR = (T_REACHED.matrix() - T_GOAL.matrix()).cwiseAbs().maxCoeff();
+        RESULT.MAX_ERR = std::max(RESULT.MAX_ERR, ERR);
+
+        RESULT.SOLVED = RESULT.SOLVED + 1;
+    }
+
+    return(RESULT);
+}
+
+void PrintResult(const rclcpp::Logger & logger, BenchRESULT R)
+{
+    std::sort(R.TIMES.begin(), R.TIMES.end());
+    double MEAN = 0.0;
+    for (double t : R.TIMES){
+        MEAN = MEAN + t;
+    }
+    MEAN = MEAN / R.TIMES.size();
+    double MEDIAN = R.TIMES[R.TIMES.size() / 2];
+    double P99 = R.TIMES[(R.TIMES.size() * 99) / 100];
+
+    RCLCPP_INFO(logger, "%s -> SOLVED: %d/%zu (%.1f%%) | TIME [us] mean: %.1f, median: %.1f, p99: %.1f | MAX POSE ERROR: %.2e",
+                R.NAME.c_str(), R.SOLVED, R.TIMES.size(), 100.0 * R.SOLVED / R.TIMES.size(), MEAN, MEDIAN, P99, R.MAX_ERR);
+}
+
+// ===================================================================================== //
+// ======================================= MAIN ======================================== //
+// ===================================================================================== //
+
+int main(int argc, char ** argv)
+{
+    // Initialise MAIN NODE:
+    rclcpp::init(argc, argv);
+    auto const node = std::make_shared<rclcpp::Node>(
+        "ros2srrc_ik_benchmark", rclcpp::NodeOptions().automatically_declare_parameters_from_overrides(true));
+    auto const logger = node->get_logger();
+
+    // Obtain parameters:
+    std::string GROUP = "ur5_arm";
+    int SAMPLES = 1000;
+    node->get_parameter("GROUP", GROUP);
+    node->get_parameter("SAMPLES", SAMPLES);
+
+    // Load ROBOT MODEL:
+    robot_model_loader::RobotModelLoader LOADER(node, "robot_description", false);
+    const moveit::core::RobotModelPtr & MODEL = LOADER.getModel();
+    if (!MODEL){
+        RCLCPP_ERROR(logger, "Robot model could not be loaded.");
+        rclcpp::shutdown();
+        return 1;
+    }
+    const moveit::core::JointModelGroup * JMG = MODEL->getJointModelGroup(GROUP);
+    if (!JMG){
+        RCLCPP_ERROR(logger, "Planning group %s not found.", GROUP.c_str());
+        rclcpp::shutdown();
+        return 1;
+    }
+    const std::string BASE = JMG->getJointModels().front()->getParentLinkModel()->getName();
+    const std::string TIP = JMG->getLinkModelNames().back();
+
+    // Load KINEMATICS PLUGINS:
+    pluginlib::ClassLoader<kinematics::KinematicsBase> PLUGIN_LOADER("moveit_core", "kinematics::KinematicsBase");
+    kinematics::KinematicsBasePtr UR = PLUGIN_LOADER.createUniqueInstance("ros2srrc_kinematics/URKinematicsPlugin");
+    kinematics::KinematicsBasePtr KDL = PLUGIN_LOADER.createUniqueInstance("kdl_kinematics_plugin/KDLKinematicsPlugin");
+    if (!UR->initialize(node, *MODEL, GROUP, BASE, {TIP}, 0.005) || !KDL->initialize(node, *MODEL, GROUP, BASE, {TIP}, 0.005)){
+        RCLCPP_ERROR(logger, "Kinematics plugins could not be initialised.");
+        rclcpp::shutdown();
+        return 1;
+    }
+
+    // Random REACHABLE poses + random seeds:
+    moveit::core::RobotState STATE(MODEL);
+    STATE.setToDefaultValues();
+    std::vector<geometry_msgs::msg::Pose> POSES;
+    std::vector<std::vector<double>> SEEDS;
+    for (int i = 0; i < SAMPLES; i++){
+        STATE.setToRandomPositions(JMG);
+        STATE.updateLinkTransforms();
+        POSES.push_back(tf2::toMsg(Eigen::Isometry3d(STATE.getGlobalLinkTransform(BASE).inverse() * STATE.getGlobalLinkTransform(TIP))));
+
+        std::vector<double> SEED;
+        STATE.setToRandomPositions(JMG);
+        STATE.copyJointGroupPositions(JMG, SEED);
+        SEEDS.push_back(SEED);
+    }
+
+    RCLCPP_INFO(logger, "IK BENCHMARK -> Group: %s (%s -> %s), %d random reachable poses.", GROUP.c_str(), BASE.c_str(), TIP.c_str(), SAMPLES);
+    PrintResult(logger, RunBenchmark("URKinematicsPlugin ", UR, POSES, SEEDS, STATE, JMG, BASE, TIP));
+    PrintResult(logger, RunBenchmark("KDLKinematicsPlugin", KDL, POSES, SEEDS, STATE, JMG, BASE, TIP));
+
+    rclcpp::shutdown();
+    return 0;
+}
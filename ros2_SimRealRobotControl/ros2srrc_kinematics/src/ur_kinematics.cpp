@@ -0,0 +1,242 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+// Closed-form inverse kinematics for the Universal Robots (UR3, UR5, ...) arms.
+// REFERENCE: K. P. Hawkins (2013), "Analytic Inverse Kinematics for the Universal Robots UR-5/UR-10 Arms".
+
+#include "ros2srrc_kinematics/ur_kinematics.h"
+
+// Include standard libraries:
+#include <cmath>
+#include <limits>
+#include <vector>
+
+namespace ros2srrc_kinematics
+{
+
+// Declaration of CONSTANT VALUES:
+const double pi = 3.14159265358979323846;
+const double ZERO_THRESH = 1e-8;
+
+// base_link -> base_link_inertia: the UR description rotates the DH base frame by pi around Z.
+static const Eigen::Isometry3d BASE_ROT(Eigen::AngleAxisd(pi, Eigen::Vector3d::UnitZ()));
+
+// Standard DH transform:
+static Eigen::Isometry3d DH(double a, double alpha, double d, double theta)
+{
+    double ct = cos(theta);
+    double st = sin(theta);
+    double ca = cos(alpha);
+    double sa = sin(alpha);
+
+    Eigen::Matrix4d M;
+    M << ct, -st*ca,  st*sa, a*ct,
+         st,  ct*ca, -ct*sa, a*st,
+         0.0,    sa,     ca,    d,
+         0.0,   0.0,    0.0,  1.0;
+
+    return Eigen::Isometry3d(M);
+}
+
+// Wrap angle into [-pi, pi]:
+static double WRAP(double a)
+{
+    a = fmod(a + pi, 2.0*pi);
+    if (a < 0.0){
+        a = a + 2.0*pi;
+    }
+    return(a - pi);
+}
+
+// Safe acos -> Returns false if |x| > 1 (no real solution):
+static bool ACOS(double x, double & RES)
+{
+    if (fabs(x) > 1.0){
+        if (fabs(x) > 1.0 + ZERO_THRESH){
+            return false;
+        }
+        x = (x > 0.0) ? 1.0 : -1.0;
+    }
+    RES = acos(x);
+    return true;
+}
+
+// ===== FORWARD KINEMATICS ===== //
+Eigen::Isometry3d URForward(const URParams & P, const double * q)
+{
+    Eigen::Isometry3d T06 = DH(0.0, pi/2.0, P.d1, q[0])
+                          * DH(P.a2, 0.0, 0.0, q[1])
+                          * DH(P.a3, 0.0, 0.0, q[2])
+                          * DH(0.0, pi/2.0, P.d4, q[3])
+                          * DH(0.0, -pi/2.0, P.d5, q[4])
+                          * DH(0.0, 0.0, P.d6, q[5]);
+
+    return(BASE_ROT * T06);
+}
+
+// ===== INVERSE KINEMATICS ===== //
+int URInverse(const URParams & P, const Eigen::Isometry3d & T, double q_sols[UR_MAX_SOLUTIONS][6], double q6_default)
+{
+    int num_sols = 0;
+
+    // 1. Pose in the DH base frame:
+    const Eigen::Isometry3d T06 = BASE_ROT * T;
+    const Eigen::Matrix3d R = T06.linear();
+    const Eigen::Vector3d p = T06.translation();
+
+    // 2. SHOULDER PAN (q1) -> From the wrist centre (frame 5):
+    const Eigen::Vector3d p05 = p - P.d6 * R.col(2);
+    const double r05 = hypot(p05.x(), p05.y());
+    if (r05 < ZERO_THRESH){
+        return 0;  // Wrist centre on the q1 axis -> infinite solutions, not handled.
+    }
+    double phi;
+    if (!ACOS(P.d4 / r05, phi)){
+        return 0;
+    }
+    const double psi = atan2(p05.y(), p05.x());
+    const double q1_opts[2] = {psi + phi + pi/2.0, psi - phi + pi/2.0};
+
+    for (int i = 0; i < 2; i++){
+
+        const double q1 = q1_opts[i];
+        const double s1 = sin(q1);
+        const double c1 = cos(q1);
+
+        // 3. WRIST 2 (q5) -> cos(q5) from the position, |sin(q5)| from the orientation. acos() alone is ill-conditioned near q5 = 0
+        //    (a rounding error of 1e-16 gives q5 ~ 1e-8), which made the singularity check below miss exact wrist singularities:
+        const double c5 = (p.x()*s1 - p.y()*c1 - P.d4) / P.d6;
+        if (fabs(c5) > 1.0 + ZERO_THRESH){
+            continue;
+        }
+        const double Y6 = -R(0,1)*s1 + R(1,1)*c1;   //  sin(q5) * sin(q6)
+        const double X6 = R(0,0)*s1 - R(1,0)*c1;    //  sin(q5) * cos(q6)
+        const double s5_abs = hypot(X6, Y6);
+        const double q5_abs = atan2(s5_abs, c5);
+
+        for (int j = 0; j < 2; j++){
+
+            const double q5 = (j == 0) ? q5_abs : -q5_abs;
+            const double s5 = (j == 0) ? s5_abs : -s5_abs;
+
+            // 4. WRIST 3 (q6) -> WRIST SINGULARITY (sin(q5) = 0): q4 and q6 are coupled, q6 = q6_default:
+            double q6;
+            if (s5_abs < ZERO_THRESH){
+                q6 = q6_default;
+            } else {
+                q6 = atan2(Y6 / s5, X6 / s5);
+            }
+
+            // 5. ELBOW (q3) -> Planar 2R problem (frame 1 to frame 3):
+            const Eigen::Isometry3d T14 = DH(0.0, pi/2.0, P.d1, q1).inverse() * T06 * (DH(0.0, -pi/2.0, P.d5, q5) * DH(0.0, 0.0, P.d6, q6)).inverse();
+            const Eigen::Vector3d p13 = T14 * Eigen::Vector3d(0.0, -P.d4, 0.0);
+            const double L = p13.norm();
+
+            double q3_abs;
+            if (!ACOS((L*L - P.a2*P.a2 - P.a3*P.a3) / (2.0*P.a2*P.a3), q3_abs)){
+                continue;
+            }
+
+            for (int k = 0; k < 2; k++){
+
+                const double q3 = (k == 0) ? q3_abs : -q3_abs;
+
+                // 6. SHOULDER LIFT (q2):
+                const double q2 = atan2(p13.y(), p13.x()) - atan2(P.a3*sin(q3), P.a2 + P.a3*cos(q3));
+
+                // 7. WRIST 1 (q4):
+                const Eigen::Isometry3d T34 = (DH(P.a2, 0.0, 0.0, q2) * DH(P.a3, 0.0, 0.0, q3)).inverse() * T14;
+                const double q4 = atan2(T34(1,0), T34(0,0));
+
+                q_sols[num_sols][0] = WRAP(q1);
+                q_sols[num_sols][1] = WRAP(q2);
+                q_sols[num_sols][2] = WRAP(q3);
+                q_sols[num_sols][3] = WRAP(q4);
+                q_sols[num_sols][4] = WRAP(q5);
+                q_sols[num_sols][5] = WRAP(q6);
+                num_sols = num_sols + 1;
+
+            }
+        }
+    }
+
+    return(num_sols);
+}
+
+// ===== SEED HANDLING ===== //
+bool URHarmonize(double q[6], const std::vector<double> & SEED, const std::vector<double> & LL, const std::vector<double> & UL)
+{
+    for (int i = 0; i < 6; i++){
+
+        // Closest 2*pi multiple to the seed:
+        double v = q[i] + 2.0*pi*std::round((SEED[i] - q[i]) / (2.0*pi));
+
+        // Move it back inside the limits, if possible:
+        while (v > UL[i]){
+            v = v - 2.0*pi;
+        }
+        while (v < LL[i]){
+            v = v + 2.0*pi;
+        }
+        if (v > UL[i]){
+            return false;
+        }
+
+        q[i] = v;
+    }
+    return true;
+}
+
+int URNearestSolution(double q_sols[UR_MAX_SOLUTIONS][6], int num_sols, const std::vector<double> & SEED, const std::vector<double> & LL, const std::vector<double> & UL)
+{
+    int BEST = -1;
+    double BEST_DIST = std::numeric_limits<double>::max();
+
+    for (int i = 0; i < num_sols; i++){
+
+        if (!URHarmonize(q_sols[i], SEED, LL, UL)){
+            continue;
+        }
+
+        double DIST = 0.0;
+        for (int j = 0; j < 6; j++){
+            DIST = DIST + (q_sols[i][j] - SEED[j]) * (q_sols[i][j] - SEED[j]);
+        }
+
+        if (DIST < BEST_DIST){
+            BEST_DIST = DIST;
+            BEST = i;
+        }
+    }
+
+    return(BEST);
+}
+
+}  // namespace ros2srrc_kinematics
@@ -0,0 +1,294 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+#include "ros2srrc_kinematics/ur_kinematics_plugin.h"
+
+// Include standard libraries:
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <string>
+#include <vector>
+
+// Include TF2 <-> Eigen conversions:
+#include <tf2_eigen/tf2_eigen.hpp>
+
+// Include PLUGINLIB:
+#include <pluginlib/class_list_macros.hpp>
+
+namespace ros2srrc_kinematics
+{
+
+static rclcpp::Logger LOGGER = rclcpp::get_logger("ros2srrc_kinematics.ur_kinematics_plugin");
+
+URKinematicsPlugin::URKinematicsPlugin() : joint_model_group_(nullptr), active_(false)
+{
+}
+
+bool URKinematicsPlugin::initialize(const rclcpp::Node::SharedPtr & node, const moveit::core::RobotModel & robot_model,
+                                    const std::string & group_name, const std::string & base_frame,
+                                    const std::vector<std::string> & tip_frames, double search_discretization)
+{
+    node_ = node;
+    storeValues(robot_model, group_name, base_frame, tip_frames, search_discretization);
+
+    // 1. Check the PLANNING GROUP -> 6-DOF serial chain:
+    joint_model_group_ = robot_model_->getJointModelGroup(group_name);
+    if (!joint_model_group_){
+        RCLCPP_ERROR(LOGGER, "Planning group %s not found in the robot model.", group_name.c_str());
+        return false;
+    }
+    if (!joint_model_group_->isChain() || joint_model_group_->getActiveJointModels().size() != 6){
+        RCLCPP_ERROR(LOGGER, "Group %s is not a 6-DOF chain. URKinematicsPlugin only supports UR arms.", group_name.c_str());
+        return false;
+    }
+    if (tip_frames.size() != 1){
+        RCLCPP_ERROR(LOGGER, "URKinematicsPlugin only supports a single tip frame.");
+        return false;
+    }
+
+    // 2. Joint names + JOINT LIMITS (from the URDF):
+    joint_names_.clear();
+    LL.clear();
+    UL.clear();
+    for (const moveit::core::JointModel * JM : joint_model_group_->getActiveJointModels()){
+        joint_names_.push_back(JM->getName());
+        const moveit::core::VariableBounds & BOUNDS = JM->getVariableBounds()[0];
+        LL.push_back(BOUNDS.position_bounded_ ? BOUNDS.min_position_ : -2.0*M_PI);
+        UL.push_back(BOUNDS.position_bounded_ ? BOUNDS.max_position_ : 2.0*M_PI);
+    }
+    link_names_ = tip_frames;
+
+    // 3. DH PARAMETERS (kinematics.yaml):
+    bool FOUND = true;
+    FOUND = lookupParam(node, "dh_d1", PARAMS.d1, 0.0) && FOUND;
+    FOUND = lookupParam(node, "dh_a2", PARAMS.a2, 0.0) && FOUND;
+    FOUND = lookupParam(node, "dh_a3", PARAMS.a3, 0.0) && FOUND;
+    FOUND = lookupParam(node, "dh_d4", PARAMS.d4, 0.0) && FOUND;
+    FOUND = lookupParam(node, "dh_d5", PARAMS.d5, 0.0) && FOUND;
+    FOUND = lookupParam(node, "dh_d6", PARAMS.d6, 0.0) && FOUND;
+    if (!FOUND){
+        RCLCPP_ERROR(LOGGER, "DH parameters (dh_d1, dh_a2, dh_a3, dh_d4, dh_d5, dh_d6) missing for group %s in kinematics.yaml.", group_name.c_str());
+        return false;
+    }
+
+    state_ = std::make_shared<moveit::core::RobotState>(robot_model_);
+    state_->setToDefaultValues();
+
+    active_ = true;
+    RCLCPP_INFO(LOGGER, "URKinematicsPlugin initialised for group %s (%s -> %s).", group_name.c_str(), base_frame.c_str(), tip_frames[0].c_str());
+    return true;
+}
+
+int URKinematicsPlugin::solveSorted(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                                    std::vector<std::vector<double>> & solutions) const
+{
+    solutions.clear();
+
+    Eigen::Isometry3d T;
+    tf2::fromMsg(ik_pose, T);
+
+    double q_sols[UR_MAX_SOLUTIONS][6];
+    const int num_sols = URInverse(PARAMS, T, q_sols, ik_seed_state[5]);
+
+    for (int i = 0; i < num_sols; i++){
+        if (URHarmonize(q_sols[i], ik_seed_state, LL, UL)){
+            solutions.emplace_back(q_sols[i], q_sols[i] + 6);
+        }
+    }
+
+    // Sort by joint-space distance to the seed:
+    auto DIST = [&ik_seed_state](const std::vector<double> & q) {
+        double d = 0.0;
+        for (size_t j = 0; j < q.size(); j++){
+            d = d + (q[j] - ik_seed_state[j]) * (q[j] - ik_seed_state[j]);
+        }
+        return d;
+    };
+    std::sort(solutions.begin(), solutions.end(),
+              [&DIST](const std::vector<double> & A, const std::vector<double> & B) { return DIST(A) < DIST(B); });
+
+    return(static_cast<int>(solutions.size()));
+}
+
+bool URKinematicsPlugin::getPositionIK(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                                       std::vector<double> & solution, moveit_msgs::msg::MoveItErrorCodes & error_code,
+                                       const kinematics::KinematicsQueryOptions & options) const
+{
+    std::vector<double> consistency_limits;
+    return searchPositionIK(ik_pose, ik_seed_state, default_timeout_, consistency_limits, solution, IKCallbackFn(), error_code, options);
+}
+
+bool URKinematicsPlugin::getPositionIK(const std::vector<geometry_msgs::msg::Pose> & ik_poses, const std::vector<double> & ik_seed_state,
+                                       std::vector<std::vector<double>> & solutions, kinematics::KinematicsResult & result,
+                                       const kinematics::KinematicsQueryOptions & options) const
+{
+    checkOptions(options);
+
+    if (!active_ || ik_poses.size() != 1 || ik_seed_state.size() != 6){
+        result.kinematic_error = kinematics::KinematicErrors::SOLVER_NOT_ACTIVE;
+        return false;
+    }
+
+    solveSorted(ik_poses[0], ik_seed_state, solutions);
+
+    if (solutions.empty()){
+        result.kinematic_error = kinematics::KinematicErrors::NO_SOLUTION;
+        result.solution_percentage = 0.0;
+        return false;
+    }
+
+    result.kinematic_error = kinematics::KinematicErrors::OK;
+    result.solution_percentage = 1.0;
+    return true;
+}
+
+bool URKinematicsPlugin::searchPositionIK(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                                          double timeout, std::vector<double> & solution, moveit_msgs::msg::MoveItErrorCodes & error_code,
+                                          const kinematics::KinematicsQueryOptions & options) const
+{
+    std::vector<double> consistency_limits;
+    return searchPositionIK(ik_pose, ik_seed_state, timeout, consistency_limits, solution, IKCallbackFn(), error_code, options);
+}
+
+bool URKinematicsPlugin::searchPositionIK(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                                          double timeout, const std::vector<double> & consistency_limits, std::vector<double> & solution,
+                                          moveit_msgs::msg::MoveItErrorCodes & error_code,
+                                          const kinematics::KinematicsQueryOptions & options) const
+{
+    return searchPositionIK(ik_pose, ik_seed_state, timeout, consistency_limits, solution, IKCallbackFn(), error_code, options);
+}
+
+bool URKinematicsPlugin::searchPositionIK(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                                          double timeout, std::vector<double> & solution, const IKCallbackFn & solution_callback,
+                                          moveit_msgs::msg::MoveItErrorCodes & error_code,
+                                          const kinematics::KinematicsQueryOptions & options) const
+{
+    std::vector<double> consistency_limits;
+    return searchPositionIK(ik_pose, ik_seed_state, timeout, consistency_limits, solution, solution_callback, error_code, options);
+}
+
+// KinematicsQueryOptions -> lock_redundant_joints has no effect (6-DOF arm, no redundant joints). return_approximate_solution is not
+// supported: the closed-form solver only returns exact solutions, which also satisfy an approximate request:
+void URKinematicsPlugin::checkOptions(const kinematics::KinematicsQueryOptions & options) const
+{
+    if (options.return_approximate_solution){
+        RCLCPP_WARN_ONCE(LOGGER, "URKinematicsPlugin: return_approximate_solution is not supported, only exact IK solutions are returned.");
+    }
+}
+
+// All the overloads end here -> The closed-form solutions are computed at once, the timeout (if > 0.0) limits the solution callback
+// checks (e.g. collision checking):
+bool URKinematicsPlugin::searchPositionIK(const geometry_msgs::msg::Pose & ik_pose, const std::vector<double> & ik_seed_state,
+                                          double timeout, const std::vector<double> & consistency_limits, std::vector<double> & solution,
+                                          const IKCallbackFn & solution_callback, moveit_msgs::msg::MoveItErrorCodes & error_code,
+                                          const kinematics::KinematicsQueryOptions & options) const
+{
+    const auto T0 = std::chrono::steady_clock::now();
+    checkOptions(options);
+
+    if (!active_ || ik_seed_state.size() != 6){
+        error_code.val = moveit_msgs::msg::MoveItErrorCodes::NO_IK_SOLUTION;
+        return false;
+    }
+
+    std::vector<std::vector<double>> solutions;
+    solveSorted(ik_pose, ik_seed_state, solutions);
+
+    for (size_t i = 0; i < solutions.size(); i++){
+
+        const std::vector<double> & q = solutions[i];
+
+        // TIMEOUT -> Checked before every candidate but the first one:
+        if (timeout > 0.0 && i > 0 && std::chrono::duration<double>(std::chrono::steady_clock::now() - T0).count() > timeout){
+            error_code.val = moveit_msgs::msg::MoveItErrorCodes::TIMED_OUT;
+            return false;
+        }
+
+        // CONSISTENCY LIMITS -> |q - seed| < limit:
+        bool CONSISTENT = true;
+        for (size_t j = 0; j < consistency_limits.size() && j < 6; j++){
+            if (fabs(q[j] - ik_seed_state[j]) > consistency_limits[j]){
+                CONSISTENT = false;
+            }
+        }
+        if (!CONSISTENT){
+            continue;
+        }
+
+        solution = q;
+
+        // SOLUTION CALLBACK -> e.g. collision checking, done by MoveIt!2:
+        if (solution_callback){
+            solution_callback(ik_pose, solution, error_code);
+            if (error_code.val != moveit_msgs::msg::MoveItErrorCodes::SUCCESS){
+                continue;
+            }
+        }
+
+        error_code.val = moveit_msgs::msg::MoveItErrorCodes::SUCCESS;
+        return true;
+    }
+
+    error_code.val = moveit_msgs::msg::MoveItErrorCodes::NO_IK_SOLUTION;
+    return false;
+}
+
+bool URKinematicsPlugin::getPositionFK(const std::vector<std::string> & link_names, const std::vector<double> & joint_angles,
+                                       std::vector<geometry_msgs::msg::Pose> & poses) const
+{
+    if (!active_ || joint_angles.size() != 6){
+        return false;
+    }
+
+    poses.clear();
+    for (const std::string & LINK : link_names){
+        if (LINK != link_names_[0]){
+            RCLCPP_ERROR(LOGGER, "URKinematicsPlugin: FK only available for the tip link (%s), requested -> %s", link_names_[0].c_str(), LINK.c_str());
+            return false;
+        }
+        poses.push_back(tf2::toMsg(URForward(PARAMS, joint_angles.data())));
+    }
+    return true;
+}
+
+const std::vector<std::string> & URKinematicsPlugin::getJointNames() const
+{
+    return joint_names_;
+}
+
+const std::vector<std::string> & URKinematicsPlugin::getLinkNames() const
+{
+    return link_names_;
+}
+
+}  // namespace ros2srrc_kinematics
+
+PLUGINLIB_EXPORT_CLASS(ros2srrc_kinematics::URKinematicsPlugin, kinematics::KinematicsBase)
@@ -0,0 +1,134 @@
+/*
+# ===================================== COPYRIGHT ===================================== #
+#                                                                                       #
+#  IFRA (Intelligent Flexible Robotics and Assembly) Group, CRANFIELD UNIVERSITY        #
+#  Created on behalf of the IFRA Group at Cranfield University, United Kingdom          #
+#  E-mail: IFRA@cranfield.ac.uk                                                         #
+#                                                                                       #
+#  Licensed under the Apache-2.0 License.                                               #
+#  You may not use this file except in compliance with the License.                     #
+#  You may obtain a copy of the License at: http://www.apache.org/licenses/LICENSE-2.0  #
+#                                                                                       #
+#  Unless required by applicable law or agreed to in writing, software distributed      #
+#  under the License is distributed on an "as-is" basis, without warranties or          #
+#  conditions of any kind, either express or implied. See the License for the specific  #
+#  language governing permissions and limitations under the License.                    #
+#                                                                                       #
+#  IFRA Group - Cranfield University                                                    #
+#  AUTHORS: Mikel Bueno Viso - Mikel.Bueno-Viso@cranfield.ac.uk                         #
+#           Dr. Seemal Asif  - s.asif@cranfield.ac.uk                                   #
+#           Prof. Phil Webb  - p.f.webb@cranfield.ac.uk                                 #
+#                                                                                       #
+#  Date: October, 2026.                                                                 #
+#                                                                                       #
+# ===================================== COPYRIGHT ===================================== #
+
+# ======= CITE OUR WORK ======= #
+# You can cite our work with the following statement:
+# IFRA-Cranfield (2023) ROS 2 Sim-to-Real Robot Control. URL: https://github.com/IFRA-Cranfield/ros2_SimRealRobotControl.
+*/
+
+// test_ur_kinematics.cpp:
+// FK -> IK -> FK round trip of the closed-form UR solver (UR3 and UR5 DH parameters, see urX kinematics.yaml), including wrist
+// singularities (q5 = 0, q5 = pi), where q4 and q6 are coupled and only the pose can be compared.
+
+#include "ros2srrc_kinematics/ur_kinematics.h"
+
+// Include standard libraries:
+#include <cmath>
+#include <random>
+#include <vector>
+
+// Include GTEST:
+#include <gtest/gtest.h>
+
+using namespace ros2srrc_kinematics;
+
+// Declaration of CONSTANT VALUES:
+const URParams UR3 = {0.1519, -0.24365, -0.21325, 0.11235, 0.08535, 0.0819};
+const URParams UR5 = {0.089159, -0.42500, -0.39225, 0.10915, 0.09465, 0.0823};
+const double POSE_TOL = 1e-8;
+const double JOINT_TOL = 1e-6;
+const int N_RANDOM = 2000;
+
+// Max. absolute difference between two poses (homogeneous matrices):
+static double PoseError(const Eigen::Isometry3d & A, const Eigen::Isometry3d & B)
+{
+    return((A.matrix() - B.matrix()).cwiseAbs().maxCoeff());
+}
+
+// FK -> IK -> FK. Every IK solution must reproduce the pose, and (if CHECK_JOINTS) the solution nearest to q must be q:
+static void RoundTrip(const URParams & P, const double q[6], bool CHECK_JOINTS)
+{
+    const Eigen::Isometry3d T = URForward(P, q);
+
+    double q_sols[UR_MAX_SOLUTIONS][6];
+    const int N = URInverse(P, T, q_sols, q[5]);
+    ASSERT_GT(N, 0) << "No IK solution for q = [" << q[0] << ", " << q[1] << ", " << q[2] << ", " << q[3] << ", " << q[4] << ", " << q[5] << "]";
+
+    for (int i = 0; i < N; i++){
+        EXPECT_LT(PoseError(URForward(P, q_sols[i]), T), POSE_TOL) << "IK solution " << i << " does not reproduce the pose.";
+    }
+
+    if (CHECK_JOINTS){
+        const std::vector<double> SEED(q, q + 6);
+        const std::vector<double> LL(6, -2.0*M_PI);
+        const std::vector<double> UL(6, 2.0*M_PI);
+        const int BEST = URNearestSolution(q_sols, N, SEED, LL, UL);
+        ASSERT_GE(BEST, 0);
+        for (int j = 0; j < 6; j++){
+            EXPECT_NEAR(q_sols[BEST][j], q[j], JOINT_TOL) << "Joint " << j + 1;
+        }
+    }
+}
+
+// Random configurations away from the wrist singularity (|sin(q5)| > 0.01):
+static void RandomRoundTrip(const URParams & P)
+{
+    std::mt19937 GEN(42);
+    std::uniform_real_distribution<double> U(-M_PI, M_PI);
+    for (int n = 0; n < N_RANDOM; n++){
+        double q[6] = {U(GEN), U(GEN), U(GEN), U(GEN), U(GEN), U(GEN)};
+        if (std::fabs(std::sin(q[4])) < 0.01){
+            continue;
+        }
+        RoundTrip(P, q, true);
+    }
+}
+
+// Wrist-singular configurations (q5 = 0, pi and close to 0):
+static void SingularRoundTrip(const URParams & P)
+{
+    std::mt19937 GEN(7);
+    std::uniform_real_distribution<double> U(-M_PI, M_PI);
+    for (double q5 : {0.0, M_PI, -M_PI, 1e-12, -1e-12, 1e-9}){
+        for (int n = 0; n < N_RANDOM / 10; n++){
+            double q[6] = {U(GEN), U(GEN), U(GEN), U(GEN), q5, U(GEN)};
+            RoundTrip(P, q, false);
+        }
+    }
+
+    // Typical tool-down pose: q5 = 0 with the wrist aligned:
+    const double q[6] = {0.0, -M_PI/2.0, M_PI/2.0, -M_PI/2.0, 0.0, 0.0};
+    RoundTrip(P, q, false);
+}
+
+TEST(URKinematics, RoundTripUR3)
+{
+    RandomRoundTrip(UR3);
+}
+
+TEST(URKinematics, RoundTripUR5)
+{
+    RandomRoundTrip(UR5);
+}
+
+TEST(URKinematics, WristSingularUR3)
+{
+    SingularRoundTrip(UR3);
+}
+
+TEST(URKinematics, WristSingularUR5)
+{
+    SingularRoundTrip(UR5);
+}
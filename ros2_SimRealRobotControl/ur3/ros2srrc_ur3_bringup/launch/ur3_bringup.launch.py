@@ -41,9 +41,13 @@ from launch.actions import ExecuteProcess, IncludeLaunchDescription, RegisterEve
 from launch.conditions import IfCondition, UnlessCondition
 from launch.event_handlers import OnProcessExit
 from launch.launch_description_sources import PythonLaunchDescriptionSource
-import xacro
+import sys
 import yaml
 
+# XACRO CACHE (ros2srrc_execution/python/xacrocache.py):
+sys.path.append(os.path.join(get_package_share_directory('ros2srrc_execution'), 'python'))
+from xacrocache import ProcessXacro
+
 # LOAD FILE:
 def load_file(package_name, file_path):
     package_path = get_package_share_directory(package_name)
@@ -142,8 +146,7 @@ def generate_launch_description():
                               'urdf',
                               'ur3.urdf.xacro')
     # Generate ROBOT_DESCRIPTION for UR3:
-    doc = xacro.parse(open(xacro_file))
-    xacro.process_doc(doc, mappings={
+    robot_description_config = ProcessXacro(xacro_file, mappings={
         "robot_ip": robot_ip, 
         "bringup": "true",
         "cell_layout_1": cell_layout_1,
@@ -155,8 +158,7 @@ def generate_launch_description():
         "script_filename": script_filename,
         "input_recipe_filename": input_recipe_filename,
         "output_recipe_filename": output_recipe_filename,
-        })
-    robot_description_config = doc.toxml()
+        }, log=print)
     robot_description = {'robot_description': robot_description_config}
 
     # ROBOT STATE PUBLISHER NODE:
@@ -254,7 +256,7 @@ def generate_launch_description():
 
     # Move group: OMPL Planning.
     ompl_planning_pipeline_config = {
-        "move_group": {
+        "ompl": {
             "planning_plugin": "ompl_interface/OMPLPlanner",
             "request_adapters": """default_planner_request_adapters/AddTimeOptimalParameterization default_planner_request_adapters/FixWorkspaceBounds default_planner_request_adapters/FixStartStateBounds default_planner_request_adapters/FixStartStateCollision default_planner_request_adapters/FixStartStatePathConstraints""",
             "start_state_max_bounds_error": 0.1,
@@ -264,7 +266,13 @@ def generate_launch_description():
     ompl_planning_yaml = load_yaml(
         "ros2srrc_ur3_moveit2", "config/ompl_planning.yaml"
     )
-    ompl_planning_pipeline_config["move_group"].update(ompl_planning_yaml)
+    ompl_planning_pipeline_config["ompl"].update(ompl_planning_yaml)
+
+    # Planning pipelines -> "move_group" (Pilz, default) + "ompl" (used by the ros2srrc_execution PLANNING STRATEGY):
+    planning_pipelines = {
+        "planning_pipelines": ["move_group", "ompl"],
+        "default_planning_pipeline": "move_group",
+    }
 
     # MoveIt!2 Controllers:
     moveit_simple_controllers_yaml = load_yaml(
@@ -303,7 +311,8 @@ def generate_launch_description():
             kinematics_yaml,
             
             pilz_planning_pipeline_config,
-            #ompl_planning_pipeline_config,
+            ompl_planning_pipeline_config,
+            planning_pipelines,
 
             joint_limits,
             pilz_cartesian_limits,
@@ -333,7 +342,8 @@ def generate_launch_description():
             kinematics_yaml,
             
             pilz_planning_pipeline_config,
-            #ompl_planning_pipeline_config,
+            ompl_planning_pipeline_config,
+            planning_pipelines,
 
             joint_limits,
             pilz_cartesian_limits,
@@ -354,14 +364,14 @@ def generate_launch_description():
             package="ros2srrc_execution",
             executable="move",
             output="screen",
-            parameters=[robot_description, robot_description_semantic, kinematics_yaml, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "none"}, {"ENV_PARAM": "bringup"}],
+            parameters=[robot_description, robot_description_semantic, kinematics_yaml, joint_limits, pilz_cartesian_limits, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "none"}, {"ENV_PARAM": "bringup"}, {"EXEC_BACKEND": "moveit"}],
         )
         SequenceInterface = Node(
             name="sequence",
             package="ros2srrc_execution",
             executable="sequence",
             output="screen",
-            parameters=[robot_description, robot_description_semantic, kinematics_yaml, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "none"}, {"ENV_PARAM": "bringup"}],
+            parameters=[robot_description, robot_description_semantic, kinematics_yaml, joint_limits, pilz_cartesian_limits, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "none"}, {"ENV_PARAM": "bringup"}, {"EXEC_BACKEND": "moveit"}],
         )
 
     if (EE_robotiq == "true"):
@@ -371,14 +381,14 @@ def generate_launch_description():
             package="ros2srrc_execution",
             executable="move",
             output="screen",
-            parameters=[robot_description, robot_description_semantic, kinematics_yaml, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "robotiq_2f85"}, {"ENV_PARAM": "bringup"}],
+            parameters=[robot_description, robot_description_semantic, kinematics_yaml, joint_limits, pilz_cartesian_limits, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "robotiq_2f85"}, {"ENV_PARAM": "bringup"}, {"EXEC_BACKEND": "moveit"}],
         )
         SequenceInterface = Node(
             name="sequence",
             package="ros2srrc_execution",
             executable="sequence",
             output="screen",
-            parameters=[robot_description, robot_description_semantic, kinematics_yaml, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "robotiq_2f85"}, {"ENV_PARAM": "bringup"}],
+            parameters=[robot_description, robot_description_semantic, kinematics_yaml, joint_limits, pilz_cartesian_limits, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "robotiq_2f85"}, {"ENV_PARAM": "bringup"}, {"EXEC_BACKEND": "moveit"}],
         )
 
     # ***** RETURN LAUNCH DESCRIPTION ***** #
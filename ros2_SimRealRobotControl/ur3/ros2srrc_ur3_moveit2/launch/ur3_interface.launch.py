@@ -41,9 +41,13 @@ from launch.actions import ExecuteProcess, IncludeLaunchDescription, RegisterEve
 from launch.conditions import IfCondition, UnlessCondition
 from launch.event_handlers import OnProcessExit
 from launch.launch_description_sources import PythonLaunchDescriptionSource
-import xacro
+import sys
 import yaml
 
+# XACRO CACHE (ros2srrc_execution/python/xacrocache.py):
+sys.path.append(os.path.join(get_package_share_directory('ros2srrc_execution'), 'python'))
+from xacrocache import ProcessXacro
+
 # LOAD FILE:
 def load_file(package_name, file_path):
     package_path = get_package_share_directory(package_name)
@@ -119,15 +123,23 @@ def generate_launch_description():
     while (error == True):
         print("     + Option N1: No end-effector.")
         print("     + Option N2: Robotiq 2f-85 parallel gripper.")
+        print("     + Option N3: Robotiq 2f-85 parallel gripper (single controller, mimic joints).")
         end_effector = input ("  Please select: ")
         if (end_effector == "1"):
             error = False
             EE_no = "true"
             EE_robotiq = "false"
+            EE_robotiq_mimic = "false"
         elif (end_effector == "2"):
             error = False
             EE_no = "false"
             EE_robotiq = "true"
+            EE_robotiq_mimic = "false"
+        elif (end_effector == "3"):
+            error = False
+            EE_no = "false"
+            EE_robotiq = "true"
+            EE_robotiq_mimic = "true"
         else:
             print ("  Please select a valid option!")
     print("")
@@ -141,15 +153,14 @@ def generate_launch_description():
                               'urdf',
                               'ur3.urdf.xacro')
     # Generate ROBOT_DESCRIPTION for UR3:
-    doc = xacro.parse(open(xacro_file))
-    xacro.process_doc(doc, mappings={
+    robot_description_config = ProcessXacro(xacro_file, mappings={
         "cell_layout_1": cell_layout_1,
         "cell_layout_2": cell_layout_2,
         "cell_layout_3": cell_layout_3,
         "EE_no": EE_no,
         "EE_robotiq": EE_robotiq,
-        })
-    robot_description_config = doc.toxml()
+        "EE_robotiq_mimic": EE_robotiq_mimic,
+        }, log=print)
     robot_description = {'robot_description': robot_description_config}
 
     # SPAWN ROBOT TO GAZEBO:
@@ -223,6 +234,23 @@ def generate_launch_description():
         executable="spawner",
         arguments=["robotiq_controller_RFTJ", "-c", "/controller_manager"],
     )
+    # Single controller (mimic joints):
+    robotiq_controller_spawner = Node(
+        package="controller_manager",
+        executable="spawner",
+        arguments=["robotiq_controller", "-c", "/controller_manager"],
+    )
+    if (EE_robotiq_mimic == "true"):
+        robotiq_controller_spawners = [robotiq_controller_spawner]
+    else:
+        robotiq_controller_spawners = [
+            robotiq_controller_spawner_LKJ,
+            robotiq_controller_spawner_RKJ,
+            robotiq_controller_spawner_LIKJ,
+            robotiq_controller_spawner_RIKJ,
+            robotiq_controller_spawner_LFTJ,
+            robotiq_controller_spawner_RFTJ,
+        ]
 
 
     # *********************** MoveIt!2 *********************** #   
@@ -277,7 +305,7 @@ def generate_launch_description():
 
     # Move group: OMPL Planning.
     ompl_planning_pipeline_config = {
-        "move_group": {
+        "ompl": {
             "planning_plugin": "ompl_interface/OMPLPlanner",
             "request_adapters": """default_planner_request_adapters/AddTimeOptimalParameterization default_planner_request_adapters/FixWorkspaceBounds default_planner_request_adapters/FixStartStateBounds default_planner_request_adapters/FixStartStateCollision default_planner_request_adapters/FixStartStatePathConstraints""",
             "start_state_max_bounds_error": 0.1,
@@ -294,7 +322,13 @@ def generate_launch_description():
             "ros2srrc_ur3_moveit2", "config/ompl_planning_robotiq.yaml"
         )
     # === ROBOTIQ 2f-85 === #
-    ompl_planning_pipeline_config["move_group"].update(ompl_planning_yaml)
+    ompl_planning_pipeline_config["ompl"].update(ompl_planning_yaml)
+
+    # Planning pipelines -> "move_group" (Pilz, default) + "ompl" (used by the ros2srrc_execution PLANNING STRATEGY):
+    planning_pipelines = {
+        "planning_pipelines": ["move_group", "ompl"],
+        "default_planning_pipeline": "move_group",
+    }
 
     # MoveIt!2 Controllers:
     if (EE_no == "true"):
@@ -302,6 +336,10 @@ def generate_launch_description():
             "ros2srrc_ur3_moveit2", "config/ur_controllers.yaml"  
         )
     # === ROBOTIQ 2f-85 === #
+    elif (EE_robotiq == "true" and EE_robotiq_mimic == "true"):
+        moveit_simple_controllers_yaml = load_yaml(
+            "ros2srrc_ur3_moveit2", "config/urrobotiq_mimic_controllers.yaml"
+        )
     elif (EE_robotiq == "true"):
         moveit_simple_controllers_yaml = load_yaml(
             "ros2srrc_ur3_moveit2", "config/urrobotiq_controllers.yaml"  
@@ -340,7 +378,8 @@ def generate_launch_description():
             kinematics_yaml,
             
             pilz_planning_pipeline_config,
-            #ompl_planning_pipeline_config,
+            ompl_planning_pipeline_config,
+            planning_pipelines,
 
             joint_limits,
             pilz_cartesian_limits,
@@ -376,7 +415,8 @@ def generate_launch_description():
             kinematics_yaml,
             
             pilz_planning_pipeline_config,
-            #ompl_planning_pipeline_config,
+            ompl_planning_pipeline_config,
+            planning_pipelines,
 
             joint_limits,
             pilz_cartesian_limits,
@@ -397,14 +437,14 @@ def generate_launch_description():
             package="ros2srrc_execution",
             executable="move",
             output="screen",
-            parameters=[robot_description, robot_description_semantic, kinematics_yaml, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "none"}, {"ENV_PARAM": "gazebo"}],
+            parameters=[robot_description, robot_description_semantic, kinematics_yaml, joint_limits, pilz_cartesian_limits, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "none"}, {"ENV_PARAM": "gazebo"}, {"EXEC_BACKEND": "moveit"}],
         )
         SequenceInterface = Node(
             name="sequence",
             package="ros2srrc_execution",
             executable="sequence",
             output="screen",
-            parameters=[robot_description, robot_description_semantic, kinematics_yaml, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "none"}, {"ENV_PARAM": "gazebo"}],
+            parameters=[robot_description, robot_description_semantic, kinematics_yaml, joint_limits, pilz_cartesian_limits, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "none"}, {"ENV_PARAM": "gazebo"}, {"EXEC_BACKEND": "moveit"}],
         )
     
     if (EE_robotiq == "true"):
@@ -414,14 +454,14 @@ def generate_launch_description():
             package="ros2srrc_execution",
             executable="move",
             output="screen",
-            parameters=[robot_description, robot_description_semantic, kinematics_yaml, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "robotiq_2f85"}, {"ENV_PARAM": "gazebo"}],
+            parameters=[robot_description, robot_description_semantic, kinematics_yaml, joint_limits, pilz_cartesian_limits, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "robotiq_2f85"}, {"ENV_PARAM": "gazebo"}, {"EXEC_BACKEND": "moveit"}, {"GRIPPER_BACKEND": "direct"}],
         )
         SequenceInterface = Node(
             name="sequence",
             package="ros2srrc_execution",
             executable="sequence",
             output="screen",
-            parameters=[robot_description, robot_description_semantic, kinematics_yaml, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "robotiq_2f85"}, {"ENV_PARAM": "gazebo"}],
+            parameters=[robot_description, robot_description_semantic, kinematics_yaml, joint_limits, pilz_cartesian_limits, {"use_sim_time": True}, {"ROB_PARAM": "ur3"}, {"EE_PARAM": "robotiq_2f85"}, {"ENV_PARAM": "gazebo"}, {"EXEC_BACKEND": "moveit"}, {"GRIPPER_BACKEND": "direct"}],
         )
 
     return LaunchDescription(
@@ -453,20 +493,13 @@ def generate_launch_description():
             RegisterEventHandler(
                 OnProcessExit(
                     target_action = joint_trajectory_controller_spawner,
-                    on_exit = [
-                        robotiq_controller_spawner_LKJ,
-                        robotiq_controller_spawner_RKJ,
-                        robotiq_controller_spawner_LIKJ,
-                        robotiq_controller_spawner_RIKJ,
-                        robotiq_controller_spawner_LFTJ,
-                        robotiq_controller_spawner_RFTJ,
-                    ]
+                    on_exit = robotiq_controller_spawners
                 )
             ),
 
             RegisterEventHandler(
                 OnProcessExit(
-                    target_action = robotiq_controller_spawner_RFTJ,
+                    target_action = robotiq_controller_spawners[-1],
                     on_exit = [
 
                         # MoveIt!2:
@@ -39,12 +39,16 @@ from launch_ros.actions import Node
 from launch.actions import ExecuteProcess, IncludeLaunchDescription, RegisterEventHandler
 from launch.event_handlers import OnProcessExit
 from launch.launch_description_sources import PythonLaunchDescriptionSource
-import xacro
+import sys
 import yaml
 
 from launch.substitutions import PathJoinSubstitution
 from launch_ros.substitutions import FindPackageShare
 
+# XACRO CACHE (ros2srrc_execution/python/xacrocache.py):
+sys.path.append(os.path.join(get_package_share_directory('ros2srrc_execution'), 'python'))
+from xacrocache import ProcessXacro
+
 # LOAD FILE:
 def load_file(package_name, file_path):
     package_path = get_package_share_directory(package_name)
@@ -106,15 +110,23 @@ def generate_launch_description():
     while (error == True):
         print("     + Option N1: No end-effector.")
         print("     + Option N2: Robotiq 2f-85 parallel gripper.")
+        print("     + Option N3: Robotiq 2f-85 parallel gripper (single controller, mimic joints).")
         end_effector = input ("  Please select: ")
         if (end_effector == "1"):
             error = False
             EE_no = "true"
             EE_robotiq = "false"
+            EE_robotiq_mimic = "false"
         elif (end_effector == "2"):
             error = False
             EE_no = "false"
             EE_robotiq = "true"
+            EE_robotiq_mimic = "false"
+        elif (end_effector == "3"):
+            error = False
+            EE_no = "false"
+            EE_robotiq = "true"
+            EE_robotiq_mimic = "true"
         else:
             print ("  Please select a valid option!")
     print("")
@@ -128,15 +140,14 @@ def generate_launch_description():
                               'urdf',
                               'ur5.urdf.xacro')
     # Generate ROBOT_DESCRIPTION for ur5:
-    doc = xacro.parse(open(xacro_file))
-    xacro.process_doc(doc, mappings={
+    robot_description_config = ProcessXacro(xacro_file, mappings={
         "cell_layout_1": cell_layout_1,
         "cell_layout_2": cell_layout_2,
         "cell_layout_3": cell_layout_3,
         "EE_no": EE_no,
         "EE_robotiq": EE_robotiq,
-        })
-    robot_description_config = doc.toxml()
+        "EE_robotiq_mimic": EE_robotiq_mimic,
+        }, log=print)
     robot_description = {'robot_description': robot_description_config}
 
 
@@ -213,6 +224,23 @@ def generate_launch_description():
         executable="spawner",
         arguments=["robotiq_controller_RFTJ", "--controller-manager", "/controller_manager"],
     )
+    # Single controller (mimic joints):
+    robotiq_controller_spawner = Node(
+        package="controller_manager",
+        executable="spawner",
+        arguments=["robotiq_controller", "--controller-manager", "/controller_manager"],
+    )
+    if (EE_robotiq_mimic == "true"):
+        robotiq_controller_spawners = [robotiq_controller_spawner]
+    else:
+        robotiq_controller_spawners = [
+            robotiq_controller_spawner_LKJ,
+            robotiq_controller_spawner_RKJ,
+            robotiq_controller_spawner_LIKJ,
+            robotiq_controller_spawner_RIKJ,
+            robotiq_controller_spawner_LFTJ,
+            robotiq_controller_spawner_RFTJ,
+        ]
     # ========== END-EFFECTORS ========== #
     # ========== END-EFFECTORS ========== #
 
@@ -235,14 +263,7 @@ def generate_launch_description():
         RegisterEventHandler(
             OnProcessExit(
                 target_action = ur_controller_spawner,
-                on_exit = [
-                    robotiq_controller_spawner_LKJ,
-                    robotiq_controller_spawner_RKJ,
-                    robotiq_controller_spawner_LIKJ,
-                    robotiq_controller_spawner_RIKJ,
-                    robotiq_controller_spawner_LFTJ,
-                    robotiq_controller_spawner_RFTJ,
-                ]
+                on_exit = robotiq_controller_spawners
             )
         ),
 